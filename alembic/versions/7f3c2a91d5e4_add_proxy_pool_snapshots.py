@@ -0,0 +1,33 @@
+"""add proxy_pool_snapshots
+
+Revision ID: 7f3c2a91d5e4
+Revises: 5ac426a27c8d
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3c2a91d5e4"
+down_revision: Union[str, None] = "5ac426a27c8d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "proxy_pool_snapshots",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("proxy_pool_snapshots")
@@ -0,0 +1,59 @@
+"""add worker_run_ledger and worker_pending_mails
+
+Revision ID: a4d81c6e2b37
+Revises: 7f3c2a91d5e4
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d81c6e2b37"
+down_revision: Union[str, None] = "7f3c2a91d5e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# sitename 타입은 hotdeal_keyword_sites에서 이미 생성되어 있으므로 재사용한다.
+sitename_enum = postgresql.ENUM(
+    "ALGUMON", "FMKOREA", "RULIWEB", name="sitename", create_type=False
+)
+runledgerstatus_enum = sa.Enum("DONE", "MAILED", name="runledgerstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "worker_run_ledger",
+        sa.Column("keyword_id", sa.Integer(), nullable=False),
+        sa.Column("site_name", sitename_enum, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=True),
+        sa.Column("status", runledgerstatus_enum, nullable=False),
+        sa.Column("deals", sa.Text(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["keyword_id"], ["hotdeal_keywords.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("keyword_id", "site_name"),
+    )
+    op.create_table(
+        "worker_pending_mails",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("worker_pending_mails")
+    op.drop_table("worker_run_ledger")
+    runledgerstatus_enum.drop(op.get_bind(), checkfirst=True)
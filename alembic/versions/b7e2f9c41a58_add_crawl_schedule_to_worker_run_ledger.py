@@ -0,0 +1,32 @@
+"""add crawl schedule columns to worker_run_ledger
+
+Revision ID: b7e2f9c41a58
+Revises: a4d81c6e2b37
+Create Date: 2026-10-17 15:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2f9c41a58"
+down_revision: Union[str, None] = "a4d81c6e2b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("worker_run_ledger", sa.Column("deal_rate", sa.Float(), nullable=True))
+    op.add_column(
+        "worker_run_ledger",
+        sa.Column("next_due_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("worker_run_ledger", "next_due_at")
+    op.drop_column("worker_run_ledger", "deal_rate")
@@ -0,0 +1,39 @@
+"""add crawl_feed_cursors
+
+Revision ID: c3f18d6a9e27
+Revises: b7e2f9c41a58
+Create Date: 2026-10-17 18:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f18d6a9e27"
+down_revision: Union[str, None] = "b7e2f9c41a58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# sitename 타입은 hotdeal_keyword_sites에서 이미 생성되어 있으므로 재사용한다.
+sitename_enum = postgresql.ENUM(
+    "ALGUMON", "FMKOREA", "RULIWEB", name="sitename", create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawl_feed_cursors",
+        sa.Column("site_name", sitename_enum, nullable=False),
+        sa.Column("last_seen_id", sa.String(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("site_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("crawl_feed_cursors")
@@ -0,0 +1,192 @@
+import asyncio
+import math
+import time
+from collections import deque
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.Infrastructure.crawling.crawl_slot import current_slot
+
+
+class AdaptiveLimiter:
+    """
+    AIMD(가산 증가/승산 감소) 방식으로 동시 실행 한도를 조절하는 세마포어.
+    - 현재 한도만큼의 요청이 연속으로 성공하고 지연시간 EWMA가 목표 이하이면 한도를 1 올린다.
+    - 직접 요청 차단(403/429/430)이나 프록시 실패율 급증 시 한도를 CRAWL_AIMD_DECREASE_FACTOR배로 줄인다.
+      동시에 도착한 같은 사건으로 여러 번 줄이지 않도록 감소 후 쿨다운 동안은 다시 줄이지 않는다.
+    한도는 [min_limit, max_limit]를 벗어나지 않으며, 한도가 줄어도 이미 실행 중인 작업은
+    끝까지 진행하고 새 작업만 대기합니다. parent가 있으면 같은 신호를 상위 한도에도 전달합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        parent: "AdaptiveLimiter | None" = None,
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial_limit))
+        self.parent = parent
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._successes_since_change = 0
+        self._last_decrease_at: float | None = None
+        self.latency_ewma: float | None = None
+        self.proxy_failure_ewma = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    def locked(self) -> bool:
+        return self.in_flight >= self.limit
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    async def acquire(self) -> bool:
+        if not self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소되면 다음 대기자에게 돌려준다.
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def _alpha(self) -> float:
+        return min(1.0, max(0.0, settings.CRAWL_AIMD_EWMA_ALPHA))
+
+    def record_success(self, latency_seconds: float | None = None) -> None:
+        alpha = self._alpha()
+        if latency_seconds is not None:
+            self.latency_ewma = (
+                latency_seconds
+                if self.latency_ewma is None
+                else alpha * latency_seconds + (1 - alpha) * self.latency_ewma
+            )
+        self.proxy_failure_ewma *= 1 - alpha
+        self._successes_since_change += 1
+        latency_healthy = (
+            self.latency_ewma is None
+            or self.latency_ewma <= settings.CRAWL_AIMD_LATENCY_TARGET_SECONDS
+        )
+        # 한도만큼의 성공(한 번의 왕복 분량)이 쌓일 때마다 한 단계 올린다.
+        if self._successes_since_change >= self.limit and latency_healthy:
+            self._set_limit(self.limit + 1, "healthy")
+        if self.parent is not None:
+            self.parent.record_success(latency_seconds)
+
+    def record_block(self) -> None:
+        self._decrease("blocked")
+        if self.parent is not None:
+            self.parent.record_block()
+
+    def record_proxy_failure(self) -> None:
+        alpha = self._alpha()
+        self.proxy_failure_ewma = alpha + (1 - alpha) * self.proxy_failure_ewma
+        if self.proxy_failure_ewma >= settings.CRAWL_AIMD_PROXY_FAILURE_RATE_THRESHOLD:
+            self._decrease("proxy_failure_spike")
+        if self.parent is not None:
+            self.parent.record_proxy_failure()
+
+    def _decrease(self, reason: str) -> None:
+        now = self._now()
+        cooldown = max(0.0, settings.CRAWL_AIMD_DECREASE_COOLDOWN_SECONDS)
+        if self._last_decrease_at is not None and now - self._last_decrease_at < cooldown:
+            return
+        factor = min(0.99, max(0.1, settings.CRAWL_AIMD_DECREASE_FACTOR))
+        self._last_decrease_at = now
+        self._set_limit(math.floor(self.limit * factor), reason)
+
+    def _set_limit(self, new_limit: int, reason: str) -> None:
+        new_limit = min(self.max_limit, max(self.min_limit, new_limit))
+        self._successes_since_change = 0
+        if new_limit == self.limit:
+            return
+        previous = self.limit
+        self.limit = new_limit
+        if new_limit > previous:
+            self.increases += 1
+        else:
+            self.decreases += 1
+        logger.info(
+            "[METRIC] crawl_concurrency name=%s event=%s limit=%s->%s reason=%s "
+            "in_flight=%s latency_ewma=%s proxy_failure_ewma=%.3f",
+            self.name,
+            "increase" if new_limit > previous else "decrease",
+            previous,
+            new_limit,
+            reason,
+            self.in_flight,
+            None if self.latency_ewma is None else round(self.latency_ewma, 3),
+            self.proxy_failure_ewma,
+        )
+        self._wake_waiters()
+
+    def log_metrics(self, label: str) -> None:
+        logger.info(
+            "[METRIC] crawl_concurrency_summary label=%s name=%s limit=%s increases=%s "
+            "decreases=%s latency_ewma=%s",
+            label,
+            self.name,
+            self.limit,
+            self.increases,
+            self.decreases,
+            None if self.latency_ewma is None else round(self.latency_ewma, 3),
+        )
+
+
+def _current_limiter() -> AdaptiveLimiter | None:
+    slot = current_slot()
+    if slot is None or not isinstance(slot.semaphore, AdaptiveLimiter):
+        return None
+    return slot.semaphore
+
+
+def report_fetch_success(latency_seconds: float | None = None) -> None:
+    """현재 태스크가 적응형 슬롯을 잡고 있으면 요청 성공을 반영합니다."""
+    limiter = _current_limiter()
+    if limiter is not None:
+        limiter.record_success(latency_seconds)
+
+
+def report_site_block() -> None:
+    limiter = _current_limiter()
+    if limiter is not None:
+        limiter.record_block()
+
+
+def report_proxy_failure() -> None:
+    limiter = _current_limiter()
+    if limiter is not None:
+        limiter.record_proxy_failure()
@@ -1,5 +1,9 @@
 import asyncio
+import re
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Collection
+from contextlib import AbstractAsyncContextManager
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from math import isfinite
@@ -10,23 +14,70 @@ from app.src.core.config import settings
 from app.src.core.logger import logger
 from app.src.domain.hotdeal.enums import SiteName
 from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.adaptive_limiter import (
+    report_fetch_success,
+    report_proxy_failure,
+    report_site_block,
+)
 from app.src.Infrastructure.crawling.browser_fetcher import BrowserFetcher
+from app.src.Infrastructure.crawling.circuit_breaker import SITE_CIRCUITS
+from app.src.Infrastructure.crawling.crawl_slot import defer_until_ready
+from app.src.Infrastructure.crawling.deadline import DEADLINE_STATS, bound_timeout, has_time_for
+from app.src.Infrastructure.crawling.parse_executor import run_parse
+from app.src.Infrastructure.crawling.parser_engine import ParserEngine, resolve_parser_engine
+from app.src.Infrastructure.crawling.proxy_client_pool import PROXY_CLIENT_POOL
 from app.src.Infrastructure.crawling.proxy_manager import ProxyFailureType, ProxyManager
+from app.src.Infrastructure.crawling.rate_limiter import SITE_RATE_LIMITERS
+from app.src.Infrastructure.crawling.response_cache import (
+    RESPONSE_CACHE,
+    CachedResponse,
+    CacheKey,
+    hash_region,
+)
+from app.src.Infrastructure.crawling.route_state import SITE_ROUTES
 
 
 class BaseCrawler(ABC):
     requires_browser: bool = False
     blocked_status_codes: set[int] = {403, 429, 430}
+    # 크롤러가 구현한 파서 엔진 (모든 엔진은 동일한 CrawledKeyword 결과를 보장해야 함)
+    supported_parser_engines: tuple[ParserEngine, ...] = (ParserEngine.BS4,)
+    # 카드 시작 태그 패턴. 지정하면 스트리밍 파싱(알려진 ID에서 조기 종료)을 지원한다.
+    card_start_pattern: re.Pattern[str] | None = None
+    # 카드 시작 태그가 청크 경계에 걸쳐도 놓치지 않도록 남겨 두는 버퍼 길이
+    stream_carry_chars: int = 1024
+    # 딜 영역의 끝 (첫 카드부터 여기까지를 해시해 변경 여부를 판단)
+    deal_region_end_pattern: re.Pattern[str] | None = None
 
     def __init__(
         self,
         keyword: str,
         client: httpx.AsyncClient,
+        parser_engine: str | ParserEngine | None = None,
     ):
         self.keyword = keyword
         self.proxy_manager: ProxyManager = ProxyManager()
         self.results = []
+        # 마지막 fetchparse에서 페이지를 받아왔는지 (결과 0건인 성공과 요청 실패를 구분)
+        self.fetch_succeeded = False
+        # 마지막 fetchparse가 실행 마감 때문에 중단되었는지 (사이트/프록시 실패로 집계하지 않음)
+        self.deadline_shed = False
         self.client = client
+        self.parser_engine: ParserEngine = resolve_parser_engine(
+            parser_engine or settings.CRAWL_PARSER_ENGINE,
+            self.supported_parser_engines,
+        )
+        # 조건부 요청 캐시: 직접 요청 응답의 검증값과 304 응답 시 재사용할 항목
+        self._response_validators: tuple[str | None, str | None] = (None, None)
+        self._not_modified_entry: CachedResponse | None = None
+
+    def __getstate__(self) -> dict:
+        # 프로세스 풀로 파싱을 넘길 때 네트워크 클라이언트/프록시 매니저는 보내지 않는다.
+        state = self.__dict__.copy()
+        state["client"] = None
+        state["proxy_manager"] = None
+        state["results"] = []
+        return state
 
     @property
     @abstractmethod
@@ -55,40 +106,86 @@ class BaseCrawler(ABC):
         return await self._fetch_with_httpx(target_url, timeout)
 
     async def _fetch_with_httpx(self, url: str, timeout: int = 10) -> str | None:
+        if SITE_ROUTES.should_bypass_direct(self.site_name):
+            logger.debug(f"[{self.keyword}] 사이트 차단 쿨다운 중, 프록시로 바로 요청: {url}")
+            return await self._fetch_with_proxy(url, timeout)
+
         logger.debug(f"[{self.keyword}] 요청: {url}")
+        cache_key = self._response_cache_key() if url == self.url else None
+        # 304를 받는 사이에 캐시 항목이 밀려나도 재사용할 수 있도록 검증값을 만든 항목을 잡아 둔다.
+        cached_entry = RESPONSE_CACHE.get(cache_key) if cache_key else None
+        conditional_headers = cached_entry.conditional_headers() if cached_entry else {}
+        await SITE_RATE_LIMITERS.acquire(self.site_name)
+        started = time.perf_counter()
         try:
-            response = await self.client.get(url, timeout=timeout)
+            if conditional_headers:
+                response = await self.client.get(
+                    url, timeout=timeout, headers=conditional_headers
+                )
+            else:
+                response = await self.client.get(url, timeout=timeout)
+
+            if response.status_code == 304 and conditional_headers:
+                SITE_ROUTES.record_direct_success(self.site_name)
+                report_fetch_success(time.perf_counter() - started)
+                self._not_modified_entry = cached_entry
+                logger.debug(f"[{self.keyword}] 변경 없음(304): {url}")
+                return None
 
             if response.status_code in self.blocked_status_codes:
-                backoff_seconds = self._get_backoff_seconds(response)
-                if self._is_backoff_budget_exceeded(
-                    0.0,
-                    backoff_seconds,
-                ):
-                    return None
-
-                if response.status_code == 430:
-                    logger.error(f"{response.status_code}: {response.text}")
-                logger.warning(
-                    "%s: 접근이 차단되었습니다. %.1f초 대기 후 프록시로 재시도합니다.",
-                    response.status_code,
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                return await self._fetch_with_proxy(
-                    url,
-                    timeout,
-                    accumulated_backoff_seconds=backoff_seconds,
-                )
+                return await self._retry_blocked_with_proxy(response, url, timeout)
 
             response.raise_for_status()
+            SITE_ROUTES.record_direct_success(self.site_name)
+            report_fetch_success(time.perf_counter() - started)
             logger.debug(f"[{self.keyword}] 요청 성공: {url}")
+            self._response_validators = self._get_response_validators(response)
             return response.text
 
         except httpx.RequestError as e:
             logger.error(f"[{self.keyword}] 요청 실패: {e}")
             return None
 
+    async def _retry_blocked_with_proxy(
+        self,
+        response: httpx.Response,
+        url: str,
+        timeout: int,
+    ) -> str | None:
+        report_site_block()
+        retry_after = response.headers.get("Retry-After")
+        retry_after_seconds = (
+            self._parse_retry_after_seconds(retry_after) if retry_after else None
+        )
+        # Retry-After는 이 요청뿐 아니라 같은 사이트의 모든 요청을 멈춘다.
+        SITE_RATE_LIMITERS.pause(self.site_name, retry_after_seconds)
+        is_new_block = SITE_ROUTES.record_block(self.site_name, retry_after_seconds)
+        if not is_new_block:
+            # 다른 크롤러가 이미 같은 사이트 차단을 감지해 대기했으므로 바로 프록시로 재시도
+            logger.debug(f"[{self.keyword}] 이미 감지된 사이트 차단, 대기 없이 프록시 재시도")
+            return await self._fetch_with_proxy(url, timeout)
+
+        backoff_seconds = self._get_backoff_seconds(response)
+        if self._is_backoff_budget_exceeded(
+            0.0,
+            backoff_seconds,
+        ):
+            return None
+
+        if response.status_code == 430:
+            logger.error(f"{response.status_code}: {response.text}")
+        logger.warning(
+            "%s: 접근이 차단되었습니다. %.1f초 대기 후 프록시로 재시도합니다.",
+            response.status_code,
+            backoff_seconds,
+        )
+        await defer_until_ready(backoff_seconds)
+        return await self._fetch_with_proxy(
+            url,
+            timeout,
+            accumulated_backoff_seconds=backoff_seconds,
+        )
+
     async def _fetch_with_browser(self, url: str, wait_seconds: int = 3) -> str | None:
         logger.debug(f"[{self.keyword}] 브라우저 요청: {url}")
         async with BrowserFetcher() as fetcher:
@@ -101,36 +198,61 @@ class BaseCrawler(ABC):
         accumulated_backoff_seconds: float = 0.0,
     ) -> str | None:
         for _ in range(15):
+            # 실행 마감이 가까우면 끝나지 못할 재시도를 시작하지 않는다.
+            if not has_time_for(settings.CRAWL_DEADLINE_MIN_REQUEST_SECONDS):
+                DEADLINE_STATS.shed_retries += 1
+                self.deadline_shed = True
+                logger.warning(f"[{self.keyword}] 실행 마감이 가까워 프록시 재시도를 중단합니다.")
+                return None
+
             proxy_url = self.proxy_manager.get_next_proxy()
             if not proxy_url:
                 logger.error("사용할 수 있는 프록시가 없습니다.")
                 return None
 
+            await SITE_RATE_LIMITERS.acquire(self.site_name)
+            started = time.perf_counter()
+            request_timeout = bound_timeout(timeout)
             try:
-                async with httpx.AsyncClient(proxy=proxy_url) as proxy_client:
-                    response = await proxy_client.get(url, timeout=timeout)
-
-                    if response.status_code == 200:
-                        self.proxy_manager.record_proxy_success(proxy_url)
-                        logger.debug(f"프록시 {proxy_url}로 요청 성공")
-                        return response.text
-
-                    failure_type = ProxyManager.classify_failure(
-                        status_code=response.status_code
+                async with self._proxy_client(proxy_url) as proxy_client:
+                    response = await proxy_client.get(url, timeout=request_timeout)
+                latency_seconds = time.perf_counter() - started
+                if settings.PROXY_CLIENT_POOL_ENABLED:
+                    PROXY_CLIENT_POOL.record_response(proxy_url, response)
+
+                if response.status_code == 200:
+                    self.proxy_manager.record_proxy_success(
+                        proxy_url, latency_seconds=latency_seconds
                     )
-                    should_retry, accumulated_backoff_seconds = (
-                        await self._handle_proxy_failure(
-                            proxy_url=proxy_url,
-                            failure_type=failure_type,
-                            accumulated_backoff_seconds=accumulated_backoff_seconds,
-                            response=response,
-                        )
+                    report_fetch_success(latency_seconds)
+                    logger.debug(f"프록시 {proxy_url}로 요청 성공")
+                    return response.text
+
+                failure_type = ProxyManager.classify_failure(
+                    status_code=response.status_code
+                )
+                should_retry, accumulated_backoff_seconds = (
+                    await self._handle_proxy_failure(
+                        proxy_url=proxy_url,
+                        failure_type=failure_type,
+                        accumulated_backoff_seconds=accumulated_backoff_seconds,
+                        response=response,
+                        latency_seconds=latency_seconds,
                     )
-                    if should_retry:
-                        continue
-                    return None
+                )
+                if should_retry:
+                    continue
+                return None
 
             except httpx.RequestError as e:
+                if isinstance(e, httpx.TimeoutException) and request_timeout < timeout:
+                    # 실행 마감으로 줄인 시간 제한이 끝난 것이므로 프록시 실패로 기록하지 않는다.
+                    DEADLINE_STATS.shed_retries += 1
+                    self.deadline_shed = True
+                    logger.warning(
+                        f"[{self.keyword}] 실행 마감으로 줄인 프록시 요청 시간 제한을 초과해 중단합니다."
+                    )
+                    return None
                 failure_type = ProxyManager.classify_failure(error=e)
                 should_retry, accumulated_backoff_seconds = (
                     await self._handle_proxy_failure(
@@ -138,6 +260,7 @@ class BaseCrawler(ABC):
                         failure_type=failure_type,
                         accumulated_backoff_seconds=accumulated_backoff_seconds,
                         error=e,
+                        latency_seconds=time.perf_counter() - started,
                     )
                 )
                 if should_retry:
@@ -147,6 +270,14 @@ class BaseCrawler(ABC):
         logger.error(f"[{self.keyword}] 모든 프록시를 사용했지만 요청에 실패했습니다.")
         return None
 
+    @staticmethod
+    def _proxy_client(
+        proxy_url: str,
+    ) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if settings.PROXY_CLIENT_POOL_ENABLED:
+            return PROXY_CLIENT_POOL.lease(proxy_url)
+        return httpx.AsyncClient(proxy=proxy_url)
+
     async def _handle_proxy_failure(
         self,
         *,
@@ -155,8 +286,19 @@ class BaseCrawler(ABC):
         accumulated_backoff_seconds: float,
         response: httpx.Response | None = None,
         error: Exception | None = None,
+        latency_seconds: float | None = None,
     ) -> tuple[bool, float]:
-        self.proxy_manager.record_proxy_failure(proxy_url, failure_type)
+        self.proxy_manager.record_proxy_failure(
+            proxy_url,
+            failure_type,
+            latency_seconds=latency_seconds,
+        )
+        report_proxy_failure()
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            SITE_RATE_LIMITERS.pause(
+                self.site_name, self._parse_retry_after_seconds(retry_after)
+            )
         backoff_seconds = self._get_proxy_backoff_seconds(
             failure_type,
             response=response,
@@ -182,7 +324,7 @@ class BaseCrawler(ABC):
             backoff_seconds,
         ):
             return False, accumulated_backoff_seconds
-        await asyncio.sleep(backoff_seconds)
+        await defer_until_ready(backoff_seconds)
         return True, accumulated_backoff_seconds + backoff_seconds
 
     def _get_proxy_backoff_seconds(
@@ -214,13 +356,40 @@ class BaseCrawler(ABC):
         return max(base_backoff, settings.CRAWL_BLOCK_BACKOFF_BUDGET_SECONDS)
 
     def _get_site_budget_seconds(self) -> float:
-        return max(1.0, settings.CRAWL_SITE_BUDGET_SECONDS)
+        return bound_timeout(max(1.0, settings.CRAWL_SITE_BUDGET_SECONDS))
+
+    def _on_site_budget_timeout(self, site_budget_seconds: float) -> None:
+        if site_budget_seconds < max(1.0, settings.CRAWL_SITE_BUDGET_SECONDS):
+            # 실행 마감으로 줄어든 제한 시간이 끝난 경우는 사이트 장애가 아니다.
+            DEADLINE_STATS.shed_sites += 1
+            self.deadline_shed = True
+        logger.warning(
+            "[%s] 사이트 크롤링 시간 제한 %.1f초를 초과하여 중단합니다: %s",
+            self.keyword,
+            site_budget_seconds,
+            self.url,
+        )
+
+    def _record_circuit_result(self) -> None:
+        """요청 결과를 서킷에 반영합니다. 실행 마감으로 중단된 요청은 건너뜀으로 보고 반영하지 않습니다."""
+        if not self.fetch_succeeded and self.deadline_shed:
+            return
+        SITE_CIRCUITS.record_result(self.site_name, self.fetch_succeeded)
 
     def _is_backoff_budget_exceeded(
         self,
         accumulated_backoff_seconds: float,
         next_backoff_seconds: float,
     ) -> bool:
+        if not has_time_for(next_backoff_seconds + settings.CRAWL_DEADLINE_MIN_REQUEST_SECONDS):
+            DEADLINE_STATS.shed_retries += 1
+            self.deadline_shed = True
+            logger.warning(
+                "실행 마감 전에 %.1f초 대기 후 재시도를 마칠 수 없어 프록시 재시도를 종료합니다.",
+                next_backoff_seconds,
+            )
+            return True
+
         backoff_budget_seconds = self._get_backoff_budget_seconds()
         projected_backoff_seconds = accumulated_backoff_seconds + next_backoff_seconds
         if projected_backoff_seconds <= backoff_budget_seconds:
@@ -254,21 +423,204 @@ class BaseCrawler(ABC):
 
         return max(0.0, retry_after_seconds)
 
+    def _response_cache_key(self) -> CacheKey | None:
+        if not settings.CRAWL_RESPONSE_CACHE_ENABLED or self.requires_browser:
+            return None
+        return (self.site_name, self.url)
+
+    @staticmethod
+    def _get_response_validators(
+        response: httpx.Response,
+    ) -> tuple[str | None, str | None]:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        return (
+            etag if isinstance(etag, str) else None,
+            last_modified if isinstance(last_modified, str) else None,
+        )
+
+    def extract_deal_region(self, html: str) -> str | None:
+        """첫 딜 카드부터 딜 영역 끝까지의 본문. 카드가 없으면 None."""
+        if self.card_start_pattern is None:
+            return None
+        start_match = self.card_start_pattern.search(html)
+        if start_match is None:
+            return None
+        end_match = (
+            self.deal_region_end_pattern.search(html, start_match.start())
+            if self.deal_region_end_pattern is not None
+            else None
+        )
+        return html[start_match.start() : end_match.start() if end_match else len(html)]
+
     async def fetchparse(self) -> list[CrawledKeyword]:
+        cache_key = self._response_cache_key()
+        self._response_validators = (None, None)
+        self._not_modified_entry = None
+        self.deadline_shed = False
         site_budget_seconds = self._get_site_budget_seconds()
         try:
             html = await asyncio.wait_for(self.fetch(), timeout=site_budget_seconds)
         except TimeoutError:
-            logger.warning(
-                "[%s] 사이트 크롤링 시간 제한 %.1f초를 초과하여 중단합니다: %s",
-                self.keyword,
-                site_budget_seconds,
-                self.url,
-            )
+            self._on_site_budget_timeout(site_budget_seconds)
             html = None
+        self.fetch_succeeded = bool(html) or self._not_modified_entry is not None
+        self._record_circuit_result()
+
+        if self._not_modified_entry is not None:
+            # 304: 이전 파싱 결과를 그대로 사용
+            RESPONSE_CACHE.record_not_modified()
+            self.results = list(self._not_modified_entry.results)
+            return self.results
 
         if html:
-            self.results = self.parse(html)
-        else:
+            region = self.extract_deal_region(html) if cache_key else None
+            region_hash = hash_region(region) if region else None
+            cached = RESPONSE_CACHE.get(cache_key) if region_hash else None
+            if cached is not None and cached.region_hash == region_hash:
+                # 딜 영역이 그대로면 파싱을 건너뛴다.
+                RESPONSE_CACHE.record_region_hit()
+                self.results = list(cached.results)
+            else:
+                # CRAWL_PARSE_EXECUTOR 설정 시 이벤트 루프 밖(스레드/프로세스 풀)에서 파싱
+                self.results = await run_parse(_parse_html, self, html)
+                if region_hash:
+                    RESPONSE_CACHE.record_miss()
+
+            if region_hash:
+                etag, last_modified = self._response_validators
+                RESPONSE_CACHE.put(
+                    cache_key,
+                    CachedResponse(
+                        etag=etag,
+                        last_modified=last_modified,
+                        region_hash=region_hash,
+                        results=tuple(self.results),
+                    ),
+                )
+        elif not self.deadline_shed:
             logger.error(f"[{self.keyword}] 크롤링 실패: {self.url}")
         return self.results
+
+    async def fetchparse_until(
+        self,
+        stop_ids: Collection[str],
+        min_results: int = 1,
+        timeout: int = 10,
+    ) -> list[CrawledKeyword]:
+        """
+        응답을 스트리밍으로 받으며 카드 단위로 파싱하고, 알려진 ID(stop_ids)를 만나고
+        min_results개 이상 모이면 나머지 본문을 받지 않고 연결을 닫습니다.
+        스트리밍을 지원하지 않거나 알려진 ID가 없으면 fetchparse()와 동일하게 동작합니다.
+        """
+        if self.requires_browser or self.card_start_pattern is None or not stop_ids:
+            return await self.fetchparse()
+
+        self.deadline_shed = False
+        site_budget_seconds = self._get_site_budget_seconds()
+        try:
+            results = await asyncio.wait_for(
+                self._stream_parse(self.url, frozenset(stop_ids), min_results, timeout),
+                timeout=site_budget_seconds,
+            )
+        except TimeoutError:
+            self._on_site_budget_timeout(site_budget_seconds)
+            results = None
+        self.fetch_succeeded = results is not None
+        self._record_circuit_result()
+
+        if results is None:
+            if not self.deadline_shed:
+                logger.error(f"[{self.keyword}] 크롤링 실패: {self.url}")
+            return self.results
+        self.results = results
+        return self.results
+
+    async def _stream_parse(
+        self,
+        url: str,
+        stop_ids: frozenset[str],
+        min_results: int,
+        timeout: int,
+    ) -> list[CrawledKeyword] | None:
+        if SITE_ROUTES.should_bypass_direct(self.site_name):
+            logger.debug(f"[{self.keyword}] 사이트 차단 쿨다운 중, 프록시로 바로 요청: {url}")
+            html = await self._fetch_with_proxy(url, timeout)
+            if not html:
+                return None
+            return await run_parse(_parse_html, self, html)
+
+        logger.debug(f"[{self.keyword}] 스트리밍 요청: {url}")
+        await SITE_RATE_LIMITERS.acquire(self.site_name)
+        started = time.perf_counter()
+        try:
+            async with self.client.stream("GET", url, timeout=timeout) as response:
+                if response.status_code in self.blocked_status_codes:
+                    await response.aread()
+                    blocked_response = response
+                else:
+                    response.raise_for_status()
+                    SITE_ROUTES.record_direct_success(self.site_name)
+                    report_fetch_success(time.perf_counter() - started)
+                    return await self._parse_stream(response, stop_ids, min_results)
+        except httpx.RequestError as e:
+            logger.error(f"[{self.keyword}] 요청 실패: {e}")
+            return None
+
+        # 차단 시에는 스트림을 닫은 뒤 기존과 같이 프록시로 전체 본문을 받아 파싱
+        html = await self._retry_blocked_with_proxy(blocked_response, url, timeout)
+        if not html:
+            return None
+        return await run_parse(_parse_html, self, html)
+
+    async def _parse_stream(
+        self,
+        response: httpx.Response,
+        stop_ids: frozenset[str],
+        min_results: int,
+    ) -> list[CrawledKeyword]:
+        results: list[CrawledKeyword] = []
+        buffer = ""
+        found_stop_id = False
+        stopped_early = False
+
+        def consume(fragment: str) -> bool:
+            nonlocal found_stop_id
+            for product in self.parse(fragment):
+                results.append(product)
+                found_stop_id = found_stop_id or product.id in stop_ids
+            return found_stop_id and len(results) >= min_results
+
+        async for chunk in response.aiter_text():
+            buffer += chunk
+            starts = [match.start() for match in self.card_start_pattern.finditer(buffer)]
+            if not starts:
+                buffer = buffer[-self.stream_carry_chars :]
+                continue
+
+            # 다음 카드의 시작 태그가 도착한 카드까지만 완성된 카드로 보고 파싱
+            for start, end in zip(starts, starts[1:], strict=False):
+                if consume(buffer[start:end]):
+                    stopped_early = True
+                    break
+            if stopped_early:
+                break
+            buffer = buffer[starts[-1] :]
+        else:
+            starts = [match.start() for match in self.card_start_pattern.finditer(buffer)]
+            if starts:
+                consume(buffer[starts[0] :])
+
+        logger.info(
+            "[METRIC] crawl_stream keyword=%s bytes=%s cards=%s stopped_early=%s",
+            self.keyword,
+            response.num_bytes_downloaded,
+            len(results),
+            stopped_early,
+        )
+        return results
+
+
+def _parse_html(crawler: BaseCrawler, html: str) -> list[CrawledKeyword]:
+    """파싱 실행기에 넘기는 진입점 (프로세스 풀에서 pickle 가능해야 함)."""
+    return crawler.parse(html)
@@ -0,0 +1,189 @@
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.domain.hotdeal.enums import SiteName
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class SiteCircuit:
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    # 실행(배치) 단위 요청/실패 수. 실패율 판단과 지표에 사용
+    calls: int = 0
+    failures: int = 0
+    opened_at: float | None = None
+    trial_started_at: float | None = None
+    opens: int = 0
+    skipped: int = 0
+    skipped_keyword_ids: set[int] = field(default_factory=set)
+
+
+class SiteCircuitBreakers:
+    """
+    프로세스 전역의 사이트별 서킷 브레이커.
+    - closed: 모든 요청을 보내고 결과를 기록한다. 연속 실패가 CRAWL_CIRCUIT_CONSECUTIVE_FAILURES에
+      이르거나, 이번 실행에서 CRAWL_CIRCUIT_MIN_CALLS번 이상 요청한 뒤 실패율이 기준 이상이면 열린다.
+    - open: 요청 없이 즉시 건너뛴다. 건너뛴 키워드는 기록해 다음 실행에서 먼저 처리한다.
+    - half_open: 열린 지 CRAWL_CIRCUIT_OPEN_SECONDS가 지나면 시험 요청 하나만 보내고,
+      성공하면 닫고 실패하면 다시 연다.
+    """
+
+    def __init__(self):
+        self._circuits: dict[SiteName, SiteCircuit] = {}
+        self._pending_keyword_ids: set[int] = set()
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    def get_state(self, site_name: SiteName) -> CircuitState:
+        circuit = self._circuits.get(site_name)
+        return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def is_open(self, site_name: SiteName) -> bool:
+        """열린 상태이고 아직 시험 요청 시각 전이면 True. 상태를 바꾸지 않습니다."""
+        if not settings.CRAWL_CIRCUIT_BREAKER_ENABLED:
+            return False
+        circuit = self._circuits.get(site_name)
+        if circuit is None or circuit.state != CircuitState.OPEN or circuit.opened_at is None:
+            return False
+        return self._now() - circuit.opened_at < max(1.0, settings.CRAWL_CIRCUIT_OPEN_SECONDS)
+
+    def allow_request(self, site_name: SiteName) -> bool:
+        """False면 이 사이트 요청을 보내지 않고 건너뛰어야 합니다."""
+        if not settings.CRAWL_CIRCUIT_BREAKER_ENABLED:
+            return True
+        circuit = self._circuits.get(site_name)
+        if circuit is None or circuit.state == CircuitState.CLOSED:
+            return True
+
+        now = self._now()
+        open_seconds = max(1.0, settings.CRAWL_CIRCUIT_OPEN_SECONDS)
+        if circuit.state == CircuitState.OPEN:
+            if circuit.opened_at is not None and now - circuit.opened_at < open_seconds:
+                return False
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.trial_started_at = None
+            logger.info("[METRIC] crawl_circuit site=%s event=half_open", site_name.value)
+
+        # 반열림: 시험 요청은 하나만. 결과 없이 끝난 시험은 open_seconds 후 다시 허용한다.
+        if circuit.trial_started_at is not None and now - circuit.trial_started_at < open_seconds:
+            return False
+        circuit.trial_started_at = now
+        return True
+
+    def record_success(self, site_name: SiteName) -> None:
+        if not settings.CRAWL_CIRCUIT_BREAKER_ENABLED:
+            return
+        circuit = self._circuits.setdefault(site_name, SiteCircuit())
+        circuit.calls += 1
+        circuit.consecutive_failures = 0
+        if circuit.state != CircuitState.CLOSED:
+            logger.info(
+                "[METRIC] crawl_circuit site=%s event=closed from=%s",
+                site_name.value,
+                circuit.state.value,
+            )
+            circuit.state = CircuitState.CLOSED
+            circuit.opened_at = None
+            circuit.trial_started_at = None
+            # 복구되었으므로 실패율은 지금부터 다시 계산한다.
+            circuit.calls = 0
+            circuit.failures = 0
+
+    def record_failure(self, site_name: SiteName) -> None:
+        if not settings.CRAWL_CIRCUIT_BREAKER_ENABLED:
+            return
+        circuit = self._circuits.setdefault(site_name, SiteCircuit())
+        circuit.calls += 1
+        circuit.failures += 1
+        circuit.consecutive_failures += 1
+        if circuit.state == CircuitState.HALF_OPEN:
+            self._open(site_name, circuit, "trial_failed")
+            return
+        if circuit.state == CircuitState.OPEN:
+            return
+
+        failure_rate = circuit.failures / circuit.calls
+        if circuit.consecutive_failures >= max(1, settings.CRAWL_CIRCUIT_CONSECUTIVE_FAILURES):
+            self._open(site_name, circuit, "consecutive_failures")
+        elif (
+            circuit.calls >= max(1, settings.CRAWL_CIRCUIT_MIN_CALLS)
+            and failure_rate >= settings.CRAWL_CIRCUIT_FAILURE_RATE_THRESHOLD
+        ):
+            self._open(site_name, circuit, "failure_rate")
+
+    def record_result(self, site_name: SiteName, success: bool) -> None:
+        if success:
+            self.record_success(site_name)
+        else:
+            self.record_failure(site_name)
+
+    def _open(self, site_name: SiteName, circuit: SiteCircuit, reason: str) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = self._now()
+        circuit.trial_started_at = None
+        circuit.opens += 1
+        logger.warning(
+            "[METRIC] crawl_circuit site=%s event=open reason=%s consecutive_failures=%s "
+            "calls=%s failures=%s open_seconds=%.1f",
+            site_name.value,
+            reason,
+            circuit.consecutive_failures,
+            circuit.calls,
+            circuit.failures,
+            settings.CRAWL_CIRCUIT_OPEN_SECONDS,
+        )
+
+    def record_skip(self, site_name: SiteName, keyword_id: int) -> None:
+        """서킷이 열려 건너뛴 키워드를 다음 실행의 우선 처리 대상으로 기록합니다."""
+        circuit = self._circuits.setdefault(site_name, SiteCircuit())
+        circuit.skipped += 1
+        circuit.skipped_keyword_ids.add(keyword_id)
+        self._pending_keyword_ids.add(keyword_id)
+
+    def take_pending_keyword_ids(self) -> set[int]:
+        """이전 실행에서 건너뛴 키워드 ID를 꺼내고 비웁니다."""
+        pending = self._pending_keyword_ids
+        self._pending_keyword_ids = set()
+        return pending
+
+    def start_batch(self) -> None:
+        """실행 단위 요청/실패 수와 건너뜀 기록을 초기화합니다. 서킷 상태는 유지합니다."""
+        for circuit in self._circuits.values():
+            circuit.calls = 0
+            circuit.failures = 0
+            circuit.opens = 0
+            circuit.skipped = 0
+            circuit.skipped_keyword_ids.clear()
+
+    def log_metrics(self, label: str) -> None:
+        for site_name, circuit in self._circuits.items():
+            logger.info(
+                "[METRIC] crawl_circuit_summary label=%s site=%s state=%s calls=%s "
+                "failures=%s opens=%s skipped=%s skipped_keywords=%s",
+                label,
+                site_name.value,
+                circuit.state.value,
+                circuit.calls,
+                circuit.failures,
+                circuit.opens,
+                circuit.skipped,
+                len(circuit.skipped_keyword_ids),
+            )
+
+    def clear(self) -> None:
+        self._circuits.clear()
+        self._pending_keyword_ids.clear()
+
+
+SITE_CIRCUITS = SiteCircuitBreakers()
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+
+
+@dataclass(slots=True)
+class CrawlSlotStats:
+    """실행 단위 슬롯 반납 대기(지연 재시도) 통계."""
+
+    deferred_count: int = 0
+    deferred_seconds: float = 0.0
+    reacquire_wait_seconds: float = 0.0
+
+    def reset(self) -> None:
+        self.deferred_count = 0
+        self.deferred_seconds = 0.0
+        self.reacquire_wait_seconds = 0.0
+
+    def log_metrics(self, label: str) -> None:
+        logger.info(
+            "[METRIC] crawl_slot label=%s deferred_count=%s deferred_seconds=%.1f "
+            "reacquire_wait_seconds=%.1f",
+            label,
+            self.deferred_count,
+            self.deferred_seconds,
+            self.reacquire_wait_seconds,
+        )
+
+
+CRAWL_SLOT_STATS = CrawlSlotStats()
+
+
+class SlotSemaphore(Protocol):
+    async def acquire(self) -> bool: ...
+
+    def release(self) -> None: ...
+
+
+_CURRENT_SLOT: ContextVar["CrawlSlot | None"] = ContextVar("crawl_slot", default=None)
+
+
+class CrawlSlot:
+    """
+    사이트 세마포어 슬롯. 진입한 태스크(와 그 하위 태스크)에서 defer_until_ready()로
+    차단 백오프를 기다리면 슬롯을 반납했다가 대기 시각이 지난 뒤 다시 줄을 서서 얻습니다.
+    덕분에 슬롯은 실제 네트워크 작업 동안만 점유되고, 대기 중인 키워드가
+    같은 사이트의 다른 키워드 진행을 막지 않습니다.
+    """
+
+    def __init__(self, semaphore: SlotSemaphore):
+        self.semaphore = semaphore
+        self.held = False
+
+    async def __aenter__(self) -> "CrawlSlot":
+        await self.semaphore.acquire()
+        self.held = True
+        self._token = _CURRENT_SLOT.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _CURRENT_SLOT.reset(self._token)
+        if self.held:
+            self.held = False
+            self.semaphore.release()
+
+    async def defer(self, delay_seconds: float) -> None:
+        self.held = False
+        self.semaphore.release()
+        # 대기 중 취소되면 슬롯을 다시 얻지 않은 채로 종료(held=False)한다.
+        await asyncio.sleep(delay_seconds)
+        started = time.perf_counter()
+        await self.semaphore.acquire()
+        self.held = True
+        CRAWL_SLOT_STATS.deferred_count += 1
+        CRAWL_SLOT_STATS.deferred_seconds += delay_seconds
+        CRAWL_SLOT_STATS.reacquire_wait_seconds += time.perf_counter() - started
+
+
+def current_slot() -> CrawlSlot | None:
+    return _CURRENT_SLOT.get()
+
+
+async def defer_until_ready(delay_seconds: float) -> None:
+    """
+    백오프 대기. 현재 태스크가 CrawlSlot을 잡고 있으면 대기 동안 슬롯을 반납하고,
+    아니면 그대로 잠듭니다.
+    """
+    slot = _CURRENT_SLOT.get()
+    if slot is None or not slot.held or not settings.CRAWL_DEFER_BACKOFF_ENABLED:
+        await asyncio.sleep(delay_seconds)
+        return
+    await slot.defer(delay_seconds)
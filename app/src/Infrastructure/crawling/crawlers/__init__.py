@@ -3,12 +3,20 @@ import httpx
 from app.src.domain.hotdeal.enums import SiteName
 from app.src.domain.hotdeal.schemas import SiteInfo
 from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
-from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+from app.src.Infrastructure.crawling.crawlers.algumon import (
+    AlgumonCrawler,
+    AlgumonFeedCrawler,
+)
 
 CRAWLER_REGISTRY: dict[SiteName, type[BaseCrawler]] = {
     SiteName.ALGUMON: AlgumonCrawler,
 }
 
+# 사이트 전체 최신 목록(피드)을 제공하는 사이트의 피드 크롤러
+FEED_CRAWLER_REGISTRY: dict[SiteName, type[BaseCrawler]] = {
+    SiteName.ALGUMON: AlgumonFeedCrawler,
+}
+
 SITE_METADATA: dict[SiteName, dict[str, str]] = {
     SiteName.ALGUMON: {
         "display_name": "알구몬",
@@ -23,6 +31,20 @@ def get_crawler(site: SiteName, keyword: str, client: httpx.AsyncClient) -> Base
     return CRAWLER_REGISTRY[site](keyword=keyword, client=client)
 
 
+def get_feed_crawler(
+    site: SiteName,
+    client: httpx.AsyncClient,
+    page: int = 1,
+) -> BaseCrawler:
+    if site not in FEED_CRAWLER_REGISTRY:
+        raise ValueError(f"Unsupported feed site: {site}")
+    return FEED_CRAWLER_REGISTRY[site](client=client, page=page)
+
+
+def supports_feed(site: SiteName) -> bool:
+    return site in FEED_CRAWLER_REGISTRY
+
+
 def get_active_sites() -> list[SiteName]:
     return list(CRAWLER_REGISTRY.keys())
 
@@ -1,11 +1,25 @@
+import re
+from typing import Any, NamedTuple
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup, Tag
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from app.src.core.logger import logger
 from app.src.domain.hotdeal.enums import SiteName
 from app.src.domain.hotdeal.schemas import CrawledKeyword
 from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
+from app.src.Infrastructure.crawling.parser_engine import ParserEngine
+
+# 텍스트 추출에서 제외하는 태그 (BeautifulSoup stripped_strings와 동일한 결과를 위해)
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class _DealCardFields(NamedTuple):
+    post_id: str
+    title: str
+    price: str | None
+    meta_segments: tuple[str | None, ...]
 
 
 class AlgumonCrawler(BaseCrawler):
@@ -19,6 +33,16 @@ class AlgumonCrawler(BaseCrawler):
         {"flex", "items-center", "gap-1", "text-xs", "mb-1", "mt-1"}
     )
     STATS_META_CLASSES = frozenset({"flex", "gap-2", "text-xs", "mb-0.5"})
+    META_CLASS_SETS = (SOURCE_META_CLASSES, PRICE_META_CLASSES, STATS_META_CLASSES)
+    card_start_pattern = re.compile(r"<div\b[^>]*\bid=[\"']deal-")
+    deal_region_end_pattern = re.compile(r"</main>")
+
+    supported_parser_engines = (
+        ParserEngine.BS4,
+        ParserEngine.BS4_STRAINER,
+        ParserEngine.LXML,
+        ParserEngine.SELECTOLAX,
+    )
 
     @property
     def url(self) -> str:
@@ -30,51 +54,108 @@ class AlgumonCrawler(BaseCrawler):
         return SiteName.ALGUMON
 
     def parse(self, html: str) -> list[CrawledKeyword]:
-        soup = BeautifulSoup(html, "html.parser")
-        deal_cards = soup.find_all(
-            "div",
-            id=lambda value: value and value.startswith(self.DEAL_CARD_ID_PREFIX),
-        )
-        if not deal_cards:
+        card_fields = self._extract_card_fields(html)
+        if card_fields is None:
             logger.warning("알구몬 딜 카드를 찾을 수 없습니다.")
             return []
 
-        products: list[CrawledKeyword] = []
-        for card in deal_cards:
-            post_id = card.get("id", "").removeprefix(self.DEAL_CARD_ID_PREFIX).strip()
-            title_anchor = card.select_one(self.TITLE_SELECTOR)
-            if not post_id or title_anchor is None:
-                continue
+        search_url = self.search_url
+        return [
+            CrawledKeyword(
+                id=fields.post_id,
+                title=fields.title,
+                link=self.DEAL_URL_TEMPLATE.format(post_id=fields.post_id),
+                price=fields.price,
+                meta_data=" | ".join(
+                    segment for segment in fields.meta_segments if segment
+                )
+                or None,
+                site_name=self.site_name,
+                search_url=search_url,
+            )
+            for fields in card_fields
+        ]
 
-            title = self._normalize_text(title_anchor)
-            if not title:
-                continue
+    def _extract_card_fields(self, html: str) -> list[_DealCardFields] | None:
+        """엔진별로 딜 카드 필드를 추출합니다. 딜 카드가 하나도 없으면 None을 반환합니다."""
+        if self.parser_engine == ParserEngine.SELECTOLAX:
+            return self._extract_with_selectolax(html)
+        if self.parser_engine == ParserEngine.LXML:
+            return self._extract_with_lxml(html)
+        return self._extract_with_bs4(
+            html,
+            restrict=self.parser_engine == ParserEngine.BS4_STRAINER,
+        )
 
-            meta_segments = [
-                self._normalize_text(
-                    self._find_card_block(card, "div", self.SOURCE_META_CLASSES)
-                ),
-                self._normalize_text(
-                    self._find_card_block(card, "div", self.PRICE_META_CLASSES)
-                ),
-                self._normalize_text(
-                    self._find_card_block(card, "div", self.STATS_META_CLASSES)
-                ),
-            ]
+    def _is_deal_card_id(self, value: str | None) -> bool:
+        return bool(value) and value.startswith(self.DEAL_CARD_ID_PREFIX)
+
+    def _build_card_fields(
+        self,
+        card_id: str | None,
+        title: str | None,
+        has_title_anchor: bool,
+        price: str | None,
+        meta_segments: tuple[str | None, ...],
+    ) -> _DealCardFields | None:
+        post_id = (card_id or "").removeprefix(self.DEAL_CARD_ID_PREFIX).strip()
+        if not post_id or not has_title_anchor or not title:
+            return None
+        return _DealCardFields(post_id, title, price, meta_segments)
 
-            products.append(
-                CrawledKeyword(
-                    id=post_id,
-                    title=title,
-                    link=self.DEAL_URL_TEMPLATE.format(post_id=post_id),
-                    price=self._normalize_text(card.find("p", class_=self.PRICE_CLASS)),
-                    meta_data=" | ".join(segment for segment in meta_segments if segment)
-                    or None,
-                    site_name=self.site_name,
-                    search_url=self.search_url,
+    # --- BeautifulSoup (html.parser) ---
+
+    def _extract_with_bs4(
+        self,
+        html: str,
+        restrict: bool = False,
+    ) -> list[_DealCardFields] | None:
+        # restrict=True면 딜 카드 하위 트리만 만들어 트리 생성 비용과 메모리를 줄인다.
+        parse_only = (
+            SoupStrainer("div", id=self._is_deal_card_id) if restrict else None
+        )
+        soup = BeautifulSoup(html, "html.parser", parse_only=parse_only)
+        deal_cards = soup.find_all("div", id=self._is_deal_card_id)
+        if not deal_cards:
+            return None
+
+        card_fields: list[_DealCardFields] = []
+        for card in deal_cards:
+            if restrict:
+                # CSS 셀렉터 엔진과 블록별 재탐색 없이 카드 하위 div를 한 번만 훑는다.
+                title_anchor = self._find_title_anchor(card)
+                card_divs = [
+                    (node, frozenset(node.get("class") or ()))
+                    for node in card.find_all("div")
+                ]
+                meta_blocks = tuple(
+                    next((node for node, found in card_divs if classes <= found), None)
+                    for classes in self.META_CLASS_SETS
+                )
+            else:
+                title_anchor = card.select_one(self.TITLE_SELECTOR)
+                meta_blocks = tuple(
+                    self._find_card_block(card, "div", classes)
+                    for classes in self.META_CLASS_SETS
                 )
+            fields = self._build_card_fields(
+                card.get("id", ""),
+                self._normalize_text(title_anchor),
+                title_anchor is not None,
+                self._normalize_text(card.find("p", class_=self.PRICE_CLASS)),
+                tuple(self._normalize_text(block) for block in meta_blocks),
             )
-        return products
+            if fields is not None:
+                card_fields.append(fields)
+        return card_fields
+
+    @staticmethod
+    def _find_title_anchor(card: Tag) -> Tag | None:
+        # TITLE_SELECTOR("h3 a[href]")와 동일: h3 조상을 가진 첫 번째 a[href]
+        for anchor in card.find_all("a", href=True):
+            if anchor.find_parent("h3") is not None:
+                return anchor
+        return None
 
     @staticmethod
     def _normalize_text(node: Tag | None) -> str | None:
@@ -94,3 +175,165 @@ class AlgumonCrawler(BaseCrawler):
             if required_classes.issubset(classes):
                 return node
         return None
+
+    # --- lxml (선택 설치) ---
+
+    def _extract_with_lxml(self, html: str) -> list[_DealCardFields] | None:
+        from lxml import html as lxml_html
+
+        if not html.strip():
+            return None
+        root = lxml_html.document_fromstring(html)
+        deal_cards = [
+            node for node in root.iter("div") if self._is_deal_card_id(node.get("id"))
+        ]
+        if not deal_cards:
+            return None
+
+        card_fields: list[_DealCardFields] = []
+        for card in deal_cards:
+            title_anchor = self._lxml_title_anchor(card)
+            price_node = next(
+                (
+                    node
+                    for node in card.iterdescendants("p")
+                    if self.PRICE_CLASS in (node.get("class") or "").split()
+                ),
+                None,
+            )
+            card_divs = [
+                (node, frozenset((node.get("class") or "").split()))
+                for node in card.iterdescendants("div")
+            ]
+            fields = self._build_card_fields(
+                card.get("id", ""),
+                self._lxml_text(title_anchor),
+                title_anchor is not None,
+                self._lxml_text(price_node),
+                tuple(
+                    self._lxml_text(
+                        next(
+                            (node for node, found in card_divs if classes <= found),
+                            None,
+                        )
+                    )
+                    for classes in self.META_CLASS_SETS
+                ),
+            )
+            if fields is not None:
+                card_fields.append(fields)
+        return card_fields
+
+    @staticmethod
+    def _lxml_title_anchor(card: Any) -> Any | None:
+        for anchor in card.iterdescendants("a"):
+            if anchor.get("href") is None:
+                continue
+            if any(ancestor.tag == "h3" for ancestor in anchor.iterancestors()):
+                return anchor
+        return None
+
+    @classmethod
+    def _lxml_text(cls, node: Any | None) -> str | None:
+        if node is None:
+            return None
+        pieces: list[str] = []
+        cls._collect_lxml_strings(node, pieces)
+        text = " ".join(" ".join(pieces).split())
+        return text or None
+
+    @classmethod
+    def _collect_lxml_strings(cls, node: Any, pieces: list[str]) -> None:
+        # 주석/처리지시문(tag가 문자열이 아님)과 스크립트류 태그의 본문은 제외하고 tail만 포함
+        if isinstance(node.tag, str) and node.tag not in NON_TEXT_TAGS and node.text:
+            pieces.append(node.text)
+        if isinstance(node.tag, str) and node.tag in NON_TEXT_TAGS:
+            return
+        for child in node:
+            cls._collect_lxml_strings(child, pieces)
+            if child.tail:
+                pieces.append(child.tail)
+
+    # --- selectolax (선택 설치) ---
+
+    def _extract_with_selectolax(self, html: str) -> list[_DealCardFields] | None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+        deal_cards = [
+            node
+            for node in tree.css("div[id]")
+            if self._is_deal_card_id(node.attributes.get("id"))
+        ]
+        if not deal_cards:
+            return None
+
+        card_fields: list[_DealCardFields] = []
+        for card in deal_cards:
+            title_anchor = card.css_first(self.TITLE_SELECTOR)
+            # css()는 자기 자신도 포함하므로 하위 노드만 남긴다.
+            card_divs = [
+                (node, frozenset((node.attributes.get("class") or "").split()))
+                for node in card.css("div")
+                if node.mem_id != card.mem_id
+            ]
+            fields = self._build_card_fields(
+                card.attributes.get("id") or "",
+                self._selectolax_text(title_anchor),
+                title_anchor is not None,
+                self._selectolax_text(card.css_first(f"p.{self.PRICE_CLASS}")),
+                tuple(
+                    self._selectolax_text(
+                        next(
+                            (node for node, found in card_divs if classes <= found),
+                            None,
+                        )
+                    )
+                    for classes in self.META_CLASS_SETS
+                ),
+            )
+            if fields is not None:
+                card_fields.append(fields)
+        return card_fields
+
+    @classmethod
+    def _selectolax_text(cls, node: Any | None) -> str | None:
+        if node is None:
+            return None
+        pieces: list[str] = []
+        cls._collect_selectolax_strings(node, pieces)
+        text = " ".join(" ".join(pieces).split())
+        return text or None
+
+    @classmethod
+    def _collect_selectolax_strings(cls, node: Any, pieces: list[str]) -> None:
+        for child in node.iter(include_text=True):
+            if child.tag == "-text":
+                if child.text_content:
+                    pieces.append(child.text_content)
+            elif not child.tag.startswith("-") and child.tag not in NON_TEXT_TAGS:
+                cls._collect_selectolax_strings(child, pieces)
+
+
+class AlgumonFeedCrawler(AlgumonCrawler):
+    """키워드 없이 사이트 전체 최신 핫딜 목록을 페이지 단위로 가져오는 크롤러."""
+
+    FEED_KEYWORD = "*"
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        page: int = 1,
+        parser_engine: str | ParserEngine | None = None,
+    ):
+        super().__init__(
+            keyword=self.FEED_KEYWORD, client=client, parser_engine=parser_engine
+        )
+        self.page = max(1, page)
+
+    @property
+    def url(self) -> str:
+        if self.page == 1:
+            return self.SEARCH_URL_BASE
+        query = urlencode({"page": self.page})
+        return f"{self.SEARCH_URL_BASE}?{query}"
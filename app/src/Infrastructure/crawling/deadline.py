@@ -0,0 +1,122 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+
+
+@dataclass(slots=True)
+class DeadlineStats:
+    """실행 단위 마감 시각으로 건너뛰거나 줄인 작업 통계."""
+
+    shed_keywords: int = 0
+    shed_sites: int = 0
+    shed_retries: int = 0
+    shortened_timeouts: int = 0
+
+    def reset(self) -> None:
+        self.shed_keywords = 0
+        self.shed_sites = 0
+        self.shed_retries = 0
+        self.shortened_timeouts = 0
+
+    def log_metrics(self, label: str) -> None:
+        remaining = remaining_seconds()
+        logger.info(
+            "[METRIC] crawl_deadline label=%s remaining_seconds=%s shed_keywords=%s "
+            "shed_sites=%s shed_retries=%s shortened_timeouts=%s",
+            label,
+            None if remaining is None else round(remaining, 1),
+            self.shed_keywords,
+            self.shed_sites,
+            self.shed_retries,
+            self.shortened_timeouts,
+        )
+
+
+DEADLINE_STATS = DeadlineStats()
+
+
+class Deadline:
+    """monotonic 기준 마감 시각. 현재 컨텍스트(와 그 안에서 만든 태스크)에 전파됩니다."""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(cls._now() + max(0.0, seconds))
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._now())
+
+
+_CURRENT_DEADLINE: ContextVar[Deadline | None] = ContextVar("crawl_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """
+    지금부터 seconds 뒤를 마감으로 설정합니다. 바깥 마감이 더 이르면 바깥 마감을 따릅니다.
+    """
+    deadline = Deadline.after(seconds)
+    outer = _CURRENT_DEADLINE.get()
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _CURRENT_DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _CURRENT_DEADLINE.reset(token)
+
+
+@contextmanager
+def reserve_scope(reserve_seconds: float) -> Iterator[Deadline | None]:
+    """
+    바깥 마감보다 reserve_seconds 앞당긴 마감을 설정합니다. (예: 메일 발송 시간 확보)
+    바깥 마감이 없으면 아무것도 바꾸지 않습니다.
+    """
+    outer = _CURRENT_DEADLINE.get()
+    if outer is None:
+        yield None
+        return
+    deadline = Deadline(outer.expires_at - max(0.0, reserve_seconds))
+    token = _CURRENT_DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _CURRENT_DEADLINE.reset(token)
+
+
+def current_deadline() -> Deadline | None:
+    if not settings.CRAWL_DEADLINE_PROPAGATION_ENABLED:
+        return None
+    return _CURRENT_DEADLINE.get()
+
+
+def remaining_seconds() -> float | None:
+    """남은 시간(초). 마감이 없으면 None."""
+    deadline = current_deadline()
+    return deadline.remaining() if deadline is not None else None
+
+
+def bound_timeout(seconds: float) -> float:
+    """seconds와 남은 시간 중 짧은 값을 반환합니다."""
+    remaining = remaining_seconds()
+    if remaining is None or remaining >= seconds:
+        return seconds
+    DEADLINE_STATS.shortened_timeouts += 1
+    return remaining
+
+
+def has_time_for(seconds: float) -> bool:
+    """마감까지 seconds 이상 남았으면 True. 마감이 없으면 항상 True."""
+    remaining = remaining_seconds()
+    return remaining is None or remaining >= seconds
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.src.core.logger import logger
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.crawlers import get_feed_crawler
+
+
+@dataclass(slots=True)
+class FeedCollectResult:
+    deals: list[CrawledKeyword] = field(default_factory=list)
+    pages_fetched: int = 0
+    reached_last_seen: bool = False
+    failed: bool = False
+
+
+def _to_deal_number(deal_id: str | None) -> int | None:
+    if deal_id is None:
+        return None
+    try:
+        return int(deal_id)
+    except ValueError:
+        return None
+
+
+async def collect_feed_deals(
+    site: SiteName,
+    client: httpx.AsyncClient,
+    *,
+    last_seen_id: str | None,
+    max_pages: int,
+) -> FeedCollectResult:
+    """
+    사이트 전체 최신 핫딜 목록을 1페이지부터 넘기며 마지막으로 확인한 딜 ID까지 수집합니다.
+    결과는 최신순이며, 페이지를 넘기는 사이 목록이 밀려 중복된 딜은 한 번만 포함합니다.
+    """
+    result = FeedCollectResult()
+    seen_ids: set[str] = set()
+    last_seen_number = _to_deal_number(last_seen_id)
+
+    for page in range(1, max(1, max_pages) + 1):
+        crawler = get_feed_crawler(site, client, page=page)
+        page_deals = await crawler.fetchparse()
+        if not page_deals:
+            # 첫 페이지부터 비어 있으면 차단/장애로 보고 이번 실행은 건너뛴다.
+            result.failed = page == 1
+            break
+        result.pages_fetched += 1
+
+        for deal in page_deals:
+            deal_number = _to_deal_number(deal.id)
+            if deal.id == last_seen_id or (
+                last_seen_number is not None
+                and deal_number is not None
+                and deal_number <= last_seen_number
+            ):
+                result.reached_last_seen = True
+                return result
+            if deal.id in seen_ids:
+                continue
+            seen_ids.add(deal.id)
+            result.deals.append(deal)
+
+    if last_seen_id is not None and not result.failed:
+        logger.warning(
+            "%s 피드에서 마지막 확인 딜(%s)까지 도달하지 못했습니다. (pages=%s)",
+            site.value,
+            last_seen_id,
+            result.pages_fetched,
+        )
+    return result
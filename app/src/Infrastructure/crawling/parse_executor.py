@@ -0,0 +1,70 @@
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+
+# none: 이벤트 루프에서 바로 파싱, thread: 스레드 풀, process: 프로세스 풀
+PARSE_EXECUTOR_KINDS = frozenset({"none", "thread", "process"})
+
+_executor: Executor | None = None
+_executor_kind: str = "none"
+
+
+def get_parse_executor_kind() -> str:
+    kind = (settings.CRAWL_PARSE_EXECUTOR or "none").strip().lower()
+    if kind not in PARSE_EXECUTOR_KINDS:
+        logger.warning("알 수 없는 파싱 실행기 설정 '%s'. 이벤트 루프에서 파싱합니다.", kind)
+        return "none"
+    return kind
+
+
+def get_parse_executor() -> Executor | None:
+    """설정에 맞는 파싱 실행기를 지연 생성해 재사용합니다. 비활성화면 None."""
+    global _executor, _executor_kind
+
+    kind = get_parse_executor_kind()
+    if kind == "none":
+        return None
+    if _executor is not None and _executor_kind == kind:
+        return _executor
+
+    shutdown_parse_executor()
+    max_workers = max(1, settings.CRAWL_PARSE_EXECUTOR_MAX_WORKERS)
+    if kind == "process":
+        # 이벤트 루프/스레드를 가진 프로세스를 fork하지 않도록 spawn 사용
+        _executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    else:
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="crawl-parse",
+        )
+    _executor_kind = kind
+    logger.info("파싱 실행기 시작: kind=%s max_workers=%s", kind, max_workers)
+    return _executor
+
+
+async def run_parse(func: Callable[..., Any], *args: Any) -> Any:
+    """실행기가 설정되어 있으면 실행기에서, 아니면 현재 루프에서 바로 실행합니다."""
+    executor = get_parse_executor()
+    if executor is None:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+def shutdown_parse_executor() -> None:
+    global _executor, _executor_kind
+
+    if _executor is None:
+        return
+    executor = _executor
+    _executor = None
+    _executor_kind = "none"
+    executor.shutdown(wait=True, cancel_futures=True)
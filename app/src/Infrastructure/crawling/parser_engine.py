@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+from enum import StrEnum
+from functools import cache
+from importlib.util import find_spec
+
+from app.src.core.logger import logger
+
+
+class ParserEngine(StrEnum):
+    AUTO = "auto"
+    BS4 = "bs4"
+    BS4_STRAINER = "bs4_strainer"
+    LXML = "lxml"
+    SELECTOLAX = "selectolax"
+
+
+# 선택 설치 패키지가 필요한 엔진 (설치되지 않으면 다음 엔진으로 대체)
+OPTIONAL_ENGINE_MODULES: dict[ParserEngine, str] = {
+    ParserEngine.LXML: "lxml",
+    ParserEngine.SELECTOLAX: "selectolax",
+}
+
+# auto를 명시적으로 선택했을 때의 우선순위 (빠른 순)
+# bs4_strainer는 카드 외 마크업이 많은 페이지에서만 이득이 있어 명시적으로 선택할 때만 사용한다.
+AUTO_ENGINE_PREFERENCE: tuple[ParserEngine, ...] = (
+    ParserEngine.SELECTOLAX,
+    ParserEngine.LXML,
+    ParserEngine.BS4,
+    ParserEngine.BS4_STRAINER,
+)
+
+_warned_fallbacks: set[tuple[str, ParserEngine]] = set()
+
+
+@cache
+def is_parser_engine_available(engine: ParserEngine) -> bool:
+    module_name = OPTIONAL_ENGINE_MODULES.get(engine)
+    if module_name is None:
+        return True
+    return find_spec(module_name) is not None
+
+
+def resolve_parser_engine(
+    requested: str | ParserEngine | None,
+    supported: Iterable[ParserEngine],
+) -> ParserEngine:
+    """
+    요청한 엔진이 지원/설치되어 있으면 그대로, 아니면 기본 엔진(bs4)으로 대체합니다.
+    auto를 요청한 경우에만 설치된 선택 엔진 중 가장 빠른 것을 고릅니다.
+    """
+    supported_engines = tuple(supported)
+    default_engine = (
+        ParserEngine.BS4
+        if ParserEngine.BS4 in supported_engines or not supported_engines
+        else supported_engines[0]
+    )
+    try:
+        engine = ParserEngine(requested or default_engine)
+    except ValueError:
+        _warn_fallback(str(requested), default_engine)
+        return default_engine
+
+    if engine != ParserEngine.AUTO:
+        if engine in supported_engines and is_parser_engine_available(engine):
+            return engine
+        _warn_fallback(engine.value, default_engine)
+        return default_engine
+
+    for candidate in AUTO_ENGINE_PREFERENCE:
+        if candidate in supported_engines and is_parser_engine_available(candidate):
+            return candidate
+    return supported_engines[0] if supported_engines else ParserEngine.BS4
+
+
+def _warn_fallback(requested: str, fallback: ParserEngine) -> None:
+    key = (requested, fallback)
+    if key in _warned_fallbacks:
+        return
+    _warned_fallbacks.add(key)
+    logger.warning(
+        "파서 엔진 '%s'을(를) 사용할 수 없어 '%s'(으)로 대체합니다.",
+        requested,
+        fallback.value,
+    )
@@ -0,0 +1,167 @@
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+
+
+@dataclass(slots=True, eq=False)
+class _PooledClient:
+    proxy_url: str
+    client: httpx.AsyncClient
+    in_use: int = 0
+    retired: bool = False
+    # 이 클라이언트가 본 연결 스트림. 약한 참조라 닫힌 연결은 자동으로 빠진다.
+    streams: weakref.WeakSet = field(default_factory=weakref.WeakSet)
+
+
+class ProxyClientPool:
+    """
+    프록시 URL 단위로 httpx.AsyncClient를 재사용하는 풀.
+    같은 프록시로 보내는 요청은 keep-alive 연결을 공유해 TCP/TLS 연결 비용을 줄이고,
+    최대 크기를 넘으면 오래 사용하지 않은 클라이언트부터 닫습니다(LRU).
+    사용 중인 클라이언트는 제거되더라도 마지막 요청이 끝난 뒤에 닫힙니다.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max(1, max_size)
+        self._clients: OrderedDict[str, _PooledClient] = OrderedDict()
+        self._retired: list[_PooledClient] = []
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        self.discarded = 0
+        self.connection_requests = 0
+        self.connection_reuses = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, proxy_url: str) -> bool:
+        return proxy_url in self._clients
+
+    @asynccontextmanager
+    async def lease(self, proxy_url: str) -> AsyncIterator[httpx.AsyncClient]:
+        await self._close_retired()
+        entry = self._acquire(proxy_url)
+        entry.in_use += 1
+        try:
+            yield entry.client
+        finally:
+            entry.in_use -= 1
+            if entry.retired and entry.in_use == 0:
+                await self._close_entry(entry)
+
+    def _acquire(self, proxy_url: str) -> _PooledClient:
+        entry = self._clients.get(proxy_url)
+        if entry is not None:
+            self._clients.move_to_end(proxy_url)
+            self.reused += 1
+            return entry
+
+        entry = _PooledClient(
+            proxy_url=proxy_url,
+            client=httpx.AsyncClient(proxy=proxy_url),
+        )
+        self._clients[proxy_url] = entry
+        self.created += 1
+        while len(self._clients) > self.max_size:
+            _, oldest = self._clients.popitem(last=False)
+            self.evicted += 1
+            self._retire(oldest)
+        return entry
+
+    def record_response(self, proxy_url: str, response: httpx.Response) -> None:
+        """
+        응답의 network_stream으로 keep-alive 연결 재사용 여부를 집계합니다.
+        스트림은 약한 참조로만 보관하므로 id 재사용으로 잘못 집계되지 않고, 닫힌 연결만큼 늘어나지도 않습니다.
+        """
+        entry = self._clients.get(proxy_url)
+        if entry is None:
+            return
+        stream = response.extensions.get("network_stream")
+        if stream is None:
+            return
+        try:
+            reused = stream in entry.streams
+            if not reused:
+                entry.streams.add(stream)
+        except TypeError:
+            # 약한 참조를 지원하지 않는 스트림은 집계하지 않는다.
+            return
+        self.connection_requests += 1
+        if reused:
+            self.connection_reuses += 1
+
+    def discard(self, proxy_url: str) -> bool:
+        """
+        프록시 하드 밴 등으로 더 이상 쓰지 않을 클라이언트를 풀에서 뺍니다.
+        동기 코드에서도 호출할 수 있도록 실제 종료는 다음 lease 또는 aclose에서 처리합니다.
+        """
+        entry = self._clients.pop(proxy_url, None)
+        if entry is None:
+            return False
+        self.discarded += 1
+        self._retire(entry)
+        return True
+
+    def _retire(self, entry: _PooledClient) -> None:
+        entry.retired = True
+        if entry.in_use == 0:
+            self._retired.append(entry)
+
+    async def _close_retired(self) -> None:
+        while self._retired:
+            entry = self._retired.pop()
+            if entry.in_use == 0:
+                await self._close_entry(entry)
+
+    @staticmethod
+    async def _close_entry(entry: _PooledClient) -> None:
+        try:
+            await entry.client.aclose()
+        except Exception as e:
+            logger.warning(f"프록시 클라이언트 종료 실패: proxy={entry.proxy_url}, error={e}")
+
+    async def aclose(self) -> None:
+        for entry in list(self._clients.values()):
+            self._retire(entry)
+        self._clients.clear()
+        await self._close_retired()
+
+    def get_metrics(self) -> dict[str, float]:
+        acquisitions = self.created + self.reused
+        return {
+            "client_pool_size": len(self._clients),
+            "clients_created": self.created,
+            "clients_evicted": self.evicted,
+            "clients_discarded": self.discarded,
+            "client_reuse_ratio": self.reused / acquisitions if acquisitions else 0.0,
+            "connection_reuse_ratio": (
+                self.connection_reuses / self.connection_requests
+                if self.connection_requests
+                else 0.0
+            ),
+        }
+
+    def reset_counters(self) -> None:
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        self.discarded = 0
+        self.connection_requests = 0
+        self.connection_reuses = 0
+
+    def clear(self) -> None:
+        """클라이언트를 닫지 않고 풀을 비웁니다(테스트 격리용)."""
+        self._clients.clear()
+        self._retired.clear()
+        self.reset_counters()
+
+
+PROXY_CLIENT_POOL = ProxyClientPool(settings.PROXY_CLIENT_POOL_MAX_SIZE)
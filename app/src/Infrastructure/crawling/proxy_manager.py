@@ -1,15 +1,25 @@
-from collections import Counter, deque
+import asyncio
+import heapq
+import random
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from ipaddress import ip_address
+from typing import Any
 from urllib.parse import urlparse
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
 
 from app.src.core.config import settings
 from app.src.core.logger import logger
+from app.src.Infrastructure.crawling.proxy_client_pool import PROXY_CLIENT_POOL
+from app.src.Infrastructure.crawling.proxy_sources import (
+    PROXY_SOURCE_REGISTRY,
+    ProxySource,
+    resolve_proxy_sources,
+)
 
 
 class ProxyFailureType(str, Enum):
@@ -28,12 +38,33 @@ class ProxyState:
     last_failed_at: datetime | None = None
     soft_ban_until: datetime | None = None
     is_hard_banned: bool = False
+    # 성공률/지연시간 EWMA (관측 전에는 None)
+    success_ewma: float | None = None
+    latency_ewma: float | None = None
+    last_observed_at: datetime | None = None
+    # 이 프록시를 가장 최근에 제공한 소스 이름
+    source: str | None = None
+
+
+# round_robin: deque 순환, p2c: 무작위 두 후보 중 EWMA 점수가 높은 프록시 선택
+PROXY_SELECTION_STRATEGIES = frozenset({"round_robin", "p2c"})
+# 관측이 없거나 오래된 프록시의 점수가 수렴하는 기본 성공률
+PROXY_SCORE_SUCCESS_PRIOR = 0.7
+PROXY_SNAPSHOT_VERSION = 1
+# 헬스체크 이력이 없는 소스의 수율(건강한 후보 비율) 기본값
+PROXY_SOURCE_YIELD_PRIOR = 0.5
 
 
 @dataclass(slots=True)
 class ProxySourceState:
     consecutive_failures: int = 0
     cooldown_until: datetime | None = None
+    fetch_count: int = 0
+    candidate_count: int = 0
+    checked_count: int = 0
+    healthy_count: int = 0
+    # 수집 회차별 healthy/checked 비율의 EWMA (헬스체크 전에는 None)
+    yield_ewma: float | None = None
 
 
 class ProxyManager:
@@ -47,20 +78,36 @@ class ProxyManager:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, proxy_url="https://www.sslproxies.org/"):
+    def __init__(self, sources: list[ProxySource] | None = None):
         if ProxyManager._initialized:
             return
-        self.proxy_url = proxy_url
-        self.proxies: deque[str] = deque()
-        self._proxy_set: set[str] = set()
+        self.sources = sources or resolve_proxy_sources(settings.PROXY_SOURCES) or [
+            PROXY_SOURCE_REGISTRY["sslproxies"]
+        ]
+        # 순환 순서를 유지하는 프록시 큐 (O(1) 회전/제거)
+        self._proxy_queue: OrderedDict[str, None] = OrderedDict()
+        # 풀에 있고 밴 기록이 없는 프록시 (O(1) 추가/제거/무작위 추출)
+        self._active_proxies: list[str] = []
+        self._active_positions: dict[str, int] = {}
+        # (soft_ban_until, proxy_url) 최소 힙. 밴이 갱신/해제되면 오래된 항목은 꺼낼 때 무시
+        self._soft_ban_heap: list[tuple[datetime, str]] = []
+        self._soft_banned: set[str] = set()
+        self._hard_banned_count = 0
+        # 배치와 백그라운드 보강이 동시에 소스를 수집하지 않도록 직렬화
+        self._replenish_lock = asyncio.Lock()
         self._proxy_states: dict[str, ProxyState] = {}
         self._failure_type_counts: Counter[ProxyFailureType] = Counter()
         self._batch_failure_type_counts: Counter[ProxyFailureType] = Counter()
         self._source_states: dict[str, ProxySourceState] = {
-            self.proxy_url: ProxySourceState()
+            source.name: ProxySourceState() for source in self.sources
         }
         ProxyManager._initialized = True
 
+    @property
+    def proxies(self) -> deque[str]:
+        """현재 순환 순서의 프록시 목록 (스냅샷)."""
+        return deque(self._proxy_queue)
+
     @staticmethod
     def _now() -> datetime:
         return datetime.now(UTC)
@@ -94,17 +141,15 @@ class ProxyManager:
             self._proxy_states[proxy_url] = state
         return state
 
-    def _get_source_state(self) -> ProxySourceState:
-        if self.proxy_url not in self._source_states:
-            self._source_states[self.proxy_url] = ProxySourceState()
-        return self._source_states[self.proxy_url]
+    def _get_source_state(self, source_name: str) -> ProxySourceState:
+        return self._source_states.setdefault(source_name, ProxySourceState())
 
-    def _is_source_on_cooldown(self) -> bool:
-        state = self._get_source_state()
+    def _is_source_on_cooldown(self, source_name: str) -> bool:
+        state = self._get_source_state(source_name)
         return bool(state.cooldown_until and state.cooldown_until > self._now())
 
-    def _mark_source_failure(self, reason: str) -> None:
-        state = self._get_source_state()
+    def _mark_source_failure(self, source_name: str, reason: str) -> None:
+        state = self._get_source_state(source_name)
         state.consecutive_failures += 1
         threshold = max(1, settings.PROXY_SOURCE_FAILURE_THRESHOLD)
         if state.consecutive_failures >= threshold:
@@ -113,76 +158,63 @@ class ProxyManager:
             state.consecutive_failures = 0
             logger.warning(
                 "프록시 소스 쿨다운 적용: source=%s, reason=%s, cooldown_until=%s",
-                self.proxy_url,
+                source_name,
                 reason,
                 state.cooldown_until.isoformat(),
             )
             return
         logger.warning(
             "프록시 소스 실패 누적: source=%s, reason=%s, consecutive_failures=%s/%s",
-            self.proxy_url,
+            source_name,
             reason,
             state.consecutive_failures,
             threshold,
         )
 
-    def _mark_source_success(self) -> None:
-        state = self._get_source_state()
+    def _mark_source_success(self, source_name: str) -> None:
+        state = self._get_source_state(source_name)
         state.consecutive_failures = 0
         state.cooldown_until = None
 
-    def _extract_proxies_from_html(self, html: bytes) -> list[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table", {"class": "table table-striped table-bordered"})
-        if not table:
-            logger.warning("프록시 테이블을 찾을 수 없습니다.")
-            return []
+    def get_source_priority(self, source_name: str) -> float:
+        state = self._get_source_state(source_name)
+        return PROXY_SOURCE_YIELD_PRIOR if state.yield_ewma is None else state.yield_ewma
 
-        tbody = table.find("tbody")
-        if tbody is None:
-            logger.warning("프록시 테이블 본문을 찾을 수 없습니다.")
-            return []
-
-        rows = tbody.find_all("tr")
-        proxies: list[str] = []
-        seen: set[str] = set()
-        skipped_invalid_rows = 0
-
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) < 2:
-                skipped_invalid_rows += 1
-                continue
-
-            host = cells[0].text.strip()
-            port_text = cells[1].text.strip()
-            if not host or not port_text:
-                skipped_invalid_rows += 1
-                continue
-
-            try:
-                ip_address(host)
-                port = int(port_text)
-            except ValueError:
-                skipped_invalid_rows += 1
+    def _ready_sources(self) -> list[ProxySource]:
+        """쿨다운이 아닌 소스를 수율이 높은 순서로 반환합니다."""
+        ready: list[ProxySource] = []
+        for source in self.sources:
+            if self._is_source_on_cooldown(source.name):
+                self._log_source_on_cooldown(source.name)
                 continue
-
-            if port < 1 or port > 65535:
-                skipped_invalid_rows += 1
-                continue
-
-            proxy_url = f"http://{host}:{port}"
-            if proxy_url in seen:
-                continue
-            seen.add(proxy_url)
-            proxies.append(proxy_url)
-
-        if skipped_invalid_rows > 0:
-            logger.debug(
-                "프록시 테이블 파싱 중 유효하지 않은 행 제외: skipped_invalid_rows=%s",
-                skipped_invalid_rows,
-            )
-        return proxies
+            ready.append(source)
+        ready.sort(key=lambda source: self.get_source_priority(source.name), reverse=True)
+        return ready
+
+    def _parse_source_response(self, source: ProxySource, content: bytes) -> list[str]:
+        candidates = source.parser(content)
+        state = self._get_source_state(source.name)
+        state.fetch_count += 1
+        state.candidate_count += len(candidates)
+        if not candidates:
+            self._mark_source_failure(source.name, "empty_candidates")
+        return candidates
+
+    def _merge_candidates(self, fetched: list[tuple[ProxySource, list[str]]]) -> list[str]:
+        """
+        소스별 후보를 우선순위 순서대로 합치고 중복을 제거합니다.
+        여러 소스가 같은 프록시를 주면 우선순위가 높은 소스를 제공처로 기록합니다.
+        """
+        merged: list[str] = []
+        seen: set[str] = set()
+        for source, candidates in fetched:
+            for proxy_url in candidates:
+                if proxy_url in seen:
+                    continue
+                seen.add(proxy_url)
+                merged.append(proxy_url)
+                self._ensure_proxy_state(proxy_url).source = source.name
+        return merged
 
     @staticmethod
     def _is_public_proxy_endpoint(proxy_url: str) -> bool:
@@ -214,96 +246,353 @@ class ProxyManager:
             logger.debug("프록시 헬스체크 실패: proxy=%s, error=%s", proxy_url, e)
             return False
 
-    def fetch_proxies(self):
-        """무료 프록시를 수집하여 저장."""
-        if self._is_source_on_cooldown():
-            source_state = self._get_source_state()
-            logger.warning(
-                "프록시 소스가 쿨다운 중입니다. source=%s, cooldown_until=%s",
-                self.proxy_url,
-                source_state.cooldown_until.isoformat() if source_state.cooldown_until else None,
-            )
-            return list(self.proxies)
+    async def _is_proxy_healthy_async(self, proxy_url: str) -> bool:
+        if not settings.PROXY_HEALTHCHECK_ENABLED:
+            return True
+        if not self._is_public_proxy_endpoint(proxy_url):
+            logger.warning("비공인/비정상 프록시 엔드포인트 제외: proxy=%s", proxy_url)
+            return False
 
         try:
-            response = requests.get(self.proxy_url, timeout=30)
-            response.raise_for_status()
-            candidates = self._extract_proxies_from_html(response.content)
-            if not candidates:
-                self._mark_source_failure("empty_candidates")
-                return list(self.proxies)
-
-            pool_size_before = len(self._proxy_set)
-            added = 0
-            unhealthy = 0
-            skipped_existing = 0
-            skipped_hard_banned = 0
-            for proxy_url in candidates:
-                state = self._ensure_proxy_state(proxy_url)
-                if state.is_hard_banned:
-                    skipped_hard_banned += 1
-                    continue
-                if proxy_url in self._proxy_set:
-                    skipped_existing += 1
-                    continue
-                if not self._is_proxy_healthy(proxy_url):
-                    unhealthy += 1
-                    self.record_proxy_failure(proxy_url, ProxyFailureType.NETWORK)
-                    continue
-                if self.register_proxy(proxy_url):
-                    added += 1
+            async with httpx.AsyncClient(
+                proxy=proxy_url,
+                timeout=settings.PROXY_HEALTHCHECK_TIMEOUT_SECONDS,
+            ) as client:
+                response = await client.get(settings.PROXY_HEALTHCHECK_URL)
+            return response.status_code < 500
+        except Exception as e:
+            logger.debug("프록시 헬스체크 실패: proxy=%s, error=%s", proxy_url, e)
+            return False
 
-            if added > 0:
-                self._mark_source_success()
-            else:
-                self._mark_source_failure("no_healthy_proxy_added")
+    def _log_source_on_cooldown(self, source_name: str) -> None:
+        source_state = self._get_source_state(source_name)
+        logger.warning(
+            "프록시 소스가 쿨다운 중입니다. source=%s, cooldown_until=%s",
+            source_name,
+            source_state.cooldown_until.isoformat() if source_state.cooldown_until else None,
+        )
+
+    def _partition_candidates(self, candidates: list[str]) -> tuple[list[str], int, int]:
+        """헬스체크 대상과 이미 풀에 있거나 하드 밴된 후보를 나눕니다."""
+        to_check: list[str] = []
+        skipped_existing = 0
+        skipped_hard_banned = 0
+        for proxy_url in candidates:
+            state = self._ensure_proxy_state(proxy_url)
+            if state.is_hard_banned:
+                skipped_hard_banned += 1
+                continue
+            if proxy_url in self._proxy_queue:
+                skipped_existing += 1
+                continue
+            to_check.append(proxy_url)
+        return to_check, skipped_existing, skipped_hard_banned
+
+    def _record_health_result(self, proxy_url: str, healthy: bool) -> bool:
+        """헬스체크 결과를 프록시와 제공 소스에 반영하고, 풀에 추가됐는지 반환합니다."""
+        state = self._ensure_proxy_state(proxy_url)
+        source_state = self._source_states.get(state.source) if state.source else None
+        if source_state is not None:
+            source_state.checked_count += 1
+        if not healthy:
+            self.record_proxy_failure(proxy_url, ProxyFailureType.NETWORK)
+            return False
+        if source_state is not None:
+            source_state.healthy_count += 1
+        return self.register_proxy(proxy_url)
+
+    def _source_check_counts(self) -> dict[str, tuple[int, int]]:
+        return {
+            source_name: (state.checked_count, state.healthy_count)
+            for source_name, state in self._source_states.items()
+        }
 
-            metrics = self.get_metrics()
+    def _finish_source_yields(
+        self,
+        fetched: list[tuple[ProxySource, list[str]]],
+        counts_before: dict[str, tuple[int, int]],
+    ) -> None:
+        """
+        이번 수집에서 소스별로 헬스체크된 후보 중 건강한 비율로 수율 EWMA를 갱신합니다.
+        건강한 후보를 낸 소스는 성공, 검사한 후보가 모두 불량이면 실패로 누적합니다.
+        (후보가 모두 기존/하드 밴이거나 목표 달성으로 검사되지 않았으면 판단을 보류합니다.)
+        """
+        alpha = min(1.0, max(0.0, settings.PROXY_SCORE_EWMA_ALPHA))
+        for source, candidates in fetched:
+            if not candidates:
+                continue
+            state = self._get_source_state(source.name)
+            checked_before, healthy_before = counts_before.get(source.name, (0, 0))
+            checked = state.checked_count - checked_before
+            healthy = state.healthy_count - healthy_before
+            if checked > 0:
+                round_yield = healthy / checked
+                state.yield_ewma = (
+                    round_yield
+                    if state.yield_ewma is None
+                    else alpha * round_yield + (1 - alpha) * state.yield_ewma
+                )
+            if healthy > 0:
+                self._mark_source_success(source.name)
+            elif checked > 0:
+                self._mark_source_failure(source.name, "no_healthy_proxy_added")
             logger.info(
-                "프록시 수집 결과: candidates=%s, added=%s, unhealthy=%s, "
-                "skipped_existing=%s, skipped_hard_banned=%s, pool_size_before=%s, "
-                "pool_size_after=%s, active=%s, soft_banned=%s, hard_banned=%s",
+                "[METRIC] proxy_source source=%s candidates=%s checked=%s healthy=%s "
+                "yield_ewma=%s fetch_count=%s",
+                source.name,
                 len(candidates),
-                added,
-                unhealthy,
-                skipped_existing,
-                skipped_hard_banned,
-                pool_size_before,
-                len(self._proxy_set),
-                metrics["active_proxy_count"],
-                metrics["soft_banned_count"],
-                metrics["hard_banned_count"],
+                checked,
+                healthy,
+                None if state.yield_ewma is None else round(state.yield_ewma, 3),
+                state.fetch_count,
             )
 
+    def _finish_fetch(
+        self,
+        *,
+        candidate_count: int,
+        added: int,
+        unhealthy: int,
+        unchecked: int,
+        skipped_existing: int,
+        skipped_hard_banned: int,
+        pool_size_before: int,
+    ) -> None:
+        metrics = self.get_metrics()
+        logger.info(
+            "프록시 수집 결과: candidates=%s, added=%s, unhealthy=%s, unchecked=%s, "
+            "skipped_existing=%s, skipped_hard_banned=%s, pool_size_before=%s, "
+            "pool_size_after=%s, active=%s, soft_banned=%s, hard_banned=%s",
+            candidate_count,
+            added,
+            unhealthy,
+            unchecked,
+            skipped_existing,
+            skipped_hard_banned,
+            pool_size_before,
+            len(self._proxy_queue),
+            metrics["active_proxy_count"],
+            metrics["soft_banned_count"],
+            metrics["hard_banned_count"],
+        )
+
+    def fetch_proxies(self):
+        """등록된 무료 프록시 소스에서 후보를 수집해 건강한 프록시를 저장."""
+        sources = self._ready_sources()
+        if not sources:
+            return list(self._proxy_queue)
+
+        fetched: list[tuple[ProxySource, list[str]]] = []
+        for source in sources:
+            try:
+                response = requests.get(source.url, timeout=30)
+                response.raise_for_status()
+                fetched.append((source, self._parse_source_response(source, response.content)))
+            except Exception as e:
+                self._mark_source_failure(source.name, str(e))
+                logger.error(f"프록시 가져오기 실패: source={source.name}, error={e}")
+        self._register_fetched_candidates(fetched)
+        return list(self._proxy_queue)
+
+    def _register_fetched_candidates(
+        self, fetched: list[tuple[ProxySource, list[str]]]
+    ) -> None:
+        candidates = self._merge_candidates(fetched)
+        if not candidates:
+            return
+
+        pool_size_before = len(self._proxy_queue)
+        counts_before = self._source_check_counts()
+        to_check, skipped_existing, skipped_hard_banned = self._partition_candidates(
+            candidates
+        )
+        added = 0
+        unhealthy = 0
+        for proxy_url in to_check:
+            healthy = self._is_proxy_healthy(proxy_url)
+            if not healthy:
+                unhealthy += 1
+            if self._record_health_result(proxy_url, healthy):
+                added += 1
+
+        self._finish_source_yields(fetched, counts_before)
+        self._finish_fetch(
+            candidate_count=len(candidates),
+            added=added,
+            unhealthy=unhealthy,
+            unchecked=0,
+            skipped_existing=skipped_existing,
+            skipped_hard_banned=skipped_hard_banned,
+            pool_size_before=pool_size_before,
+        )
+
+    async def _fetch_source_candidates_async(
+        self, client: httpx.AsyncClient, source: ProxySource
+    ) -> list[str]:
+        try:
+            response = await client.get(source.url)
+            response.raise_for_status()
+            return self._parse_source_response(source, response.content)
         except Exception as e:
-            self._mark_source_failure(str(e))
-            logger.error(f"프록시 가져오기 실패: {e}")
-        return list(self.proxies)
+            self._mark_source_failure(source.name, str(e))
+            logger.error(f"프록시 가져오기 실패: source={source.name}, error={e}")
+            return []
+
+    async def fetch_proxies_async(self, target: int | None = None) -> list[str]:
+        """
+        fetch_proxies의 비동기 버전. 쿨다운이 아닌 소스 페이지를 동시에 받아 하나의 후보 목록으로
+        합치고(수율이 높은 소스 우선), 후보 헬스체크를 PROXY_HEALTHCHECK_CONCURRENCY 만큼
+        동시에 수행합니다. target이 주어지면 그 수만큼 건강한 프록시를 추가한 즉시
+        남은 헬스체크를 취소하므로, 수율이 낮은 소스의 후보는 뒤로 밀려 검사되지 않을 수 있습니다.
+        """
+        sources = self._ready_sources()
+        if not sources:
+            return list(self._proxy_queue)
+
+        async with httpx.AsyncClient(timeout=30) as client:
+            results = await asyncio.gather(
+                *(self._fetch_source_candidates_async(client, source) for source in sources)
+            )
+        fetched = list(zip(sources, results, strict=True))
+        candidates = self._merge_candidates(fetched)
+        if not candidates:
+            return list(self._proxy_queue)
+
+        pool_size_before = len(self._proxy_queue)
+        counts_before = self._source_check_counts()
+        to_check, skipped_existing, skipped_hard_banned = self._partition_candidates(
+            candidates
+        )
+        added, unhealthy, unchecked = await self._register_healthy_proxies(to_check, target)
+        self._finish_source_yields(fetched, counts_before)
+        self._finish_fetch(
+            candidate_count=len(candidates),
+            added=added,
+            unhealthy=unhealthy,
+            unchecked=unchecked,
+            skipped_existing=skipped_existing,
+            skipped_hard_banned=skipped_hard_banned,
+            pool_size_before=pool_size_before,
+        )
+        return list(self._proxy_queue)
+
+    async def _register_healthy_proxies(
+        self,
+        proxy_urls: list[str],
+        target: int | None,
+    ) -> tuple[int, int, int]:
+        semaphore = asyncio.Semaphore(max(1, settings.PROXY_HEALTHCHECK_CONCURRENCY))
+
+        async def check(proxy_url: str) -> tuple[str, bool]:
+            async with semaphore:
+                return proxy_url, await self._is_proxy_healthy_async(proxy_url)
+
+        tasks = [asyncio.create_task(check(proxy_url)) for proxy_url in proxy_urls]
+        added = 0
+        unhealthy = 0
+        checked = 0
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                proxy_url, healthy = await next_result
+                checked += 1
+                if not healthy:
+                    unhealthy += 1
+                if self._record_health_result(proxy_url, healthy):
+                    added += 1
+                if target is not None and added >= target:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return added, unhealthy, len(proxy_urls) - checked
 
     def reset_proxies(self, clear_history: bool = False):
         """프록시 큐를 초기화합니다. clear_history=True일 때만 실패 이력도 초기화합니다."""
-        self.proxies.clear()
-        self._proxy_set.clear()
+        self._proxy_queue.clear()
+        self._active_proxies.clear()
+        self._active_positions.clear()
         if clear_history:
             self._proxy_states.clear()
+            self._soft_ban_heap.clear()
+            self._soft_banned.clear()
+            self._hard_banned_count = 0
             self._failure_type_counts.clear()
             self._batch_failure_type_counts.clear()
-            self._source_states.clear()
-            self._source_states[self.proxy_url] = ProxySourceState()
+            self._source_states = {source.name: ProxySourceState() for source in self.sources}
         logger.info("프록시 리스트 초기화 완료 (clear_history=%s)", clear_history)
 
     def start_batch(self) -> None:
         self._batch_failure_type_counts.clear()
+        PROXY_CLIENT_POOL.reset_counters()
+
+    def _activate(self, proxy_url: str) -> None:
+        if proxy_url in self._active_positions:
+            return
+        self._active_positions[proxy_url] = len(self._active_proxies)
+        self._active_proxies.append(proxy_url)
+
+    def _deactivate(self, proxy_url: str) -> None:
+        position = self._active_positions.pop(proxy_url, None)
+        if position is None:
+            return
+        last = self._active_proxies.pop()
+        if last != proxy_url:
+            self._active_proxies[position] = last
+            self._active_positions[last] = position
+
+    def _set_soft_ban(self, proxy_url: str, state: ProxyState, until: datetime) -> None:
+        state.soft_ban_until = until
+        self._soft_banned.add(proxy_url)
+        heapq.heappush(self._soft_ban_heap, (until, proxy_url))
+        self._deactivate(proxy_url)
+
+    def _clear_soft_ban(self, proxy_url: str, state: ProxyState) -> None:
+        state.soft_ban_until = None
+        self._soft_banned.discard(proxy_url)
+        if proxy_url in self._proxy_queue and not state.is_hard_banned:
+            self._activate(proxy_url)
 
     def _release_expired_soft_bans(self, *, now: datetime | None = None) -> int:
         current = now or self._now()
         released = 0
-        for state in self._proxy_states.values():
-            if state.soft_ban_until and state.soft_ban_until <= current:
-                state.soft_ban_until = None
+        heap = self._soft_ban_heap
+        while heap and heap[0][0] <= current:
+            _, proxy_url = heapq.heappop(heap)
+            state = self._proxy_states.get(proxy_url)
+            if state is None or state.soft_ban_until is None:
+                continue
+            if state.soft_ban_until <= current:
+                self._clear_soft_ban(proxy_url, state)
                 released += 1
         return released
 
+    def _find_expired_soft_bans(self, now: datetime) -> list[str]:
+        """힙을 변경하지 않고 만료됐지만 아직 해제되지 않은 소프트 밴을 찾습니다."""
+        heap = self._soft_ban_heap
+        expired: list[str] = []
+        seen: set[str] = set()
+        stack = [0] if heap else []
+        while stack:
+            index = stack.pop()
+            until, proxy_url = heap[index]
+            if until > now:
+                continue
+            state = self._proxy_states.get(proxy_url)
+            if (
+                proxy_url not in seen
+                and proxy_url in self._soft_banned
+                and state is not None
+                and state.soft_ban_until is not None
+                and state.soft_ban_until <= now
+            ):
+                seen.add(proxy_url)
+                expired.append(proxy_url)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    stack.append(child)
+        return expired
+
     def _has_active_soft_ban(
         self,
         state: ProxyState,
@@ -315,24 +604,100 @@ class ProxyManager:
         current = now or self._now()
         return state.soft_ban_until > current
 
+    @staticmethod
+    def get_selection_strategy() -> str:
+        strategy = (settings.PROXY_SELECTION_STRATEGY or "round_robin").strip().lower()
+        if strategy not in PROXY_SELECTION_STRATEGIES:
+            logger.warning("알 수 없는 프록시 선택 전략 '%s'. round_robin을 사용합니다.", strategy)
+            return "round_robin"
+        return strategy
+
+    def get_proxy_score(self, state: ProxyState, *, now: datetime | None = None) -> float:
+        """
+        성공률 EWMA를 지연시간으로 나눈 점수. 마지막 관측 이후 시간이 지날수록
+        (PROXY_SCORE_RECENCY_HALF_LIFE_SECONDS 반감기) 사전값으로 되돌아가
+        오래전에 실패한 프록시도 다시 선택될 기회를 얻습니다.
+        """
+        reference_latency = max(0.001, settings.PROXY_SCORE_LATENCY_REFERENCE_SECONDS)
+        success = PROXY_SCORE_SUCCESS_PRIOR
+        latency = reference_latency
+        if state.last_observed_at is not None:
+            current = now or self._now()
+            age_seconds = max(0.0, (current - state.last_observed_at).total_seconds())
+            half_life = max(1.0, settings.PROXY_SCORE_RECENCY_HALF_LIFE_SECONDS)
+            weight = 0.5 ** (age_seconds / half_life)
+            if state.success_ewma is not None:
+                success += (state.success_ewma - success) * weight
+            if state.latency_ewma is not None:
+                latency += (state.latency_ewma - latency) * weight
+        return success / (1.0 + latency / reference_latency)
+
+    def _observe(
+        self,
+        state: ProxyState,
+        *,
+        success: bool,
+        latency_seconds: float | None,
+        observed_at: datetime,
+    ) -> None:
+        alpha = min(1.0, max(0.01, settings.PROXY_SCORE_EWMA_ALPHA))
+        outcome = 1.0 if success else 0.0
+        if state.success_ewma is None:
+            state.success_ewma = outcome
+        else:
+            state.success_ewma = alpha * outcome + (1 - alpha) * state.success_ewma
+        if latency_seconds is not None:
+            if state.latency_ewma is None:
+                state.latency_ewma = latency_seconds
+            else:
+                state.latency_ewma = alpha * latency_seconds + (1 - alpha) * state.latency_ewma
+        state.last_observed_at = observed_at
+
+    def _select_power_of_two(self) -> str | None:
+        """
+        밴되지 않은 프록시 중 PROXY_SELECTION_CHOICES개(기본 2개)를 무작위로 뽑아
+        점수가 가장 높은 프록시를 고릅니다.
+        """
+        choices = max(1, settings.PROXY_SELECTION_CHOICES)
+        now = self._now()
+        best_proxy: str | None = None
+        best_score = -1.0
+        candidates = self._active_proxies
+        for proxy in random.sample(candidates, min(choices, len(candidates))):
+            state = self._ensure_proxy_state(proxy)
+            if state.is_hard_banned or self._has_active_soft_ban(state, now=now):
+                continue
+            score = self.get_proxy_score(state, now=now)
+            if score > best_score:
+                best_proxy, best_score = proxy, score
+        return best_proxy
+
     def get_next_proxy(self) -> str | None:
         """다음 사용 가능한 프록시를 반환합니다."""
-        if not self.proxies:
+        if not self._proxy_queue:
             logger.warning("사용 가능한 프록시가 없습니다.")
             return None
 
         self._release_expired_soft_bans()
-        for _ in range(len(self.proxies)):
-            proxy = self.proxies.popleft()
+        if self.get_selection_strategy() == "p2c":
+            proxy = self._select_power_of_two()
+            if proxy is not None:
+                return proxy
+            # 후보가 모두 밴 상태면 순환 탐색으로 사용 가능한 프록시를 찾는다.
+
+        for _ in range(len(self._proxy_queue)):
+            proxy = next(iter(self._proxy_queue))
             state = self._ensure_proxy_state(proxy)
             if state.is_hard_banned:
-                self._proxy_set.discard(proxy)
+                self._remove_from_pool(proxy)
                 logger.debug("하드 밴 프록시 제거: %s", proxy)
                 continue
+            self._proxy_queue.move_to_end(proxy)
             if not self._has_active_soft_ban(state):
-                self.proxies.append(proxy)
+                if state.soft_ban_until is not None:
+                    # 힙에 없는 만료된 밴(외부에서 갱신된 값)은 선택 시점에 해제한다.
+                    self._clear_soft_ban(proxy, state)
                 return proxy
-            self.proxies.append(proxy)
             logger.debug("소프트 밴 프록시 건너뛰기: %s", proxy)
 
         metrics = self.get_metrics()
@@ -345,19 +710,19 @@ class ProxyManager:
         return None
 
     def _remove_from_pool(self, proxy_url: str) -> None:
-        if proxy_url not in self._proxy_set:
+        if self._proxy_queue.pop(proxy_url, False) is False:
             return
-        self._proxy_set.discard(proxy_url)
-        self.proxies = deque(item for item in self.proxies if item != proxy_url)
+        self._deactivate(proxy_url)
 
     def register_proxy(self, proxy_url: str) -> bool:
         state = self._ensure_proxy_state(proxy_url)
         if state.is_hard_banned:
             return False
-        if proxy_url in self._proxy_set:
+        if proxy_url in self._proxy_queue:
             return False
-        self.proxies.append(proxy_url)
-        self._proxy_set.add(proxy_url)
+        self._proxy_queue[proxy_url] = None
+        if state.soft_ban_until is None:
+            self._activate(proxy_url)
         return True
 
     def record_proxy_failure(
@@ -365,9 +730,16 @@ class ProxyManager:
         proxy_url: str,
         failure_type: ProxyFailureType,
         failed_at: datetime | None = None,
+        latency_seconds: float | None = None,
     ) -> ProxyState:
         state = self._ensure_proxy_state(proxy_url)
         timestamp = failed_at or self._now()
+        self._observe(
+            state,
+            success=False,
+            latency_seconds=latency_seconds,
+            observed_at=timestamp,
+        )
 
         state.failure_count += 1
         state.last_failure_type = failure_type
@@ -379,9 +751,13 @@ class ProxyManager:
         hard_threshold = max(soft_threshold, settings.PROXY_HARD_BAN_FAILURE_THRESHOLD)
 
         if state.failure_count >= hard_threshold:
+            if not state.is_hard_banned:
+                self._hard_banned_count += 1
             state.is_hard_banned = True
             state.soft_ban_until = None
+            self._soft_banned.discard(proxy_url)
             self._remove_from_pool(proxy_url)
+            PROXY_CLIENT_POOL.discard(proxy_url)
             logger.warning(
                 "프록시 하드 밴 적용: proxy=%s, failure_count=%s, failure_type=%s",
                 proxy_url,
@@ -392,7 +768,7 @@ class ProxyManager:
 
         if state.failure_count >= soft_threshold:
             ttl_seconds = max(1, settings.PROXY_SOFT_BAN_TTL_SECONDS)
-            state.soft_ban_until = timestamp + timedelta(seconds=ttl_seconds)
+            self._set_soft_ban(proxy_url, state, timestamp + timedelta(seconds=ttl_seconds))
             logger.info(
                 "프록시 소프트 밴 적용: proxy=%s, failure_count=%s, until=%s, failure_type=%s",
                 proxy_url,
@@ -440,11 +816,13 @@ class ProxyManager:
             if state.is_hard_banned:
                 summary["released_hard_bans"] += 1
 
+            if state.is_hard_banned:
+                self._hard_banned_count -= 1
             state.failure_count = 0
             state.last_failure_type = None
             state.last_failed_at = None
-            state.soft_ban_until = None
             state.is_hard_banned = False
+            self._clear_soft_ban(proxy_url, state)
             summary["reset"] += 1
 
             if self.register_proxy(proxy_url):
@@ -466,15 +844,29 @@ class ProxyManager:
         """하위 호환용 메서드. 실패 이력 누적 기반 밴 정책을 적용합니다."""
         return self.record_proxy_failure(proxy_url, failure_type)
 
-    def record_proxy_success(self, proxy_url: str) -> ProxyState:
+    def record_proxy_success(
+        self,
+        proxy_url: str,
+        latency_seconds: float | None = None,
+    ) -> ProxyState:
         state = self._ensure_proxy_state(proxy_url)
         if state.is_hard_banned:
             return state
 
+        self._observe(
+            state,
+            success=True,
+            latency_seconds=latency_seconds,
+            observed_at=self._now(),
+        )
+
         decay = max(1, settings.PROXY_SUCCESS_DECAY)
         state.failure_count = max(0, state.failure_count - decay)
-        if state.failure_count < max(1, settings.PROXY_SOFT_BAN_FAILURE_THRESHOLD):
-            state.soft_ban_until = None
+        if (
+            state.failure_count < max(1, settings.PROXY_SOFT_BAN_FAILURE_THRESHOLD)
+            and state.soft_ban_until is not None
+        ):
+            self._clear_soft_ban(proxy_url, state)
         if state.failure_count == 0:
             state.last_failure_type = None
             state.last_failed_at = None
@@ -492,29 +884,16 @@ class ProxyManager:
         return max(0.0, backoff)
 
     def get_metrics(self) -> dict[str, int]:
-        now = self._now()
-        soft_banned_count = 0
-        hard_banned_count = 0
-        for state in self._proxy_states.values():
-            if state.is_hard_banned:
-                hard_banned_count += 1
-                continue
-            if self._has_active_soft_ban(state, now=now):
-                soft_banned_count += 1
-
-        active_proxy_count = 0
-        for proxy_url in self._proxy_set:
-            state = self._ensure_proxy_state(proxy_url)
-            if state.is_hard_banned:
-                continue
-            if self._has_active_soft_ban(state, now=now):
-                continue
-            active_proxy_count += 1
-
+        """
+        증분 카운터로 계산합니다. 만료됐지만 아직 해제되지 않은 소프트 밴은
+        상태를 바꾸지 않고 힙에서 찾아 활성으로 셉니다.
+        """
+        expired = self._find_expired_soft_bans(self._now())
+        expired_in_pool = sum(1 for proxy_url in expired if proxy_url in self._proxy_queue)
         return {
-            "active_proxy_count": active_proxy_count,
-            "soft_banned_count": soft_banned_count,
-            "hard_banned_count": hard_banned_count,
+            "active_proxy_count": len(self._active_proxies) + expired_in_pool,
+            "soft_banned_count": len(self._soft_banned) - len(expired),
+            "hard_banned_count": self._hard_banned_count,
         }
 
     def get_failure_rates(self, *, batch_only: bool = False) -> dict[str, float]:
@@ -530,16 +909,28 @@ class ProxyManager:
     def log_metrics(self, context: str) -> None:
         metrics = self.get_metrics()
         batch_failure_rates = self.get_failure_rates(batch_only=True)
+        client_metrics = PROXY_CLIENT_POOL.get_metrics()
         logger.info(
             "[METRIC] proxy_pool context=%s active_proxy_count=%s "
-            "soft_banned_count=%s hard_banned_count=%s batch_failure_rates=%s",
+            "soft_banned_count=%s hard_banned_count=%s batch_failure_rates=%s "
+            "client_pool_size=%s clients_created=%s clients_evicted=%s "
+            "clients_discarded=%s client_reuse_ratio=%.3f connection_reuse_ratio=%.3f",
             context,
             metrics["active_proxy_count"],
             metrics["soft_banned_count"],
             metrics["hard_banned_count"],
             batch_failure_rates,
+            client_metrics["client_pool_size"],
+            client_metrics["clients_created"],
+            client_metrics["clients_evicted"],
+            client_metrics["clients_discarded"],
+            client_metrics["client_reuse_ratio"],
+            client_metrics["connection_reuse_ratio"],
         )
 
+    def get_pool_size(self) -> int:
+        return len(self._proxy_queue)
+
     def get_available_proxy_count(self) -> int:
         return self.get_metrics()["active_proxy_count"]
 
@@ -577,5 +968,197 @@ class ProxyManager:
         self.log_metrics("replenish_failed")
         return False
 
+    async def ensure_min_available_proxies_async(
+        self, min_available: int | None = None
+    ) -> bool:
+        """
+        ensure_min_available_proxies의 비동기 버전. 이벤트 루프를 막지 않습니다.
+        다른 보강이 진행 중이면 끝날 때까지 기다린 뒤 다시 확인합니다.
+        """
+        async with self._replenish_lock:
+            return await self._ensure_min_available_proxies_async(min_available)
+
+    async def _ensure_min_available_proxies_async(
+        self, min_available: int | None = None
+    ) -> bool:
+        required = max(1, min_available or settings.MIN_AVAILABLE_PROXIES)
+        available = self.get_available_proxy_count()
+        if available >= required:
+            return True
+
+        logger.warning(
+            "가용 프록시 부족 감지: available=%s, required=%s. 보강 절차를 시작합니다.",
+            available,
+            required,
+        )
+        attempts = max(1, settings.PROXY_REPLENISH_ATTEMPTS)
+        for attempt in range(1, attempts + 1):
+            logger.info("프록시 보강 시도 %s/%s", attempt, attempts)
+            await self.fetch_proxies_async(target=required - available)
+            available = self.get_available_proxy_count()
+            if available >= required:
+                logger.info(
+                    "프록시 보강 성공: available=%s, required=%s",
+                    available,
+                    required,
+                )
+                self.log_metrics("replenish_success")
+                return True
+
+        logger.error(
+            "프록시 보강 실패: available=%s, required=%s, attempts=%s",
+            available,
+            required,
+            attempts,
+        )
+        self.log_metrics("replenish_failed")
+        return False
+
+    def export_snapshot(self) -> dict[str, Any]:
+        """재시작 후 복원할 수 있도록 프록시 평판/풀/소스 상태를 JSON 직렬화 가능한 dict로 만듭니다."""
+        states = []
+        for proxy_url, state in self._proxy_states.items():
+            in_pool = proxy_url in self._proxy_queue
+            if not in_pool and state.failure_count == 0 and state.success_ewma is None:
+                continue
+            states.append(
+                {
+                    "proxy_url": proxy_url,
+                    "in_pool": in_pool,
+                    "failure_count": state.failure_count,
+                    "last_failure_type": (
+                        state.last_failure_type.value if state.last_failure_type else None
+                    ),
+                    "last_failed_at": _isoformat_or_none(state.last_failed_at),
+                    "soft_ban_until": _isoformat_or_none(state.soft_ban_until),
+                    "is_hard_banned": state.is_hard_banned,
+                    "success_ewma": state.success_ewma,
+                    "latency_ewma": state.latency_ewma,
+                    "last_observed_at": _isoformat_or_none(state.last_observed_at),
+                    "source": state.source,
+                }
+            )
+        return {
+            "version": PROXY_SNAPSHOT_VERSION,
+            "saved_at": self._now().isoformat(),
+            "states": states,
+            "sources": {
+                source_name: {
+                    "consecutive_failures": source_state.consecutive_failures,
+                    "cooldown_until": _isoformat_or_none(source_state.cooldown_until),
+                    "fetch_count": source_state.fetch_count,
+                    "candidate_count": source_state.candidate_count,
+                    "checked_count": source_state.checked_count,
+                    "healthy_count": source_state.healthy_count,
+                    "yield_ewma": source_state.yield_ewma,
+                }
+                for source_name, source_state in self._source_states.items()
+            },
+        }
+
+    def restore_snapshot(self, snapshot: dict[str, Any]) -> dict[str, int]:
+        """
+        export_snapshot 결과를 복원합니다. 이미 알고 있는 프록시는 건너뜁니다.
+        - 만료된 소프트 밴/소스 쿨다운은 버리고, 남은 밴은 원래 만료 시각을 유지합니다.
+        - 마지막 실패가 PROXY_SNAPSHOT_HARD_BAN_TTL_SECONDS보다 오래된 하드 밴은 해제합니다.
+        - 스냅샷이 PROXY_SNAPSHOT_MAX_AGE_SECONDS보다 오래됐으면 풀 구성은 복원하지 않습니다.
+        풀은 점수가 높은 순서로 다시 채워 첫 배치가 검증된 프록시부터 사용하게 합니다.
+        """
+        summary = {
+            "restored": 0,
+            "requeued": 0,
+            "soft_banned": 0,
+            "hard_banned": 0,
+            "expired_hard_bans": 0,
+        }
+        if snapshot.get("version") != PROXY_SNAPSHOT_VERSION:
+            logger.warning("지원하지 않는 프록시 스냅샷 버전: %s", snapshot.get("version"))
+            return summary
+
+        now = self._now()
+        saved_at = _parse_datetime(snapshot.get("saved_at")) or now
+        restore_pool = (now - saved_at).total_seconds() <= max(
+            0, settings.PROXY_SNAPSHOT_MAX_AGE_SECONDS
+        )
+        hard_ban_ttl = timedelta(seconds=max(0, settings.PROXY_SNAPSHOT_HARD_BAN_TTL_SECONDS))
+
+        pool_candidates: list[str] = []
+        for item in snapshot.get("states", []):
+            proxy_url = item["proxy_url"]
+            if proxy_url in self._proxy_states:
+                continue
+            state = self._ensure_proxy_state(proxy_url)
+            state.failure_count = int(item.get("failure_count", 0))
+            failure_type = item.get("last_failure_type")
+            state.last_failure_type = ProxyFailureType(failure_type) if failure_type else None
+            state.last_failed_at = _parse_datetime(item.get("last_failed_at"))
+            state.success_ewma = item.get("success_ewma")
+            state.latency_ewma = item.get("latency_ewma")
+            state.last_observed_at = _parse_datetime(item.get("last_observed_at"))
+            state.source = item.get("source")
+            summary["restored"] += 1
+
+            if item.get("is_hard_banned"):
+                last_failed_at = state.last_failed_at or saved_at
+                if now - last_failed_at < hard_ban_ttl:
+                    state.is_hard_banned = True
+                    self._hard_banned_count += 1
+                    summary["hard_banned"] += 1
+                    continue
+                state.failure_count = 0
+                summary["expired_hard_bans"] += 1
+
+            soft_ban_until = _parse_datetime(item.get("soft_ban_until"))
+            if soft_ban_until is not None and soft_ban_until > now:
+                self._set_soft_ban(proxy_url, state, soft_ban_until)
+                summary["soft_banned"] += 1
+            if restore_pool and item.get("in_pool"):
+                pool_candidates.append(proxy_url)
+
+        pool_candidates.sort(
+            key=lambda proxy_url: self.get_proxy_score(self._proxy_states[proxy_url], now=now),
+            reverse=True,
+        )
+        for proxy_url in pool_candidates:
+            if self.register_proxy(proxy_url):
+                summary["requeued"] += 1
+
+        for source_name, item in snapshot.get("sources", {}).items():
+            # 더 이상 설정되지 않은 소스는 복원하지 않는다.
+            source_state = self._source_states.get(source_name)
+            if source_state is None:
+                continue
+            source_state.consecutive_failures = int(item.get("consecutive_failures", 0))
+            cooldown_until = _parse_datetime(item.get("cooldown_until"))
+            source_state.cooldown_until = (
+                cooldown_until if cooldown_until is not None and cooldown_until > now else None
+            )
+            source_state.fetch_count = int(item.get("fetch_count", 0))
+            source_state.candidate_count = int(item.get("candidate_count", 0))
+            source_state.checked_count = int(item.get("checked_count", 0))
+            source_state.healthy_count = int(item.get("healthy_count", 0))
+            source_state.yield_ewma = item.get("yield_ewma")
+
+        logger.info(
+            "프록시 스냅샷 복원: saved_at=%s, restore_pool=%s, summary=%s",
+            saved_at.isoformat(),
+            restore_pool,
+            summary,
+        )
+        return summary
+
     def get_proxy_state(self, proxy_url: str) -> ProxyState | None:
         return self._proxy_states.get(proxy_url)
+
+
+def _isoformat_or_none(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed
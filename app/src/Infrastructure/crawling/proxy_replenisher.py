@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import datetime
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.core.time import utc_now
+from app.src.Infrastructure.crawling.proxy_manager import ProxyManager
+
+
+class ProxyReplenisher:
+    """
+    스케줄 실행과 분리된 백그라운드 프록시 보강 루프.
+    평소에는 PROXY_REPLENISH_INTERVAL_SECONDS 간격으로 PROXY_REPLENISH_TARGET을 유지하고,
+    다음 크론 실행 PROXY_PREWARM_LEAD_SECONDS 전부터는 더 높은 PROXY_PREWARM_TARGET을
+    짧은 간격으로 채워 배치가 가득 찬 풀로 시작하게 합니다.
+    """
+
+    def __init__(
+        self,
+        manager: ProxyManager,
+        next_run_time: Callable[[], datetime | None],
+    ):
+        self.manager = manager
+        self.next_run_time = next_run_time
+
+    def _seconds_to_next_run(self, now: datetime) -> float | None:
+        next_run = self.next_run_time()
+        if next_run is None:
+            return None
+        return (next_run - now).total_seconds()
+
+    def resolve_phase(self, now: datetime | None = None) -> tuple[str, int, float]:
+        """현재 단계(idle/prewarm)와 목표 가용 수, 다음 점검까지 대기 시간을 반환합니다."""
+        current = now or utc_now()
+        idle_interval = max(1.0, settings.PROXY_REPLENISH_INTERVAL_SECONDS)
+        lead_seconds = max(0.0, settings.PROXY_PREWARM_LEAD_SECONDS)
+        seconds_to_next_run = self._seconds_to_next_run(current)
+
+        if seconds_to_next_run is not None and 0 <= seconds_to_next_run <= lead_seconds:
+            return (
+                "prewarm",
+                max(1, settings.PROXY_PREWARM_TARGET),
+                max(1.0, settings.PROXY_PREWARM_INTERVAL_SECONDS),
+            )
+
+        delay = idle_interval
+        if seconds_to_next_run is not None and seconds_to_next_run > lead_seconds:
+            # 사전 준비 구간이 시작되는 시점에 바로 깨어나도록 대기 시간을 줄인다.
+            delay = min(delay, max(1.0, seconds_to_next_run - lead_seconds))
+        return "idle", max(1, settings.PROXY_REPLENISH_TARGET), delay
+
+    async def replenish_once(self, now: datetime | None = None) -> float:
+        phase, target, delay = self.resolve_phase(now)
+        if self.manager.get_available_proxy_count() < target:
+            await self.manager.ensure_min_available_proxies_async(target)
+        self.log_gauges(phase, target, now)
+        return delay
+
+    def log_gauges(self, phase: str, target: int, now: datetime | None = None) -> None:
+        metrics = self.manager.get_metrics()
+        seconds_to_next_run = self._seconds_to_next_run(now or utc_now())
+        logger.info(
+            "[METRIC] proxy_pool_gauge phase=%s target=%s active_proxy_count=%s "
+            "soft_banned_count=%s hard_banned_count=%s pool_size=%s seconds_to_next_run=%s",
+            phase,
+            target,
+            metrics["active_proxy_count"],
+            metrics["soft_banned_count"],
+            metrics["hard_banned_count"],
+            self.manager.get_pool_size(),
+            None if seconds_to_next_run is None else round(seconds_to_next_run),
+        )
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        logger.info("[INFO] 백그라운드 프록시 보강 루프 시작")
+        while not stop_event.is_set():
+            try:
+                delay = await self.replenish_once()
+            except Exception as e:
+                logger.error(f"백그라운드 프록시 보강 실패: {e}")
+                delay = max(1.0, settings.PROXY_REPLENISH_INTERVAL_SECONDS)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), timeout=delay)
+        logger.info("[INFO] 백그라운드 프록시 보강 루프 종료")
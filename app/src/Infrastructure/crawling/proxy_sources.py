@@ -0,0 +1,116 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from ipaddress import ip_address
+
+from bs4 import BeautifulSoup
+
+from app.src.core.logger import logger
+
+
+def _normalize_proxy_endpoint(host: str, port_text: str) -> str | None:
+    host = host.strip()
+    port_text = port_text.strip()
+    if not host or not port_text:
+        return None
+    try:
+        ip_address(host)
+        port = int(port_text)
+    except ValueError:
+        return None
+    if port < 1 or port > 65535:
+        return None
+    return f"http://{host}:{port}"
+
+
+def parse_html_table(html: bytes) -> list[str]:
+    """sslproxies.org 계열(free-proxy-list.net, us-proxy.org)의 프록시 테이블을 파싱합니다."""
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", {"class": "table table-striped table-bordered"})
+    if not table:
+        logger.warning("프록시 테이블을 찾을 수 없습니다.")
+        return []
+
+    tbody = table.find("tbody")
+    if tbody is None:
+        logger.warning("프록시 테이블 본문을 찾을 수 없습니다.")
+        return []
+
+    proxies: list[str] = []
+    seen: set[str] = set()
+    skipped_invalid_rows = 0
+    for row in tbody.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) < 2:
+            skipped_invalid_rows += 1
+            continue
+
+        proxy_url = _normalize_proxy_endpoint(cells[0].text, cells[1].text)
+        if proxy_url is None:
+            skipped_invalid_rows += 1
+            continue
+        if proxy_url in seen:
+            continue
+        seen.add(proxy_url)
+        proxies.append(proxy_url)
+
+    if skipped_invalid_rows > 0:
+        logger.debug(
+            "프록시 테이블 파싱 중 유효하지 않은 행 제외: skipped_invalid_rows=%s",
+            skipped_invalid_rows,
+        )
+    return proxies
+
+
+def parse_plain_text(body: bytes) -> list[str]:
+    """한 줄에 하나씩 `host:port`(선택적으로 `http://` 접두사)가 나열된 목록을 파싱합니다."""
+    proxies: list[str] = []
+    seen: set[str] = set()
+    for line in body.decode("utf-8", errors="ignore").splitlines():
+        endpoint = line.strip().removeprefix("http://")
+        host, separator, port_text = endpoint.rpartition(":")
+        if not separator:
+            continue
+        proxy_url = _normalize_proxy_endpoint(host, port_text)
+        if proxy_url is None or proxy_url in seen:
+            continue
+        seen.add(proxy_url)
+        proxies.append(proxy_url)
+    return proxies
+
+
+@dataclass(frozen=True, slots=True)
+class ProxySource:
+    name: str
+    url: str
+    parser: Callable[[bytes], list[str]]
+
+
+PROXY_SOURCE_REGISTRY: dict[str, ProxySource] = {
+    source.name: source
+    for source in (
+        ProxySource("sslproxies", "https://www.sslproxies.org/", parse_html_table),
+        ProxySource("free_proxy_list", "https://free-proxy-list.net/", parse_html_table),
+        ProxySource("us_proxy", "https://www.us-proxy.org/", parse_html_table),
+        ProxySource(
+            "proxyscrape",
+            "https://api.proxyscrape.com/v2/?request=getproxies&protocol=http"
+            "&timeout=5000&country=all&ssl=yes&anonymity=all",
+            parse_plain_text,
+        ),
+    )
+}
+
+
+def resolve_proxy_sources(names: str) -> list[ProxySource]:
+    """쉼표로 구분된 소스 이름을 등록된 ProxySource 목록으로 변환합니다. 모르는 이름은 건너뜁니다."""
+    sources: list[ProxySource] = []
+    for name in (part.strip() for part in names.split(",")):
+        if not name:
+            continue
+        source = PROXY_SOURCE_REGISTRY.get(name)
+        if source is None:
+            logger.warning("등록되지 않은 프록시 소스 무시: source=%s", name)
+            continue
+        if source not in sources:
+            sources.append(source)
+    return sources
@@ -0,0 +1,130 @@
+import time
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.Infrastructure.crawling.crawl_slot import defer_until_ready
+
+
+class TokenBucket:
+    """
+    사이트 단위 토큰 버킷(GCRA 방식 예약).
+    호출마다 다음 전송 시각을 예약하므로 초당 rate_per_second 요청을 정확히 지키고,
+    쉬고 있던 버킷은 burst개까지 바로 보낼 수 있습니다.
+    pause()가 호출되면 버킷 전체가 그 시각까지 멈추고, 재개 직후에는 burst 없이 다시 시작합니다.
+    대기는 defer_until_ready로 하므로 사이트 슬롯을 잡고 있지 않습니다.
+    """
+
+    def __init__(self, name: str, rate_per_second: float, burst: int = 1):
+        self.name = name
+        self.interval = 1.0 / max(0.001, rate_per_second)
+        self.burst = max(1, burst)
+        self._tolerance = (self.burst - 1) * self.interval
+        self._theoretical_arrival = 0.0
+        self.paused_until = 0.0
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self.pauses = 0
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    def _reserve(self, now: float) -> float:
+        """전송 시각을 예약하고, 그때까지 기다려야 할 시간을 반환합니다."""
+        arrival = max(self._theoretical_arrival, now)
+        send_at = max(now, arrival - self._tolerance)
+        self._theoretical_arrival = arrival + self.interval
+        return send_at - now
+
+    async def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            now = self._now()
+            if self.paused_until > now:
+                delay = self.paused_until - now
+                await defer_until_ready(delay)
+                waited += delay
+                continue
+
+            delay = self._reserve(now)
+            if delay > 0:
+                await defer_until_ready(delay)
+                waited += delay
+            # 예약 후 대기 중에 pause가 걸렸으면 재개 시각 이후로 다시 예약한다.
+            if self.paused_until <= self._now():
+                break
+        self.acquired += 1
+        self.waited_seconds += waited
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        until = self._now() + seconds
+        if until <= self.paused_until:
+            return
+        self.paused_until = until
+        self._theoretical_arrival = max(self._theoretical_arrival, until + self._tolerance)
+        self.pauses += 1
+        logger.info(
+            "[METRIC] crawl_rate_limit site=%s event=pause seconds=%.1f",
+            self.name,
+            seconds,
+        )
+
+    def reset_counters(self) -> None:
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self.pauses = 0
+
+
+class SiteRateLimiters:
+    """SiteName별 TokenBucket 모음. 모든 크롤러 인스턴스가 같은 버킷을 공유합니다."""
+
+    def __init__(self):
+        self._buckets: dict[SiteName, TokenBucket] = {}
+
+    def get(self, site_name: SiteName) -> TokenBucket:
+        bucket = self._buckets.get(site_name)
+        if bucket is None:
+            bucket = TokenBucket(
+                site_name.value,
+                settings.CRAWL_SITE_RATE_PER_SECOND,
+                settings.CRAWL_SITE_RATE_BURST,
+            )
+            self._buckets[site_name] = bucket
+        return bucket
+
+    async def acquire(self, site_name: SiteName) -> None:
+        if not settings.CRAWL_SITE_RATE_LIMIT_ENABLED:
+            return
+        await self.get(site_name).acquire()
+
+    def pause(self, site_name: SiteName, seconds: float | None) -> None:
+        if not settings.CRAWL_SITE_RATE_LIMIT_ENABLED or seconds is None:
+            return
+        max_pause = max(0.0, settings.CRAWL_BLOCK_BACKOFF_MAX_SECONDS)
+        self.get(site_name).pause(min(max_pause, seconds))
+
+    def log_metrics(self, label: str) -> None:
+        for bucket in self._buckets.values():
+            logger.info(
+                "[METRIC] crawl_rate_limit_summary label=%s site=%s acquired=%s "
+                "waited_seconds=%.1f pauses=%s",
+                label,
+                bucket.name,
+                bucket.acquired,
+                bucket.waited_seconds,
+                bucket.pauses,
+            )
+
+    def reset_counters(self) -> None:
+        for bucket in self._buckets.values():
+            bucket.reset_counters()
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+SITE_RATE_LIMITERS = SiteRateLimiters()
@@ -0,0 +1,101 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+
+CacheKey = tuple[SiteName, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    region_hash: str
+    results: tuple[CrawledKeyword, ...]
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalResponseCache:
+    """
+    (사이트, 요청 URL) 단위의 조건부 요청 캐시.
+    ETag/Last-Modified 검증값으로 304 응답을 받거나, 본문의 딜 영역 해시가 같으면
+    이전 파싱 결과를 재사용해 파싱을 건너뜁니다. 오래 사용하지 않은 항목부터 제거(LRU)합니다.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self.not_modified_hits = 0
+        self.region_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def conditional_headers(self, key: CacheKey) -> dict[str, str]:
+        entry = self._entries.get(key)
+        return entry.conditional_headers() if entry is not None else {}
+
+    def record_not_modified(self) -> None:
+        self.not_modified_hits += 1
+
+    def record_region_hit(self) -> None:
+        self.region_hits += 1
+
+    def record_miss(self) -> None:
+        self.misses += 1
+
+    def reset_counters(self) -> None:
+        self.not_modified_hits = 0
+        self.region_hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.reset_counters()
+
+    def log_metrics(self, label: str) -> None:
+        lookups = self.not_modified_hits + self.region_hits + self.misses
+        hit_ratio = (
+            (self.not_modified_hits + self.region_hits) / lookups if lookups else 0.0
+        )
+        logger.info(
+            "[METRIC] response_cache label=%s hits_not_modified=%s hits_region=%s "
+            "misses=%s hit_ratio=%.3f entries=%s",
+            label,
+            self.not_modified_hits,
+            self.region_hits,
+            self.misses,
+            hit_ratio,
+            len(self._entries),
+        )
+
+
+def hash_region(region: str) -> str:
+    return hashlib.blake2b(region.encode("utf-8"), digest_size=16).hexdigest()
+
+
+RESPONSE_CACHE = ConditionalResponseCache(settings.CRAWL_RESPONSE_CACHE_MAX_ENTRIES)
@@ -0,0 +1,154 @@
+import time
+from dataclasses import dataclass
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.domain.hotdeal.enums import SiteName
+
+
+@dataclass(slots=True)
+class SiteRouteState:
+    # 이 시각(monotonic)까지는 직접 요청을 건너뛰고 프록시로 바로 요청
+    proxy_until: float | None = None
+    consecutive_blocks: int = 0
+    last_probe_at: float | None = None
+    probe_pending: bool = False
+    bypassed: int = 0
+    probes: int = 0
+
+
+class SiteRouteRegistry:
+    """
+    프로세스 전역의 사이트별 요청 경로 상태.
+    한 크롤러가 직접 요청에서 차단(403/429/430)을 만나면 같은 사이트의 이후 크롤링은
+    쿨다운 동안 직접 요청과 차단 대기 없이 프록시로 바로 요청합니다.
+    쿨다운은 연속 차단마다 두 배로 늘고(최대 CRAWL_ROUTE_PROXY_COOLDOWN_MAX_SECONDS),
+    Retry-After가 더 길면 그 값을 따릅니다. 쿨다운 중에도 CRAWL_ROUTE_PROBE_INTERVAL_SECONDS마다
+    요청 하나를 직접 경로로 보내 차단이 풀렸는지 확인합니다.
+    """
+
+    def __init__(self):
+        self._states: dict[SiteName, SiteRouteState] = {}
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    def get_state(self, site_name: SiteName) -> SiteRouteState | None:
+        return self._states.get(site_name)
+
+    def should_bypass_direct(self, site_name: SiteName) -> bool:
+        """True면 직접 요청을 건너뛰고 프록시로 바로 요청해야 합니다."""
+        if not settings.CRAWL_ROUTE_STATE_ENABLED:
+            return False
+        state = self._states.get(site_name)
+        if state is None or state.proxy_until is None:
+            return False
+
+        now = self._now()
+        if now >= state.proxy_until:
+            # 쿨다운이 끝났으면 직접 요청으로 복귀한다. 연속 차단 횟수는 성공 시 초기화.
+            state.proxy_until = None
+            return False
+
+        probe_interval = max(1.0, settings.CRAWL_ROUTE_PROBE_INTERVAL_SECONDS)
+        if state.last_probe_at is None or now - state.last_probe_at >= probe_interval:
+            state.last_probe_at = now
+            state.probe_pending = True
+            state.probes += 1
+            logger.info(
+                "[METRIC] crawl_route site=%s event=probe remaining_seconds=%.1f",
+                site_name.value,
+                state.proxy_until - now,
+            )
+            return False
+
+        state.bypassed += 1
+        return True
+
+    def record_block(
+        self,
+        site_name: SiteName,
+        retry_after_seconds: float | None = None,
+    ) -> bool:
+        """
+        직접 요청 차단을 기록합니다. 이미 쿨다운 중이었으면 False를 반환해
+        동시에 차단을 만난 다른 크롤러가 같은 차단에 대해 중복으로 대기하지 않게 합니다.
+        """
+        if not settings.CRAWL_ROUTE_STATE_ENABLED:
+            return True
+        now = self._now()
+        state = self._states.setdefault(site_name, SiteRouteState())
+        already_blocked = state.proxy_until is not None and now < state.proxy_until
+
+        base_cooldown = max(1.0, settings.CRAWL_ROUTE_PROXY_COOLDOWN_SECONDS)
+        max_cooldown = max(base_cooldown, settings.CRAWL_ROUTE_PROXY_COOLDOWN_MAX_SECONDS)
+        # 쿨다운 중 동시에 도착한 차단은 같은 차단으로 보고, 탐침이 차단되면 쿨다운을 늘린다.
+        if not already_blocked or state.probe_pending:
+            state.consecutive_blocks += 1
+        state.probe_pending = False
+        cooldown = base_cooldown * 2 ** max(0, state.consecutive_blocks - 1)
+        if retry_after_seconds is not None:
+            cooldown = max(cooldown, retry_after_seconds)
+        cooldown = min(max_cooldown, cooldown)
+
+        proxy_until = now + cooldown
+        if state.proxy_until is None or proxy_until > state.proxy_until:
+            state.proxy_until = proxy_until
+        state.last_probe_at = now
+        logger.info(
+            "[METRIC] crawl_route site=%s event=blocked consecutive_blocks=%s "
+            "cooldown_seconds=%.1f retry_after=%s already_blocked=%s",
+            site_name.value,
+            state.consecutive_blocks,
+            cooldown,
+            retry_after_seconds,
+            already_blocked,
+        )
+        return not already_blocked
+
+    def record_direct_success(self, site_name: SiteName) -> None:
+        state = self._states.get(site_name)
+        if state is None or (state.proxy_until is None and state.consecutive_blocks == 0):
+            return
+        logger.info(
+            "[METRIC] crawl_route site=%s event=recovered consecutive_blocks=%s "
+            "bypassed=%s probes=%s",
+            site_name.value,
+            state.consecutive_blocks,
+            state.bypassed,
+            state.probes,
+        )
+        state.proxy_until = None
+        state.consecutive_blocks = 0
+        state.last_probe_at = None
+        state.probe_pending = False
+
+    def log_metrics(self, label: str) -> None:
+        for site_name, state in self._states.items():
+            remaining = (
+                max(0.0, state.proxy_until - self._now())
+                if state.proxy_until is not None
+                else 0.0
+            )
+            logger.info(
+                "[METRIC] crawl_route_state label=%s site=%s proxy_only_remaining=%.1f "
+                "consecutive_blocks=%s bypassed=%s probes=%s",
+                label,
+                site_name.value,
+                remaining,
+                state.consecutive_blocks,
+                state.bypassed,
+                state.probes,
+            )
+
+    def reset_counters(self) -> None:
+        for state in self._states.values():
+            state.bypassed = 0
+            state.probes = 0
+
+    def clear(self) -> None:
+        self._states.clear()
+
+
+SITE_ROUTES = SiteRouteRegistry()
@@ -33,16 +33,87 @@ class Settings(BaseSettings):
     CRAWL_KEYWORD_CONCURRENCY: int = 4
     CRAWL_SITE_CONCURRENCY_MAX: int = 4
     CRAWL_KEYWORD_CONCURRENCY_MAX: int = 8
+    # AIMD 적응형 동시성: 위 값으로 시작해 *_MAX 범위 안에서 지연/차단 신호에 따라 조절
+    CRAWL_ADAPTIVE_CONCURRENCY_ENABLED: bool = False
+    CRAWL_AIMD_LATENCY_TARGET_SECONDS: float = 3.0
+    CRAWL_AIMD_DECREASE_FACTOR: float = 0.5
+    CRAWL_AIMD_DECREASE_COOLDOWN_SECONDS: float = 10.0
+    CRAWL_AIMD_PROXY_FAILURE_RATE_THRESHOLD: float = 0.5
+    CRAWL_AIMD_EWMA_ALPHA: float = 0.3
     CRAWL_BLOCK_BACKOFF_SECONDS: float = 3.0
     CRAWL_BLOCK_BACKOFF_MAX_SECONDS: float = 60.0
     CRAWL_BLOCK_BACKOFF_BUDGET_SECONDS: float = 180.0
     CRAWL_SITE_BUDGET_SECONDS: float = 120.0
+    # 사이트별 공유 토큰 버킷 (초당 요청 수/버스트). 비활성화하면 기존 랜덤 지연을 사용
+    CRAWL_SITE_RATE_LIMIT_ENABLED: bool = True
+    CRAWL_SITE_RATE_PER_SECOND: float = 1.0
+    CRAWL_SITE_RATE_BURST: int = 2
+    # 차단 백오프 대기 동안 사이트 세마포어 슬롯을 반납하고 대기 후 다시 획득
+    CRAWL_DEFER_BACKOFF_ENABLED: bool = True
+    # 사이트별 서킷 브레이커: 연속 실패 또는 실행 내 실패율이 기준을 넘으면 열림(해당 사이트 건너뜀)
+    # 열린 지 CRAWL_CIRCUIT_OPEN_SECONDS가 지나면 반열림 상태에서 시험 요청 하나로 복구를 확인
+    CRAWL_CIRCUIT_BREAKER_ENABLED: bool = True
+    CRAWL_CIRCUIT_CONSECUTIVE_FAILURES: int = 5
+    CRAWL_CIRCUIT_FAILURE_RATE_THRESHOLD: float = 0.5
+    CRAWL_CIRCUIT_MIN_CALLS: int = 10
+    CRAWL_CIRCUIT_OPEN_SECONDS: float = 300.0
     WORKER_RUN_TIMEOUT_SECONDS: float = 1500.0
+    # 실행 마감 시각을 사이트 크롤링/프록시 재시도/백오프까지 전파해 마감이 가까우면 작업을 줄이거나 건너뜀
+    CRAWL_DEADLINE_PROPAGATION_ENABLED: bool = True
+    # 크롤링 마감을 실행 마감보다 이만큼 앞당겨 메일 발송 시간을 확보
+    WORKER_MAIL_RESERVE_SECONDS: float = 120.0
+    # 크롤링 마감까지 남은 시간이 이보다 짧으면 새 사이트 요청/프록시 재시도를 시작하지 않음
+    CRAWL_DEADLINE_MIN_REQUEST_SECONDS: float = 10.0
     WORKER_LOG_MONITOR_WINDOW_MINUTES: int = 90
+    CRAWL_ANCHOR_FLUSH_CHUNK_SIZE: int = 500
+    # 키워드×사이트 완료 기록(실행 원장)과 메일 발송 대기열로 중단된 실행을 이어서 처리
+    WORKER_RUN_LEDGER_ENABLED: bool = True
+    # 키워드×사이트별 신규 핫딜 속도와 구독자 수로 다음 크롤링 시각을 정하고, 주기마다 기한이 된 쌍만 크롤링
+    # (실행 원장 필요. 비활성화 시 매시 정각/30분에 전체 크롤링)
+    CRAWL_ADAPTIVE_SCHEDULE_ENABLED: bool = False
+    CRAWL_SCHEDULE_TICK_MINUTES: int = 5
+    CRAWL_SCHEDULE_MIN_INTERVAL_MINUTES: float = 5.0
+    CRAWL_SCHEDULE_MAX_INTERVAL_MINUTES: float = 360.0
+    # 속도 관측이 없을 때의 주기
+    CRAWL_SCHEDULE_DEFAULT_INTERVAL_MINUTES: float = 30.0
+    # 한 번 크롤링할 때 기대하는 신규 핫딜 수 (작을수록 자주 크롤링)
+    CRAWL_SCHEDULE_TARGET_DEALS_PER_CRAWL: float = 0.25
+    CRAWL_SCHEDULE_RATE_EWMA_ALPHA: float = 0.3
+    WORKER_STREAMING_MAIL_ENABLED: bool = False
+    # 연속 스케줄: 키워드 크롤링을 실행 시작에 몰지 않고 구간 전체에 일정한 간격으로 나눠 시작
+    # (실행 주기와 실행 마감 안에서 마지막 키워드도 사이트 크롤링 한 번과 메일 발송 시간을 남김)
+    WORKER_CONTINUOUS_SCHEDULE_ENABLED: bool = False
+    WORKER_CONTINUOUS_DRAIN_SECONDS: float = 1200.0
+    # 연속 스케줄에서 사용자별로 모은 핫딜을 메일 한 통으로 발송하는 간격
+    WORKER_MAIL_FLUSH_INTERVAL_SECONDS: float = 300.0
+    CRAWL_FEED_MODE_ENABLED: bool = False
+    CRAWL_FEED_MAX_PAGES: int = 5
+    # bs4 | bs4_strainer | lxml | selectolax | auto
+    # lxml/selectolax는 선택 설치 패키지(poetry install --extras parsers)이므로 명시적으로 고를 때만 사용
+    # (auto는 설치된 가장 빠른 엔진)
+    CRAWL_PARSER_ENGINE: str = "bs4"
+    # none | thread | process
+    CRAWL_PARSE_EXECUTOR: str = "none"
+    CRAWL_PARSE_EXECUTOR_MAX_WORKERS: int = 2
+    CRAWL_STREAMING_FETCH_ENABLED: bool = False
+    CRAWL_RESPONSE_CACHE_ENABLED: bool = True
+    CRAWL_RESPONSE_CACHE_MAX_ENTRIES: int = 5000
+    # 직접 요청 차단 시 사이트 단위로 프록시 경로 고정 (쿨다운/직접 경로 복구 탐침 간격)
+    CRAWL_ROUTE_STATE_ENABLED: bool = True
+    CRAWL_ROUTE_PROXY_COOLDOWN_SECONDS: float = 120.0
+    CRAWL_ROUTE_PROXY_COOLDOWN_MAX_SECONDS: float = 1800.0
+    CRAWL_ROUTE_PROBE_INTERVAL_SECONDS: float = 60.0
 
     # 프록시 밴 정책/보강 설정
     MIN_AVAILABLE_PROXIES: int = 5
     PROXY_REPLENISH_ATTEMPTS: int = 2
+    # 스케줄과 분리된 백그라운드 보강 (평시 목표/간격, 크론 실행 직전 사전 준비 목표/간격)
+    PROXY_REPLENISHER_ENABLED: bool = True
+    PROXY_REPLENISH_TARGET: int = 10
+    PROXY_REPLENISH_INTERVAL_SECONDS: float = 300.0
+    PROXY_PREWARM_TARGET: int = 20
+    PROXY_PREWARM_LEAD_SECONDS: float = 180.0
+    PROXY_PREWARM_INTERVAL_SECONDS: float = 20.0
     PROXY_SOFT_BAN_FAILURE_THRESHOLD: int = 2
     PROXY_SOFT_BAN_TTL_SECONDS: int = 900
     PROXY_HARD_BAN_FAILURE_THRESHOLD: int = 5
@@ -57,9 +128,27 @@ class Settings(BaseSettings):
     PROXY_HEALTHCHECK_ENABLED: bool = True
     PROXY_HEALTHCHECK_URL: str = "https://httpbin.org/ip"
     PROXY_HEALTHCHECK_TIMEOUT_SECONDS: float = 5.0
+    PROXY_HEALTHCHECK_CONCURRENCY: int = 20
+    # 쉼표로 구분한 프록시 소스 이름 (proxy_sources.PROXY_SOURCE_REGISTRY 참고)
+    PROXY_SOURCES: str = "sslproxies,free_proxy_list,us_proxy,proxyscrape"
     PROXY_SOURCE_FAILURE_THRESHOLD: int = 3
     PROXY_SOURCE_COOLDOWN_SECONDS: int = 600
 
+    # round_robin | p2c (성공률/지연시간/최근성 EWMA 점수 기반 power-of-two-choices)
+    PROXY_SELECTION_STRATEGY: str = "round_robin"
+    PROXY_SELECTION_CHOICES: int = 2
+    PROXY_SCORE_EWMA_ALPHA: float = 0.3
+    PROXY_SCORE_LATENCY_REFERENCE_SECONDS: float = 1.0
+    PROXY_SCORE_RECENCY_HALF_LIFE_SECONDS: float = 600.0
+
+    PROXY_CLIENT_POOL_ENABLED: bool = True
+    PROXY_CLIENT_POOL_MAX_SIZE: int = 32
+
+    # 프록시 풀 상태를 DB에 스냅샷으로 저장하고 워커 시작 시 복원
+    PROXY_SNAPSHOT_ENABLED: bool = True
+    PROXY_SNAPSHOT_MAX_AGE_SECONDS: int = 21600
+    PROXY_SNAPSHOT_HARD_BAN_TTL_SECONDS: int = 86400
+
     CRAWL_PROTECTION_SITE_CONCURRENCY: int = 1
     CRAWL_PROTECTION_KEYWORD_CONCURRENCY: int = 2
     CRAWL_PROTECTION_KEYWORD_RATIO: float = 0.5
@@ -0,0 +1,72 @@
+import asyncio
+import time
+from contextlib import suppress
+
+from app.src.core.logger import logger
+
+
+class EventLoopLagMonitor:
+    """
+    주기적으로 잠들었다 깨어나며 예정 시각 대비 지연을 측정합니다.
+    CPU 작업이 이벤트 루프를 붙잡고 있으면 지연이 커집니다.
+    """
+
+    def __init__(self, interval_seconds: float = 0.1):
+        self.interval_seconds = max(0.01, interval_seconds)
+        self._samples: list[float] = []
+        self._task: asyncio.Task | None = None
+        self._expected_at: float | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._samples = []
+            self._expected_at = None
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # 루프가 막혀 깨어나지 못한 마지막 구간도 반영
+        if self._expected_at is not None:
+            pending_lag = time.perf_counter() - self._expected_at
+            if pending_lag > 0:
+                self._samples.append(pending_lag)
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._expected_at = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self._samples.append(max(0.0, time.perf_counter() - self._expected_at))
+            self._expected_at = None
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._samples)
+
+    def summary(self) -> dict[str, float]:
+        if not self._samples:
+            return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self._samples)
+        p95_index = min(len(ordered) - 1, int(len(ordered) * 0.95))
+        return {
+            "avg_ms": sum(ordered) / len(ordered) * 1000,
+            "p95_ms": ordered[p95_index] * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+    def log_metrics(self, label: str, **extra_fields: str) -> None:
+        summary = self.summary()
+        extra = "".join(f" {key}={value}" for key, value in extra_fields.items())
+        logger.info(
+            "[METRIC] event_loop_lag label=%s samples=%s avg_ms=%.1f p95_ms=%.1f max_ms=%.1f%s",
+            label,
+            self.sample_count,
+            summary["avg_ms"],
+            summary["p95_ms"],
+            summary["max_ms"],
+            extra,
+        )
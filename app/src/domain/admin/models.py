@@ -1,9 +1,10 @@
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, Integer, Text
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
 
 from app.src.core.database import Base
 from app.src.core.time import utc_now
+from app.src.domain.hotdeal.enums import SiteName
 
 
 class WorkerStatus(enum.Enum):
@@ -22,3 +23,52 @@ class WorkerLog(Base):
     emails_sent = Column(Integer, default=0)
     message = Column(Text, nullable=True)
     details = Column(Text, nullable=True)
+
+
+class ProxyPoolSnapshot(Base):
+    """워커 재시작 후 웜 스타트를 위한 프록시 풀 상태 스냅샷 (JSON)"""
+
+    __tablename__ = "proxy_pool_snapshots"
+
+    name = Column(String, primary_key=True)
+    payload = Column(Text, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+
+
+class FeedCursor(Base):
+    """피드 모드에서 사이트별로 마지막으로 메일 적재까지 마친 딜 ID. 다음 실행은 이 딜까지만 수집"""
+
+    __tablename__ = "crawl_feed_cursors"
+
+    site_name = Column(Enum(SiteName), primary_key=True, nullable=False)
+    last_seen_id = Column(String, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+
+
+class RunLedgerStatus(enum.Enum):
+    # 크롤링과 앵커 반영은 끝났지만 이 결과로 메일을 아직 만들지 않음
+    DONE = "DONE"
+    # 메일 발송 대기열까지 적재 완료
+    MAILED = "MAILED"
+
+
+class WorkerRunLedger(Base):
+    """키워드×사이트별 마지막 크롤링 완료 기록. 중단된 실행의 재개와 처리 순서 결정에 사용"""
+
+    __tablename__ = "worker_run_ledger"
+
+    keyword_id = Column(
+        Integer,
+        ForeignKey("hotdeal_keywords.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    site_name = Column(Enum(SiteName), primary_key=True, nullable=False)
+    run_id = Column(Integer, nullable=True)
+    status = Column(Enum(RunLedgerStatus), nullable=False)
+    # 이번 완료에서 찾은 신규 핫딜 (CrawledKeyword 목록 JSON)
+    deals = Column(Text, nullable=True)
+    completed_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    # 시간당 신규 핫딜 수 EWMA와 이를 바탕으로 정한 다음 크롤링 시각 (적응형 스케줄)
+    deal_rate = Column(Float, nullable=True)
+    next_due_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,10 +1,22 @@
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.time import ensure_utc, ensure_utc_or_none, utc_now
-from app.src.domain.admin.models import WorkerLog, WorkerStatus
+from app.src.domain.admin.models import (
+    FeedCursor,
+    ProxyPoolSnapshot,
+    RunLedgerStatus,
+    WorkerLog,
+    WorkerRunLedger,
+    WorkerStatus,
+)
+from app.src.domain.hotdeal.enums import SiteName
 
 
 async def get_all_worker_logs(
@@ -57,3 +69,102 @@ async def get_worker_log_monitor(
         "alert_zero_mail_in_window": len(success_logs) > 0
         and len(success_with_mail_logs) == 0,
     }
+
+
+async def get_proxy_pool_snapshot(db: AsyncSession, name: str) -> ProxyPoolSnapshot | None:
+    return await db.get(ProxyPoolSnapshot, name)
+
+
+async def save_proxy_pool_snapshot(db: AsyncSession, name: str, payload: str) -> None:
+    snapshot = await db.get(ProxyPoolSnapshot, name)
+    if snapshot is None:
+        db.add(ProxyPoolSnapshot(name=name, payload=payload, updated_at=utc_now()))
+    else:
+        snapshot.payload = payload
+        snapshot.updated_at = utc_now()
+    await db.commit()
+
+
+async def select_feed_cursors(db: AsyncSession) -> dict[SiteName, str]:
+    result = await db.execute(select(FeedCursor))
+    return {cursor.site_name: cursor.last_seen_id for cursor in result.scalars().all()}
+
+
+async def save_feed_cursors(db: AsyncSession, last_seen_ids: dict[SiteName, str]) -> None:
+    for site_name, last_seen_id in last_seen_ids.items():
+        cursor = await db.get(FeedCursor, site_name)
+        if cursor is None:
+            db.add(FeedCursor(site_name=site_name, last_seen_id=last_seen_id, updated_at=utc_now()))
+        else:
+            cursor.last_seen_id = last_seen_id
+            cursor.updated_at = utc_now()
+    await db.commit()
+
+
+# 키워드 목록에 해당하는 실행 원장(키워드×사이트 완료 기록)을 한 번에 조회
+async def select_run_ledger(
+    db: AsyncSession,
+    keyword_ids: Iterable[int],
+    site_names: Iterable[SiteName] | None = None,
+) -> list[WorkerRunLedger]:
+    keyword_id_list = list(keyword_ids)
+    if not keyword_id_list:
+        return []
+    select_query = select(WorkerRunLedger).where(
+        WorkerRunLedger.keyword_id.in_(keyword_id_list)
+    )
+    if site_names is not None:
+        select_query = select_query.where(WorkerRunLedger.site_name.in_(list(site_names)))
+    result = await db.execute(select_query)
+    return list(result.scalars().all())
+
+
+# 실행 원장 여러 건을 (keyword_id, site_name) 기준으로 일괄 upsert
+async def upsert_run_ledger(
+    db: AsyncSession,
+    rows: list[dict[str, Any]],
+    commit: bool = True,
+) -> int:
+    if not rows:
+        return 0
+
+    dialect_name = db.get_bind().dialect.name
+    insert_factory = sqlite_insert if dialect_name == "sqlite" else postgresql_insert
+    insert_query = insert_factory(WorkerRunLedger).values(rows)
+    upsert_query = insert_query.on_conflict_do_update(
+        index_elements=[WorkerRunLedger.keyword_id, WorkerRunLedger.site_name],
+        set_={
+            "run_id": insert_query.excluded.run_id,
+            "status": insert_query.excluded.status,
+            "deals": insert_query.excluded.deals,
+            "completed_at": insert_query.excluded.completed_at,
+            "deal_rate": insert_query.excluded.deal_rate,
+            "next_due_at": insert_query.excluded.next_due_at,
+        },
+    )
+    await db.execute(upsert_query)
+    if commit:
+        await db.commit()
+    return len(rows)
+
+
+# 메일을 만들지 않은(DONE) 완료 기록을 메일 적재 완료(MAILED)로 표시
+async def mark_run_ledger_mailed(
+    db: AsyncSession,
+    keyword_ids: Iterable[int],
+    commit: bool = True,
+) -> int:
+    keyword_id_list = list(keyword_ids)
+    if not keyword_id_list:
+        return 0
+    result = await db.execute(
+        update(WorkerRunLedger)
+        .where(
+            WorkerRunLedger.keyword_id.in_(keyword_id_list),
+            WorkerRunLedger.status == RunLedgerStatus.DONE,
+        )
+        .values(status=RunLedgerStatus.MAILED, deals=None)
+    )
+    if commit:
+        await db.commit()
+    return result.rowcount
@@ -0,0 +1,164 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.core.logger import logger
+from app.src.core.time import ensure_utc, utc_now
+from app.src.domain.admin.repositories import upsert_run_ledger
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.repositories import (
+    select_existing_keyword_ids,
+    select_keyword_sites,
+    upsert_keyword_sites,
+)
+from app.src.domain.hotdeal.run_ledger import RunLedger
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+
+AnchorKey = tuple[int, SiteName]
+
+
+class KeywordSiteAnchorStore:
+    """
+    워커 실행 단위의 KeywordSite 앵커 저장소.
+    실행 시작 시 앵커를 한 번에 적재하고, 크롤링 태스크는 메모리에서 비교/갱신하며,
+    변경된 앵커는 청크 단위 또는 실행 종료 시 일괄 upsert 합니다.
+    run_ledger가 있으면 (키워드, 사이트) 완료 기록을 앵커와 같은 트랜잭션으로 반영해,
+    앵커는 전진했는데 완료 기록(과 찾은 핫딜)이 없는 상태가 생기지 않게 합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        chunk_size: int = 500,
+        run_ledger: RunLedger | None = None,
+    ):
+        self._session_factory = session_factory
+        self._chunk_size = max(1, chunk_size)
+        self.run_ledger = run_ledger
+        self._external_ids: dict[AnchorKey, str] = {}
+        # 마지막으로 신규 핫딜이 나온 시각 (실행 원장의 속도 추정에 사용)
+        self._last_deal_at: dict[AnchorKey, datetime] = {}
+        self._pending: dict[AnchorKey, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self.loaded_count = 0
+        self.staged_count = 0
+        self.flushed_count = 0
+
+    async def load(
+        self,
+        keyword_ids: Iterable[int],
+        site_names: Iterable[SiteName] | None = None,
+    ) -> int:
+        async with self._session_factory() as session:
+            keyword_sites = await select_keyword_sites(session, keyword_ids, site_names)
+
+        for keyword_site in keyword_sites:
+            key = (keyword_site.keyword_id, keyword_site.site_name)
+            self._external_ids[key] = keyword_site.external_id
+            self._last_deal_at[key] = ensure_utc(keyword_site.wdate)
+        self.loaded_count = len(keyword_sites)
+        return self.loaded_count
+
+    def get_external_id(self, keyword_id: int, site: SiteName) -> str | None:
+        return self._external_ids.get((keyword_id, site))
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def is_pending(self, keyword_id: int, site: SiteName) -> bool:
+        """앵커 변경분이 아직 DB에 반영되지 않았는지 여부."""
+        return (keyword_id, site) in self._pending
+
+    async def stage(
+        self,
+        keyword_id: int,
+        site: SiteName,
+        *,
+        external_id: str,
+        link: str | None,
+        price: str | None,
+        meta_data: str | None,
+    ) -> None:
+        key = (keyword_id, site)
+        wdate = utc_now()
+        self._external_ids[key] = external_id
+        self._last_deal_at[key] = wdate
+        self._pending[key] = {
+            "keyword_id": keyword_id,
+            "site_name": site,
+            "external_id": external_id,
+            "link": link,
+            "price": price,
+            "meta_data": meta_data,
+            "wdate": wdate,
+        }
+        self.staged_count += 1
+
+        if len(self._pending) >= self._chunk_size:
+            # 크롤링 경로에서 DB 오류를 올리지 않는다. 실패한 행은 다시 스테이징되어 실행 종료 시 재시도된다.
+            # (예외가 올라가면 이 쌍의 신규 핫딜이 버려지고 DB 장애가 사이트 장애로 집계된다)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"KeywordSite 앵커 청크 반영 중 오류 발생 (실행 종료 시 재시도): {e}")
+
+    def record_completion(
+        self,
+        keyword_id: int,
+        site: SiteName,
+        deals: list[CrawledKeyword],
+    ) -> None:
+        """크롤링을 마친 (키워드, 사이트)를 실행 원장에 기록합니다. (다음 플러시에 함께 반영)"""
+        if self.run_ledger is not None:
+            self.run_ledger.record_completion(
+                keyword_id, site, deals, last_deal_at=self._last_deal_at.get((keyword_id, site))
+            )
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            ledger_rows = self.run_ledger.take_staged() if self.run_ledger is not None else []
+            if not self._pending and not ledger_rows:
+                return 0
+
+            # 플러시 도중 새로 스테이징된 앵커는 다음 플러시로 넘긴다.
+            rows = list(self._pending.values())
+            self._pending = {}
+            try:
+                async with self._session_factory() as session:
+                    # 실행 도중 삭제된 키워드의 행은 외래 키 위반으로 청크 전체를 실패시키므로 뺀다.
+                    existing_ids = await select_existing_keyword_ids(
+                        session, {row["keyword_id"] for row in (*rows, *ledger_rows)}
+                    )
+                    rows = self._drop_deleted_keywords(rows, existing_ids)
+                    ledger_rows = self._drop_deleted_keywords(ledger_rows, existing_ids)
+                    await upsert_keyword_sites(session, rows, commit=False)
+                    await upsert_run_ledger(session, ledger_rows, commit=False)
+                    await session.commit()
+            except Exception:
+                for row in rows:
+                    key = (row["keyword_id"], row["site_name"])
+                    self._pending.setdefault(key, row)
+                if self.run_ledger is not None:
+                    self.run_ledger.restage(ledger_rows)
+                raise
+
+            self.flushed_count += len(rows)
+            logger.debug("KeywordSite 앵커 일괄 반영: rows=%s", len(rows))
+            return len(rows)
+
+    @staticmethod
+    def _drop_deleted_keywords(
+        rows: list[dict[str, Any]],
+        existing_ids: set[int],
+    ) -> list[dict[str, Any]]:
+        kept_rows = [row for row in rows if row["keyword_id"] in existing_ids]
+        if len(kept_rows) < len(rows):
+            logger.info(
+                "삭제된 키워드의 앵커/원장 행 %s건을 반영하지 않습니다.", len(rows) - len(kept_rows)
+            )
+        return kept_rows
@@ -0,0 +1,51 @@
+import math
+from datetime import datetime, timedelta
+
+from app.src.core.config import settings
+
+# 첫 관측에서 마지막 신규 핫딜 이후 경과 시간이 이보다 짧아도 이 값으로 본다. (속도 과대추정 방지)
+_MIN_OBSERVATION_HOURS = 1 / 60
+
+
+def estimate_deal_rate(
+    previous_rate: float | None,
+    new_deal_count: int,
+    elapsed_hours: float | None,
+    last_deal_at: datetime | None,
+    now: datetime,
+) -> float | None:
+    """
+    시간당 신규 핫딜 수를 EWMA로 갱신합니다.
+    - 직전 완료 이후 경과 시간이 있으면 이번 크롤링에서 찾은 신규 핫딜 수로 관측합니다.
+    - 첫 관측이면 마지막으로 신규 핫딜이 나온 시각(KeywordSite.wdate) 이후 경과 시간으로 초기값을 잡습니다.
+    관측할 수 없으면 이전 값을 그대로 반환합니다.
+    """
+    if elapsed_hours is not None and elapsed_hours > 0:
+        sample = new_deal_count / elapsed_hours
+    elif last_deal_at is not None:
+        hours_since_deal = (now - last_deal_at).total_seconds() / 3600
+        sample = 1 / max(_MIN_OBSERVATION_HOURS, hours_since_deal)
+    else:
+        return previous_rate
+
+    if previous_rate is None:
+        return sample
+    alpha = min(1.0, max(0.0, settings.CRAWL_SCHEDULE_RATE_EWMA_ALPHA))
+    return alpha * sample + (1 - alpha) * previous_rate
+
+
+def compute_crawl_interval(deal_rate: float | None, subscriber_count: int = 1) -> timedelta:
+    """
+    다음 크롤링까지의 간격. 한 번에 CRAWL_SCHEDULE_TARGET_DEALS_PER_CRAWL건이 쌓일 시간을 기준으로,
+    구독자가 두 배가 될 때마다 한 단계씩 더 자주 크롤링합니다. [최소, 최대] 간격을 벗어나지 않습니다.
+    """
+    min_minutes = max(1.0, settings.CRAWL_SCHEDULE_MIN_INTERVAL_MINUTES)
+    max_minutes = max(min_minutes, settings.CRAWL_SCHEDULE_MAX_INTERVAL_MINUTES)
+    if deal_rate is None:
+        minutes = settings.CRAWL_SCHEDULE_DEFAULT_INTERVAL_MINUTES
+    elif deal_rate <= 0:
+        minutes = max_minutes
+    else:
+        minutes = max(0.0, settings.CRAWL_SCHEDULE_TARGET_DEALS_PER_CRAWL) / deal_rate * 60
+    minutes /= 1 + math.log2(max(1, subscriber_count))
+    return timedelta(minutes=min(max_minutes, max(min_minutes, minutes)))
@@ -0,0 +1,188 @@
+from collections import deque
+from collections.abc import Iterable, Mapping
+
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.domain.hotdeal.utils import normalize_keyword
+
+# 삭제된 키워드만 쓰던 노드가 전체 노드의 절반을 넘으면 트라이를 다시 만든다.
+_MAX_DEAD_NODE_RATIO = 0.5
+# 노드 수가 이보다 적으면 다시 만들지 않는다. (작은 트라이에서 재구성이 잦아지지 않도록)
+_MIN_REBUILD_NODES = 64
+
+
+class KeywordMatcher:
+    """
+    등록된 키워드 전체를 하나의 Aho-Corasick 오토마톤으로 컴파일해
+    제목 한 번의 순회로 포함된 모든 키워드 ID를 찾습니다.
+    키워드 추가/삭제는 트라이에 바로 반영하고, 실패 링크는 다음 매칭 전에 한 번만 재계산합니다.
+    삭제로 쓰이지 않는 노드가 많아지면 남은 키워드로 트라이를 다시 만듭니다.
+    """
+
+    def __init__(self, keyword_titles: Mapping[int, str] | None = None):
+        self._reset()
+        if keyword_titles:
+            for keyword_id, title in keyword_titles.items():
+                self.add(keyword_id, title)
+
+    def _reset(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 실패 링크를 따라가며 처음 만나는 출력 노드 (없으면 0)
+        self._output_link: list[int] = [0]
+        self._outputs: list[set[int]] = [set()]
+        self._patterns: dict[int, str] = {}
+        self._pattern_nodes: dict[int, int] = {}
+        # 살아 있는 키워드 글자 수 합. 살아 있는 노드 수의 상한(+ 루트)
+        self._pattern_chars = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, keyword_id: int) -> bool:
+        return keyword_id in self._patterns
+
+    @property
+    def node_count(self) -> int:
+        return len(self._goto)
+
+    def add(self, keyword_id: int, title: str) -> None:
+        pattern = normalize_keyword(title).strip()
+        if self._patterns.get(keyword_id) == pattern:
+            return
+        if keyword_id in self._patterns:
+            self.remove(keyword_id)
+        if not pattern:
+            return
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output_link.append(0)
+                self._outputs.append(set())
+            node = next_node
+
+        self._outputs[node].add(keyword_id)
+        self._patterns[keyword_id] = pattern
+        self._pattern_chars += len(pattern)
+        self._pattern_nodes[keyword_id] = node
+        self._dirty = True
+
+    def remove(self, keyword_id: int) -> None:
+        node = self._pattern_nodes.pop(keyword_id, None)
+        if node is None:
+            return
+        pattern = self._patterns.pop(keyword_id)
+        self._pattern_chars -= len(pattern)
+        self._outputs[node].discard(keyword_id)
+        if not self._outputs[node]:
+            # 출력 링크가 바뀌므로 재계산 필요 (트라이 노드는 남겨 두고 재사용)
+            self._dirty = True
+        if self._should_rebuild():
+            self._rebuild()
+
+    def _should_rebuild(self) -> bool:
+        node_count = len(self._goto)
+        if node_count < _MIN_REBUILD_NODES:
+            return False
+        dead_nodes = node_count - (self._pattern_chars + 1)
+        return dead_nodes / node_count > _MAX_DEAD_NODE_RATIO
+
+    def _rebuild(self) -> None:
+        """남은 키워드만으로 트라이를 다시 만들어 삭제된 키워드의 노드를 정리합니다."""
+        patterns = self._patterns
+        self._reset()
+        for keyword_id, pattern in patterns.items():
+            self.add(keyword_id, pattern)
+
+    def sync(self, keyword_titles: Mapping[int, str]) -> tuple[int, int]:
+        """현재 활성 키워드 목록에 맞춰 변경분만 추가/삭제합니다. (추가 수, 삭제 수) 반환"""
+        removed_ids = [kid for kid in self._patterns if kid not in keyword_titles]
+        for keyword_id in removed_ids:
+            self.remove(keyword_id)
+
+        added = 0
+        for keyword_id, title in keyword_titles.items():
+            before = self._patterns.get(keyword_id)
+            self.add(keyword_id, title)
+            if self._patterns.get(keyword_id) != before:
+                added += 1
+        return added, len(removed_ids)
+
+    def match(self, title: str) -> set[int]:
+        """정규화한 제목에 포함된 모든 키워드 ID를 반환합니다."""
+        if self._dirty:
+            self._build_links()
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        output_link = self._output_link
+
+        matched: set[int] = set()
+        node = 0
+        for char in normalize_keyword(title):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            hit = node if outputs[node] else output_link[node]
+            while hit:
+                matched.update(outputs[hit])
+                hit = output_link[hit]
+        return matched
+
+    def match_deals(
+        self,
+        deals: Iterable[CrawledKeyword],
+    ) -> dict[int, list[CrawledKeyword]]:
+        """딜 제목마다 한 번씩 순회해 키워드 ID별 딜 목록을 반환합니다. (순서 유지)"""
+        matches: dict[int, list[CrawledKeyword]] = {}
+        for deal in deals:
+            for keyword_id in self.match(deal.title):
+                matches.setdefault(keyword_id, []).append(deal)
+        return matches
+
+    def _build_links(self) -> None:
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        output_link = self._output_link
+
+        queue: deque[int] = deque()
+        for child in goto[0].values():
+            fail[child] = 0
+            output_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                fallback = fail[node]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                child_fail = goto[fallback].get(char, 0)
+                fail[child] = child_fail
+                output_link[child] = (
+                    child_fail if outputs[child_fail] else output_link[child_fail]
+                )
+                queue.append(child)
+
+        self._dirty = False
+
+
+def match_deals_by_keyword(
+    keyword_titles: Mapping[int, str],
+    deals: Iterable[CrawledKeyword],
+) -> dict[int, list[CrawledKeyword]]:
+    """정규화한 키워드가 제목에 포함된 딜을 키워드 ID별로 묶어 반환합니다. (순서 유지)"""
+    return KeywordMatcher(keyword_titles).match_deals(deals)
+
+
+# 프로세스 단위 매처. 워커가 실행마다 활성 키워드와 sync()로 변경분만 반영합니다.
+KEYWORD_MATCHER = KeywordMatcher()
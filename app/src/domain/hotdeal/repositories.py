@@ -1,10 +1,15 @@
+from collections.abc import Iterable
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import exists
 
-from app.src.domain.hotdeal.models import Keyword
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.models import Keyword, KeywordSite
 from app.src.domain.user.models import User, user_keywords
 
 
@@ -128,3 +133,60 @@ async def select_users_keywords(
     )
     result = await db.execute(select_query)
     return result.scalars().all()
+
+
+# 키워드 목록에 해당하는 KeywordSite(앵커) 전체를 한 번에 조회
+async def select_keyword_sites(
+    db: AsyncSession,
+    keyword_ids: Iterable[int],
+    site_names: Iterable[SiteName] | None = None,
+) -> list[KeywordSite]:
+    keyword_id_list = list(keyword_ids)
+    if not keyword_id_list:
+        return []
+    select_query = select(KeywordSite).where(KeywordSite.keyword_id.in_(keyword_id_list))
+    if site_names is not None:
+        select_query = select_query.where(KeywordSite.site_name.in_(list(site_names)))
+    result = await db.execute(select_query)
+    return list(result.scalars().all())
+
+
+# 주어진 키워드 ID 중 아직 존재하는 것만 조회 (실행 도중 삭제된 키워드 제외용)
+async def select_existing_keyword_ids(
+    db: AsyncSession,
+    keyword_ids: Iterable[int],
+) -> set[int]:
+    keyword_id_list = list(keyword_ids)
+    if not keyword_id_list:
+        return set()
+    result = await db.execute(select(Keyword.id).where(Keyword.id.in_(keyword_id_list)))
+    return set(result.scalars().all())
+
+
+# KeywordSite 여러 건을 (keyword_id, site_name) 기준으로 일괄 upsert
+async def upsert_keyword_sites(
+    db: AsyncSession,
+    rows: list[dict[str, Any]],
+    commit: bool = True,
+) -> int:
+    if not rows:
+        return 0
+
+    # 운영(PostgreSQL)과 테스트(SQLite) 모두 ON CONFLICT 구문을 지원한다.
+    dialect_name = db.get_bind().dialect.name
+    insert_factory = sqlite_insert if dialect_name == "sqlite" else postgresql_insert
+    insert_query = insert_factory(KeywordSite).values(rows)
+    upsert_query = insert_query.on_conflict_do_update(
+        index_elements=[KeywordSite.keyword_id, KeywordSite.site_name],
+        set_={
+            "external_id": insert_query.excluded.external_id,
+            "link": insert_query.excluded.link,
+            "price": insert_query.excluded.price,
+            "meta_data": insert_query.excluded.meta_data,
+            "wdate": insert_query.excluded.wdate,
+        },
+    )
+    await db.execute(upsert_query)
+    if commit:
+        await db.commit()
+    return len(rows)
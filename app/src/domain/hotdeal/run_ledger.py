@@ -0,0 +1,226 @@
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.core.logger import logger
+from app.src.core.time import ensure_utc, ensure_utc_or_none, utc_now
+from app.src.domain.admin.models import RunLedgerStatus
+from app.src.domain.admin.repositories import select_run_ledger
+from app.src.domain.hotdeal.crawl_schedule import compute_crawl_interval, estimate_deal_rate
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.models import Keyword
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+
+LedgerKey = tuple[int, SiteName]
+
+_DEALS_ADAPTER = TypeAdapter(list[CrawledKeyword])
+# 완료 기록이 없는 (키워드, 사이트)는 가장 오래된 것으로 취급해 먼저 처리한다.
+_NEVER_COMPLETED = datetime.min.replace(tzinfo=UTC)
+
+
+class RunLedger:
+    """
+    워커 실행 원장. (키워드, 사이트)별 마지막 크롤링 완료 시각과 결과를 기록합니다.
+    - 실행 시작 시 원장을 적재해 완료 기록이 없거나 가장 오래된 키워드부터 처리합니다.
+    - 이전 실행이 크롤링/앵커 반영까지 마치고 메일을 만들기 전에 중단된(DONE) 쌍은
+      다시 크롤링하지 않고 저장된 신규 핫딜을 이번 실행의 메일에 포함합니다.
+    - 완료할 때마다 신규 핫딜 속도와 구독자 수로 다음 크롤링 시각을 정해 두고,
+      적응형 스케줄에서는 그 시각이 된 쌍만 크롤링합니다.
+    완료 기록은 앵커 저장소가 앵커와 같은 트랜잭션으로 반영합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        run_id: int | None = None,
+        subscriber_counts: dict[int, int] | None = None,
+    ):
+        self._session_factory = session_factory
+        self.run_id = run_id
+        self._subscriber_counts = subscriber_counts or {}
+        self._completed_at: dict[LedgerKey, datetime] = {}
+        self._deal_rates: dict[LedgerKey, float] = {}
+        self._next_due_at: dict[LedgerKey, datetime] = {}
+        self._carried: dict[LedgerKey, list[CrawledKeyword]] = {}
+        self._staged: dict[LedgerKey, dict[str, Any]] = {}
+        # 이번 실행에서 메일 적재를 마친 키워드 (아직 반영되지 않은 완료 기록에도 적용)
+        self._mailed_keyword_ids: set[int] = set()
+        self.loaded_count = 0
+        self.carried_count = 0
+        self.completed_count = 0
+        self.due_count = 0
+        self.not_due_count = 0
+
+    async def load(
+        self,
+        keyword_ids: Iterable[int],
+        site_names: Iterable[SiteName] | None = None,
+    ) -> int:
+        async with self._session_factory() as session:
+            rows = await select_run_ledger(session, keyword_ids, site_names)
+
+        for row in rows:
+            key = (row.keyword_id, row.site_name)
+            self._completed_at[key] = ensure_utc(row.completed_at)
+            if row.deal_rate is not None:
+                self._deal_rates[key] = row.deal_rate
+            next_due_at = ensure_utc_or_none(row.next_due_at)
+            if next_due_at is not None:
+                self._next_due_at[key] = next_due_at
+            if row.status == RunLedgerStatus.DONE:
+                self._carried[key] = self._load_deals(row.deals)
+        self.loaded_count = len(rows)
+        return self.loaded_count
+
+    @staticmethod
+    def _load_deals(deals: str | None) -> list[CrawledKeyword]:
+        if not deals:
+            return []
+        try:
+            return _DEALS_ADAPTER.validate_json(deals)
+        except ValidationError as e:
+            logger.warning(f"실행 원장의 핫딜 결과를 읽지 못해 건너뜁니다: {e}")
+            return []
+
+    @property
+    def pending_carry_count(self) -> int:
+        return len(self._carried)
+
+    def prioritize(
+        self,
+        keywords: list[Keyword],
+        site_names: Iterable[SiteName],
+    ) -> list[Keyword]:
+        """완료 기록이 없거나 가장 오래전에 완료한 키워드부터 정렬합니다. (동률이면 기존 순서 유지)"""
+        sites = list(site_names)
+        if not sites:
+            return keywords
+
+        def stalest_completion(keyword: Keyword) -> datetime:
+            return min(
+                self._completed_at.get((keyword.id, site), _NEVER_COMPLETED) for site in sites
+            )
+
+        return sorted(keywords, key=stalest_completion)
+
+    def select_due(
+        self,
+        keywords: list[Keyword],
+        site_names: Iterable[SiteName],
+    ) -> dict[int, set[SiteName]]:
+        """
+        키워드별로 다음 크롤링 시각이 된 사이트를 반환합니다.
+        기록이 없거나 실패로 완료되지 않은 쌍, 이전 실행의 결과가 남은 쌍은 항상 포함합니다.
+        """
+        sites = list(site_names)
+        now = utc_now()
+        due_sites_by_keyword: dict[int, set[SiteName]] = {}
+        for keyword in keywords:
+            due_sites = set()
+            for site in sites:
+                key = (keyword.id, site)
+                next_due_at = self._next_due_at.get(key)
+                if next_due_at is None or next_due_at <= now or key in self._carried:
+                    due_sites.add(site)
+            due_sites_by_keyword[keyword.id] = due_sites
+            self.due_count += len(due_sites)
+            self.not_due_count += len(sites) - len(due_sites)
+        return due_sites_by_keyword
+
+    def take_carried(self, keyword_id: int, site: SiteName) -> list[CrawledKeyword] | None:
+        """이전 실행에서 완료했지만 메일을 만들지 않은 결과. 없으면 None (크롤링 필요)."""
+        deals = self._carried.pop((keyword_id, site), None)
+        if deals is not None:
+            self.carried_count += 1
+        return deals
+
+    def record_completion(
+        self,
+        keyword_id: int,
+        site: SiteName,
+        deals: list[CrawledKeyword],
+        last_deal_at: datetime | None = None,
+    ) -> None:
+        """last_deal_at: 이번 크롤링 전 마지막으로 신규 핫딜이 나온 시각 (첫 관측의 속도 추정에 사용)"""
+        key = (keyword_id, site)
+        completed_at = utc_now()
+        previous_completed_at = self._completed_at.get(key)
+        elapsed_hours = (
+            (completed_at - previous_completed_at).total_seconds() / 3600
+            if previous_completed_at is not None
+            else None
+        )
+        deal_rate = estimate_deal_rate(
+            self._deal_rates.get(key),
+            len(deals),
+            elapsed_hours,
+            ensure_utc_or_none(last_deal_at),
+            completed_at,
+        )
+        next_due_at = completed_at + compute_crawl_interval(
+            deal_rate, self._subscriber_counts.get(keyword_id, 1)
+        )
+        self._completed_at[key] = completed_at
+        if deal_rate is not None:
+            self._deal_rates[key] = deal_rate
+        self._next_due_at[key] = next_due_at
+        self._staged[key] = {
+            "keyword_id": keyword_id,
+            "site_name": site,
+            "run_id": self.run_id,
+            "status": RunLedgerStatus.DONE,
+            "deals": _DEALS_ADAPTER.dump_json(deals).decode() if deals else None,
+            "completed_at": completed_at,
+            "deal_rate": deal_rate,
+            "next_due_at": next_due_at,
+        }
+        self.completed_count += 1
+
+    @property
+    def staged_count(self) -> int:
+        return len(self._staged)
+
+    def take_staged(self) -> list[dict[str, Any]]:
+        rows = list(self._staged.values())
+        self._staged = {}
+        return rows
+
+    def restage(self, rows: list[dict[str, Any]]) -> None:
+        """반영에 실패한 행을 되돌립니다. 그 사이 새로 기록된 행이 우선합니다."""
+        for row in rows:
+            if row["keyword_id"] in self._mailed_keyword_ids:
+                self._mark_row_mailed(row)
+            self._staged.setdefault((row["keyword_id"], row["site_name"]), row)
+
+    def mark_mailed(self, keyword_ids: Iterable[int]) -> None:
+        """
+        메일 적재를 마친 키워드의 완료 기록 중 아직 반영되지 않은 행도 메일 적재 완료로 바꿉니다.
+        나중에 반영되더라도 다음 실행이 같은 핫딜을 이월해 다시 보내지 않도록 합니다.
+        """
+        self._mailed_keyword_ids.update(keyword_ids)
+        for (keyword_id, _), row in self._staged.items():
+            if keyword_id in self._mailed_keyword_ids:
+                self._mark_row_mailed(row)
+
+    @staticmethod
+    def _mark_row_mailed(row: dict[str, Any]) -> None:
+        row["status"] = RunLedgerStatus.MAILED
+        row["deals"] = None
+
+    def log_metrics(self, label: str) -> None:
+        logger.info(
+            "[METRIC] run_ledger label=%s run_id=%s loaded=%s carried=%s completed=%s "
+            "staged=%s due=%s not_due=%s",
+            label,
+            self.run_id,
+            self.loaded_count,
+            self.carried_count,
+            self.completed_count,
+            self.staged_count,
+            self.due_count,
+            self.not_due_count,
+        )
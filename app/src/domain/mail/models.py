@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import UUID, Column, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.src.core.database import Base
@@ -15,3 +15,20 @@ class MailLog(Base):
 
     user = relationship("User", back_populates="mail_logs")
     keyword = relationship("Keyword", back_populates="mail_logs")
+
+
+class PendingMail(Base):
+    """생성했지만 아직 발송을 마치지 못한 메일. 워커가 중단되면 다음 실행 시작 시 발송"""
+
+    __tablename__ = "worker_pending_mails"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    run_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+
+    user = relationship("User")
@@ -0,0 +1,39 @@
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.src.domain.mail.models import PendingMail
+
+
+# 생성한 메일을 발송 대기열에 적재
+async def add_pending_mails(
+    db: AsyncSession,
+    mails: list[dict[str, Any]],
+    commit: bool = True,
+) -> list[PendingMail]:
+    pending_mails = [PendingMail(**mail) for mail in mails]
+    if not pending_mails:
+        return []
+    db.add_all(pending_mails)
+    await db.flush()
+    if commit:
+        await db.commit()
+    return pending_mails
+
+
+# 발송하지 못한 메일 전체를 수신자 정보와 함께 조회 (오래된 순)
+async def select_pending_mails(db: AsyncSession) -> list[PendingMail]:
+    result = await db.execute(
+        select(PendingMail)
+        .options(selectinload(PendingMail.user))
+        .order_by(PendingMail.id)
+    )
+    return list(result.scalars().all())
+
+
+# 발송을 마친 메일을 대기열에서 제거
+async def delete_pending_mail(db: AsyncSession, mail_id: int) -> None:
+    await db.execute(delete(PendingMail).where(PendingMail.id == mail_id))
+    await db.commit()
@@ -1,10 +1,19 @@
 import asyncio
+import json
 import os
 import random
 import signal
+import time
 import traceback
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from datetime import datetime
 from math import isfinite
 from pathlib import Path
+from typing import Any
+from uuid import UUID
 
 import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -15,20 +24,62 @@ from sqlalchemy.orm import selectinload
 
 from app.src.core.config import settings
 from app.src.core.logger import logger
+from app.src.core.loop_lag import EventLoopLagMonitor
 from app.src.core.time import utc_now
 from app.src.domain.admin.models import WorkerLog, WorkerStatus
+from app.src.domain.admin.repositories import (
+    get_proxy_pool_snapshot,
+    mark_run_ledger_mailed,
+    save_feed_cursors,
+    save_proxy_pool_snapshot,
+    select_feed_cursors,
+)
+from app.src.domain.hotdeal.anchor_store import KeywordSiteAnchorStore
 from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.keyword_matcher import KEYWORD_MATCHER
 from app.src.domain.hotdeal.models import Keyword, KeywordSite
+from app.src.domain.hotdeal.run_ledger import RunLedger
 from app.src.domain.hotdeal.schemas import CrawledKeyword
 from app.src.domain.mail.models import MailLog
+from app.src.domain.mail.repositories import (
+    add_pending_mails,
+    delete_pending_mail,
+    select_pending_mails,
+)
 from app.src.domain.user.models import User, user_keywords
 
 # 프로젝트의 공통 설정과 DB 세션을 가져옵니다
+from app.src.Infrastructure.crawling.adaptive_limiter import AdaptiveLimiter
+from app.src.Infrastructure.crawling.circuit_breaker import SITE_CIRCUITS
+from app.src.Infrastructure.crawling.crawl_slot import (
+    CRAWL_SLOT_STATS,
+    CrawlSlot,
+    SlotSemaphore,
+)
 from app.src.Infrastructure.crawling.crawlers import (
     get_active_sites,
     get_crawler,
+    supports_feed,
 )
+from app.src.Infrastructure.crawling.deadline import (
+    DEADLINE_STATS,
+    bound_timeout,
+    deadline_scope,
+    has_time_for,
+    remaining_seconds,
+    reserve_scope,
+)
+from app.src.Infrastructure.crawling.feed_collector import collect_feed_deals
+from app.src.Infrastructure.crawling.parse_executor import (
+    get_parse_executor_kind,
+    shutdown_parse_executor,
+)
+from app.src.Infrastructure.crawling.proxy_client_pool import PROXY_CLIENT_POOL
 from app.src.Infrastructure.crawling.proxy_manager import ProxyFailureType, ProxyManager
+from app.src.Infrastructure.crawling.proxy_replenisher import ProxyReplenisher
+from app.src.Infrastructure.crawling.rate_limiter import SITE_RATE_LIMITERS
+from app.src.Infrastructure.crawling.response_cache import RESPONSE_CACHE
+from app.src.Infrastructure.crawling.route_state import SITE_ROUTES
 from app.src.Infrastructure.crawling.shared_browser import SharedBrowser
 from app.src.Infrastructure.mail.mail_manager import (
     make_hotdeal_email_content,
@@ -62,7 +113,56 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+@dataclass(slots=True)
+class DbCheckoutStats:
+    """실행 단위 DB 커넥션 체크아웃 대기 시간 통계."""
+
+    count: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        self.count += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.count if self.count else 0.0
+
+
+DB_CHECKOUT_STATS = DbCheckoutStats()
+
+
+@asynccontextmanager
+async def _db_session() -> AsyncIterator[AsyncSession]:
+    """
+    커넥션을 즉시 체크아웃하는 짧은 DB 세션을 엽니다.
+    풀 대기 시간을 DB_CHECKOUT_STATS에 기록하므로 네트워크 I/O 구간에서는 사용하지 않습니다.
+    """
+    async with AsyncSessionLocal() as session:
+        started_at = time.perf_counter()
+        await session.connection()
+        DB_CHECKOUT_STATS.record(time.perf_counter() - started_at)
+        yield session
+
+
+def _log_db_checkout_metrics() -> None:
+    logger.info(
+        "[METRIC] db_pool_checkout count=%s avg_wait_ms=%.1f max_wait_ms=%.1f",
+        DB_CHECKOUT_STATS.count,
+        DB_CHECKOUT_STATS.avg_wait_seconds * 1000,
+        DB_CHECKOUT_STATS.max_wait_seconds * 1000,
+    )
+
+
 PROXY_MANAGER = ProxyManager()
+PROXY_SNAPSHOT_NAME = "worker"
 JOB_RUN_LOCK = asyncio.Lock()
 ALGUMON_PROXY_RECOVERY_FAILURE_TYPES = frozenset(
     {ProxyFailureType.BLOCKED, ProxyFailureType.UNKNOWN}
@@ -72,6 +172,14 @@ ALGUMON_PROXY_HISTORY_RECONCILED = False
 UNKNOWN_TEXT = "unknown"
 UNKNOWN_COUNT = -1
 
+# KeywordSite.external_id에 보관하는 최신 핫딜 앵커 개수
+ANCHOR_COUNT = 3
+# 실행 종료 시 앵커 일괄 반영 시도 횟수와 재시도 간격(초, 시도마다 늘어남)
+ANCHOR_FLUSH_ATTEMPTS = 3
+ANCHOR_FLUSH_RETRY_DELAY_SECONDS = 1.0
+# 피드 모드에서 사이트별로 마지막으로 메일 적재까지 마친 딜 ID (crawl_feed_cursors에 저장된 값의 캐시)
+FEED_LAST_SEEN_IDS: dict[SiteName, str] = {}
+
 
 def _clamp_concurrency(name: str, requested: int, max_allowed: int) -> int:
     safe_max = max(1, max_allowed)
@@ -110,14 +218,67 @@ def _resolve_crawl_concurrency(active_sites: list[SiteName]) -> tuple[int, int]:
         keyword_limit = site_limit
 
     logger.info(
-        "[INFO] 크롤링 동시성 설정: active_sites=%s, site_limit=%s, keyword_limit=%s, site_delay_jitter=1~3s",
+        "[INFO] 크롤링 동시성 설정: active_sites=%s, site_limit=%s, keyword_limit=%s, pacing=%s",
         len(active_sites),
         site_limit,
         keyword_limit,
+        (
+            f"token_bucket({settings.CRAWL_SITE_RATE_PER_SECOND}/s, "
+            f"burst={settings.CRAWL_SITE_RATE_BURST})"
+            if settings.CRAWL_SITE_RATE_LIMIT_ENABLED
+            else "jitter=1~3s"
+        ),
     )
     return site_limit, keyword_limit
 
 
+def _build_concurrency_limiters(
+    active_sites: list[SiteName],
+    site_limit: int,
+    keyword_limit: int,
+    protected: bool = False,
+) -> tuple[dict[SiteName, SlotSemaphore], asyncio.Semaphore | AdaptiveLimiter]:
+    """
+    사이트별/키워드 동시성 제한기를 만듭니다. CRAWL_ADAPTIVE_CONCURRENCY_ENABLED이면
+    결정된 한도에서 시작해 *_MAX 범위 안에서 AIMD로 조절되는 제한기를 사용합니다.
+    protected(프록시 보호 모드)이면 보호 한도를 상한으로 두어 줄이기만 합니다.
+    """
+    if not settings.CRAWL_ADAPTIVE_CONCURRENCY_ENABLED:
+        return (
+            {site: asyncio.Semaphore(site_limit) for site in active_sites},
+            asyncio.Semaphore(keyword_limit),
+        )
+
+    keyword_max_limit = (
+        keyword_limit
+        if protected
+        else max(keyword_limit, settings.CRAWL_KEYWORD_CONCURRENCY_MAX)
+    )
+    site_max_limit = (
+        site_limit if protected else max(site_limit, settings.CRAWL_SITE_CONCURRENCY_MAX)
+    )
+    keyword_limiter = AdaptiveLimiter("keyword", keyword_limit, keyword_max_limit)
+    site_limiters: dict[SiteName, SlotSemaphore] = {
+        site: AdaptiveLimiter(
+            f"site:{site.value}",
+            site_limit,
+            site_max_limit,
+            parent=keyword_limiter,
+        )
+        for site in active_sites
+    }
+    return site_limiters, keyword_limiter
+
+
+def _log_concurrency_limiters(
+    site_semaphores: dict[SiteName, SlotSemaphore],
+    keyword_semaphore: asyncio.Semaphore | AdaptiveLimiter,
+) -> None:
+    for limiter in (*site_semaphores.values(), keyword_semaphore):
+        if isinstance(limiter, AdaptiveLimiter):
+            limiter.log_metrics("crawl")
+
+
 def _resolve_protection_keyword_ratio() -> float:
     try:
         ratio = float(settings.CRAWL_PROTECTION_KEYWORD_RATIO)
@@ -126,17 +287,36 @@ def _resolve_protection_keyword_ratio() -> float:
     return max(0.1, min(ratio, 1.0))
 
 
-def _prioritize_keywords_for_protection(keywords: list[Keyword]) -> list[Keyword]:
+def _prioritize_keywords_for_protection(
+    keywords: list[Keyword],
+    priority_keyword_ids: set[int] | None = None,
+) -> list[Keyword]:
+    priority_keyword_ids = priority_keyword_ids or set()
     return sorted(
         keywords,
-        key=lambda keyword: (-len(keyword.users or []), keyword.title),
+        key=lambda keyword: (
+            keyword.id not in priority_keyword_ids,
+            -len(keyword.users or []),
+            keyword.title,
+        ),
     )
 
 
+def _prioritize_skipped_keywords(
+    keywords: list[Keyword],
+    skipped_keyword_ids: set[int],
+) -> list[Keyword]:
+    """이전 실행에서 서킷이 열려 건너뛴 키워드를 앞으로 옮깁니다. (나머지 순서는 유지)"""
+    if not skipped_keyword_ids:
+        return keywords
+    return sorted(keywords, key=lambda keyword: keyword.id not in skipped_keyword_ids)
+
+
 def _apply_proxy_pool_protection(
     keywords: list[Keyword],
     site_limit: int,
     keyword_limit: int,
+    priority_keyword_ids: set[int] | None = None,
 ) -> tuple[list[Keyword], int, int]:
     protected_site_limit = _clamp_concurrency(
         "CRAWL_PROTECTION_SITE_CONCURRENCY",
@@ -153,7 +333,7 @@ def _apply_proxy_pool_protection(
 
     protection_ratio = _resolve_protection_keyword_ratio()
     max_keywords = max(1, int(len(keywords) * protection_ratio))
-    prioritized_keywords = _prioritize_keywords_for_protection(keywords)
+    prioritized_keywords = _prioritize_keywords_for_protection(keywords, priority_keyword_ids)
     selected_keywords = prioritized_keywords[:max_keywords]
 
     logger.warning(
@@ -168,6 +348,40 @@ def _apply_proxy_pool_protection(
     return selected_keywords, protected_site_limit, protected_keyword_limit
 
 
+async def _restore_proxy_pool_snapshot() -> None:
+    """워커 시작 시 저장된 프록시 평판/풀을 복원해 첫 배치를 웜 스타트합니다."""
+    if not settings.PROXY_SNAPSHOT_ENABLED:
+        return
+    try:
+        async with _db_session() as session:
+            snapshot = await get_proxy_pool_snapshot(session, PROXY_SNAPSHOT_NAME)
+        if snapshot is None:
+            logger.info("[INFO] 저장된 프록시 스냅샷이 없어 빈 풀로 시작합니다.")
+            return
+        PROXY_MANAGER.restore_snapshot(json.loads(snapshot.payload))
+        PROXY_MANAGER.log_metrics("snapshot_restore")
+    except Exception as e:
+        logger.error(f"프록시 스냅샷 복원 실패: {e}")
+
+
+async def _save_proxy_pool_snapshot(context: str) -> None:
+    if not settings.PROXY_SNAPSHOT_ENABLED:
+        return
+    try:
+        snapshot = PROXY_MANAGER.export_snapshot()
+        payload = json.dumps(snapshot, ensure_ascii=False)
+        async with _db_session() as session:
+            await save_proxy_pool_snapshot(session, PROXY_SNAPSHOT_NAME, payload)
+        logger.info(
+            "[METRIC] proxy_snapshot_saved context=%s states=%s bytes=%s",
+            context,
+            len(snapshot["states"]),
+            len(payload),
+        )
+    except Exception as e:
+        logger.error(f"프록시 스냅샷 저장 실패: {e}")
+
+
 def _reconcile_algumon_proxy_history(active_sites: list[SiteName]) -> None:
     global ALGUMON_PROXY_HISTORY_RECONCILED
 
@@ -302,13 +516,39 @@ def _log_process_identity(event: str, **extra_fields: str) -> None:
     logger.info("[DIAG] process_identity %s", payload)
 
 
+def _skip_open_circuit_site(keyword: Keyword, site: SiteName) -> list[CrawledKeyword]:
+    SITE_CIRCUITS.record_skip(site, keyword.id)
+    logger.info(
+        "[%s] %s 서킷이 열려 있어 크롤링을 건너뜁니다. (다음 실행에서 우선 처리)",
+        keyword.title,
+        site.value,
+    )
+    return []
+
+
+def _shed_site_for_deadline(keyword: Keyword, site: SiteName) -> list[CrawledKeyword]:
+    DEADLINE_STATS.shed_sites += 1
+    logger.info(
+        "[%s] 실행 마감이 가까워 %s 크롤링을 건너뜁니다.",
+        keyword.title,
+        site.value,
+    )
+    return []
+
+
 async def handle_keyword(
     keyword: Keyword,
     client: httpx.AsyncClient,
-    site_semaphores: dict[SiteName, asyncio.Semaphore],
+    site_semaphores: dict[SiteName, SlotSemaphore],
+    anchor_store: KeywordSiteAnchorStore | None = None,
+    feed_matches: dict[SiteName, dict[int, list[CrawledKeyword]]] | None = None,
+    due_sites: set[SiteName] | None = None,
 ) -> tuple[Keyword, list[CrawledKeyword]] | None:
     """
     단일 키워드를 모든 활성 사이트에서 크롤링하고, 신규 핫딜이 있는 경우 결과를 반환합니다.
+    크롤링(네트워크) 단계는 DB 커넥션 없이 수행하고, 비교/저장 단계에서만 커넥션을 사용합니다.
+    feed_matches에 포함된 사이트는 요청 없이 피드 매칭 결과를 그대로 사용합니다.
+    due_sites가 주어지면(적응형 스케줄) 그 밖의 사이트는 크롤링하지 않습니다.
     """
     logger.debug(f"[DEBUG] 키워드 처리: [{keyword.title}]")
 
@@ -320,27 +560,71 @@ async def handle_keyword(
         120.0,
     )
 
+    run_ledger = anchor_store.run_ledger if anchor_store is not None else None
+
     async def crawl_site(site: SiteName) -> list[CrawledKeyword]:
         """특정 사이트에서 크롤링 수행 (세마포어로 동시성 제어)"""
-        async with site_semaphores[site]:
-            # 각 작업 사이에 랜덤한 지연을 주어 서버 부하를 분산
-            await asyncio.sleep(random.uniform(1, 3))
-            async with AsyncSessionLocal() as session:
-                try:
-                    return await asyncio.wait_for(
-                        get_new_hotdeal_keywords_for_site(
-                            session, keyword, client, site
-                        ),
-                        timeout=site_timeout_seconds,
-                    )
-                except TimeoutError:
-                    logger.warning(
-                        "[%s] %s 크롤링 시간 제한 %.1f초를 초과하여 건너뜁니다.",
-                        keyword.title,
-                        site.value,
-                        site_timeout_seconds,
-                    )
-                    return []
+        # 이전 실행이 크롤링까지 마치고 메일을 만들기 전에 중단된 쌍은 저장된 결과를 그대로 사용
+        if run_ledger is not None:
+            carried_deals = run_ledger.take_carried(keyword.id, site)
+            if carried_deals is not None:
+                return carried_deals
+
+        if feed_matches is not None and site in feed_matches:
+            return await get_new_hotdeal_keywords_for_site(
+                None,
+                keyword,
+                client,
+                site,
+                anchor_store=anchor_store,
+                latest_products=feed_matches[site].get(keyword.id, []),
+            )
+
+        # 적응형 스케줄: 다음 크롤링 시각이 되지 않은 사이트는 요청하지 않는다.
+        if due_sites is not None and site not in due_sites:
+            return []
+
+        # 서킷이 열린 사이트는 슬롯을 기다리지 않고 바로 건너뛴다.
+        if SITE_CIRCUITS.is_open(site):
+            return _skip_open_circuit_site(keyword, site)
+        if not has_time_for(settings.CRAWL_DEADLINE_MIN_REQUEST_SECONDS):
+            return _shed_site_for_deadline(keyword, site)
+
+        # 차단 백오프 대기 중에는 슬롯을 반납하므로 슬롯은 실제 요청 구간만 점유한다.
+        async with CrawlSlot(site_semaphores[site]):
+            # 슬롯을 기다리는 동안 서킷이 열렸거나 마감이 가까워졌을 수 있으므로 요청 직전에 다시 확인한다.
+            if not has_time_for(settings.CRAWL_DEADLINE_MIN_REQUEST_SECONDS):
+                return _shed_site_for_deadline(keyword, site)
+            if not SITE_CIRCUITS.allow_request(site):
+                return _skip_open_circuit_site(keyword, site)
+            # 요청 간격은 사이트별 토큰 버킷이 맞춘다. 비활성화 시에만 랜덤 지연으로 부하를 분산
+            if not settings.CRAWL_SITE_RATE_LIMIT_ENABLED:
+                await asyncio.sleep(random.uniform(1, 3))
+            # 실행 마감까지 남은 시간보다 길게 크롤링하지 않는다.
+            timeout_seconds = bound_timeout(site_timeout_seconds)
+            try:
+                # 세션은 네트워크 단계가 끝난 뒤 비교/저장 단계에서만 연다.
+                return await asyncio.wait_for(
+                    get_new_hotdeal_keywords_for_site(
+                        None, keyword, client, site, anchor_store=anchor_store
+                    ),
+                    timeout=timeout_seconds,
+                )
+            except TimeoutError:
+                if timeout_seconds < site_timeout_seconds:
+                    # 실행 마감으로 줄어든 제한 시간이 끝난 것은 사이트 장애가 아니므로 서킷에 반영하지 않는다.
+                    return _shed_site_for_deadline(keyword, site)
+                SITE_CIRCUITS.record_failure(site)
+                logger.warning(
+                    "[%s] %s 크롤링 시간 제한 %.1f초를 초과하여 건너뜁니다.",
+                    keyword.title,
+                    site.value,
+                    site_timeout_seconds,
+                )
+                return []
+            except Exception:
+                SITE_CIRCUITS.record_failure(site)
+                raise
 
     # 모든 활성 사이트에서 병렬 크롤링
     site_results = await asyncio.gather(
@@ -367,23 +651,55 @@ async def handle_keyword(
         return None
 
 
-async def get_new_hotdeal_keywords_for_site(
-    session: AsyncSession,
+def _select_new_deals(
+    latest_products: list[CrawledKeyword],
+    stored_external_id: str | None,
+) -> list[CrawledKeyword]:
+    """저장된 앵커(external_id CSV)와 최신 목록을 비교해 새로운 핫딜만 반환합니다."""
+    if stored_external_id is None:
+        # 첫 크롤링인 경우, 최신 1개만 새로운 핫딜로 간주
+        return latest_products[:1]
+
+    # 마지막으로 크롤링된 핫딜의 인덱스를 찾음 (앞쪽 앵커가 삭제된 경우 다음 앵커 사용)
+    latest_ids = [p.id for p in latest_products]
+    for anchor in _split_anchor_ids(stored_external_id):
+        try:
+            idx = latest_ids.index(anchor)
+        except ValueError:
+            continue
+        return latest_products[:idx]
+
+    return latest_products
+
+
+def _build_anchor_external_id(latest_products: list[CrawledKeyword]) -> str:
+    return ",".join(p.id for p in latest_products[:ANCHOR_COUNT])
+
+
+def _split_anchor_ids(stored_external_id: str | None) -> list[str]:
+    if not stored_external_id:
+        return []
+    return [anchor.strip() for anchor in stored_external_id.split(",") if anchor.strip()]
+
+
+async def _fetch_latest_products(
     keyword: Keyword,
     client: httpx.AsyncClient,
     site: SiteName,
-) -> list[CrawledKeyword]:
+    known_ids: list[str] | None = None,
+) -> tuple[list[CrawledKeyword], bool]:
     """
-    특정 사이트에서 새로운 핫딜 키워드를 조회합니다.
-    1. 해당 키워드로 크롤링을 수행하여 최신 핫딜 목록을 가져옵니다.
-    2. DB에서 이전에 저장된 KeywordSite 정보를 조회하여 마지막으로 확인한 핫딜을 찾습니다.
-    3. 최신 핫딜 목록과 마지막 확인 핫딜을 비교하여 새로운 핫딜만 필터링합니다.
-    4. 새로운 핫딜이 있는 경우, KeywordSite 정보를 최신 핫딜로 업데이트하고 새로운 핫딜 목록을 반환합니다.
-    5. 새로운 핫딜이 없는 경우, 빈 목록을 반환합니다.
+    네트워크 단계: DB 접근 없이 사이트를 크롤링해 최신 핫딜 목록을 가져옵니다.
+    스트리밍 모드에서는 알려진 앵커 ID가 나오면 (앵커 개수만큼 모은 뒤) 다운로드를 중단합니다.
+    목록과 함께 페이지를 실제로 받아왔는지(결과 0건인 성공과 실패 구분)를 반환합니다.
     """
-    # 1. 크롤링으로 최신 핫딜 목록 가져오기
     crawler = get_crawler(site, keyword.title, client)
-    latest_products: list[CrawledKeyword] = await crawler.fetchparse()
+    if settings.CRAWL_STREAMING_FETCH_ENABLED and known_ids:
+        latest_products: list[CrawledKeyword] = await crawler.fetchparse_until(
+            known_ids, min_results=ANCHOR_COUNT
+        )
+    else:
+        latest_products = await crawler.fetchparse()
     logger.info(
         "[METRIC] crawl_site_result site=%s keyword=%s results=%s search_url=%s",
         site.value,
@@ -391,11 +707,16 @@ async def get_new_hotdeal_keywords_for_site(
         len(latest_products),
         crawler.search_url,
     )
+    return latest_products, bool(crawler.fetch_succeeded)
 
-    if not latest_products:
-        return []
 
-    # 2. DB에서 이전에 저장된 KeywordSite 정보 조회
+async def _store_new_deals_for_site(
+    session: AsyncSession,
+    keyword: Keyword,
+    site: SiteName,
+    latest_products: list[CrawledKeyword],
+) -> list[CrawledKeyword]:
+    """DB 단계: 저장된 KeywordSite와 비교해 새로운 핫딜을 걸러내고 앵커를 갱신합니다."""
     stmt = select(KeywordSite).where(
         KeywordSite.site_name == site,
         KeywordSite.keyword_id == keyword.id,
@@ -403,59 +724,194 @@ async def get_new_hotdeal_keywords_for_site(
     result: Result = await session.execute(stmt)
     last_crawled_site: KeywordSite | None = result.scalars().one_or_none()
 
-    # 3. 새로운 핫딜 필터링
-    new_deals: list[CrawledKeyword] = []
-    if not last_crawled_site:
-        # 첫 크롤링인 경우, 최신 1개만 새로운 핫딜로 간주
-        new_deals = latest_products[:1]
+    new_deals = _select_new_deals(
+        latest_products,
+        last_crawled_site.external_id if last_crawled_site else None,
+    )
+    if not new_deals:
+        return []
+
+    new_external_id = _build_anchor_external_id(latest_products)
+    newest_product = latest_products[0]
+
+    if last_crawled_site:
+        # 기존 정보 업데이트
+        last_crawled_site.external_id = new_external_id
+        last_crawled_site.link = newest_product.link
+        last_crawled_site.price = newest_product.price
+        last_crawled_site.meta_data = newest_product.meta_data
+        last_crawled_site.wdate = utc_now()
     else:
-        # 마지막으로 크롤링된 핫딜의 인덱스를 찾음
-        anchors = last_crawled_site.external_id.split(",")
-        found_anchor = False
-        for anchor in anchors:
-            if not anchor.strip():
-                continue
-            try:
-                idx = [p.id for p in latest_products].index(anchor.strip())
-                new_deals = latest_products[:idx]
-                found_anchor = True
-                break
-            except ValueError:
-                continue
+        # 첫 크롤링 정보 저장
+        new_site_entry = KeywordSite(
+            keyword_id=keyword.id,
+            site_name=site,
+            external_id=new_external_id,
+            link=newest_product.link,
+            price=newest_product.price,
+            meta_data=newest_product.meta_data,
+        )
+        session.add(new_site_entry)
 
-        if not found_anchor:
-            new_deals = latest_products
-
-    # 4. 새로운 핫딜이 있으면 DB 업데이트 및 반환
-    if new_deals:
-        new_anchors = [p.id for p in latest_products[:3]]
-        new_external_id = ",".join(new_anchors)
-        newest_product = latest_products[0]
-
-        if last_crawled_site:
-            # 기존 정보 업데이트
-            last_crawled_site.external_id = new_external_id
-            last_crawled_site.link = newest_product.link
-            last_crawled_site.price = newest_product.price
-            last_crawled_site.meta_data = newest_product.meta_data
-            last_crawled_site.wdate = utc_now()
-        else:
-            # 첫 크롤링 정보 저장
-            new_site_entry = KeywordSite(
-                keyword_id=keyword.id,
-                site_name=site,
-                external_id=new_external_id,
+    await session.commit()
+    return new_deals
+
+
+async def get_new_hotdeal_keywords_for_site(
+    session: AsyncSession | None,
+    keyword: Keyword,
+    client: httpx.AsyncClient,
+    site: SiteName,
+    anchor_store: KeywordSiteAnchorStore | None = None,
+    latest_products: list[CrawledKeyword] | None = None,
+) -> list[CrawledKeyword]:
+    """
+    특정 사이트에서 새로운 핫딜 키워드를 조회합니다.
+    1. 해당 키워드로 크롤링을 수행하여 최신 핫딜 목록을 가져옵니다. (DB 커넥션 미사용)
+       - latest_products가 주어지면(피드 모드) 크롤링 없이 해당 목록을 사용
+    2. 이전에 저장된 앵커(KeywordSite)와 비교하여 새로운 핫딜만 필터링합니다.
+       - anchor_store가 있으면 메모리에서 비교하고 변경분을 일괄 반영 대기열에 적재
+         (크롤링에 성공한 쌍은 실행 원장 완료 기록도 함께 적재)
+       - session이 있으면 해당 세션으로, 없으면 이 단계에서만 짧은 세션을 열어 DB에 반영
+    3. 새로운 핫딜이 없는 경우, 빈 목록을 반환합니다.
+    """
+    # 피드 모드는 피드 실패와 매칭 없음을 구분할 수 없으므로 완료로 기록하지 않는다.
+    fetch_succeeded = False
+    if latest_products is None:
+        known_ids = (
+            _split_anchor_ids(anchor_store.get_external_id(keyword.id, site))
+            if anchor_store is not None
+            else None
+        )
+        latest_products, fetch_succeeded = await _fetch_latest_products(
+            keyword, client, site, known_ids=known_ids
+        )
+    if not latest_products:
+        if fetch_succeeded and anchor_store is not None:
+            anchor_store.record_completion(keyword.id, site, [])
+        return []
+
+    if anchor_store is not None:
+        new_deals = _select_new_deals(
+            latest_products,
+            anchor_store.get_external_id(keyword.id, site),
+        )
+        # 완료 기록을 앵커보다 먼저 적재해 같은 플러시에 함께 반영되게 한다.
+        if fetch_succeeded:
+            anchor_store.record_completion(keyword.id, site, new_deals)
+        if new_deals:
+            newest_product = latest_products[0]
+            await anchor_store.stage(
+                keyword.id,
+                site,
+                external_id=_build_anchor_external_id(latest_products),
                 link=newest_product.link,
                 price=newest_product.price,
                 meta_data=newest_product.meta_data,
             )
-            session.add(new_site_entry)
-
-        await session.commit()
         return new_deals
 
-    # 5. 새로운 핫딜이 없으면 빈 목록 반환
-    return []
+    if session is not None:
+        return await _store_new_deals_for_site(session, keyword, site, latest_products)
+
+    async with _db_session() as db_session:
+        return await _store_new_deals_for_site(
+            db_session, keyword, site, latest_products
+        )
+
+
+async def collect_feed_matches(
+    keywords: list[Keyword],
+    client: httpx.AsyncClient,
+    sites: list[SiteName],
+) -> tuple[dict[SiteName, dict[int, list[CrawledKeyword]]], dict[SiteName, str]]:
+    """
+    피드를 지원하는 사이트마다 전체 최신 목록을 마지막 확인 딜까지 한 번만 가져와
+    모든 키워드를 제목에 대해 로컬에서 매칭합니다. (요청 수: 키워드 수 → 페이지 수)
+    반환된 딜의 search_url은 키워드별 검색 URL로 바꿔 메일 링크를 기존과 동일하게 유지합니다.
+    사이트별 다음 확인 딜 ID도 함께 반환하며, 호출자가 앵커 반영과 메일 적재를 마친 뒤 전진시킵니다.
+    """
+    keyword_titles = {keyword.id: keyword.title for keyword in keywords}
+    feed_matches: dict[SiteName, dict[int, list[CrawledKeyword]]] = {}
+    next_last_seen_ids: dict[SiteName, str] = {}
+    # 프로세스 단위 매처에 이번 실행의 키워드 변경분만 반영 (전체 재컴파일 없음)
+    added_count, removed_count = KEYWORD_MATCHER.sync(keyword_titles)
+    logger.info(
+        "[METRIC] keyword_matcher keywords=%s nodes=%s added=%s removed=%s",
+        len(KEYWORD_MATCHER),
+        KEYWORD_MATCHER.node_count,
+        added_count,
+        removed_count,
+    )
+
+    for site in sites:
+        if not supports_feed(site):
+            continue
+
+        try:
+            feed = await collect_feed_deals(
+                site,
+                client,
+                last_seen_id=FEED_LAST_SEEN_IDS.get(site),
+                max_pages=settings.CRAWL_FEED_MAX_PAGES,
+            )
+        except Exception as e:
+            logger.error(f"{site.value} 피드 수집 중 오류 발생: {e}")
+            feed_matches[site] = {}
+            continue
+
+        if feed.failed:
+            # 피드 장애 시 키워드별 검색으로 되돌리지 않는다. (차단 상황에서 요청 폭증 방지)
+            logger.warning("%s 피드를 가져오지 못해 이번 실행에서 건너뜁니다.", site.value)
+            feed_matches[site] = {}
+            continue
+
+        if feed.deals:
+            next_last_seen_ids[site] = feed.deals[0].id
+
+        site_matches: dict[int, list[CrawledKeyword]] = {}
+        for keyword_id, deals in KEYWORD_MATCHER.match_deals(feed.deals).items():
+            search_url = get_crawler(site, keyword_titles[keyword_id], client).search_url
+            site_matches[keyword_id] = [
+                deal.model_copy(update={"search_url": search_url}) for deal in deals
+            ]
+        feed_matches[site] = site_matches
+
+        logger.info(
+            "[METRIC] crawl_feed_result site=%s pages=%s deals=%s matched_keywords=%s "
+            "reached_last_seen=%s",
+            site.value,
+            feed.pages_fetched,
+            len(feed.deals),
+            len(site_matches),
+            feed.reached_last_seen,
+        )
+
+    return feed_matches, next_last_seen_ids
+
+
+async def _load_feed_cursors() -> None:
+    """프로세스 시작 후 첫 실행이면 저장된 피드 커서를 불러옵니다. (재시작 후 같은 딜을 다시 수집하지 않도록)"""
+    if FEED_LAST_SEEN_IDS:
+        return
+    try:
+        async with _db_session() as session:
+            FEED_LAST_SEEN_IDS.update(await select_feed_cursors(session))
+    except Exception as e:
+        logger.error(f"피드 커서 조회 중 오류 발생: {e}")
+
+
+async def _advance_feed_cursors(next_last_seen_ids: dict[SiteName, str]) -> None:
+    """피드 커서를 저장한 뒤 전진시킵니다. 저장에 실패하면 다음 실행이 같은 구간을 다시 수집합니다."""
+    if not next_last_seen_ids:
+        return
+    try:
+        async with _db_session() as session:
+            await save_feed_cursors(session, next_last_seen_ids)
+    except Exception as e:
+        logger.error(f"피드 커서 저장 중 오류 발생: {e}")
+        return
+    FEED_LAST_SEEN_IDS.update(next_last_seen_ids)
 
 
 async def get_new_hotdeal_keywords(
@@ -472,6 +928,587 @@ async def get_new_hotdeal_keywords(
     )
 
 
+async def _build_user_email(
+    user: User,
+    user_deals: dict[Keyword, list[CrawledKeyword]],
+) -> tuple[str, str] | None:
+    """사용자별 메일 제목과 본문을 생성합니다. 유효한 내용이 없으면 None을 반환합니다."""
+    email_content: str = ""
+    subject: str = ""
+    for keyword, deals in user_deals.items():
+        try:
+            email_content += await make_hotdeal_email_content(keyword, deals)
+            subject += f"{keyword.title}, "
+        except Exception as e:
+            logger.error(
+                f"사용자 {user.email}, 키워드 {keyword.title} 메일 내용 생성 중 오류: {e}"
+            )
+            # 내용 생성 실패 시 해당 키워드는 건너뛰고 계속 진행
+            continue
+
+    if not email_content:
+        # 모든 키워드에서 내용 생성 실패 시 메일 발송 안함
+        logger.info(f"[INFO] 사용자 {user.email} 에게 발송할 유효한 메일 내용 없음")
+        return None
+
+    subject = subject.rstrip(", ")  # 마지막 쉼표 및 공백 제거
+    return f"[{subject}] 새로운 핫딜 알림", email_content
+
+
+def _deliver_user_email(
+    user: User,
+    subject: str,
+    body: str,
+) -> Coroutine[Any, Any, None] | None:
+    """운영 환경이면 발송 코루틴을 반환하고, 그 외 환경에서는 로그만 남깁니다."""
+    if settings.ENVIRONMENT == "prod":
+        return send_email(subject=subject, to=user.email, body=body, is_html=True)
+
+    logger.info(f"[DEV] 사용자 {user.email} 에게 메일 발송 제목:{subject} 내용:{body}")
+    return None
+
+
+async def _store_pending_mails(
+    emails: list[tuple[User, str, str]],
+    run_ledger: RunLedger | None = None,
+    mailed_keyword_ids: list[int] | None = None,
+) -> list[int | None] | None:
+    """
+    생성한 메일을 발송 대기열 테이블에 저장하고, 같은 트랜잭션에서 실행 원장의 완료 기록을
+    메일 적재 완료로 표시합니다. 발송 전에 중단되면 다음 실행이 대기열의 메일을 발송합니다.
+    저장에 실패하면 None을 반환하며, 이때는 메일을 발송하지 않습니다. (원장이 그대로 남아 다음 실행이 발송)
+    """
+    if not settings.WORKER_RUN_LEDGER_ENABLED:
+        return [None] * len(emails)
+    try:
+        async with _db_session() as session:
+            pending_mails = await add_pending_mails(
+                session,
+                [
+                    {
+                        "user_id": user.id,
+                        "subject": subject,
+                        "body": body,
+                        "run_id": run_ledger.run_id if run_ledger is not None else None,
+                    }
+                    for user, subject, body in emails
+                ],
+                commit=False,
+            )
+            if run_ledger is not None and mailed_keyword_ids:
+                await mark_run_ledger_mailed(session, mailed_keyword_ids, commit=False)
+            await session.commit()
+    except Exception as e:
+        logger.error(f"메일 발송 대기열 저장 중 오류 발생: {e}")
+        return None
+    if run_ledger is not None and mailed_keyword_ids:
+        run_ledger.mark_mailed(mailed_keyword_ids)
+    return [mail.id for mail in pending_mails]
+
+
+async def _clear_pending_mail(mail_id: int | None) -> None:
+    if mail_id is None:
+        return
+    try:
+        async with _db_session() as session:
+            await delete_pending_mail(session, mail_id)
+    except Exception as e:
+        logger.error(f"발송 완료 메일 대기열 정리 중 오류 발생: mail_id={mail_id}, {e}")
+
+
+async def _send_and_clear_pending_mail(
+    send_coroutine: Coroutine[Any, Any, None],
+    mail_id: int | None,
+) -> None:
+    await send_coroutine
+    await _clear_pending_mail(mail_id)
+
+
+async def _send_stored_emails(emails: list[tuple[User, str, str, int | None]]) -> int:
+    """대기열에 저장된 메일을 발송하고, 발송을 마친 메일은 대기열에서 제거합니다."""
+    send_tasks = []
+    for user, subject, body, mail_id in emails:
+        send_coroutine = _deliver_user_email(user, subject, body)
+        if send_coroutine is None:
+            await _clear_pending_mail(mail_id)
+            continue
+        send_tasks.append(_send_and_clear_pending_mail(send_coroutine, mail_id))
+    if send_tasks:
+        await asyncio.gather(*send_tasks)
+    return len(send_tasks)
+
+
+async def _deliver_pending_mails() -> int:
+    """이전 실행이 생성했지만 발송을 마치지 못한 메일을 발송합니다."""
+    try:
+        async with _db_session() as session:
+            pending_mails = await select_pending_mails(session)
+    except Exception as e:
+        logger.error(f"미발송 메일 조회 중 오류 발생: {e}")
+        return 0
+    if not pending_mails:
+        return 0
+
+    logger.info("[METRIC] pending_mail_resume count=%s", len(pending_mails))
+    return await _send_stored_emails(
+        [(mail.user, mail.subject, mail.body, mail.id) for mail in pending_mails]
+    )
+
+
+async def _mark_run_ledger_mailed(run_ledger: RunLedger | None, keyword_ids: list[int]) -> None:
+    if run_ledger is None:
+        return
+    try:
+        async with _db_session() as session:
+            await mark_run_ledger_mailed(session, keyword_ids)
+    except Exception as e:
+        logger.error(f"실행 원장 메일 적재 표시 중 오류 발생: {e}")
+        return
+    run_ledger.mark_mailed(keyword_ids)
+
+
+def _ledger_sites(active_sites: list[SiteName]) -> list[SiteName]:
+    """실행 원장에 완료가 기록되는 사이트. (피드 모드로 처리되는 사이트는 제외)"""
+    if not settings.CRAWL_FEED_MODE_ENABLED:
+        return active_sites
+    return [site for site in active_sites if not supports_feed(site)]
+
+
+async def _load_run_ledger(
+    run_id: int | None,
+    keywords: list[Keyword],
+    active_sites: list[SiteName],
+) -> RunLedger | None:
+    if not settings.WORKER_RUN_LEDGER_ENABLED:
+        return None
+    run_ledger = RunLedger(
+        session_factory=_db_session,
+        run_id=run_id,
+        subscriber_counts={keyword.id: len(keyword.users) for keyword in keywords},
+    )
+    try:
+        await run_ledger.load([keyword.id for keyword in keywords], active_sites)
+    except Exception as e:
+        logger.error(f"실행 원장 조회 중 오류 발생: {e}")
+        return None
+    run_ledger.log_metrics("batch_start")
+    return run_ledger
+
+
+def _select_due_keywords(
+    keywords: list[Keyword],
+    run_ledger: RunLedger,
+    active_sites: list[SiteName],
+) -> tuple[list[Keyword], dict[int, set[SiteName]]]:
+    """
+    적응형 스케줄: 다음 크롤링 시각이 된 사이트가 있는 키워드만 남깁니다.
+    피드 모드로 처리되는 사이트는 요청 없이 매칭하므로 모든 키워드를 남깁니다.
+    """
+    ledger_sites = _ledger_sites(active_sites)
+    due_sites_by_keyword = run_ledger.select_due(keywords, ledger_sites)
+    if len(ledger_sites) < len(active_sites):
+        due_keywords = keywords
+    else:
+        due_keywords = [keyword for keyword in keywords if due_sites_by_keyword[keyword.id]]
+    logger.info(
+        "[METRIC] crawl_schedule due_keywords=%s total_keywords=%s due_pairs=%s not_due_pairs=%s",
+        len(due_keywords),
+        len(keywords),
+        run_ledger.due_count,
+        run_ledger.not_due_count,
+    )
+    return due_keywords, due_sites_by_keyword
+
+
+class StreamingMailDispatcher:
+    """
+    사용자별로 이번 실행에서 남은 구독 키워드 수를 카운트다운하고,
+    0이 되는 즉시 메일을 생성해 발송 대기열에 넣습니다.
+    완료된 사용자의 핫딜은 바로 해제되므로 전체 결과를 실행 끝까지 들고 있지 않습니다.
+    키워드의 모든 구독자 메일이 대기열에 들어가면 그 키워드의 실행 원장을 같은 트랜잭션에서
+    메일 적재 완료로 표시합니다. (중단 후 재실행 시 이미 적재한 핫딜을 다시 보내지 않도록)
+    """
+
+    def __init__(
+        self,
+        users: list[User],
+        keywords: list[Keyword],
+        before_send: Callable[[], Awaitable[Any]] | None = None,
+        is_unflushed: Callable[[int, SiteName], bool] | None = None,
+        run_ledger: RunLedger | None = None,
+    ):
+        keyword_ids = {keyword.id for keyword in keywords}
+        self._users: dict[UUID, User] = {}
+        self._pending_counts: dict[UUID, int] = {}
+        self._subscribers: dict[int, list[UUID]] = defaultdict(list)
+        self._user_deals: dict[UUID, dict[Keyword, list[CrawledKeyword]]] = {}
+        self._before_send = before_send
+        self._is_unflushed = is_unflushed
+        self._run_ledger = run_ledger
+        # before_send 실패로 실행 끝까지 미룬 사용자별 핫딜
+        self._deferred: dict[UUID, tuple[User, dict[Keyword, list[CrawledKeyword]]]] = {}
+        # 키워드별로 아직 메일 대기열 적재를 마치지 않은 구독자
+        self._unsettled: dict[int, set[UUID]] = {}
+        # 크롤링에 실패했거나 건너뛴 키워드 (원장을 메일 적재 완료로 표시하지 않음)
+        self._unmailable_keyword_ids: set[int] = set()
+        # 모든 구독자 처리를 마쳤지만 아직 원장에 표시하지 않은 키워드
+        self._mailed_keyword_ids: set[int] = set()
+        self._send_tasks: set[asyncio.Task] = set()
+        self.emails_queued = 0
+        # 메일을 발송 대기열에 넣지 못한 사용자 수
+        self.failed_user_count = 0
+
+        for user in users:
+            subscribed_ids = {kw.id for kw in user.keywords if kw.id in keyword_ids}
+            if not subscribed_ids:
+                continue
+            self._users[user.id] = user
+            self._pending_counts[user.id] = len(subscribed_ids)
+            for keyword_id in subscribed_ids:
+                self._subscribers[keyword_id].append(user.id)
+                self._unsettled.setdefault(keyword_id, set()).add(user.id)
+
+    @property
+    def pending_user_count(self) -> int:
+        return len(self._pending_counts)
+
+    async def complete_keyword(
+        self,
+        keyword: Keyword,
+        deals: list[CrawledKeyword],
+        mailable: bool = True,
+    ) -> None:
+        """mailable=False: 크롤링에 실패했거나 건너뛴 키워드. 원장을 메일 적재 완료로 표시하지 않습니다."""
+        if not mailable:
+            self._unmailable_keyword_ids.add(keyword.id)
+        for user_id in self._subscribers.pop(keyword.id, []):
+            if deals:
+                self._user_deals.setdefault(user_id, {})[keyword] = deals
+            else:
+                self._settle(user_id, [keyword.id])
+            self._pending_counts[user_id] -= 1
+            if self._pending_counts[user_id] == 0:
+                del self._pending_counts[user_id]
+                await self._dispatch(user_id)
+
+    def _settle(self, user_id: UUID, keyword_ids: Iterable[int]) -> None:
+        for keyword_id in keyword_ids:
+            unsettled = self._unsettled.get(keyword_id)
+            if unsettled is None:
+                continue
+            unsettled.discard(user_id)
+            if not unsettled:
+                del self._unsettled[keyword_id]
+                if keyword_id not in self._unmailable_keyword_ids:
+                    self._mailed_keyword_ids.add(keyword_id)
+
+    def _mailed_after_settle(self, user_id: UUID, keyword_ids: Iterable[int]) -> list[int]:
+        """이 사용자 메일을 적재하면 원장을 메일 적재 완료로 표시할 수 있는 키워드."""
+        mailed_keyword_ids = set(self._mailed_keyword_ids)
+        for keyword_id in keyword_ids:
+            if (
+                self._unsettled.get(keyword_id) == {user_id}
+                and keyword_id not in self._unmailable_keyword_ids
+            ):
+                mailed_keyword_ids.add(keyword_id)
+        return sorted(mailed_keyword_ids)
+
+    async def _dispatch(self, user_id: UUID) -> None:
+        user = self._users.pop(user_id)
+        user_deals = self._user_deals.pop(user_id, None)
+        if not user_deals:
+            return
+        await self._send_user_deals(user, user_deals)
+
+    async def _send_user_deals(
+        self,
+        user: User,
+        user_deals: dict[Keyword, list[CrawledKeyword]],
+    ) -> None:
+        try:
+            # 발송 전에 앵커를 먼저 반영해야 중단 후 재실행 시 중복 발송이 없다.
+            # 반영에 실패하면 이 사용자는 실행 끝으로 미룬다.
+            if self._before_send is not None:
+                try:
+                    await self._before_send()
+                except Exception as e:
+                    logger.warning(f"메일 발송 전 사전 작업 실패로 사용자 {user.email} 발송을 미룹니다: {e}")
+                    self._defer(user, user_deals)
+                    return
+            await self._queue_user_email(user, user_deals, list(user_deals))
+        except Exception as e:
+            self.failed_user_count += 1
+            logger.error(f"사용자 {user.email} 메일 처리 중 오류 발생: {e}")
+
+    async def _queue_user_email(
+        self,
+        user: User,
+        user_deals: dict[Keyword, list[CrawledKeyword]],
+        settled_keywords: list[Keyword],
+    ) -> None:
+        """
+        메일을 발송 대기열에 저장하고 발송을 시작합니다.
+        settled_keywords: 이 메일로 이 사용자의 핫딜을 모두 담은 키워드 (원장 표시 대상)
+        """
+        settled_keyword_ids = [keyword.id for keyword in settled_keywords]
+        email = await _build_user_email(user, user_deals) if user_deals else None
+        if email is None:
+            self._settle(user.id, settled_keyword_ids)
+            return
+
+        # 발송 전에 대기열에 저장해, 발송 도중 중단되어도 다음 실행에서 발송한다.
+        # 원장 표시도 같은 트랜잭션에서 하고, 저장에 실패하면 발송하지 않는다.
+        mailed_keyword_ids = self._mailed_after_settle(user.id, settled_keyword_ids)
+        mail_ids = await _store_pending_mails([(user, *email)], self._run_ledger, mailed_keyword_ids)
+        if mail_ids is None:
+            self.failed_user_count += 1
+            return
+        self._settle(user.id, settled_keyword_ids)
+        self._mailed_keyword_ids.difference_update(mailed_keyword_ids)
+
+        (mail_id,) = mail_ids
+        send_coroutine = _deliver_user_email(user, *email)
+        if send_coroutine is None:
+            await _clear_pending_mail(mail_id)
+            return
+        task = asyncio.create_task(_send_and_clear_pending_mail(send_coroutine, mail_id))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+        self.emails_queued += 1
+
+    def _defer(self, user: User, user_deals: dict[Keyword, list[CrawledKeyword]]) -> None:
+        _, deferred_deals = self._deferred.setdefault(user.id, (user, {}))
+        for keyword, deals in user_deals.items():
+            deferred_deals.setdefault(keyword, []).extend(deals)
+
+    def _exclude_unflushed(
+        self,
+        user_deals: dict[Keyword, list[CrawledKeyword]],
+    ) -> dict[Keyword, list[CrawledKeyword]]:
+        if self._is_unflushed is None:
+            # 어떤 앵커가 반영되지 않았는지 알 수 없으면 이번 실행에서는 보내지 않는다.
+            return {}
+        mailable_deals = {
+            keyword: _exclude_unflushed_deals(keyword, deals, self._is_unflushed)
+            for keyword, deals in user_deals.items()
+        }
+        return {keyword: deals for keyword, deals in mailable_deals.items() if deals}
+
+    async def _send_deferred(self) -> None:
+        """
+        미뤄 둔 사용자를 발송합니다. 앵커 반영을 한 번 더 시도하고, 실패하면 반영되지 않은
+        앵커의 핫딜을 빼고 보냅니다. (뺀 핫딜은 다음 실행이 다시 찾아 발송)
+        """
+        deferred, self._deferred = self._deferred, {}
+        if not deferred:
+            return
+        anchors_flushed = True
+        if self._before_send is not None:
+            try:
+                await self._before_send()
+            except Exception as e:
+                logger.error(f"메일 발송 전 사전 작업 중 오류 발생: {e}")
+                anchors_flushed = False
+
+        for user, user_deals in deferred.values():
+            try:
+                if anchors_flushed:
+                    await self._queue_user_email(user, user_deals, list(user_deals))
+                    continue
+                mailable_deals = self._exclude_unflushed(user_deals)
+                settled_keywords = [
+                    keyword
+                    for keyword, deals in mailable_deals.items()
+                    if len(deals) == len(user_deals[keyword])
+                ]
+                await self._queue_user_email(user, mailable_deals, settled_keywords)
+            except Exception as e:
+                self.failed_user_count += 1
+                logger.error(f"사용자 {user.email} 메일 처리 중 오류 발생: {e}")
+
+    async def wait_sent(self) -> int:
+        await self._send_deferred()
+        # 메일 없이 처리를 마친 키워드(신규 핫딜 없음 등)의 원장 표시
+        if self._mailed_keyword_ids:
+            await _mark_run_ledger_mailed(self._run_ledger, sorted(self._mailed_keyword_ids))
+            self._mailed_keyword_ids.clear()
+        if self._send_tasks:
+            await asyncio.gather(*list(self._send_tasks), return_exceptions=True)
+        return self.emails_queued
+
+    async def close(self) -> None:
+        """
+        끝나지 않은 발송 태스크를 취소하고 정리합니다. (실행이 시간 제한으로 중단된 경우)
+        취소된 메일은 발송 대기열에 남아 다음 실행이 발송합니다.
+        """
+        for task in self._send_tasks:
+            task.cancel()
+        if self._send_tasks:
+            await asyncio.gather(*list(self._send_tasks), return_exceptions=True)
+
+
+class IntervalMailDispatcher(StreamingMailDispatcher):
+    """
+    연속 스케줄용 메일 발송기. 구독 키워드가 모두 끝난 사용자는 스트리밍 모드처럼 바로 발송하고,
+    아직 남은 키워드가 있는 사용자는 그때까지 모인 핫딜을 flush_interval_seconds마다 한 통으로 발송합니다.
+    """
+
+    def __init__(
+        self,
+        users: list[User],
+        keywords: list[Keyword],
+        flush_interval_seconds: float,
+        before_send: Callable[[], Awaitable[Any]] | None = None,
+        is_unflushed: Callable[[int, SiteName], bool] | None = None,
+        run_ledger: RunLedger | None = None,
+    ):
+        super().__init__(users, keywords, before_send, is_unflushed, run_ledger)
+        self._flush_interval_seconds = max(1.0, flush_interval_seconds)
+        self._stopped = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self.flushes = 0
+
+    def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while not self._stopped.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._flush_interval_seconds)
+                return
+            await self.flush()
+
+    async def flush(self) -> None:
+        """지금까지 모인 핫딜을 사용자별로 한 통씩 발송 대기열에 넣습니다."""
+        for user_id in list(self._user_deals):
+            user_deals = self._user_deals.pop(user_id, None)
+            user = self._users.get(user_id)
+            if not user_deals or user is None:
+                continue
+            await self._send_user_deals(user, user_deals)
+        self.flushes += 1
+
+    def stop(self) -> None:
+        """주기 발송을 끝냅니다. 발송 중에 멈추지 않도록 취소 대신 종료 신호를 보냅니다."""
+        self._stopped.set()
+
+    async def wait_sent(self) -> int:
+        self.stop()
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
+        emails_queued = await super().wait_sent()
+        logger.info(
+            "[METRIC] mail_flush flushes=%s emails=%s interval_seconds=%.1f",
+            self.flushes,
+            emails_queued,
+            self._flush_interval_seconds,
+        )
+        return emails_queued
+
+    async def close(self) -> None:
+        self.stop()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+        await super().close()
+
+
+async def _flush_anchor_store(anchor_store: KeywordSiteAnchorStore) -> bool:
+    """앵커 변경분을 일괄 반영합니다. 실패하면 잠시 뒤 재시도하고, 끝내 실패하면 False를 반환합니다."""
+    for attempt in range(1, ANCHOR_FLUSH_ATTEMPTS + 1):
+        try:
+            await anchor_store.flush()
+            return True
+        except Exception as e:
+            logger.error(
+                f"KeywordSite 앵커 일괄 반영 중 오류 발생 ({attempt}/{ANCHOR_FLUSH_ATTEMPTS}): {e}"
+            )
+            if attempt < ANCHOR_FLUSH_ATTEMPTS:
+                await asyncio.sleep(ANCHOR_FLUSH_RETRY_DELAY_SECONDS * attempt)
+    return False
+
+
+def _exclude_unflushed_deals(
+    keyword: Keyword,
+    deals: list[CrawledKeyword],
+    is_unflushed: Callable[[int, SiteName], bool],
+) -> list[CrawledKeyword]:
+    """앵커가 DB에 반영되지 않은 (키워드, 사이트)의 핫딜을 뺍니다. 다음 실행이 다시 찾아 발송합니다."""
+    mailable_deals = [deal for deal in deals if not is_unflushed(keyword.id, deal.site_name)]
+    if len(mailable_deals) < len(deals):
+        logger.warning(
+            "[%s] 앵커 반영 실패로 핫딜 %s건을 이번 메일에서 제외합니다.",
+            keyword.title,
+            len(deals) - len(mailable_deals),
+        )
+    return mailable_deals
+
+
+def _job_period_seconds() -> float:
+    """스케줄러 실행 주기(초). _build_job_trigger와 같은 기준입니다."""
+    if settings.ENVIRONMENT != "prod":
+        return 60.0
+    if settings.CRAWL_ADAPTIVE_SCHEDULE_ENABLED and settings.WORKER_RUN_LEDGER_ENABLED:
+        return min(30, max(1, settings.CRAWL_SCHEDULE_TICK_MINUTES)) * 60.0
+    return 1800.0
+
+
+def _resolve_drain_seconds(mail_reserve_seconds: float) -> float:
+    """
+    연속 스케줄에서 키워드 크롤링 시작을 나눠 둘 구간(초).
+    마지막 키워드도 사이트 크롤링 한 번과 메일 발송 시간을 남기고, 다음 실행 전에 끝나도록 줄입니다.
+    """
+    site_budget_seconds = _resolve_timeout_seconds(
+        "CRAWL_SITE_BUDGET_SECONDS",
+        settings.CRAWL_SITE_BUDGET_SECONDS,
+        120.0,
+    )
+    drain_seconds = min(
+        max(0.0, settings.WORKER_CONTINUOUS_DRAIN_SECONDS),
+        _job_period_seconds() - site_budget_seconds - mail_reserve_seconds,
+    )
+    run_remaining_seconds = remaining_seconds()
+    if run_remaining_seconds is not None:
+        drain_seconds = min(
+            drain_seconds,
+            run_remaining_seconds - site_budget_seconds - mail_reserve_seconds,
+        )
+    return max(0.0, drain_seconds)
+
+
+async def _drain_steadily(
+    coroutines: list[Coroutine[Any, Any, Any]],
+    window_seconds: float,
+) -> list[Any]:
+    """
+    작업을 window_seconds 동안 일정한 간격으로 하나씩 시작합니다.
+    결과는 asyncio.gather(return_exceptions=True)처럼 입력 순서대로 반환합니다.
+    """
+    interval_seconds = window_seconds / len(coroutines) if coroutines else 0.0
+    logger.info(
+        "[METRIC] continuous_drain tasks=%s window_seconds=%.1f interval_seconds=%.2f",
+        len(coroutines),
+        window_seconds,
+        interval_seconds,
+    )
+    tasks: list[asyncio.Task] = []
+    try:
+        for index, coroutine in enumerate(coroutines):
+            if index and interval_seconds > 0:
+                await asyncio.sleep(interval_seconds)
+            tasks.append(asyncio.create_task(coroutine))
+    except BaseException:
+        for coroutine in coroutines[len(tasks) :]:
+            coroutine.close()
+        for task in tasks:
+            task.cancel()
+        raise
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def _requires_browser() -> bool:
     active_sites = get_active_sites()
     if not active_sites:
@@ -491,8 +1528,15 @@ async def _run_job_once():
     사용자와 연결된 키워드만 불러와 병렬로 처리하고, 결과를 취합하여 메일을 발송합니다.
     """
     log_id = None
+    DB_CHECKOUT_STATS.reset()
+    RESPONSE_CACHE.reset_counters()
+    SITE_ROUTES.reset_counters()
+    CRAWL_SLOT_STATS.reset()
+    SITE_RATE_LIMITERS.reset_counters()
+    SITE_CIRCUITS.start_batch()
+    DEADLINE_STATS.reset()
     try:
-        async with AsyncSessionLocal() as session:
+        async with _db_session() as session:
             log_entry = WorkerLog(status=WorkerStatus.RUNNING)
             session.add(log_entry)
             await session.commit()
@@ -507,6 +1551,7 @@ async def _run_job_once():
 
     total_items_found = 0
     total_emails_sent = 0
+    mail_dispatcher: StreamingMailDispatcher | None = None
     try:
         if browser_required:
             browser_cleanup_required = True
@@ -534,7 +1579,7 @@ async def _run_job_once():
         all_users_with_keywords: list[User] = []  # 사용자 정보를 담을 리스트 추가
 
         try:
-            async with AsyncSessionLocal() as session:
+            async with _db_session() as session:
                 # 사용자와 매핑된 키워드만 조회
                 stmt = select(Keyword).options(selectinload(Keyword.users)).where(
                     Keyword.users.any()
@@ -550,47 +1595,207 @@ async def _run_job_once():
             logger.error(f"DB 조회 중 오류 발생: {e}")
             return  # DB 조회 실패 시 작업 중단
 
+        # 이전 실행이 생성했지만 발송하지 못한 메일을 먼저 발송
+        if settings.WORKER_RUN_LEDGER_ENABLED:
+            total_emails_sent += await _deliver_pending_mails()
+
         if not keywords_to_process:
             logger.debug("[DEBUG] 처리할 활성 키워드가 없습니다.")
             return
 
         _reconcile_algumon_proxy_history(active_sites)
         PROXY_MANAGER.start_batch()
-        proxy_pool_ready = PROXY_MANAGER.ensure_min_available_proxies(
+        proxy_pool_ready = await PROXY_MANAGER.ensure_min_available_proxies_async(
             settings.MIN_AVAILABLE_PROXIES
         )
         PROXY_MANAGER.log_metrics("batch_start")
 
         id_to_crawled_keyword: dict[Keyword, list[CrawledKeyword]] = {}
 
+        # 실행 원장: 완료 기록이 없거나 가장 오래된 키워드부터, 중단된 실행이 남긴 결과는 재사용
+        run_ledger = await _load_run_ledger(log_id, keywords_to_process, active_sites)
+        due_sites_by_keyword: dict[int, set[SiteName]] | None = None
+        if run_ledger is not None:
+            if settings.CRAWL_ADAPTIVE_SCHEDULE_ENABLED:
+                keywords_to_process, due_sites_by_keyword = _select_due_keywords(
+                    keywords_to_process, run_ledger, active_sites
+                )
+            keywords_to_process = run_ledger.prioritize(
+                keywords_to_process, _ledger_sites(active_sites)
+            )
+
+        # 이전 실행에서 서킷이 열려 건너뛴 키워드를 먼저 처리 (태스크는 목록 순서대로 슬롯을 얻음)
+        skipped_keyword_ids = SITE_CIRCUITS.take_pending_keyword_ids()
+        keywords_to_process = _prioritize_skipped_keywords(
+            keywords_to_process, skipped_keyword_ids
+        )
+
         site_limit, keyword_limit = _resolve_crawl_concurrency(active_sites)
         if not proxy_pool_ready:
             keywords_to_process, site_limit, keyword_limit = _apply_proxy_pool_protection(
                 keywords_to_process,
                 site_limit,
                 keyword_limit,
+                priority_keyword_ids=skipped_keyword_ids,
             )
 
-        # 사이트별 동시성 제한 세마포어
-        site_semaphores = {
-            site: asyncio.Semaphore(site_limit) for site in active_sites
-        }
-        # 키워드 처리 동시성 제한 세마포어
-        keyword_semaphore = asyncio.Semaphore(keyword_limit)
+        # 실행 단위 앵커 저장소: 키워드×사이트 앵커를 한 번에 적재하고 변경분만 일괄 반영
+        anchor_store = KeywordSiteAnchorStore(
+            session_factory=_db_session,
+            chunk_size=settings.CRAWL_ANCHOR_FLUSH_CHUNK_SIZE,
+            run_ledger=run_ledger,
+        )
+        try:
+            await anchor_store.load(
+                [keyword.id for keyword in keywords_to_process],
+                active_sites,
+            )
+        except Exception as e:
+            logger.error(f"KeywordSite 앵커 조회 중 오류 발생: {e}")
+            return
+
+        # 스트리밍 모드: 사용자의 구독 키워드가 모두 끝나는 즉시 메일 발송
+        # 연속 스케줄: 사용자별로 모은 핫딜을 일정 간격으로 발송
+        if settings.WORKER_CONTINUOUS_SCHEDULE_ENABLED:
+            mail_dispatcher = IntervalMailDispatcher(
+                all_users_with_keywords,
+                keywords_to_process,
+                flush_interval_seconds=settings.WORKER_MAIL_FLUSH_INTERVAL_SECONDS,
+                before_send=anchor_store.flush,
+                is_unflushed=anchor_store.is_pending,
+                run_ledger=run_ledger,
+            )
+        elif settings.WORKER_STREAMING_MAIL_ENABLED:
+            mail_dispatcher = StreamingMailDispatcher(
+                all_users_with_keywords,
+                keywords_to_process,
+                before_send=anchor_store.flush,
+                is_unflushed=anchor_store.is_pending,
+                run_ledger=run_ledger,
+            )
+
+        # 메일 예비 시간은 남은 실행 시간의 절반을 넘지 않게 한다. (짧은 실행 제한에서 크롤링 전체가 밀리지 않도록)
+        mail_reserve_seconds = max(0.0, settings.WORKER_MAIL_RESERVE_SECONDS)
+        run_remaining_seconds = remaining_seconds()
+        if run_remaining_seconds is not None:
+            mail_reserve_seconds = min(mail_reserve_seconds, run_remaining_seconds / 2)
+
+        # 사이트별/키워드 처리 동시성 제한 (적응형이면 실행 중 AIMD로 조절)
+        site_semaphores, keyword_semaphore = _build_concurrency_limiters(
+            active_sites, site_limit, keyword_limit, protected=not proxy_pool_ready
+        )
 
         async with httpx.AsyncClient() as client:
+            # 피드 모드: 사이트 전체 최신 목록을 한 번 가져와 모든 키워드를 로컬 매칭
+            feed_matches: dict[SiteName, dict[int, list[CrawledKeyword]]] | None = None
+            next_feed_last_seen_ids: dict[SiteName, str] = {}
+            if settings.CRAWL_FEED_MODE_ENABLED:
+                await _load_feed_cursors()
+                feed_matches, next_feed_last_seen_ids = await collect_feed_matches(
+                    keywords_to_process, client, active_sites
+                )
+
+            keyword_requests_required = feed_matches is None or any(
+                site not in feed_matches for site in active_sites
+            )
+
+            # 크롤링에 실패했거나 건너뛴 키워드 (실행 원장을 메일 적재 완료로 표시하지 않음)
+            unmailable_keyword_ids: set[int] = set()
+
             # 각 키워드를 세마포어 제어 하에 처리하는 태스크 리스트 생성
             async def sem_handle_keyword(keyword: Keyword):
+                nonlocal total_items_found
                 async with keyword_semaphore:
                     # 세마포어 내에서도 짧은 랜덤 딜레이를 주면 부하를 더 분산시킬 수 있습니다.
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
-                    return await handle_keyword(keyword, client, site_semaphores)
+                    # (토큰 버킷 사용 시, 또는 모든 사이트가 피드로 처리되면 요청이 없으므로 생략)
+                    if keyword_requests_required and not settings.CRAWL_SITE_RATE_LIMIT_ENABLED:
+                        await asyncio.sleep(random.uniform(0.5, 1.5))
+                    try:
+                        # 크롤링은 메일 발송 예비 시간을 뺀 마감까지만 진행한다.
+                        with reserve_scope(mail_reserve_seconds):
+                            if keyword_requests_required and not has_time_for(
+                                settings.CRAWL_DEADLINE_MIN_REQUEST_SECONDS
+                            ):
+                                DEADLINE_STATS.shed_keywords += 1
+                                logger.info(
+                                    "[%s] 실행 마감이 가까워 키워드 크롤링을 건너뜁니다.",
+                                    keyword.title,
+                                )
+                                unmailable_keyword_ids.add(keyword.id)
+                                result = None
+                            else:
+                                result = await handle_keyword(
+                                    keyword,
+                                    client,
+                                    site_semaphores,
+                                    anchor_store,
+                                    feed_matches=feed_matches,
+                                    due_sites=(
+                                        due_sites_by_keyword.get(keyword.id)
+                                        if due_sites_by_keyword is not None
+                                        else None
+                                    ),
+                                )
+                    except Exception:
+                        unmailable_keyword_ids.add(keyword.id)
+                        if mail_dispatcher is not None:
+                            await mail_dispatcher.complete_keyword(keyword, [], mailable=False)
+                        raise
+
+                if mail_dispatcher is None:
+                    return result
+
+                # 스트리밍 모드에서는 결과를 보관하지 않고 바로 사용자별 카운트다운에 반영
+                deals = result[1] if result else []
+                total_items_found += len(deals)
+                await mail_dispatcher.complete_keyword(
+                    keyword, deals, mailable=keyword.id not in unmailable_keyword_ids
+                )
+                return None
 
             tasks = [sem_handle_keyword(kw) for kw in keywords_to_process]
 
-            # asyncio.gather로 모든 작업을 동시에 실행 (세마포어가 동시성 제어)
-            # return_exceptions=True를 통해 일부 작업이 실패해도 전체가 중단되지 않도록 함
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # 크롤링 단계의 이벤트 루프 지연 측정 (파싱 실행기 효과 비교용)
+            loop_lag_monitor = EventLoopLagMonitor()
+            loop_lag_monitor.start()
+            try:
+                if isinstance(mail_dispatcher, IntervalMailDispatcher):
+                    # 연속 스케줄: 키워드를 구간 전체에 일정한 간격으로 시작해 요청이 한꺼번에 몰리지 않게 함
+                    mail_dispatcher.start()
+                    results = await _drain_steadily(
+                        tasks, _resolve_drain_seconds(mail_reserve_seconds)
+                    )
+                else:
+                    # asyncio.gather로 모든 작업을 동시에 실행 (세마포어가 동시성 제어)
+                    # return_exceptions=True를 통해 일부 작업이 실패해도 전체가 중단되지 않도록 함
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                if isinstance(mail_dispatcher, IntervalMailDispatcher):
+                    mail_dispatcher.stop()
+                await loop_lag_monitor.stop()
+                loop_lag_monitor.log_metrics(
+                    "crawl", parse_executor=get_parse_executor_kind()
+                )
+                _log_concurrency_limiters(site_semaphores, keyword_semaphore)
+
+        # 변경된 앵커를 메일 발송 전에 일괄 반영. 끝내 실패하면 반영되지 않은 앵커의 핫딜은
+        # 메일에서 빼고, 다음 실행이 같은 핫딜을 다시 찾아 발송한다. (중복 발송 방지)
+        anchors_flushed = await _flush_anchor_store(anchor_store)
+        logger.info(
+            "[METRIC] anchor_store loaded=%s staged=%s flushed=%s pending=%s",
+            anchor_store.loaded_count,
+            anchor_store.staged_count,
+            anchor_store.flushed_count,
+            anchor_store.pending_count,
+        )
+        if run_ledger is not None:
+            run_ledger.log_metrics("crawl")
+        RESPONSE_CACHE.log_metrics("crawl")
+        SITE_ROUTES.log_metrics("crawl")
+        CRAWL_SLOT_STATS.log_metrics("crawl")
+        SITE_RATE_LIMITERS.log_metrics("crawl")
+        SITE_CIRCUITS.log_metrics("crawl")
+        DEADLINE_STATS.log_metrics("crawl")
 
         # 결과 처리
         failed_keyword_count = 0
@@ -603,7 +1808,13 @@ async def _run_job_once():
             elif res:
                 keyword, deals = res
                 total_items_found += len(deals)
-                id_to_crawled_keyword[keyword] = deals
+                if not anchors_flushed:
+                    mailable_deals = _exclude_unflushed_deals(keyword, deals, anchor_store.is_pending)
+                    if len(mailable_deals) < len(deals):
+                        unmailable_keyword_ids.add(keyword.id)
+                    deals = mailable_deals
+                if deals:
+                    id_to_crawled_keyword[keyword] = deals
 
         total_keyword_count = len(keywords_to_process)
         batch_failure_rate = (
@@ -620,82 +1831,67 @@ async def _run_job_once():
             PROXY_MANAGER.get_failure_rates(batch_only=True),
         )
         PROXY_MANAGER.log_metrics("batch_end")
+        await _save_proxy_pool_snapshot("batch_end")
 
         logger.debug("[DEBUG] 모든 키워드 크롤링 완료. 메일 발송 시작...")
+        processed_keyword_ids = [
+            keyword.id for keyword in keywords_to_process if keyword.id not in unmailable_keyword_ids
+        ]
 
         # 사용자별 메일 발송 로직
-        email_tasks = []
-        for user in all_users_with_keywords:
-            try:
-                user_deals: dict[Keyword, list[CrawledKeyword]] = {}
-                # 사용자가 구독한 Keyword 객체들을 set으로 만들어 빠른 조회를 지원
-                subscribed_keywords_set = set(user.keywords)
-
-                # 사용자가 구독한 키워드 중 크롤링된 결과가 있는지 확인
-                for crawled_keyword_obj, deals in id_to_crawled_keyword.items():
-                    if crawled_keyword_obj in subscribed_keywords_set:
-                        user_deals[crawled_keyword_obj] = deals
-
-                if user_deals:
-                    # 메일 내용 생성
-                    email_content: str = ""
-                    subject: str = ""
-                    for keyword, deals in user_deals.items():
-                        try:
-                            email_content += await make_hotdeal_email_content(
-                                keyword, deals
-                            )
-                            subject += f"{keyword.title}, "
-                        except Exception as e:
-                            logger.error(
-                                f"사용자 {user.email}, 키워드 {keyword.title} 메일 내용 생성 중 오류: {e}"
-                            )
-                            # 내용 생성 실패 시 해당 키워드는 건너뛰고 계속 진행
-                            continue
-
-                    if not email_content:
-                        # 모든 키워드에서 내용 생성 실패 시 메일 발송 안함
-                        logger.info(
-                            f"[INFO] 사용자 {user.email} 에게 발송할 유효한 메일 내용 없음"
-                        )
+        if mail_dispatcher is not None:
+            # 스트리밍/연속 스케줄 모드: 크롤링 중 이미 발송 대기열에 넣은 메일의 완료만 기다린다.
+            # 원장의 메일 적재 표시는 키워드별로 모든 구독자의 메일을 적재할 때 함께 반영된다.
+            total_emails_sent += await mail_dispatcher.wait_sent()
+            mails_queued = mail_dispatcher.failed_user_count == 0
+        else:
+            user_emails: list[tuple[User, str, str]] = []
+            for user in all_users_with_keywords:
+                try:
+                    # 사용자가 구독한 Keyword 객체들을 set으로 만들어 빠른 조회를 지원
+                    subscribed_keywords_set = set(user.keywords)
+
+                    # 사용자가 구독한 키워드 중 크롤링된 결과가 있는지 확인
+                    user_deals: dict[Keyword, list[CrawledKeyword]] = {
+                        crawled_keyword_obj: deals
+                        for crawled_keyword_obj, deals in id_to_crawled_keyword.items()
+                        if crawled_keyword_obj in subscribed_keywords_set
+                    }
+                    if not user_deals:
                         continue
 
-                    subject = subject.rstrip(", ")  # 마지막 쉼표 및 공백 제거
-                    subject = f"[{subject}] 새로운 핫딜 알림"
-
-                    if settings.ENVIRONMENT == "prod":
-                        task = send_email(
-                            subject=subject,
-                            to=user.email,
-                            body=email_content,
-                            is_html=True,
-                        )
-                        email_tasks.append(task)
-                        # 메일 발송 성공 로그 (선택적)
-                        # logger.info(f"사용자 {user.email} 에게 메일 발송 완료.")
-                    else:
-                        logger.info(
-                            f"[DEV] 사용자 {user.email} 에게 메일 발송 제목:{subject} 내용:{email_content}"
-                        )
-                # else:
-                # 발송할 딜 없는 경우 로그는 위에서 처리했으므로 주석처리 또는 제거
-                # print(f"[INFO] 사용자 {user.email} 에게 발송할 새 핫딜 없음")
-            except Exception as e:
-                # 사용자별 메일 처리 루프 전체에서 예외 발생 시 로깅
-                logger.error(f"사용자 {user.email} 메일 처리 중 오류 발생: {e}")
-                # 다음 사용자로 계속 진행
-                continue
+                    email = await _build_user_email(user, user_deals)
+                    if email is None:
+                        continue
 
-        if email_tasks:
-            await asyncio.gather(*email_tasks)
-            total_emails_sent = len(email_tasks)
+                    user_emails.append((user, *email))
+                except Exception as e:
+                    # 사용자별 메일 처리 루프 전체에서 예외 발생 시 로깅
+                    logger.error(f"사용자 {user.email} 메일 처리 중 오류 발생: {e}")
+                    # 다음 사용자로 계속 진행
+                    continue
+
+            # 대기열 저장과 원장의 메일 적재 표시를 한 번에 반영한 뒤 발송 (저장에 실패하면 발송하지 않음)
+            mail_ids = await _store_pending_mails(
+                user_emails, run_ledger, processed_keyword_ids
+            )
+            mails_queued = mail_ids is not None
+            if mails_queued:
+                total_emails_sent += await _send_stored_emails(
+                    [(*email, mail_id) for email, mail_id in zip(user_emails, mail_ids, strict=True)]
+                )
+
+        # 피드 커서는 앵커 반영과 모든 키워드의 메일 적재를 마친 뒤에만 전진시킨다.
+        # (그렇지 않으면 다음 실행이 같은 구간을 다시 수집해 빠진 핫딜을 찾는다)
+        if anchors_flushed and mails_queued and not unmailable_keyword_ids:
+            await _advance_feed_cursors(next_feed_last_seen_ids)
 
         # 작업이 완료되면 지역 변수인 id_to_crawled_keyword는 자동으로 사라집니다.
         logger.info("[INFO] 메일 발송 완료 및 크롤링 결과 초기화")
 
         if log_id:
             try:
-                async with AsyncSessionLocal() as session:
+                async with _db_session() as session:
                     stmt = select(WorkerLog).where(WorkerLog.id == log_id)
                     result = await session.execute(stmt)
                     log = result.scalars().first()
@@ -710,7 +1906,7 @@ async def _run_job_once():
         logger.warning("Job cancelled")
         if log_id:
             try:
-                async with AsyncSessionLocal() as session:
+                async with _db_session() as session:
                     stmt = select(WorkerLog).where(WorkerLog.id == log_id)
                     result = await session.execute(stmt)
                     log = result.scalars().first()
@@ -726,7 +1922,7 @@ async def _run_job_once():
         logger.error(f"Job failed with error: {e}")
         if log_id:
             try:
-                async with AsyncSessionLocal() as session:
+                async with _db_session() as session:
                     stmt = select(WorkerLog).where(WorkerLog.id == log_id)
                     result = await session.execute(stmt)
                     log = result.scalars().first()
@@ -739,6 +1935,10 @@ async def _run_job_once():
                 logger.error(f"Failed to update worker log fail: {db_e}")
         raise
     finally:
+        if mail_dispatcher is not None:
+            # 시간 제한으로 중단되면 진행 중인 발송 태스크가 실행 밖에 남지 않게 정리한다.
+            await mail_dispatcher.close()
+        _log_db_checkout_metrics()
         if browser_cleanup_required:
             await SharedBrowser.get_instance().stop()
 
@@ -759,10 +1959,12 @@ async def job():
 
         async with JOB_RUN_LOCK:
             try:
-                await asyncio.wait_for(
-                    _run_job_once(),
-                    timeout=worker_run_timeout_seconds,
-                )
+                # 실행 마감을 컨텍스트로 전파해 크롤링/재시도가 남은 시간 안에서만 진행되게 한다.
+                with deadline_scope(worker_run_timeout_seconds):
+                    await asyncio.wait_for(
+                        _run_job_once(),
+                        timeout=worker_run_timeout_seconds,
+                    )
                 outcome = "success"
             except TimeoutError:
                 outcome = "timeout"
@@ -784,6 +1986,27 @@ async def job():
             logger.warning("[WARN] job 종료 시 defunct 프로세스 감지: %s", defunct_count)
 
 
+def _get_next_run_time(scheduler: AsyncIOScheduler) -> datetime | None:
+    try:
+        scheduled_job = scheduler.get_job("hotdeal_worker")
+    except Exception:
+        return None
+    return scheduled_job.next_run_time if scheduled_job is not None else None
+
+
+def _build_job_trigger() -> CronTrigger:
+    """
+    운영 환경은 매시 정각/30분에 실행합니다. 적응형 스케줄에서는 CRAWL_SCHEDULE_TICK_MINUTES마다 실행하고,
+    각 실행은 다음 크롤링 시각이 된 키워드×사이트만 크롤링합니다.
+    """
+    if settings.ENVIRONMENT != "prod":
+        return CronTrigger(minute="*")
+    if settings.CRAWL_ADAPTIVE_SCHEDULE_ENABLED and settings.WORKER_RUN_LEDGER_ENABLED:
+        tick_minutes = min(30, max(1, settings.CRAWL_SCHEDULE_TICK_MINUTES))
+        return CronTrigger(minute=f"*/{tick_minutes}")
+    return CronTrigger(minute="0,30")
+
+
 async def main():
     scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
     shutdown_event = asyncio.Event()
@@ -802,9 +2025,7 @@ async def main():
         except NotImplementedError:
             signal.signal(sig, lambda *_args, signame=sig.name: request_shutdown(signame))
 
-    trigger = CronTrigger(minute="0,30")
-    if settings.ENVIRONMENT != "prod":
-        trigger = CronTrigger(minute="*")
+    trigger = _build_job_trigger()
 
     async def scheduled_job() -> None:
         current_task = asyncio.current_task()
@@ -825,11 +2046,18 @@ async def main():
         coalesce=True,
         misfire_grace_time=300,
     )
+    await _restore_proxy_pool_snapshot()
     scheduler.start()
     _log_process_identity("worker_start")
-    logger.info(
-        "[INFO] Worker 스케줄러 시작: 매시 정각 및 30분마다 크롤링 및 메일 발송"
-    )
+
+    replenisher_task: asyncio.Task | None = None
+    if settings.PROXY_REPLENISHER_ENABLED:
+        replenisher = ProxyReplenisher(
+            PROXY_MANAGER,
+            next_run_time=lambda: _get_next_run_time(scheduler),
+        )
+        replenisher_task = asyncio.create_task(replenisher.run(shutdown_event))
+    logger.info(f"[INFO] Worker 스케줄러 시작: {trigger} 주기로 크롤링 및 메일 발송")
 
     try:
         # 스케줄러가 백그라운드에서 실행되는 동안 메인 코루틴을 유지합니다.
@@ -842,6 +2070,11 @@ async def main():
         except Exception as e:
             logger.error(f"스케줄러 종료 중 오류 발생: {e}")
 
+        if replenisher_task is not None:
+            replenisher_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await replenisher_task
+
         if in_flight_jobs:
             try:
                 await asyncio.wait_for(
@@ -858,6 +2091,18 @@ async def main():
         except Exception as e:
             logger.error(f"SharedBrowser 종료 중 오류 발생: {e}")
 
+        await _save_proxy_pool_snapshot("shutdown")
+
+        try:
+            await PROXY_CLIENT_POOL.aclose()
+        except Exception as e:
+            logger.error(f"프록시 클라이언트 풀 종료 중 오류 발생: {e}")
+
+        try:
+            shutdown_parse_executor()
+        except Exception as e:
+            logger.error(f"파싱 실행기 종료 중 오류 발생: {e}")
+
         try:
             await async_engine.dispose()
         except Exception as e:
@@ -0,0 +1,108 @@
+"""
+키워드 매처 마이크로 벤치마크.
+
+    python -m benchmarks.bench_keyword_matcher [--titles 2000] [--sizes 1000 10000 100000]
+
+키워드 수별로 컴파일 시간, 증분 추가 시간, 초당 처리 제목 수를 출력하고
+기존 방식(키워드별 `in` 루프)과 비교합니다. 단순 루프는 시간이 오래 걸리므로 제목 일부만 측정합니다.
+"""
+
+import argparse
+import random
+import time
+
+from app.src.domain.hotdeal.keyword_matcher import KeywordMatcher
+from app.src.domain.hotdeal.utils import normalize_keyword
+
+SYLLABLES = "가나다라마바사아자차카타파하갤럭시아이폰에어팟키보드마우스모니터노트북"
+LATIN = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def _random_word(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return "".join(rng.choice(LATIN) for _ in range(rng.randint(2, 6)))
+
+
+def _make_keywords(count: int, rng: random.Random) -> dict[int, str]:
+    keywords: dict[int, str] = {}
+    seen: set[str] = set()
+    while len(keywords) < count:
+        title = " ".join(_random_word(rng) for _ in range(rng.randint(1, 2)))
+        if title in seen:
+            continue
+        seen.add(title)
+        keywords[len(keywords) + 1] = title
+    return keywords
+
+
+def _make_titles(count: int, rng: random.Random) -> list[str]:
+    return [
+        f"[{_random_word(rng)}] " + " ".join(_random_word(rng) for _ in range(rng.randint(4, 10)))
+        for _ in range(count)
+    ]
+
+
+def _naive_match(patterns: list[tuple[int, str]], title: str) -> set[int]:
+    normalized_title = normalize_keyword(title)
+    return {keyword_id for keyword_id, pattern in patterns if pattern in normalized_title}
+
+
+def run(sizes: list[int], title_count: int, naive_title_count: int) -> None:
+    rng = random.Random(42)
+    titles = _make_titles(title_count, rng)
+
+    print(f"titles={title_count} (naive={naive_title_count})")
+    print(
+        f"{'keywords':>9} {'compile_s':>10} {'add_1k_ms':>10} {'nodes':>9} "
+        f"{'titles/s':>11} {'naive/s':>11} {'speedup':>8}"
+    )
+    for size in sizes:
+        keywords = _make_keywords(size, rng)
+
+        started = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        matcher.match("")  # 실패 링크 계산 포함
+        compile_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for offset in range(1, 1001):
+            matcher.add(size + offset, f"증분{offset}")
+        matcher.match("")
+        add_ms = (time.perf_counter() - started) * 1000
+        for offset in range(1, 1001):
+            matcher.remove(size + offset)
+
+        started = time.perf_counter()
+        matched_total = sum(len(matcher.match(title)) for title in titles)
+        matcher_rate = title_count / (time.perf_counter() - started)
+
+        patterns = [
+            (keyword_id, pattern)
+            for keyword_id, title in keywords.items()
+            if (pattern := normalize_keyword(title).strip())
+        ]
+        naive_titles = titles[:naive_title_count]
+        started = time.perf_counter()
+        for title in naive_titles:
+            _naive_match(patterns, title)
+        naive_rate = len(naive_titles) / (time.perf_counter() - started)
+
+        print(
+            f"{size:>9} {compile_seconds:>10.2f} {add_ms:>10.1f} {matcher.node_count:>9} "
+            f"{matcher_rate:>11.0f} {naive_rate:>11.0f} {matcher_rate / naive_rate:>7.1f}x"
+            f"  (matches={matched_total})"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--titles", type=int, default=2000)
+    parser.add_argument("--naive-titles", type=int, default=200)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+    run(args.sizes, args.titles, min(args.naive_titles, args.titles))
+
+
+if __name__ == "__main__":
+    main()
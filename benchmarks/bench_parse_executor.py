@@ -0,0 +1,85 @@
+"""
+파싱 실행기별 이벤트 루프 지연 벤치마크.
+
+    python -m benchmarks.bench_parse_executor [--pages 40] [--concurrency 4]
+
+저장된 알구몬 페이지를 동시에 fetchparse 하면서 이벤트 루프 지연(p95/max)과
+전체 소요 시간을 CRAWL_PARSE_EXECUTOR=none/thread/process 별로 비교합니다.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+for _name in (
+    "DATABASE_URL",
+    "REFRESH_TOKEN_SECRET_KEY",
+    "EMAIL_SECRET_KEY",
+    "PASSWORD_SECRET_KEY",
+):
+    os.environ.setdefault(_name, "sqlite+aiosqlite:///:memory:" if _name == "DATABASE_URL" else "bench")
+
+from app.src.core.config import settings  # noqa: E402
+from app.src.core.loop_lag import EventLoopLagMonitor  # noqa: E402
+from app.src.Infrastructure.crawling import parse_executor  # noqa: E402
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler  # noqa: E402
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "infrastructure" / "fixtures" / "algumon_feed_page.html"
+
+
+async def _run_mode(kind: str, pages: int, concurrency: int, html: str) -> None:
+    settings.CRAWL_PARSE_EXECUTOR = kind
+    parse_executor.shutdown_parse_executor()
+    parse_executor.get_parse_executor()  # 풀 기동 비용은 측정에서 제외
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_page() -> int:
+        async with semaphore:
+            crawler = AlgumonCrawler(keyword="키보드", client=MagicMock())
+            return len(await crawler.fetchparse())
+
+    async def fake_fetch(*_args, **_kwargs) -> str:
+        await asyncio.sleep(0.01)  # 네트워크 대기 흉내
+        return html
+
+    with patch.object(AlgumonCrawler, "fetch", AsyncMock(side_effect=fake_fetch)):
+        # 워밍업: 모든 워커 프로세스 기동/import를 측정 전에 끝낸다.
+        await asyncio.gather(*[one_page() for _ in range(concurrency * 2)])
+        monitor = EventLoopLagMonitor(interval_seconds=0.005)
+        monitor.start()
+        started = time.perf_counter()
+        cards = sum(await asyncio.gather(*[one_page() for _ in range(pages)]))
+        elapsed = time.perf_counter() - started
+        await monitor.stop()
+
+    summary = monitor.summary()
+    print(
+        f"{kind:>8} {elapsed:>9.2f} {cards / elapsed:>9.0f} "
+        f"{summary['p95_ms']:>8.1f} {summary['max_ms']:>8.1f}"
+    )
+    parse_executor.shutdown_parse_executor()
+
+
+async def run(pages: int, concurrency: int) -> None:
+    html = FIXTURE.read_text(encoding="utf-8")
+    settings.CRAWL_PARSE_EXECUTOR_MAX_WORKERS = concurrency
+    print(f"pages={pages} concurrency={concurrency} engine={AlgumonCrawler('', MagicMock()).parser_engine}")
+    print(f"{'executor':>8} {'elapsed_s':>9} {'cards/s':>9} {'p95_ms':>8} {'max_ms':>8}")
+    for kind in ("none", "thread", "process"):
+        await _run_mode(kind, pages, concurrency, html)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args.pages, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
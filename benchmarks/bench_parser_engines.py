@@ -0,0 +1,114 @@
+"""
+알구몬 파서 엔진 벤치마크.
+
+    python -m benchmarks.bench_parser_engines [--iterations 50]
+
+저장된 알구몬 페이지(tests/infrastructure/fixtures/algumon_*.html)를 엔진별로 파싱해
+초당 카드 수와 최대 메모리를 출력합니다. 엔진마다 별도 프로세스에서 측정하며,
+메모리는 Python 힙 최대치(tracemalloc)와 프로세스 최대 RSS 증가량을 함께 보고합니다.
+(lxml/selectolax의 C 할당은 tracemalloc에 잡히지 않으므로 RSS를 같이 본다.)
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# 설정 로딩에 필요한 값 (벤치마크는 DB/메일을 사용하지 않음)
+for _name in (
+    "DATABASE_URL",
+    "REFRESH_TOKEN_SECRET_KEY",
+    "EMAIL_SECRET_KEY",
+    "PASSWORD_SECRET_KEY",
+):
+    os.environ.setdefault(_name, "sqlite+aiosqlite:///:memory:" if _name == "DATABASE_URL" else "bench")
+
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler  # noqa: E402
+from app.src.Infrastructure.crawling.parser_engine import (  # noqa: E402
+    ParserEngine,
+    is_parser_engine_available,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "infrastructure" / "fixtures"
+ENGINES = [
+    ParserEngine.BS4,
+    ParserEngine.BS4_STRAINER,
+    ParserEngine.LXML,
+    ParserEngine.SELECTOLAX,
+]
+
+
+def _load_pages() -> list[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(FIXTURES_DIR.glob("algumon_*.html"))]
+
+
+def _measure(engine: ParserEngine, iterations: int, queue: multiprocessing.Queue) -> None:
+    pages = _load_pages()
+    crawler = AlgumonCrawler(keyword="키보드", client=MagicMock(), parser_engine=engine)
+    crawler.parse(pages[0])  # 지연 import/워밍업
+
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    started = time.perf_counter()
+    cards = 0
+    for _ in range(iterations):
+        for html in pages:
+            cards += len(crawler.parse(html))
+    elapsed = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # tracemalloc 오버헤드 없이 처리량만 다시 측정
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages:
+            crawler.parse(html)
+    untraced_elapsed = time.perf_counter() - started
+
+    queue.put(
+        {
+            "cards": cards,
+            "cards_per_sec": cards / untraced_elapsed,
+            "traced_cards_per_sec": cards / elapsed,
+            "peak_heap_kb": peak_bytes / 1024,
+            "rss_growth_kb": rss_after_kb - rss_before_kb,
+        }
+    )
+
+
+def run(iterations: int) -> None:
+    pages = _load_pages()
+    page_bytes = sum(len(html.encode("utf-8")) for html in pages)
+    print(f"pages={len(pages)} bytes={page_bytes} iterations={iterations}")
+    print(f"{'engine':>13} {'cards/s':>10} {'peak_heap_kb':>13} {'rss_growth_kb':>14}")
+
+    context = multiprocessing.get_context("spawn")
+    for engine in ENGINES:
+        if not is_parser_engine_available(engine):
+            print(f"{engine.value:>13} {'(미설치)':>10}")
+            continue
+        queue = context.Queue()
+        process = context.Process(target=_measure, args=(engine, iterations, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        print(
+            f"{engine.value:>13} {result['cards_per_sec']:>10.0f} "
+            f"{result['peak_heap_kb']:>13.0f} {result['rss_growth_kb']:>14}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.main import app
+from app.src.core.config import settings
 from app.src.core.database import Base
 from app.src.core.dependencies.auth import (
     authenticate_refresh_token,
@@ -21,6 +22,11 @@ from app.src.core.security import hash_password
 from app.src.domain.user.enums import AuthLevel
 from app.src.domain.user.models import User
 from app.src.domain.user.schemas import AuthenticatedUser
+from app.src.Infrastructure.crawling.circuit_breaker import SITE_CIRCUITS
+from app.src.Infrastructure.crawling.proxy_client_pool import PROXY_CLIENT_POOL
+from app.src.Infrastructure.crawling.rate_limiter import SITE_RATE_LIMITERS
+from app.src.Infrastructure.crawling.response_cache import RESPONSE_CACHE
+from app.src.Infrastructure.crawling.route_state import SITE_ROUTES
 
 # SQLite 인메모리 데이터베이스 설정 (비동기)
 # 참고: SQLite 비동기 드라이버 필요 (e.g., aiosqlite)
@@ -48,6 +54,53 @@ def mock_send_email():
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """크롤러 조건부 요청 캐시가 테스트 사이에 공유되지 않도록 초기화"""
+    RESPONSE_CACHE.clear()
+    yield
+    RESPONSE_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_proxy_client_pool():
+    """프록시 클라이언트 풀(모킹된 클라이언트 포함)이 테스트 사이에 공유되지 않도록 초기화"""
+    PROXY_CLIENT_POOL.clear()
+    yield
+    PROXY_CLIENT_POOL.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_site_routes():
+    """사이트별 차단/프록시 경로 상태가 테스트 사이에 공유되지 않도록 초기화"""
+    SITE_ROUTES.clear()
+    yield
+    SITE_ROUTES.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_site_rate_limiters():
+    """사이트별 토큰 버킷 상태가 테스트 사이에 공유되지 않도록 초기화"""
+    SITE_RATE_LIMITERS.clear()
+    yield
+    SITE_RATE_LIMITERS.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_site_circuits():
+    """사이트별 서킷 브레이커 상태가 테스트 사이에 공유되지 않도록 초기화"""
+    SITE_CIRCUITS.clear()
+    yield
+    SITE_CIRCUITS.clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_proxy_replenisher():
+    """worker main() 테스트에서 백그라운드 프록시 보강 루프가 외부 요청을 보내지 않도록 비활성화"""
+    with patch.object(settings, "PROXY_REPLENISHER_ENABLED", False):
+        yield
+
+
 @pytest_asyncio.fixture
 async def mock_db_session() -> AsyncGenerator[AsyncSession, None]:
     """비동기 AsyncSession 객체를 생성하는 픽스처"""
@@ -0,0 +1,27 @@
+import asyncio
+import time
+
+from app.src.core.loop_lag import EventLoopLagMonitor
+
+
+async def test_event_loop_lag_monitor_detects_blocking_work():
+    monitor = EventLoopLagMonitor(interval_seconds=0.01)
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    time.sleep(0.15)  # 이벤트 루프를 붙잡는 CPU 작업 흉내
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+
+    summary = monitor.summary()
+    assert monitor.sample_count >= 2
+    assert summary["max_ms"] >= 100
+    assert summary["avg_ms"] <= summary["max_ms"]
+
+
+def test_event_loop_lag_monitor_summary_without_samples():
+    assert EventLoopLagMonitor().summary() == {
+        "avg_ms": 0.0,
+        "p95_ms": 0.0,
+        "max_ms": 0.0,
+    }
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.domain.hotdeal.anchor_store import KeywordSiteAnchorStore
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.models import Keyword, KeywordSite
+
+
+@pytest.fixture
+async def keywords_with_anchor(mock_db_session: AsyncSession) -> list[Keyword]:
+    first = Keyword(title="키보드")
+    second = Keyword(title="마우스")
+    mock_db_session.add_all([first, second])
+    await mock_db_session.commit()
+    mock_db_session.add(
+        KeywordSite(
+            keyword_id=first.id,
+            site_name=SiteName.ALGUMON,
+            external_id="100,99,98",
+        )
+    )
+    await mock_db_session.commit()
+    return [first, second]
+
+
+@pytest.mark.asyncio
+async def test_load_preloads_existing_anchors(mock_db_session, keywords_with_anchor):
+    first, second = keywords_with_anchor
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session)
+
+    loaded = await store.load([first.id, second.id], [SiteName.ALGUMON])
+
+    assert loaded == 1
+    assert store.get_external_id(first.id, SiteName.ALGUMON) == "100,99,98"
+    assert store.get_external_id(second.id, SiteName.ALGUMON) is None
+
+
+@pytest.mark.asyncio
+async def test_flush_upserts_updated_and_new_anchors(mock_db_session, keywords_with_anchor):
+    first, second = keywords_with_anchor
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session)
+    await store.load([first.id, second.id], [SiteName.ALGUMON])
+
+    await store.stage(
+        first.id,
+        SiteName.ALGUMON,
+        external_id="102,101,100",
+        link="link-102",
+        price="1000원",
+        meta_data=None,
+    )
+    await store.stage(
+        second.id,
+        SiteName.ALGUMON,
+        external_id="201",
+        link="link-201",
+        price=None,
+        meta_data="meta",
+    )
+    assert store.pending_count == 2
+
+    flushed = await store.flush()
+
+    assert flushed == 2
+    assert store.pending_count == 0
+    result = await mock_db_session.execute(
+        select(KeywordSite).order_by(KeywordSite.keyword_id)
+    )
+    rows = result.scalars().all()
+    await mock_db_session.refresh(rows[0])
+    assert [(row.keyword_id, row.external_id) for row in rows] == [
+        (first.id, "102,101,100"),
+        (second.id, "201"),
+    ]
+    assert rows[0].link == "link-102"
+
+
+@pytest.mark.asyncio
+async def test_stage_flushes_when_chunk_size_reached(mock_db_session, keywords_with_anchor):
+    first, second = keywords_with_anchor
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session, chunk_size=2)
+
+    for keyword in (first, second):
+        await store.stage(
+            keyword.id,
+            SiteName.ALGUMON,
+            external_id="300",
+            link=None,
+            price=None,
+            meta_data=None,
+        )
+
+    assert store.pending_count == 0
+    assert store.flushed_count == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_skips_rows_of_keywords_deleted_mid_run(mock_db_session, keywords_with_anchor):
+    first, second = keywords_with_anchor
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session)
+    for keyword in (first, second):
+        await store.stage(
+            keyword.id,
+            SiteName.ALGUMON,
+            external_id="300",
+            link=None,
+            price=None,
+            meta_data=None,
+        )
+    await mock_db_session.delete(second)
+    await mock_db_session.commit()
+
+    # 삭제된 키워드의 행 때문에 나머지 앵커까지 반영에 실패하지 않는다.
+    flushed = await store.flush()
+
+    assert flushed == 1
+    assert store.pending_count == 0
+    result = await mock_db_session.execute(select(KeywordSite.keyword_id, KeywordSite.external_id))
+    assert sorted(result.all()) == [(first.id, "300")]
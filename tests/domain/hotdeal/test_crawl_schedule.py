@@ -0,0 +1,37 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from app.src.core.time import utc_now
+from app.src.domain.hotdeal.crawl_schedule import compute_crawl_interval, estimate_deal_rate
+
+SETTINGS = "app.src.domain.hotdeal.crawl_schedule.settings"
+
+
+def test_interval_follows_deal_rate_and_subscribers_within_bounds():
+    with (
+        patch(f"{SETTINGS}.CRAWL_SCHEDULE_MIN_INTERVAL_MINUTES", 5.0),
+        patch(f"{SETTINGS}.CRAWL_SCHEDULE_MAX_INTERVAL_MINUTES", 360.0),
+        patch(f"{SETTINGS}.CRAWL_SCHEDULE_DEFAULT_INTERVAL_MINUTES", 30.0),
+        patch(f"{SETTINGS}.CRAWL_SCHEDULE_TARGET_DEALS_PER_CRAWL", 0.25),
+    ):
+        assert compute_crawl_interval(None) == timedelta(minutes=30)
+        # 시간당 1건 → 15분, 구독자 4명이면 1/3
+        assert compute_crawl_interval(1.0) == timedelta(minutes=15)
+        assert compute_crawl_interval(1.0, subscriber_count=4) == timedelta(minutes=5)
+        # 한 달에 한 건 수준은 최대 간격, 아주 뜨거운 키워드는 최소 간격
+        assert compute_crawl_interval(1 / 720) == timedelta(minutes=360)
+        assert compute_crawl_interval(0.0) == timedelta(minutes=360)
+        assert compute_crawl_interval(100.0) == timedelta(minutes=5)
+
+
+def test_deal_rate_seeds_from_last_deal_and_decays_without_deals():
+    now = utc_now()
+    with patch(f"{SETTINGS}.CRAWL_SCHEDULE_RATE_EWMA_ALPHA", 0.5):
+        assert estimate_deal_rate(None, 0, None, None, now) is None
+        seeded = estimate_deal_rate(None, 0, None, now - timedelta(hours=4), now)
+        assert seeded == 0.25
+
+        decayed = estimate_deal_rate(seeded, 0, 0.5, None, now)
+        assert decayed == 0.125
+        increased = estimate_deal_rate(decayed, 3, 0.5, None, now)
+        assert increased == 0.5 * 6 + 0.5 * 0.125
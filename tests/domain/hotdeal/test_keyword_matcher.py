@@ -0,0 +1,100 @@
+import random
+
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.keyword_matcher import KeywordMatcher, match_deals_by_keyword
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.domain.hotdeal.utils import normalize_keyword
+
+
+def _deal(deal_id: str, title: str) -> CrawledKeyword:
+    return CrawledKeyword(
+        id=deal_id,
+        title=title,
+        link=f"https://www.algumon.com/n/deal/{deal_id}",
+        site_name=SiteName.ALGUMON,
+        search_url="https://www.algumon.com/n/deal",
+    )
+
+
+def test_match_deals_by_keyword_uses_normalized_titles():
+    deals = [
+        _deal("3", "[쿠팡] 로지텍 MX Keys 키보드"),
+        _deal("2", "애플 에어팟 프로2"),
+        _deal("1", "로지텍 G304 마우스!"),
+    ]
+
+    matches = match_deals_by_keyword({10: "로지텍", 20: "MX Keys!", 30: "갤럭시"}, deals)
+
+    assert [deal.id for deal in matches[10]] == ["3", "1"]
+    assert [deal.id for deal in matches[20]] == ["3"]
+    assert 30 not in matches
+
+
+def test_match_deals_by_keyword_ignores_empty_keywords():
+    deals = [_deal("1", "아무 상품")]
+
+    assert match_deals_by_keyword({1: "!!", 2: " "}, deals) == {}
+
+
+def test_keyword_matcher_finds_overlapping_patterns():
+    matcher = KeywordMatcher({1: "he", 2: "she", 3: "his", 4: "hers", 5: "갤럭시 s24"})
+
+    assert matcher.match("USHERS") == {1, 2, 4}
+    assert matcher.match("[삼성] 갤럭시 S24 울트라") == {5}
+    assert matcher.match("아무것도 없음") == set()
+
+
+def test_keyword_matcher_incremental_add_remove_and_sync():
+    matcher = KeywordMatcher({1: "키보드"})
+    assert matcher.match("기계식 키보드") == {1}
+
+    matcher.add(2, "기계식")
+    assert matcher.match("기계식 키보드") == {1, 2}
+
+    matcher.remove(1)
+    assert matcher.match("기계식 키보드") == {2}
+    assert 1 not in matcher
+
+    added, removed = matcher.sync({2: "기계식", 3: "마우스"})
+    assert (added, removed) == (1, 0)
+    assert matcher.match("기계식 키보드와 마우스") == {2, 3}
+
+    added, removed = matcher.sync({3: "마우스 패드"})
+    assert (added, removed) == (1, 1)
+    assert matcher.match("기계식 마우스") == set()
+    assert matcher.match("마우스 패드") == {3}
+    assert len(matcher) == 1
+
+
+def test_keyword_matcher_agrees_with_substring_search():
+    rng = random.Random(7)
+    alphabet = "가나다라ab "
+    keyword_titles = {
+        keyword_id: "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+        for keyword_id in range(200)
+    }
+    matcher = KeywordMatcher(keyword_titles)
+
+    for _ in range(200):
+        title = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        normalized_title = normalize_keyword(title)
+        expected = {
+            keyword_id
+            for keyword_id, keyword_title in keyword_titles.items()
+            if (pattern := normalize_keyword(keyword_title).strip())
+            and pattern in normalized_title
+        }
+        assert matcher.match(title) == expected
+
+
+def test_keyword_matcher_rebuilds_trie_after_many_removals():
+    matcher = KeywordMatcher({keyword_id: f"키워드{keyword_id:03d}" for keyword_id in range(100)})
+    grown_nodes = matcher.node_count
+
+    for keyword_id in range(1, 100):
+        matcher.remove(keyword_id)
+
+    assert matcher.node_count < grown_nodes // 2
+    assert len(matcher) == 1
+    assert matcher.match("새 키워드000 특가") == {0}
+    assert matcher.match("키워드050") == set()
@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.core.time import utc_now
+from app.src.domain.admin.models import RunLedgerStatus, WorkerRunLedger
+from app.src.domain.admin.repositories import mark_run_ledger_mailed
+from app.src.domain.hotdeal.anchor_store import KeywordSiteAnchorStore
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.models import Keyword, KeywordSite
+from app.src.domain.hotdeal.run_ledger import RunLedger
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+
+DEAL = CrawledKeyword(
+    id="101",
+    title="키보드 특가",
+    link="link-101",
+    price="1000원",
+    site_name=SiteName.ALGUMON,
+    search_url="https://www.algumon.com/n/deal?keyword=test",
+)
+
+
+@pytest.fixture
+async def keywords(mock_db_session: AsyncSession) -> list[Keyword]:
+    rows = [Keyword(title="키보드"), Keyword(title="마우스"), Keyword(title="모니터")]
+    mock_db_session.add_all(rows)
+    await mock_db_session.commit()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_prioritize_puts_unfinished_then_stalest_keywords_first(
+    mock_db_session, keywords
+):
+    keyboard, mouse, monitor = keywords
+    now = utc_now()
+    mock_db_session.add_all(
+        [
+            WorkerRunLedger(
+                keyword_id=keyboard.id,
+                site_name=SiteName.ALGUMON,
+                status=RunLedgerStatus.MAILED,
+                completed_at=now,
+            ),
+            WorkerRunLedger(
+                keyword_id=monitor.id,
+                site_name=SiteName.ALGUMON,
+                status=RunLedgerStatus.MAILED,
+                completed_at=now - timedelta(hours=1),
+            ),
+        ]
+    )
+    await mock_db_session.commit()
+    ledger = RunLedger(session_factory=lambda: mock_db_session)
+
+    loaded = await ledger.load([k.id for k in keywords], [SiteName.ALGUMON])
+    ordered = ledger.prioritize(keywords, [SiteName.ALGUMON])
+
+    assert loaded == 2
+    assert [k.title for k in ordered] == ["마우스", "모니터", "키보드"]
+    assert ledger.take_carried(keyboard.id, SiteName.ALGUMON) is None
+
+
+@pytest.mark.asyncio
+async def test_completion_is_flushed_with_anchor_and_carried_until_mailed(
+    mock_db_session, keywords
+):
+    keyboard, mouse, _ = keywords
+    ledger = RunLedger(session_factory=lambda: mock_db_session, run_id=7)
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session, run_ledger=ledger)
+
+    store.record_completion(keyboard.id, SiteName.ALGUMON, [DEAL])
+    store.record_completion(mouse.id, SiteName.ALGUMON, [])
+    await store.stage(
+        keyboard.id,
+        SiteName.ALGUMON,
+        external_id="101",
+        link=DEAL.link,
+        price=DEAL.price,
+        meta_data=None,
+    )
+    await store.flush()
+
+    anchors = (await mock_db_session.execute(select(KeywordSite))).scalars().all()
+    assert [anchor.external_id for anchor in anchors] == ["101"]
+    assert ledger.staged_count == 0
+
+    # 메일을 만들기 전에 중단된 실행 → 다음 실행은 저장된 결과를 재사용
+    resumed = RunLedger(session_factory=lambda: mock_db_session, run_id=8)
+    await resumed.load([keyboard.id, mouse.id], [SiteName.ALGUMON])
+    assert resumed.take_carried(keyboard.id, SiteName.ALGUMON) == [DEAL]
+    assert resumed.take_carried(mouse.id, SiteName.ALGUMON) == []
+    assert resumed.carried_count == 2
+
+    await mark_run_ledger_mailed(mock_db_session, [keyboard.id, mouse.id])
+    after_mail = RunLedger(session_factory=lambda: mock_db_session)
+    await after_mail.load([keyboard.id, mouse.id], [SiteName.ALGUMON])
+    assert after_mail.pending_carry_count == 0
+
+
+@pytest.mark.asyncio
+async def test_completion_schedules_next_due_and_select_due_skips_it(mock_db_session, keywords):
+    keyboard, mouse, _ = keywords
+    ledger = RunLedger(
+        session_factory=lambda: mock_db_session,
+        subscriber_counts={keyboard.id: 1, mouse.id: 1},
+    )
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session, run_ledger=ledger)
+    store.record_completion(keyboard.id, SiteName.ALGUMON, [])
+    await store.flush()
+    await mark_run_ledger_mailed(mock_db_session, [keyboard.id])
+
+    next_tick = RunLedger(session_factory=lambda: mock_db_session)
+    await next_tick.load([keyboard.id, mouse.id], [SiteName.ALGUMON])
+    due = next_tick.select_due([keyboard, mouse], [SiteName.ALGUMON])
+
+    row = (await mock_db_session.execute(select(WorkerRunLedger))).scalars().one()
+    assert row.next_due_at is not None
+    assert due == {keyboard.id: set(), mouse.id: {SiteName.ALGUMON}}
+    assert (next_tick.due_count, next_tick.not_due_count) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_mark_mailed_applies_to_rows_not_yet_flushed(mock_db_session, keywords):
+    keyboard, mouse, _ = keywords
+    ledger = RunLedger(session_factory=lambda: mock_db_session)
+    store = KeywordSiteAnchorStore(session_factory=lambda: mock_db_session, run_ledger=ledger)
+    store.record_completion(keyboard.id, SiteName.ALGUMON, [DEAL])
+    store.record_completion(mouse.id, SiteName.ALGUMON, [DEAL])
+
+    # 메일 적재를 마친 뒤 반영된 행은 다음 실행에 이월되지 않는다.
+    ledger.mark_mailed([keyboard.id])
+    await store.flush()
+
+    next_run = RunLedger(session_factory=lambda: mock_db_session)
+    await next_run.load([keyboard.id, mouse.id], [SiteName.ALGUMON])
+    assert next_run.take_carried(keyboard.id, SiteName.ALGUMON) is None
+    assert next_run.take_carried(mouse.id, SiteName.ALGUMON) == [DEAL]
@@ -0,0 +1,78 @@
+import asyncio
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FakeProxyStats:
+    requests: int = 0
+    active: int = 0
+    max_active: int = 0
+
+
+@dataclass
+class FakeProxyServer:
+    """
+    127.0.0.1에서 동작하는 HTTP 프록시 흉내 서버.
+    절대 경로(absolute-form) 요청을 그대로 받아 지정된 상태 코드/지연으로 응답하므로
+    실제 네트워크 없이 프록시 헬스체크와 소스 페이지 수집을 검증할 수 있습니다.
+    """
+
+    status_code: int = 200
+    delay_seconds: float = 0.0
+    body: bytes = b'{"origin": "fake-proxy"}'
+    stats: FakeProxyStats = field(default_factory=FakeProxyStats)
+    _server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None
+        return self._server.sockets[0].getsockname()[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def __aenter__(self) -> "FakeProxyServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats.requests += 1
+        self.stats.active += 1
+        self.stats.max_active = max(self.stats.max_active, self.stats.active)
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            if self.delay_seconds:
+                await asyncio.sleep(self.delay_seconds)
+            writer.write(
+                f"HTTP/1.1 {self.status_code} FAKE\r\n"
+                f"Content-Length: {len(self.body)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + self.body
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.stats.active -= 1
+            writer.close()
+
+
+def build_proxy_source_page(proxy_urls: list[str]) -> bytes:
+    rows = []
+    for proxy_url in proxy_urls:
+        host, port = proxy_url.removeprefix("http://").split(":")
+        rows.append(
+            f"<tr><td>{host}</td><td>{port}</td><td></td><td></td>"
+            "<td>anonymous</td><td></td><td>yes</td></tr>"
+        )
+    return (
+        "<table class='table table-striped table-bordered'><tbody>"
+        + "".join(rows)
+        + "</tbody></table>"
+    ).encode()
@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.Infrastructure.crawling.adaptive_limiter import (
+    AdaptiveLimiter,
+    report_fetch_success,
+    report_site_block,
+)
+from app.src.Infrastructure.crawling.crawl_slot import CrawlSlot
+
+
+@pytest.fixture
+def clock():
+    current = {"now": 1000.0}
+    with patch.object(AdaptiveLimiter, "_now", staticmethod(lambda: current["now"])):
+        yield current
+
+
+@pytest.fixture(autouse=True)
+def aimd_settings():
+    with (
+        patch.object(settings, "CRAWL_AIMD_LATENCY_TARGET_SECONDS", 2.0),
+        patch.object(settings, "CRAWL_AIMD_DECREASE_FACTOR", 0.5),
+        patch.object(settings, "CRAWL_AIMD_DECREASE_COOLDOWN_SECONDS", 10.0),
+        patch.object(settings, "CRAWL_AIMD_PROXY_FAILURE_RATE_THRESHOLD", 0.5),
+        patch.object(settings, "CRAWL_AIMD_EWMA_ALPHA", 0.3),
+    ):
+        yield
+
+
+def test_additive_increase_per_round_trip_until_max():
+    limiter = AdaptiveLimiter("site", initial_limit=2, max_limit=4)
+
+    for _ in range(2):
+        limiter.record_success(0.5)
+    assert limiter.limit == 3
+    for _ in range(3):
+        limiter.record_success(0.5)
+    assert limiter.limit == 4
+    for _ in range(10):
+        limiter.record_success(0.5)
+
+    assert limiter.limit == 4
+    assert limiter.increases == 2
+
+
+def test_slow_latency_blocks_increase():
+    limiter = AdaptiveLimiter("site", initial_limit=2, max_limit=4)
+
+    for _ in range(10):
+        limiter.record_success(5.0)
+
+    assert limiter.limit == 2
+
+
+def test_block_halves_limit_once_per_cooldown(clock):
+    limiter = AdaptiveLimiter("site", initial_limit=8, max_limit=8)
+
+    limiter.record_block()
+    limiter.record_block()
+    assert limiter.limit == 4
+
+    clock["now"] += 11
+    limiter.record_block()
+    clock["now"] += 11
+    limiter.record_block()
+    clock["now"] += 11
+    limiter.record_block()
+
+    assert limiter.limit == 1
+    assert limiter.decreases == 3
+
+
+def test_proxy_failure_spike_decreases_but_isolated_failure_does_not():
+    limiter = AdaptiveLimiter("site", initial_limit=4, max_limit=4)
+
+    limiter.record_proxy_failure()
+    assert limiter.limit == 4
+    limiter.record_proxy_failure()
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_lowered_limit_holds_new_acquires_and_increase_wakes_waiters(clock):
+    limiter = AdaptiveLimiter("site", initial_limit=2, max_limit=4)
+    await limiter.acquire()
+    await limiter.acquire()
+    limiter.record_block()
+    limiter.release()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert waiter.done() is False
+
+    limiter.record_success(0.1)
+    await asyncio.sleep(0)
+    assert waiter.done() is True
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = AdaptiveLimiter("site", initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    limiter.release()
+    assert limiter.in_flight == 0
+    assert limiter.locked() is False
+
+
+@pytest.mark.asyncio
+async def test_crawl_slot_reports_signals_to_site_and_parent(clock):
+    keyword_limiter = AdaptiveLimiter("keyword", initial_limit=4, max_limit=8)
+    site_limiter = AdaptiveLimiter("site", initial_limit=2, max_limit=4, parent=keyword_limiter)
+
+    async with CrawlSlot(site_limiter):
+        report_fetch_success(0.2)
+        report_fetch_success(0.2)
+        report_site_block()
+
+    # 슬롯 밖에서는 신호가 무시된다.
+    report_site_block()
+
+    assert site_limiter.limit == 1
+    assert site_limiter.increases == 1
+    assert keyword_limiter.limit == 2
+    assert site_limiter.in_flight == 0
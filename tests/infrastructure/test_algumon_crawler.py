@@ -1,7 +1,32 @@
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from app.src.core.config import settings
 from app.src.domain.hotdeal.enums import SiteName
-from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+from app.src.Infrastructure.crawling.crawlers.algumon import (
+    AlgumonCrawler,
+    AlgumonFeedCrawler,
+)
+from app.src.Infrastructure.crawling.parser_engine import (
+    ParserEngine,
+    is_parser_engine_available,
+    resolve_parser_engine,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+CONCRETE_ENGINES = [
+    ParserEngine.BS4,
+    ParserEngine.BS4_STRAINER,
+    ParserEngine.LXML,
+    ParserEngine.SELECTOLAX,
+]
+
+
+def _require_engine(engine: ParserEngine) -> None:
+    if not is_parser_engine_available(engine):
+        pytest.skip(f"{engine.value} 미설치")
 
 ALGUMON_SEARCH_HTML = """
 <div class="flex flex-col gap-1.5 bg-base-200 py-1.5 svelte-17cy2qz">
@@ -60,3 +85,78 @@ def test_algumon_crawler_parses_new_deal_card_structure():
     assert first.site_name == SiteName.ALGUMON
     assert first.search_url == crawler.search_url
     assert first.meta_data == "퀘이사존 | 배송 무료 · 26. 02. 06. | 5 길가던노랭이"
+
+
+def test_algumon_feed_crawler_builds_paged_feed_url():
+    assert AlgumonFeedCrawler(client=MagicMock()).url == "https://www.algumon.com/n/deal"
+    assert (
+        AlgumonFeedCrawler(client=MagicMock(), page=3).url
+        == "https://www.algumon.com/n/deal?page=3"
+    )
+
+
+@pytest.mark.parametrize("engine", CONCRETE_ENGINES)
+def test_algumon_parser_engines_parse_card_structure(engine):
+    _require_engine(engine)
+    crawler = AlgumonCrawler(keyword="테스트 상품", client=MagicMock(), parser_engine=engine)
+
+    assert crawler.parser_engine == engine
+    result = crawler.parse(ALGUMON_SEARCH_HTML)
+
+    assert [item.model_dump() for item in result] == [
+        item.model_dump()
+        for item in AlgumonCrawler(
+            keyword="테스트 상품", client=MagicMock(), parser_engine=ParserEngine.BS4
+        ).parse(ALGUMON_SEARCH_HTML)
+    ]
+
+
+@pytest.mark.parametrize("engine", CONCRETE_ENGINES)
+@pytest.mark.parametrize(
+    "fixture_name", ["algumon_search_page.html", "algumon_feed_page.html"]
+)
+def test_algumon_parser_engines_match_bs4_on_saved_pages(engine, fixture_name):
+    _require_engine(engine)
+    html = (FIXTURES_DIR / fixture_name).read_text(encoding="utf-8")
+
+    expected = AlgumonCrawler(
+        keyword="키보드", client=MagicMock(), parser_engine=ParserEngine.BS4
+    ).parse(html)
+    result = AlgumonCrawler(
+        keyword="키보드", client=MagicMock(), parser_engine=engine
+    ).parse(html)
+
+    assert expected
+    assert [item.model_dump() for item in result] == [
+        item.model_dump() for item in expected
+    ]
+
+
+@pytest.mark.parametrize("engine", CONCRETE_ENGINES)
+def test_algumon_parser_engines_return_empty_without_cards(engine):
+    _require_engine(engine)
+    crawler = AlgumonCrawler(keyword="테스트", client=MagicMock(), parser_engine=engine)
+
+    assert crawler.parse("<html><body><div>결과 없음</div></body></html>") == []
+
+
+def test_resolve_parser_engine_falls_back_when_unsupported_or_unknown():
+    supported = (ParserEngine.BS4, ParserEngine.BS4_STRAINER)
+
+    assert resolve_parser_engine("bs4", supported) == ParserEngine.BS4
+    assert resolve_parser_engine("selectolax", supported) == ParserEngine.BS4
+    assert resolve_parser_engine("unknown", supported) == ParserEngine.BS4
+    assert resolve_parser_engine("bs4_strainer", supported) == ParserEngine.BS4_STRAINER
+    assert resolve_parser_engine(None, (ParserEngine.BS4,)) == ParserEngine.BS4
+
+
+def test_resolve_parser_engine_defaults_to_bs4_even_when_optional_engines_installed():
+    supported = tuple(ParserEngine)[1:]
+    with patch(
+        "app.src.Infrastructure.crawling.parser_engine.is_parser_engine_available",
+        side_effect=lambda engine: engine != ParserEngine.SELECTOLAX,
+    ):
+        assert settings.CRAWL_PARSER_ENGINE == "bs4"
+        assert resolve_parser_engine(settings.CRAWL_PARSER_ENGINE, supported) == ParserEngine.BS4
+        assert resolve_parser_engine("selectolax", supported) == ParserEngine.BS4
+        assert resolve_parser_engine("auto", supported) == ParserEngine.LXML
@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.Infrastructure.crawling.circuit_breaker import CircuitState, SiteCircuitBreakers
+
+
+@pytest.fixture
+def clock():
+    current = {"now": 1000.0}
+    with patch.object(SiteCircuitBreakers, "_now", staticmethod(lambda: current["now"])):
+        yield current
+
+
+@pytest.fixture(autouse=True)
+def circuit_settings():
+    with (
+        patch.object(settings, "CRAWL_CIRCUIT_CONSECUTIVE_FAILURES", 3),
+        patch.object(settings, "CRAWL_CIRCUIT_FAILURE_RATE_THRESHOLD", 0.5),
+        patch.object(settings, "CRAWL_CIRCUIT_MIN_CALLS", 6),
+        patch.object(settings, "CRAWL_CIRCUIT_OPEN_SECONDS", 100.0),
+    ):
+        yield
+
+
+def test_consecutive_failures_open_circuit_per_site(clock):
+    breakers = SiteCircuitBreakers()
+
+    for _ in range(2):
+        breakers.record_failure(SiteName.ALGUMON)
+    assert breakers.allow_request(SiteName.ALGUMON) is True
+
+    breakers.record_failure(SiteName.ALGUMON)
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.OPEN
+    assert breakers.is_open(SiteName.ALGUMON) is True
+    assert breakers.allow_request(SiteName.ALGUMON) is False
+    assert breakers.allow_request(SiteName.FMKOREA) is True
+
+
+def test_failure_rate_opens_circuit_after_min_calls(clock):
+    breakers = SiteCircuitBreakers()
+
+    # 실패가 연속되지 않아도 실행 내 실패율이 기준 이상이면 열린다.
+    for success in (True, False, True, False, True):
+        breakers.record_result(SiteName.ALGUMON, success)
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.CLOSED
+
+    breakers.record_failure(SiteName.ALGUMON)
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.OPEN
+
+
+def test_half_open_allows_single_trial_and_closes_on_success(clock):
+    breakers = SiteCircuitBreakers()
+    for _ in range(3):
+        breakers.record_failure(SiteName.ALGUMON)
+
+    clock["now"] += 101
+    assert breakers.is_open(SiteName.ALGUMON) is False
+    assert breakers.allow_request(SiteName.ALGUMON) is True
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.HALF_OPEN
+    # 시험 요청이 끝나기 전에는 다른 요청을 보내지 않는다.
+    assert breakers.allow_request(SiteName.ALGUMON) is False
+
+    breakers.record_success(SiteName.ALGUMON)
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.CLOSED
+    assert breakers.allow_request(SiteName.ALGUMON) is True
+
+
+def test_half_open_trial_failure_reopens_circuit(clock):
+    breakers = SiteCircuitBreakers()
+    for _ in range(3):
+        breakers.record_failure(SiteName.ALGUMON)
+
+    clock["now"] += 101
+    assert breakers.allow_request(SiteName.ALGUMON) is True
+    breakers.record_failure(SiteName.ALGUMON)
+
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.OPEN
+    clock["now"] += 50
+    assert breakers.allow_request(SiteName.ALGUMON) is False
+
+
+def test_skipped_keywords_are_taken_once_for_next_run(clock):
+    breakers = SiteCircuitBreakers()
+    breakers.record_skip(SiteName.ALGUMON, 1)
+    breakers.record_skip(SiteName.FMKOREA, 2)
+    breakers.record_skip(SiteName.ALGUMON, 1)
+
+    assert breakers.take_pending_keyword_ids() == {1, 2}
+    assert breakers.take_pending_keyword_ids() == set()
+
+
+def test_disabled_breaker_never_opens(clock):
+    breakers = SiteCircuitBreakers()
+    with patch.object(settings, "CRAWL_CIRCUIT_BREAKER_ENABLED", False):
+        for _ in range(10):
+            breakers.record_failure(SiteName.ALGUMON)
+        assert breakers.allow_request(SiteName.ALGUMON) is True
+    assert breakers.get_state(SiteName.ALGUMON) == CircuitState.CLOSED
@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
+from app.src.Infrastructure.crawling.crawl_slot import (
+    CRAWL_SLOT_STATS,
+    CrawlSlot,
+    defer_until_ready,
+)
+
+
+class SlotCrawler(BaseCrawler):
+    @property
+    def url(self) -> str:
+        return "https://slot-site.com"
+
+    @property
+    def site_name(self) -> SiteName:
+        return SiteName.ALGUMON
+
+    def parse(self, html: str) -> list[CrawledKeyword]:
+        return []
+
+
+@pytest.fixture(autouse=True)
+def reset_slot_stats():
+    CRAWL_SLOT_STATS.reset()
+    yield
+    CRAWL_SLOT_STATS.reset()
+
+
+@pytest.mark.asyncio
+async def test_deferred_backoff_releases_slot_to_other_tasks():
+    semaphore = asyncio.Semaphore(1)
+    events: list[str] = []
+
+    async def blocked_keyword():
+        async with CrawlSlot(semaphore):
+            events.append("blocked:start")
+            await defer_until_ready(0.05)
+            events.append("blocked:resume")
+
+    async def healthy_keyword():
+        await asyncio.sleep(0.01)
+        async with CrawlSlot(semaphore):
+            events.append("healthy:run")
+
+    await asyncio.gather(blocked_keyword(), healthy_keyword())
+
+    assert events == ["blocked:start", "healthy:run", "blocked:resume"]
+    assert CRAWL_SLOT_STATS.deferred_count == 1
+    assert semaphore._value == 1
+
+
+@pytest.mark.asyncio
+async def test_defer_without_slot_or_when_disabled_just_sleeps():
+    semaphore = asyncio.Semaphore(1)
+    await defer_until_ready(0)
+
+    with patch.object(settings, "CRAWL_DEFER_BACKOFF_ENABLED", False):
+        async with CrawlSlot(semaphore):
+            await defer_until_ready(0)
+            assert semaphore.locked() is True
+
+    assert CRAWL_SLOT_STATS.deferred_count == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_defer_keeps_semaphore_balanced():
+    semaphore = asyncio.Semaphore(1)
+
+    async def blocked_keyword():
+        async with CrawlSlot(semaphore):
+            await defer_until_ready(10)
+
+    task = asyncio.create_task(blocked_keyword())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert semaphore._value == 1
+
+
+@pytest.mark.asyncio
+async def test_blocked_fetch_backoff_does_not_hold_site_slot():
+    semaphore = asyncio.Semaphore(1)
+    blocked = MagicMock()
+    blocked.status_code = 429
+    blocked.text = "Too Many Requests"
+    blocked.headers = {}
+    client = MagicMock()
+    client.get = AsyncMock(return_value=blocked)
+    crawler = SlotCrawler(keyword="blocked", client=client)
+    slot_acquired_during_backoff = asyncio.Event()
+
+    async def fetch_with_proxy(*args, **kwargs):
+        # 백오프가 끝나 프록시로 재시도할 때는 이미 다른 키워드가 슬롯을 썼어야 한다.
+        assert slot_acquired_during_backoff.is_set()
+        return "<html>proxy</html>"
+
+    async def other_keyword():
+        await asyncio.sleep(0.05)
+        async with CrawlSlot(semaphore):
+            slot_acquired_during_backoff.set()
+
+    async def blocked_keyword():
+        async with CrawlSlot(semaphore):
+            return await crawler.fetch()
+
+    with (
+        patch.object(settings, "CRAWL_BLOCK_BACKOFF_SECONDS", 0.5),
+        patch.object(
+            SlotCrawler,
+            "_fetch_with_proxy",
+            new=AsyncMock(side_effect=fetch_with_proxy),
+        ),
+    ):
+        result, _ = await asyncio.gather(blocked_keyword(), other_keyword())
+
+    assert result == "<html>proxy</html>"
+    assert CRAWL_SLOT_STATS.deferred_count == 1
@@ -0,0 +1,174 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.src.core.config import settings
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
+from app.src.Infrastructure.crawling.circuit_breaker import SITE_CIRCUITS, CircuitState
+from app.src.Infrastructure.crawling.deadline import (
+    DEADLINE_STATS,
+    Deadline,
+    bound_timeout,
+    deadline_scope,
+    has_time_for,
+    remaining_seconds,
+    reserve_scope,
+)
+
+
+class DeadlineCrawler(BaseCrawler):
+    @property
+    def url(self) -> str:
+        return "https://deadline-site.com"
+
+    @property
+    def site_name(self) -> SiteName:
+        return SiteName.ALGUMON
+
+    def parse(self, html: str) -> list[CrawledKeyword]:
+        return []
+
+
+@pytest.fixture
+def clock():
+    current = {"now": 1000.0}
+    with patch.object(Deadline, "_now", staticmethod(lambda: current["now"])):
+        yield current
+
+
+@pytest.fixture(autouse=True)
+def reset_deadline_stats():
+    DEADLINE_STATS.reset()
+    yield
+    DEADLINE_STATS.reset()
+
+
+def test_nested_scopes_keep_earliest_deadline_and_reserve(clock):
+    assert remaining_seconds() is None
+    assert bound_timeout(120.0) == 120.0
+
+    with deadline_scope(300.0):
+        with deadline_scope(600.0):
+            assert remaining_seconds() == 300.0
+        with reserve_scope(120.0):
+            assert remaining_seconds() == 180.0
+            clock["now"] += 150
+            assert bound_timeout(120.0) == 30.0
+            assert has_time_for(30.0) is True
+            assert has_time_for(31.0) is False
+    assert remaining_seconds() is None
+    assert DEADLINE_STATS.shortened_timeouts == 1
+
+
+def test_disabled_propagation_ignores_deadline(clock):
+    with (
+        patch.object(settings, "CRAWL_DEADLINE_PROPAGATION_ENABLED", False),
+        deadline_scope(1.0),
+    ):
+        assert remaining_seconds() is None
+        assert has_time_for(10.0) is True
+
+
+@pytest.mark.asyncio
+async def test_deadline_propagates_to_child_tasks(clock):
+    async def child() -> float | None:
+        return remaining_seconds()
+
+    with deadline_scope(50.0):
+        remaining = await asyncio.create_task(child())
+
+    assert remaining == 50.0
+
+
+@pytest.mark.asyncio
+async def test_proxy_retries_stop_when_deadline_is_near(clock):
+    crawler = DeadlineCrawler(keyword="deadline", client=MagicMock())
+    crawler.proxy_manager = MagicMock()
+
+    with (
+        patch.object(settings, "CRAWL_DEADLINE_MIN_REQUEST_SECONDS", 10.0),
+        deadline_scope(5.0),
+    ):
+        result = await crawler._fetch_with_proxy("https://deadline-site.com")
+
+    assert result is None
+    crawler.proxy_manager.get_next_proxy.assert_not_called()
+    assert DEADLINE_STATS.shed_retries == 1
+
+
+@pytest.mark.asyncio
+async def test_backoff_that_outlives_deadline_is_not_started(clock):
+    crawler = DeadlineCrawler(keyword="deadline", client=MagicMock())
+    blocked = MagicMock()
+    blocked.status_code = 429
+    blocked.text = "Too Many Requests"
+    blocked.headers = {}
+    crawler.client.get = AsyncMock(return_value=blocked)
+
+    with (
+        patch.object(settings, "CRAWL_BLOCK_BACKOFF_SECONDS", 30.0),
+        patch.object(settings, "CRAWL_DEADLINE_MIN_REQUEST_SECONDS", 10.0),
+        patch.object(DeadlineCrawler, "_fetch_with_proxy", new=AsyncMock()) as fetch_proxy,
+        patch(
+            "app.src.Infrastructure.crawling.base_crawler.defer_until_ready",
+            new=AsyncMock(),
+        ) as defer,
+        deadline_scope(35.0),
+    ):
+        result = await crawler.fetch()
+
+    assert result is None
+    defer.assert_not_awaited()
+    fetch_proxy.assert_not_awaited()
+    assert DEADLINE_STATS.shed_retries == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_shed_fetch_is_not_a_circuit_failure(clock):
+    crawler = DeadlineCrawler(keyword="deadline", client=MagicMock())
+    blocked = MagicMock()
+    blocked.status_code = 429
+    blocked.text = "Too Many Requests"
+    blocked.headers = {}
+    crawler.client.get = AsyncMock(return_value=blocked)
+
+    with (
+        patch.object(settings, "CRAWL_BLOCK_BACKOFF_SECONDS", 30.0),
+        patch.object(settings, "CRAWL_DEADLINE_MIN_REQUEST_SECONDS", 10.0),
+        deadline_scope(35.0),
+    ):
+        results = await crawler.fetchparse()
+
+    assert results == []
+    assert crawler.fetch_succeeded is False
+    assert crawler.deadline_shed is True
+    assert SITE_CIRCUITS.get_state(SiteName.ALGUMON) == CircuitState.CLOSED
+    assert SITE_CIRCUITS._circuits == {}
+
+
+@pytest.mark.asyncio
+async def test_proxy_timeout_shortened_by_deadline_is_not_a_proxy_failure(clock):
+    crawler = DeadlineCrawler(keyword="deadline", client=MagicMock())
+    crawler.proxy_manager = MagicMock()
+    crawler.proxy_manager.get_next_proxy.return_value = "http://1.1.1.1:8080"
+    proxy_client = MagicMock()
+    proxy_client.get = AsyncMock(side_effect=httpx.ReadTimeout("timed out"))
+    proxy_client.__aenter__ = AsyncMock(return_value=proxy_client)
+    proxy_client.__aexit__ = AsyncMock(return_value=None)
+
+    with (
+        patch.object(settings, "CRAWL_DEADLINE_MIN_REQUEST_SECONDS", 10.0),
+        patch.object(DeadlineCrawler, "_proxy_client", return_value=proxy_client),
+        deadline_scope(15.0),
+    ):
+        result = await crawler._fetch_with_proxy("https://deadline-site.com", timeout=20)
+
+    assert result is None
+    assert proxy_client.get.await_args.kwargs["timeout"] == 15.0
+    crawler.proxy_manager.record_proxy_failure.assert_not_called()
+    assert crawler.deadline_shed is True
+    assert DEADLINE_STATS.shed_retries == 1
@@ -0,0 +1,70 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.feed_collector import collect_feed_deals
+
+
+def _deal(deal_id: str) -> CrawledKeyword:
+    return CrawledKeyword(
+        id=deal_id,
+        title=f"딜 {deal_id}",
+        link=f"https://www.algumon.com/n/deal/{deal_id}",
+        site_name=SiteName.ALGUMON,
+        search_url="https://www.algumon.com/n/deal",
+    )
+
+
+def _patch_pages(pages: list[list[CrawledKeyword]]):
+    crawlers = []
+    for page_deals in pages:
+        crawler = MagicMock()
+        crawler.fetchparse = AsyncMock(return_value=page_deals)
+        crawlers.append(crawler)
+    return patch(
+        "app.src.Infrastructure.crawling.feed_collector.get_feed_crawler",
+        side_effect=crawlers,
+    )
+
+
+async def test_collect_feed_deals_stops_at_last_seen_id():
+    pages = [
+        [_deal("110"), _deal("109")],
+        [_deal("109"), _deal("108"), _deal("105"), _deal("104")],
+        [_deal("103")],
+    ]
+    with _patch_pages(pages) as mock_get_feed_crawler:
+        result = await collect_feed_deals(
+            SiteName.ALGUMON, MagicMock(), last_seen_id="105", max_pages=5
+        )
+
+    assert [deal.id for deal in result.deals] == ["110", "109", "108"]
+    assert result.pages_fetched == 2
+    assert result.reached_last_seen is True
+    assert mock_get_feed_crawler.call_count == 2
+
+
+async def test_collect_feed_deals_stops_below_deleted_last_seen_id():
+    with _patch_pages([[_deal("110"), _deal("104")]]):
+        result = await collect_feed_deals(
+            SiteName.ALGUMON, MagicMock(), last_seen_id="105", max_pages=5
+        )
+
+    assert [deal.id for deal in result.deals] == ["110"]
+    assert result.reached_last_seen is True
+
+
+async def test_collect_feed_deals_respects_max_pages_and_reports_failure():
+    with _patch_pages([[_deal("110")], [_deal("109")], [_deal("108")]]):
+        result = await collect_feed_deals(
+            SiteName.ALGUMON, MagicMock(), last_seen_id=None, max_pages=2
+        )
+    assert [deal.id for deal in result.deals] == ["110", "109"]
+    assert result.reached_last_seen is False
+
+    with _patch_pages([[]]):
+        failed = await collect_feed_deals(
+            SiteName.ALGUMON, MagicMock(), last_seen_id="105", max_pages=2
+        )
+    assert failed.failed is True
+    assert failed.deals == []
@@ -0,0 +1,95 @@
+import pickle
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.src.Infrastructure.crawling import parse_executor
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+from app.src.Infrastructure.crawling.parser_engine import ParserEngine
+
+FIXTURE_HTML = (
+    Path(__file__).parent / "fixtures" / "algumon_search_page.html"
+).read_text(encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def reset_parse_executor():
+    parse_executor.shutdown_parse_executor()
+    yield
+    parse_executor.shutdown_parse_executor()
+
+
+@pytest.fixture(autouse=True)
+def mock_fetch():
+    with patch.object(
+        AlgumonCrawler, "fetch", AsyncMock(return_value=FIXTURE_HTML)
+    ) as fetch:
+        yield fetch
+
+
+def _crawler() -> AlgumonCrawler:
+    return AlgumonCrawler(
+        keyword="키보드", client=MagicMock(), parser_engine=ParserEngine.BS4
+    )
+
+
+def test_crawler_pickles_without_network_state():
+    crawler = _crawler()
+
+    restored = pickle.loads(pickle.dumps(crawler))
+
+    assert restored.client is None
+    assert restored.proxy_manager is None
+    assert restored.keyword == "키보드"
+    assert restored.parser_engine == ParserEngine.BS4
+    assert restored.parse(FIXTURE_HTML) == crawler.parse(FIXTURE_HTML)
+
+
+async def test_fetchparse_parses_inline_by_default():
+    with patch.object(parse_executor.settings, "CRAWL_PARSE_EXECUTOR", "none"):
+        results = await _crawler().fetchparse()
+
+    assert parse_executor.get_parse_executor() is None
+    assert len(results) == 27
+
+
+async def test_fetchparse_uses_thread_executor():
+    parse_threads: list[str] = []
+    original_parse = AlgumonCrawler.parse
+
+    def recording_parse(self, html):
+        parse_threads.append(threading.current_thread().name)
+        return original_parse(self, html)
+
+    with (
+        patch.object(parse_executor.settings, "CRAWL_PARSE_EXECUTOR", "thread"),
+        patch.object(AlgumonCrawler, "parse", recording_parse),
+    ):
+        results = await _crawler().fetchparse()
+
+    assert len(results) == 27
+    assert parse_threads[0].startswith("crawl-parse")
+
+
+async def test_fetchparse_process_executor_returns_identical_results():
+    expected = _crawler().parse(FIXTURE_HTML)
+
+    with (
+        patch.object(parse_executor.settings, "CRAWL_PARSE_EXECUTOR", "process"),
+        patch.object(parse_executor.settings, "CRAWL_PARSE_EXECUTOR_MAX_WORKERS", 1),
+    ):
+        results = await _crawler().fetchparse()
+        executor_kind = parse_executor.get_parse_executor_kind()
+
+    assert executor_kind == "process"
+    assert [item.model_dump() for item in results] == [
+        item.model_dump() for item in expected
+    ]
+
+
+def test_unknown_executor_kind_falls_back_to_inline():
+    with patch.object(parse_executor.settings, "CRAWL_PARSE_EXECUTOR", "gpu"):
+        assert parse_executor.get_parse_executor_kind() == "none"
+        assert parse_executor.get_parse_executor() is None
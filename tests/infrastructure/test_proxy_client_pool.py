@@ -0,0 +1,205 @@
+import gc
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from app.src.core.config import settings
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
+from app.src.Infrastructure.crawling.proxy_client_pool import (
+    PROXY_CLIENT_POOL,
+    ProxyClientPool,
+)
+from app.src.Infrastructure.crawling.proxy_manager import ProxyFailureType, ProxyManager
+
+
+class _FakeStream:
+    """httpcore 네트워크 스트림 대용 (약한 참조 가능)"""
+
+
+class FakeProxyClient:
+    def __init__(self, proxy: str, responses: list[httpx.Response] | None = None):
+        self.proxy = proxy
+        self.responses = responses or []
+        self.requests = 0
+        self.is_closed = False
+
+    async def get(self, url: str, timeout: int = 20) -> httpx.Response:
+        self.requests += 1
+        return self.responses.pop(0)
+
+    async def aclose(self) -> None:
+        self.is_closed = True
+
+
+class ProxyCrawler(BaseCrawler):
+    @property
+    def url(self) -> str:
+        return "https://proxy-site.com"
+
+    @property
+    def site_name(self) -> SiteName:
+        return SiteName.ALGUMON
+
+    def parse(self, html: str) -> list[CrawledKeyword]:
+        return []
+
+
+@pytest.fixture
+def created_clients():
+    clients: list[FakeProxyClient] = []
+
+    def factory(proxy: str) -> FakeProxyClient:
+        client = FakeProxyClient(proxy)
+        clients.append(client)
+        return client
+
+    with patch(
+        "app.src.Infrastructure.crawling.proxy_client_pool.httpx.AsyncClient",
+        side_effect=factory,
+    ):
+        yield clients
+
+
+@pytest.fixture
+def proxy_manager():
+    manager = ProxyManager()
+    manager.reset_proxies(clear_history=True)
+    yield manager
+    manager.reset_proxies(clear_history=True)
+
+
+@pytest.mark.asyncio
+async def test_lease_reuses_client_per_proxy(created_clients):
+    pool = ProxyClientPool(max_size=4)
+
+    async with pool.lease("http://1.1.1.1:8080") as first:
+        pass
+    async with pool.lease("http://1.1.1.1:8080") as second:
+        pass
+
+    assert first is second
+    assert len(created_clients) == 1
+    assert pool.get_metrics()["client_reuse_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_closes_least_recently_used_client(created_clients):
+    pool = ProxyClientPool(max_size=2)
+
+    for proxy_url in ("http://1.1.1.1:8080", "http://2.2.2.2:8080"):
+        async with pool.lease(proxy_url):
+            pass
+    async with pool.lease("http://1.1.1.1:8080"):
+        pass
+    async with pool.lease("http://3.3.3.3:8080"):
+        pass
+    async with pool.lease("http://1.1.1.1:8080"):
+        pass
+
+    closed = {client.proxy for client in created_clients if client.is_closed}
+    assert closed == {"http://2.2.2.2:8080"}
+    assert "http://2.2.2.2:8080" not in pool
+    assert pool.get_metrics()["clients_evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_discard_defers_close_until_lease_released(created_clients):
+    pool = ProxyClientPool(max_size=4)
+
+    async with pool.lease("http://1.1.1.1:8080") as client:
+        assert pool.discard("http://1.1.1.1:8080") is True
+        assert client.is_closed is False
+
+    assert client.is_closed is True
+    assert "http://1.1.1.1:8080" not in pool
+
+
+@pytest.mark.asyncio
+async def test_record_response_counts_keep_alive_connection_reuse(created_clients):
+    pool = ProxyClientPool(max_size=4)
+    stream = _FakeStream()
+    async with pool.lease("http://1.1.1.1:8080"):
+        pass
+
+    for _ in range(3):
+        response = httpx.Response(200, extensions={"network_stream": stream})
+        pool.record_response("http://1.1.1.1:8080", response)
+
+    assert pool.get_metrics()["connection_reuse_ratio"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_record_response_forgets_closed_connections(created_clients):
+    pool = ProxyClientPool(max_size=4)
+    async with pool.lease("http://1.1.1.1:8080"):
+        pass
+
+    # 닫힌 연결의 id가 새 연결에 재사용되어도 재사용으로 집계하지 않는다.
+    for _ in range(3):
+        response = httpx.Response(200, extensions={"network_stream": _FakeStream()})
+        pool.record_response("http://1.1.1.1:8080", response)
+        del response
+        gc.collect()
+
+    assert pool.get_metrics()["connection_reuse_ratio"] == 0.0
+    assert len(pool._clients["http://1.1.1.1:8080"].streams) == 0
+
+
+@pytest.mark.asyncio
+async def test_hard_ban_discards_and_closes_pooled_client(created_clients, proxy_manager):
+    proxy_url = "http://1.1.1.1:8080"
+    proxy_manager.register_proxy(proxy_url)
+    async with PROXY_CLIENT_POOL.lease(proxy_url):
+        pass
+
+    with (
+        patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 1),
+        patch.object(settings, "PROXY_HARD_BAN_FAILURE_THRESHOLD", 1),
+    ):
+        proxy_manager.record_proxy_failure(proxy_url, ProxyFailureType.BLOCKED)
+
+    assert proxy_url not in PROXY_CLIENT_POOL
+    await PROXY_CLIENT_POOL.aclose()
+    assert created_clients[0].is_closed is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_proxy_reuses_pooled_client_across_keywords(created_clients):
+    proxy_url = "http://1.1.1.1:8080"
+    keywords = ["monitor", "keyboard"]
+    async with PROXY_CLIENT_POOL.lease(proxy_url) as pooled_client:
+        pooled_client.responses.extend(
+            httpx.Response(200, text=keyword) for keyword in keywords
+        )
+
+    for keyword in keywords:
+        crawler = ProxyCrawler(keyword=keyword, client=MagicMock())
+        with (
+            patch.object(crawler.proxy_manager, "get_next_proxy", return_value=proxy_url),
+            patch.object(crawler.proxy_manager, "record_proxy_success"),
+        ):
+            assert await crawler._fetch_with_proxy(crawler.url, 10) == keyword
+
+    assert len(created_clients) == 1
+    assert created_clients[0].requests == 2
+    assert created_clients[0].is_closed is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_proxy_reports_latency(created_clients):
+    proxy_url = "http://1.1.1.1:8080"
+    async with PROXY_CLIENT_POOL.lease(proxy_url) as pooled_client:
+        pooled_client.responses.append(httpx.Response(200, text="ok"))
+
+    crawler = ProxyCrawler(keyword="monitor", client=MagicMock())
+    with (
+        patch.object(crawler.proxy_manager, "get_next_proxy", return_value=proxy_url),
+        patch.object(crawler.proxy_manager, "record_proxy_success") as mock_success,
+    ):
+        await crawler._fetch_with_proxy(crawler.url, 10)
+
+    latency_seconds = mock_success.call_args.kwargs["latency_seconds"]
+    assert latency_seconds >= 0
@@ -0,0 +1,237 @@
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.Infrastructure.crawling.proxy_manager import ProxyFailureType, ProxyManager
+from app.src.Infrastructure.crawling.proxy_sources import (
+    ProxySource,
+    parse_html_table,
+    parse_plain_text,
+)
+from tests.infrastructure.fake_proxy_server import (
+    FakeProxyServer,
+    FakeProxyStats,
+    build_proxy_source_page,
+)
+
+
+@pytest.fixture
+def proxy_manager():
+    manager = ProxyManager()
+    manager.reset_proxies(clear_history=True)
+    with (
+        patch.object(settings, "PROXY_HEALTHCHECK_ENABLED", True),
+        patch.object(settings, "PROXY_HEALTHCHECK_URL", "http://healthcheck.test/ip"),
+        patch.object(settings, "PROXY_HEALTHCHECK_TIMEOUT_SECONDS", 1.0),
+        patch.object(ProxyManager, "_is_public_proxy_endpoint", return_value=True),
+    ):
+        yield manager
+    manager.reset_proxies(clear_history=True)
+
+
+async def start_proxies(
+    stack: AsyncExitStack,
+    count: int,
+    stats: FakeProxyStats,
+    **kwargs,
+) -> list[FakeProxyServer]:
+    return [
+        await stack.enter_async_context(FakeProxyServer(stats=stats, **kwargs))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_health_check_accepts_healthy_fake_proxy(proxy_manager):
+    async with FakeProxyServer() as server:
+        assert await proxy_manager._is_proxy_healthy_async(server.url) is True
+    assert server.stats.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_async_health_check_rejects_server_error_and_timeout(proxy_manager):
+    with patch.object(settings, "PROXY_HEALTHCHECK_TIMEOUT_SECONDS", 0.2):
+        async with (
+            FakeProxyServer(status_code=502) as broken,
+            FakeProxyServer(delay_seconds=0.5) as slow,
+        ):
+            assert await proxy_manager._is_proxy_healthy_async(broken.url) is False
+            assert await proxy_manager._is_proxy_healthy_async(slow.url) is False
+
+
+@pytest.mark.asyncio
+async def test_health_checks_run_concurrently_within_semaphore(proxy_manager):
+    stats = FakeProxyStats()
+    async with AsyncExitStack() as stack:
+        servers = await start_proxies(stack, 6, stats, delay_seconds=0.1)
+        with patch.object(settings, "PROXY_HEALTHCHECK_CONCURRENCY", 3):
+            added, unhealthy, unchecked = await proxy_manager._register_healthy_proxies(
+                [server.url for server in servers], target=None
+            )
+
+    assert (added, unhealthy, unchecked) == (6, 0, 0)
+    assert stats.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_health_checks_stop_once_target_reached(proxy_manager):
+    stats = FakeProxyStats()
+    async with AsyncExitStack() as stack:
+        servers = await start_proxies(stack, 10, stats, delay_seconds=0.05)
+        with patch.object(settings, "PROXY_HEALTHCHECK_CONCURRENCY", 2):
+            added, _, unchecked = await proxy_manager._register_healthy_proxies(
+                [server.url for server in servers], target=3
+            )
+
+    assert added == 3
+    assert unchecked > 0
+    assert stats.requests < 10
+    assert proxy_manager.get_available_proxy_count() == 3
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_candidates_are_recorded_as_network_failures(proxy_manager):
+    async with FakeProxyServer(status_code=503) as broken:
+        broken_url = broken.url
+        added, unhealthy, _ = await proxy_manager._register_healthy_proxies(
+            [broken_url], target=None
+        )
+
+    state = proxy_manager.get_proxy_state(broken_url)
+    assert (added, unhealthy) == (0, 1)
+    assert state is not None
+    assert state.last_failure_type == ProxyFailureType.NETWORK
+    assert proxy_manager.get_available_proxy_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_ensure_min_available_async_replenishes_from_local_source(proxy_manager):
+    stats = FakeProxyStats()
+    async with AsyncExitStack() as stack:
+        healthy = await start_proxies(stack, 4, stats)
+        broken = await start_proxies(stack, 2, FakeProxyStats(), status_code=502)
+        source = await stack.enter_async_context(
+            FakeProxyServer(
+                body=build_proxy_source_page(
+                    [server.url for server in broken + healthy]
+                )
+            )
+        )
+        with (
+            patch.object(
+                proxy_manager,
+                "sources",
+                [ProxySource("local", f"{source.url}/", parse_html_table)],
+            ),
+            patch.object(settings, "PROXY_HEALTHCHECK_CONCURRENCY", 1),
+        ):
+            assert await proxy_manager.ensure_min_available_proxies_async(2) is True
+
+    assert source.stats.requests == 1
+    assert proxy_manager.get_available_proxy_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_sources_are_fetched_concurrently_and_merged_with_dedupe(proxy_manager):
+    source_stats = FakeProxyStats()
+    async with AsyncExitStack() as stack:
+        healthy = await start_proxies(stack, 3, FakeProxyStats())
+        first = await stack.enter_async_context(
+            FakeProxyServer(
+                body=build_proxy_source_page([healthy[0].url, healthy[1].url]),
+                delay_seconds=0.1,
+                stats=source_stats,
+            )
+        )
+        second = await stack.enter_async_context(
+            FakeProxyServer(
+                body="\n".join(
+                    server.url.removeprefix("http://") for server in healthy[1:]
+                ).encode(),
+                delay_seconds=0.1,
+                stats=source_stats,
+            )
+        )
+        proxy_manager._get_source_state("text").yield_ewma = 0.9
+        with patch.object(
+            proxy_manager,
+            "sources",
+            [
+                ProxySource("table", f"{first.url}/", parse_html_table),
+                ProxySource("text", f"{second.url}/", parse_plain_text),
+            ],
+        ):
+            await proxy_manager.fetch_proxies_async()
+        healthy_urls = [server.url for server in healthy]
+
+    assert source_stats.max_active == 2
+    assert sorted(proxy_manager.proxies) == sorted(healthy_urls)
+    # 두 소스가 함께 제공한 프록시는 수율이 높은 소스를 제공처로 기록한다.
+    assert proxy_manager.get_proxy_state(healthy_urls[0]).source == "table"
+    assert proxy_manager.get_proxy_state(healthy_urls[1]).source == "text"
+    assert proxy_manager._get_source_state("table").healthy_count == 1
+    assert proxy_manager._get_source_state("text").healthy_count == 2
+
+
+@pytest.mark.asyncio
+async def test_source_on_cooldown_does_not_block_other_sources(proxy_manager):
+    async with AsyncExitStack() as stack:
+        healthy = await start_proxies(stack, 2, FakeProxyStats())
+        cooling = await stack.enter_async_context(FakeProxyServer(body=b""))
+        working = await stack.enter_async_context(
+            FakeProxyServer(body=build_proxy_source_page([server.url for server in healthy]))
+        )
+        proxy_manager._get_source_state("cooling").cooldown_until = (
+            proxy_manager._now() + timedelta(minutes=5)
+        )
+        with patch.object(
+            proxy_manager,
+            "sources",
+            [
+                ProxySource("cooling", f"{cooling.url}/", parse_html_table),
+                ProxySource("working", f"{working.url}/", parse_html_table),
+            ],
+        ):
+            assert await proxy_manager.ensure_min_available_proxies_async(2) is True
+
+    assert cooling.stats.requests == 0
+    assert proxy_manager.get_available_proxy_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_low_yield_source_is_deprioritized(proxy_manager):
+    async with AsyncExitStack() as stack:
+        healthy = await start_proxies(stack, 2, FakeProxyStats())
+        broken_stats = FakeProxyStats()
+        broken = await start_proxies(stack, 2, broken_stats, status_code=502)
+        poor = await stack.enter_async_context(
+            FakeProxyServer(body=build_proxy_source_page([server.url for server in broken]))
+        )
+        rich = await stack.enter_async_context(
+            FakeProxyServer(body=build_proxy_source_page([server.url for server in healthy]))
+        )
+        sources = [
+            ProxySource("poor", f"{poor.url}/", parse_html_table),
+            ProxySource("rich", f"{rich.url}/", parse_html_table),
+        ]
+        with patch.object(proxy_manager, "sources", sources):
+            await proxy_manager.fetch_proxies_async()
+            assert proxy_manager._get_source_state("poor").yield_ewma == 0.0
+            assert proxy_manager._get_source_state("rich").yield_ewma == 1.0
+            assert [source.name for source in proxy_manager._ready_sources()] == [
+                "rich",
+                "poor",
+            ]
+
+            # 다음 수집에서는 수율이 높은 소스의 후보를 먼저 검사해 목표를 채운다.
+            proxy_manager.reset_proxies(clear_history=False)
+            broken_requests = broken_stats.requests
+            with patch.object(settings, "PROXY_HEALTHCHECK_CONCURRENCY", 1):
+                await proxy_manager.fetch_proxies_async(target=2)
+
+    # 동시성 1에서도 목표 달성 직전 다음 후보 하나는 시작될 수 있다.
+    assert broken_stats.requests - broken_requests < len(broken)
+    assert proxy_manager.get_available_proxy_count() == 2
@@ -1,3 +1,5 @@
+import random
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
@@ -7,6 +9,12 @@ from app.src.core.config import settings
 from app.src.Infrastructure.crawling.proxy_manager import (
     ProxyFailureType,
     ProxyManager,
+    ProxyState,
+)
+from app.src.Infrastructure.crawling.proxy_sources import (
+    PROXY_SOURCE_REGISTRY,
+    parse_html_table,
+    parse_plain_text,
 )
 
 HTML_WITH_SINGLE_PROXY = b"""
@@ -46,9 +54,10 @@ class FakeResponse:
 @pytest.fixture
 def proxy_manager():
     manager = ProxyManager()
-    manager.reset_proxies(clear_history=True)
-    yield manager
-    manager.reset_proxies(clear_history=True)
+    with patch.object(manager, "sources", [PROXY_SOURCE_REGISTRY["sslproxies"]]):
+        manager.reset_proxies(clear_history=True)
+        yield manager
+        manager.reset_proxies(clear_history=True)
 
 
 def test_classify_failure_type():
@@ -127,7 +136,7 @@ def test_failed_proxy_not_reintroduced_across_batches(proxy_manager):
     assert proxy_manager.get_next_proxy() is None
 
 
-def test_extract_proxies_from_html_collects_full_table_without_limit(proxy_manager):
+def test_parse_html_table_collects_full_table_without_limit():
     html = build_proxy_table(
         [
             (f"8.8.8.{index}", 8000 + index, "anonymous" if index % 2 else "transparent", "yes")
@@ -135,13 +144,19 @@ def test_extract_proxies_from_html_collects_full_table_without_limit(proxy_manag
         ]
     )
 
-    proxies = proxy_manager._extract_proxies_from_html(html)
+    proxies = parse_html_table(html)
 
     assert len(proxies) == 40
     assert proxies[0] == "http://8.8.8.1:8001"
     assert proxies[-1] == "http://8.8.8.40:8040"
 
 
+def test_parse_plain_text_skips_invalid_and_duplicate_lines():
+    body = b"8.8.8.8:3128\nhttp://9.9.9.9:80\n8.8.8.8:3128\nnot-a-proxy\n1.1.1.1:99999\n"
+
+    assert parse_plain_text(body) == ["http://8.8.8.8:3128", "http://9.9.9.9:80"]
+
+
 def test_fetch_proxies_logs_candidate_pool_breakdown(proxy_manager):
     html = build_proxy_table(
         [
@@ -284,3 +299,254 @@ def test_rehabilitate_proxy_history_restores_only_targeted_failures(proxy_manage
     assert preserved_state is not None
     assert preserved_state.failure_count == 2
     assert preserved_state.is_hard_banned is True
+
+
+def test_proxy_score_prefers_fast_reliable_proxy(proxy_manager):
+    fast_proxy = "http://1.1.1.1:8080"
+    slow_proxy = "http://2.2.2.2:8080"
+    for proxy_url in (fast_proxy, slow_proxy):
+        proxy_manager.register_proxy(proxy_url)
+
+    with patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 10):
+        for _ in range(5):
+            proxy_manager.record_proxy_success(fast_proxy, latency_seconds=0.2)
+            proxy_manager.record_proxy_success(slow_proxy, latency_seconds=3.0)
+        proxy_manager.record_proxy_failure(
+            slow_proxy, ProxyFailureType.NETWORK, latency_seconds=5.0
+        )
+
+    fast_score = proxy_manager.get_proxy_score(proxy_manager.get_proxy_state(fast_proxy))
+    slow_score = proxy_manager.get_proxy_score(proxy_manager.get_proxy_state(slow_proxy))
+    assert fast_score > slow_score
+
+
+def test_proxy_score_decays_toward_prior_over_time(proxy_manager):
+    proxy_url = "http://1.1.1.1:8080"
+    with patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 10):
+        state = proxy_manager.record_proxy_failure(
+            proxy_url, ProxyFailureType.NETWORK, latency_seconds=5.0
+        )
+    unobserved = proxy_manager.get_proxy_score(
+        proxy_manager._ensure_proxy_state("http://9.9.9.9:8080")
+    )
+
+    recent_score = proxy_manager.get_proxy_score(state)
+    stale_score = proxy_manager.get_proxy_score(
+        state, now=datetime.now(UTC) + timedelta(days=1)
+    )
+
+    assert recent_score < stale_score
+    assert stale_score == pytest.approx(unobserved)
+
+
+def test_power_of_two_choices_picks_higher_scored_candidate(proxy_manager):
+    good_proxy = "http://1.1.1.1:8080"
+    bad_proxy = "http://2.2.2.2:8080"
+    for proxy_url in (good_proxy, bad_proxy):
+        proxy_manager.register_proxy(proxy_url)
+
+    with patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 10):
+        proxy_manager.record_proxy_success(good_proxy, latency_seconds=0.1)
+        proxy_manager.record_proxy_failure(
+            bad_proxy, ProxyFailureType.NETWORK, latency_seconds=5.0
+        )
+
+    with patch.object(settings, "PROXY_SELECTION_STRATEGY", "p2c"):
+        picks = {proxy_manager.get_next_proxy() for _ in range(10)}
+
+    assert picks == {good_proxy}
+
+
+def test_power_of_two_choices_skips_soft_banned_candidates(proxy_manager):
+    banned_proxy = "http://1.1.1.1:8080"
+    open_proxy = "http://2.2.2.2:8080"
+    for proxy_url in (banned_proxy, open_proxy):
+        proxy_manager.register_proxy(proxy_url)
+
+    with (
+        patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 1),
+        patch.object(settings, "PROXY_HARD_BAN_FAILURE_THRESHOLD", 10),
+    ):
+        proxy_manager.record_proxy_failure(banned_proxy, ProxyFailureType.BLOCKED)
+
+    with patch.object(settings, "PROXY_SELECTION_STRATEGY", "p2c"):
+        picks = {proxy_manager.get_next_proxy() for _ in range(10)}
+
+    assert picks == {open_proxy}
+
+
+class ReferenceProxyPool:
+    """인덱스 도입 전 ProxyManager의 선형 탐색 동작을 그대로 옮긴 비교용 모델"""
+
+    def __init__(self, now):
+        self.now = now
+        self.proxies: deque[str] = deque()
+        self.states: dict[str, ProxyState] = {}
+
+    def state(self, proxy_url: str) -> ProxyState:
+        return self.states.setdefault(proxy_url, ProxyState(proxy_url=proxy_url))
+
+    def register(self, proxy_url: str) -> None:
+        if not self.state(proxy_url).is_hard_banned and proxy_url not in self.proxies:
+            self.proxies.append(proxy_url)
+
+    def fail(self, proxy_url: str) -> None:
+        state = self.state(proxy_url)
+        state.failure_count += 1
+        if state.failure_count >= settings.PROXY_HARD_BAN_FAILURE_THRESHOLD:
+            state.is_hard_banned = True
+            state.soft_ban_until = None
+            self.proxies = deque(item for item in self.proxies if item != proxy_url)
+        elif state.failure_count >= settings.PROXY_SOFT_BAN_FAILURE_THRESHOLD:
+            state.soft_ban_until = self.now() + timedelta(
+                seconds=settings.PROXY_SOFT_BAN_TTL_SECONDS
+            )
+
+    def succeed(self, proxy_url: str) -> None:
+        state = self.state(proxy_url)
+        if state.is_hard_banned:
+            return
+        state.failure_count = max(0, state.failure_count - 1)
+        if state.failure_count < settings.PROXY_SOFT_BAN_FAILURE_THRESHOLD:
+            state.soft_ban_until = None
+
+    def next_proxy(self) -> str | None:
+        now = self.now()
+        for state in self.states.values():
+            if state.soft_ban_until and state.soft_ban_until <= now:
+                state.soft_ban_until = None
+        for _ in range(len(self.proxies)):
+            proxy_url = self.proxies.popleft()
+            state = self.state(proxy_url)
+            if state.is_hard_banned:
+                continue
+            self.proxies.append(proxy_url)
+            if state.soft_ban_until is None or state.soft_ban_until <= now:
+                return proxy_url
+        return None
+
+    def metrics(self) -> dict[str, int]:
+        now = self.now()
+
+        def soft_banned(state: ProxyState) -> bool:
+            return state.soft_ban_until is not None and state.soft_ban_until > now
+
+        return {
+            "active_proxy_count": sum(
+                1
+                for proxy_url in self.proxies
+                if not self.state(proxy_url).is_hard_banned
+                and not soft_banned(self.state(proxy_url))
+            ),
+            "soft_banned_count": sum(
+                1
+                for state in self.states.values()
+                if not state.is_hard_banned and soft_banned(state)
+            ),
+            "hard_banned_count": sum(1 for state in self.states.values() if state.is_hard_banned),
+        }
+
+
+def test_indexed_pool_matches_linear_reference_behavior(proxy_manager):
+    clock = {"now": datetime(2026, 1, 1, tzinfo=UTC)}
+    reference = ReferenceProxyPool(lambda: clock["now"])
+    rng = random.Random(13)
+    proxy_urls = [f"http://8.8.{index // 200}.{index % 200}:8080" for index in range(40)]
+    observed_bans: set[str] = set()
+
+    with (
+        patch.object(ProxyManager, "_now", staticmethod(lambda: clock["now"])),
+        patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 2),
+        patch.object(settings, "PROXY_HARD_BAN_FAILURE_THRESHOLD", 6),
+        patch.object(settings, "PROXY_SOFT_BAN_TTL_SECONDS", 30),
+        patch.object(settings, "PROXY_SUCCESS_DECAY", 1),
+        patch.object(settings, "PROXY_SELECTION_STRATEGY", "round_robin"),
+    ):
+        for _ in range(3000):
+            action = rng.random()
+            proxy_url = rng.choice(proxy_urls)
+            if action < 0.1:
+                proxy_manager.register_proxy(proxy_url)
+                reference.register(proxy_url)
+            elif action < 0.3:
+                proxy_manager.record_proxy_failure(proxy_url, ProxyFailureType.NETWORK)
+                reference.fail(proxy_url)
+            elif action < 0.4:
+                proxy_manager.record_proxy_success(proxy_url)
+                reference.succeed(proxy_url)
+            elif action < 0.48:
+                clock["now"] += timedelta(seconds=rng.randint(1, 20))
+            elif action < 0.49:
+                proxy_manager.reset_proxies(clear_history=False)
+                reference.proxies.clear()
+            else:
+                assert proxy_manager.get_next_proxy() == reference.next_proxy()
+
+            assert list(proxy_manager.proxies) == list(reference.proxies)
+            metrics = proxy_manager.get_metrics()
+            assert metrics == reference.metrics()
+            observed_bans |= {
+                key for key in ("soft_banned_count", "hard_banned_count") if metrics[key]
+            }
+
+    assert observed_bans == {"soft_banned_count", "hard_banned_count"}
+
+
+def test_snapshot_restore_honours_ban_ttls_and_ranks_pool(proxy_manager):
+    now = datetime.now(UTC)
+    fast_proxy = "http://1.1.1.1:8080"
+    slow_proxy = "http://2.2.2.2:8080"
+    soft_banned_proxy = "http://3.3.3.3:8080"
+    recent_hard_ban = "http://4.4.4.4:8080"
+    old_hard_ban = "http://5.5.5.5:8080"
+
+    for proxy_url in (slow_proxy, fast_proxy, soft_banned_proxy):
+        proxy_manager.register_proxy(proxy_url)
+    proxy_manager.record_proxy_success(slow_proxy, latency_seconds=3.0)
+    proxy_manager.record_proxy_success(fast_proxy, latency_seconds=0.1)
+    with (
+        patch.object(settings, "PROXY_SOFT_BAN_FAILURE_THRESHOLD", 1),
+        patch.object(settings, "PROXY_HARD_BAN_FAILURE_THRESHOLD", 2),
+    ):
+        proxy_manager.record_proxy_failure(soft_banned_proxy, ProxyFailureType.BLOCKED)
+        for _ in range(2):
+            proxy_manager.record_proxy_failure(recent_hard_ban, ProxyFailureType.BLOCKED)
+            proxy_manager.record_proxy_failure(
+                old_hard_ban, ProxyFailureType.BLOCKED, failed_at=now - timedelta(days=3)
+            )
+    proxy_manager._get_source_state("sslproxies").cooldown_until = now + timedelta(minutes=5)
+    proxy_manager._get_source_state("sslproxies").yield_ewma = 0.25
+
+    snapshot = proxy_manager.export_snapshot()
+    proxy_manager.reset_proxies(clear_history=True)
+    with patch.object(settings, "PROXY_SNAPSHOT_HARD_BAN_TTL_SECONDS", 86400):
+        summary = proxy_manager.restore_snapshot(snapshot)
+
+    assert list(proxy_manager.proxies) == [fast_proxy, slow_proxy, soft_banned_proxy]
+    assert proxy_manager.get_next_proxy() == fast_proxy
+    assert proxy_manager.get_proxy_state(soft_banned_proxy).soft_ban_until is not None
+    assert proxy_manager.get_proxy_state(recent_hard_ban).is_hard_banned is True
+    assert proxy_manager.get_proxy_state(old_hard_ban).is_hard_banned is False
+    assert proxy_manager._is_source_on_cooldown("sslproxies") is True
+    assert proxy_manager._get_source_state("sslproxies").yield_ewma == 0.25
+    assert summary["hard_banned"] == 1
+    assert summary["expired_hard_bans"] == 1
+    assert proxy_manager.get_metrics() == {
+        "active_proxy_count": 2,
+        "soft_banned_count": 1,
+        "hard_banned_count": 1,
+    }
+
+
+def test_snapshot_restore_skips_pool_when_snapshot_is_stale(proxy_manager):
+    proxy_url = "http://1.1.1.1:8080"
+    proxy_manager.register_proxy(proxy_url)
+    snapshot = proxy_manager.export_snapshot()
+    snapshot["saved_at"] = (datetime.now(UTC) - timedelta(days=1)).isoformat()
+    proxy_manager.reset_proxies(clear_history=True)
+
+    with patch.object(settings, "PROXY_SNAPSHOT_MAX_AGE_SECONDS", 3600):
+        proxy_manager.restore_snapshot(snapshot)
+
+    assert list(proxy_manager.proxies) == []
+    assert proxy_manager.get_proxy_state(proxy_url) is not None
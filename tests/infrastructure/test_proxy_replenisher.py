@@ -0,0 +1,82 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.Infrastructure.crawling.proxy_replenisher import ProxyReplenisher
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def replenisher_settings():
+    with (
+        patch.object(settings, "PROXY_REPLENISH_TARGET", 10),
+        patch.object(settings, "PROXY_REPLENISH_INTERVAL_SECONDS", 300.0),
+        patch.object(settings, "PROXY_PREWARM_TARGET", 20),
+        patch.object(settings, "PROXY_PREWARM_LEAD_SECONDS", 180.0),
+        patch.object(settings, "PROXY_PREWARM_INTERVAL_SECONDS", 20.0),
+    ):
+        yield
+
+
+def make_manager(available: int) -> MagicMock:
+    manager = MagicMock()
+    manager.get_available_proxy_count.return_value = available
+    manager.ensure_min_available_proxies_async = AsyncMock(return_value=True)
+    manager.get_metrics.return_value = {
+        "active_proxy_count": available,
+        "soft_banned_count": 0,
+        "hard_banned_count": 0,
+    }
+    manager.get_pool_size.return_value = available
+    return manager
+
+
+def test_resolve_phase_idle_without_scheduled_run():
+    replenisher = ProxyReplenisher(make_manager(0), next_run_time=lambda: None)
+
+    assert replenisher.resolve_phase(NOW) == ("idle", 10, 300.0)
+
+
+def test_resolve_phase_prewarm_inside_lead_window():
+    next_run = NOW + timedelta(seconds=120)
+    replenisher = ProxyReplenisher(make_manager(0), next_run_time=lambda: next_run)
+
+    assert replenisher.resolve_phase(NOW) == ("prewarm", 20, 20.0)
+
+
+def test_resolve_phase_idle_wakes_up_at_prewarm_window():
+    next_run = NOW + timedelta(seconds=240)
+    replenisher = ProxyReplenisher(make_manager(0), next_run_time=lambda: next_run)
+
+    assert replenisher.resolve_phase(NOW) == ("idle", 10, 60.0)
+
+
+@pytest.mark.asyncio
+async def test_replenish_once_uses_phase_target_only_when_below():
+    next_run = NOW + timedelta(seconds=60)
+    low = make_manager(available=5)
+    full = make_manager(available=25)
+
+    await ProxyReplenisher(low, next_run_time=lambda: next_run).replenish_once(NOW)
+    await ProxyReplenisher(full, next_run_time=lambda: next_run).replenish_once(NOW)
+
+    low.ensure_min_available_proxies_async.assert_awaited_once_with(20)
+    full.ensure_min_available_proxies_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_stops_when_event_is_set():
+    manager = make_manager(available=0)
+    stop_event = asyncio.Event()
+    replenisher = ProxyReplenisher(manager, next_run_time=lambda: None)
+
+    task = asyncio.create_task(replenisher.run(stop_event))
+    await asyncio.sleep(0)
+    stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+
+    manager.ensure_min_available_proxies_async.assert_awaited_once_with(10)
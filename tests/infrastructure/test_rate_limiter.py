@@ -0,0 +1,123 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
+from app.src.Infrastructure.crawling.rate_limiter import SITE_RATE_LIMITERS, TokenBucket
+
+
+class RateCrawler(BaseCrawler):
+    @property
+    def url(self) -> str:
+        return "https://rate-site.com"
+
+    @property
+    def site_name(self) -> SiteName:
+        return SiteName.ALGUMON
+
+    def parse(self, html: str) -> list[CrawledKeyword]:
+        return []
+
+
+@pytest.fixture
+def clock():
+    """asyncio.sleep이 호출되면 그만큼 시간이 흐르는 가상 시계."""
+    current = {"now": 100.0}
+
+    async def fake_sleep(seconds: float) -> None:
+        current["now"] += seconds
+
+    with (
+        patch.object(TokenBucket, "_now", staticmethod(lambda: current["now"])),
+        patch(
+            "app.src.Infrastructure.crawling.crawl_slot.asyncio.sleep",
+            side_effect=fake_sleep,
+        ),
+    ):
+        yield current
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_paces_at_rate(clock):
+    bucket = TokenBucket("site", rate_per_second=2.0, burst=2)
+    send_times = []
+    for _ in range(5):
+        await bucket.acquire()
+        send_times.append(clock["now"])
+
+    assert send_times == [100.0, 100.0, 100.5, 101.0, 101.5]
+
+
+@pytest.mark.asyncio
+async def test_pause_stops_whole_bucket_and_resumes_without_burst(clock):
+    bucket = TokenBucket("site", rate_per_second=1.0, burst=3)
+    await bucket.acquire()
+    bucket.pause(10)
+
+    send_times = []
+    for _ in range(3):
+        await bucket.acquire()
+        send_times.append(clock["now"])
+
+    assert send_times == [110.0, 111.0, 112.0]
+    assert bucket.pauses == 1
+
+
+@pytest.mark.asyncio
+async def test_pause_during_reserved_wait_reschedules(clock):
+    bucket = TokenBucket("site", rate_per_second=1.0, burst=1)
+    await bucket.acquire()
+
+    async def pausing_sleep(seconds: float) -> None:
+        clock["now"] += seconds
+        if not bucket.pauses:
+            bucket.pause(5)
+
+    with patch(
+        "app.src.Infrastructure.crawling.crawl_slot.asyncio.sleep",
+        side_effect=pausing_sleep,
+    ):
+        await bucket.acquire()
+
+    assert clock["now"] >= 106.0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_from_any_crawler_pauses_site_for_all():
+    blocked = MagicMock()
+    blocked.status_code = 429
+    blocked.text = "Too Many Requests"
+    blocked.headers = {"Retry-After": "30"}
+    client = MagicMock()
+    client.get = AsyncMock(return_value=blocked)
+    crawler = RateCrawler(keyword="blocked", client=client)
+
+    with (
+        patch.object(
+            RateCrawler, "_fetch_with_proxy", new=AsyncMock(return_value="<html>ok</html>")
+        ),
+        patch(
+            "app.src.Infrastructure.crawling.base_crawler.asyncio.sleep", new=AsyncMock()
+        ),
+        patch.object(settings, "CRAWL_BLOCK_BACKOFF_MAX_SECONDS", 60.0),
+    ):
+        await crawler.fetch()
+
+    bucket = SITE_RATE_LIMITERS.get(SiteName.ALGUMON)
+    assert bucket.pauses == 1
+    assert bucket.paused_until == pytest.approx(bucket._now() + 30, abs=1)
+    assert SITE_RATE_LIMITERS.get(SiteName.FMKOREA).pauses == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_rate_limit_skips_bucket():
+    with patch.object(settings, "CRAWL_SITE_RATE_LIMIT_ENABLED", False):
+        await asyncio.wait_for(SITE_RATE_LIMITERS.acquire(SiteName.ALGUMON), timeout=1)
+        SITE_RATE_LIMITERS.pause(SiteName.ALGUMON, 30)
+
+    assert SITE_RATE_LIMITERS.get(SiteName.ALGUMON).acquired == 0
+    assert SITE_RATE_LIMITERS.get(SiteName.ALGUMON).pauses == 0
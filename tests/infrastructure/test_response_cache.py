@@ -0,0 +1,143 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+from app.src.Infrastructure.crawling.parser_engine import ParserEngine
+from app.src.Infrastructure.crawling.response_cache import (
+    RESPONSE_CACHE,
+    CachedResponse,
+    ConditionalResponseCache,
+)
+
+FIXTURE_HTML = (
+    Path(__file__).parent / "fixtures" / "algumon_search_page.html"
+).read_text(encoding="utf-8")
+
+
+def _client(responses: list[httpx.Response], requests: list[httpx.Request]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def _fetchparse_twice(responses: list[httpx.Response]):
+    requests: list[httpx.Request] = []
+    original_parse = AlgumonCrawler.parse
+    parse_calls = 0
+
+    def counting_parse(self, html):
+        nonlocal parse_calls
+        parse_calls += 1
+        return original_parse(self, html)
+
+    async with _client(responses, requests) as client:
+        with patch.object(AlgumonCrawler, "parse", counting_parse):
+            first = await AlgumonCrawler(
+                keyword="키보드", client=client, parser_engine=ParserEngine.BS4
+            ).fetchparse()
+            second = await AlgumonCrawler(
+                keyword="키보드", client=client, parser_engine=ParserEngine.BS4
+            ).fetchparse()
+    return first, second, requests, parse_calls
+
+
+async def test_not_modified_response_reuses_cached_results():
+    first, second, requests, parse_calls = await _fetchparse_twice(
+        [
+            httpx.Response(200, text=FIXTURE_HTML, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert second == first
+    assert parse_calls == 1
+    assert RESPONSE_CACHE.not_modified_hits == 1
+    assert RESPONSE_CACHE.misses == 1
+
+
+async def test_unchanged_deal_region_skips_parse():
+    changed_chrome = FIXTURE_HTML.replace("<title>", "<title>새 배너 ")
+    first, second, requests, parse_calls = await _fetchparse_twice(
+        [
+            httpx.Response(200, text=FIXTURE_HTML),
+            httpx.Response(200, text=changed_chrome),
+        ]
+    )
+
+    assert "If-None-Match" not in requests[1].headers
+    assert second == first
+    assert parse_calls == 1
+    assert RESPONSE_CACHE.region_hits == 1
+
+
+async def test_changed_deal_region_is_parsed_again():
+    changed_deals = FIXTURE_HTML.replace("로지텍 MX", "로지텍 MX 신상", 1)
+    first, second, _, parse_calls = await _fetchparse_twice(
+        [
+            httpx.Response(200, text=FIXTURE_HTML),
+            httpx.Response(200, text=changed_deals),
+        ]
+    )
+
+    assert parse_calls == 2
+    assert second != first
+    assert RESPONSE_CACHE.misses == 2
+
+
+async def test_response_cache_can_be_disabled():
+    with patch(
+        "app.src.Infrastructure.crawling.base_crawler.settings.CRAWL_RESPONSE_CACHE_ENABLED",
+        False,
+    ):
+        _, _, _, parse_calls = await _fetchparse_twice(
+            [
+                httpx.Response(200, text=FIXTURE_HTML, headers={"ETag": '"v1"'}),
+                httpx.Response(200, text=FIXTURE_HTML, headers={"ETag": '"v1"'}),
+            ]
+        )
+
+    assert parse_calls == 2
+    assert len(RESPONSE_CACHE) == 0
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ConditionalResponseCache(max_entries=2)
+    entry = CachedResponse(etag=None, last_modified=None, region_hash="h", results=())
+
+    cache.put((SiteName.ALGUMON, "a"), entry)
+    cache.put((SiteName.ALGUMON, "b"), entry)
+    cache.get((SiteName.ALGUMON, "a"))
+    cache.put((SiteName.ALGUMON, "c"), entry)
+
+    assert cache.get((SiteName.ALGUMON, "a")) is entry
+    assert cache.get((SiteName.ALGUMON, "b")) is None
+    assert len(cache) == 2
+
+
+async def test_not_modified_uses_snapshot_when_entry_evicted_in_flight():
+    responses = [
+        httpx.Response(200, text=FIXTURE_HTML, headers={"ETag": '"v1"'}),
+        httpx.Response(304),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "If-None-Match" in request.headers:
+            # 검증값을 보낸 뒤 304를 받기 전에 다른 요청이 항목을 밀어낸 상황
+            RESPONSE_CACHE.clear()
+        return responses.pop(0)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await AlgumonCrawler(
+            keyword="키보드", client=client, parser_engine=ParserEngine.BS4
+        ).fetchparse()
+        crawler = AlgumonCrawler(keyword="키보드", client=client, parser_engine=ParserEngine.BS4)
+        second = await crawler.fetchparse()
+
+    assert second == first
+    assert crawler.fetch_succeeded is True
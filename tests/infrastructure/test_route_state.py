@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.src.core.config import settings
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
+from app.src.Infrastructure.crawling.route_state import SITE_ROUTES, SiteRouteRegistry
+
+
+class RouteCrawler(BaseCrawler):
+    @property
+    def url(self) -> str:
+        return "https://route-site.com"
+
+    @property
+    def site_name(self) -> SiteName:
+        return SiteName.ALGUMON
+
+    def parse(self, html: str) -> list[CrawledKeyword]:
+        return []
+
+
+@pytest.fixture
+def clock():
+    current = {"now": 1000.0}
+    with patch.object(SiteRouteRegistry, "_now", staticmethod(lambda: current["now"])):
+        yield current
+
+
+@pytest.fixture(autouse=True)
+def route_settings():
+    with (
+        patch.object(settings, "CRAWL_ROUTE_PROXY_COOLDOWN_SECONDS", 100.0),
+        patch.object(settings, "CRAWL_ROUTE_PROXY_COOLDOWN_MAX_SECONDS", 1000.0),
+        patch.object(settings, "CRAWL_ROUTE_PROBE_INTERVAL_SECONDS", 30.0),
+    ):
+        yield
+
+
+def blocked_response(retry_after: str | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 429
+    response.text = "Too Many Requests"
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    return response
+
+
+def test_block_routes_site_to_proxy_until_cooldown_expires(clock):
+    registry = SiteRouteRegistry()
+    registry.should_bypass_direct(SiteName.ALGUMON)
+
+    assert registry.record_block(SiteName.ALGUMON) is True
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is True
+    assert registry.should_bypass_direct(SiteName.FMKOREA) is False
+
+    clock["now"] += 101
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is False
+
+
+def test_concurrent_blocks_are_deduplicated_and_retry_after_extends_cooldown(clock):
+    registry = SiteRouteRegistry()
+
+    assert registry.record_block(SiteName.ALGUMON) is True
+    assert registry.record_block(SiteName.ALGUMON, retry_after_seconds=400) is False
+
+    state = registry.get_state(SiteName.ALGUMON)
+    assert state.consecutive_blocks == 1
+    assert state.proxy_until == clock["now"] + 400
+
+
+def test_probe_goes_direct_and_blocked_probe_doubles_cooldown(clock):
+    registry = SiteRouteRegistry()
+    registry.record_block(SiteName.ALGUMON)
+
+    clock["now"] += 10
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is True
+    clock["now"] += 20
+    # 탐침 간격이 지나면 한 요청만 직접 경로로 보낸다.
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is False
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is True
+
+    assert registry.record_block(SiteName.ALGUMON) is False
+    state = registry.get_state(SiteName.ALGUMON)
+    assert state.consecutive_blocks == 2
+    assert state.proxy_until == clock["now"] + 200
+
+
+def test_successful_probe_restores_direct_route(clock):
+    registry = SiteRouteRegistry()
+    registry.record_block(SiteName.ALGUMON)
+    clock["now"] += 30
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is False
+
+    registry.record_direct_success(SiteName.ALGUMON)
+
+    assert registry.should_bypass_direct(SiteName.ALGUMON) is False
+    assert registry.get_state(SiteName.ALGUMON).consecutive_blocks == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_crawlers_share_one_block_backoff():
+    crawlers_in_flight = 8
+    arrived = asyncio.Event()
+    calls = {"count": 0}
+
+    async def get(url: str, timeout: int = 10):
+        # 모든 키워드가 같은 차단 응답을 동시에 받도록 맞춘다.
+        calls["count"] += 1
+        if calls["count"] >= crawlers_in_flight:
+            arrived.set()
+        await arrived.wait()
+        return blocked_response("7")
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=get)
+    crawlers = [
+        RouteCrawler(keyword=f"keyword-{index}", client=client)
+        for index in range(crawlers_in_flight)
+    ]
+
+    with (
+        # 토큰 버킷 대기가 백오프 대기 횟수에 섞이지 않도록 끈다.
+        patch.object(settings, "CRAWL_SITE_RATE_LIMIT_ENABLED", False),
+        patch.object(
+            RouteCrawler,
+            "_fetch_with_proxy",
+            new=AsyncMock(return_value="<html>proxy</html>"),
+        ) as mock_proxy_fetch,
+        patch(
+            "app.src.Infrastructure.crawling.base_crawler.asyncio.sleep",
+            new=AsyncMock(),
+        ) as mock_sleep,
+    ):
+        results = await asyncio.gather(*(crawler.fetch() for crawler in crawlers))
+        assert client.get.await_count == 8
+
+        # 쿨다운 동안 새 크롤링은 직접 요청 없이 프록시로 바로 간다.
+        late = RouteCrawler(keyword="late", client=client)
+        assert await late.fetch() == "<html>proxy</html>"
+
+    assert results == ["<html>proxy</html>"] * 8
+    mock_sleep.assert_awaited_once_with(7.0)
+    assert client.get.await_count == 8
+    assert mock_proxy_fetch.await_count == 9
+    assert SITE_ROUTES.get_state(SiteName.ALGUMON).bypassed == 1
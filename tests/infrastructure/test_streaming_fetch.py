@@ -0,0 +1,94 @@
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+from app.src.Infrastructure.crawling.parser_engine import ParserEngine
+
+FIXTURE_HTML = (
+    Path(__file__).parent / "fixtures" / "algumon_search_page.html"
+).read_text(encoding="utf-8")
+CHUNK_SIZE = 2048
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes):
+        self.chunks = [body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+        self.sent_chunks = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent_chunks += 1
+            yield chunk
+
+
+def _client(status_code: int = 200) -> tuple[httpx.AsyncClient, ChunkedStream]:
+    stream = ChunkedStream(FIXTURE_HTML.encode("utf-8"))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, stream=stream)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), stream
+
+
+def _full_parse() -> list:
+    return AlgumonCrawler(
+        keyword="키보드", client=None, parser_engine=ParserEngine.BS4
+    ).parse(FIXTURE_HTML)
+
+
+async def test_fetchparse_until_stops_after_known_anchor():
+    expected = _full_parse()
+    client, stream = _client()
+
+    async with client:
+        crawler = AlgumonCrawler(keyword="키보드", client=client, parser_engine=ParserEngine.BS4)
+        results = await crawler.fetchparse_until({expected[1].id}, min_results=3)
+
+    assert [item.model_dump() for item in results] == [
+        item.model_dump() for item in expected[:3]
+    ]
+    assert stream.sent_chunks < len(stream.chunks)
+
+
+async def test_fetchparse_until_reads_whole_page_when_anchor_missing():
+    expected = _full_parse()
+    client, stream = _client()
+
+    async with client:
+        crawler = AlgumonCrawler(keyword="키보드", client=client, parser_engine=ParserEngine.BS4)
+        results = await crawler.fetchparse_until({"1"}, min_results=3)
+
+    assert [item.model_dump() for item in results] == [
+        item.model_dump() for item in expected
+    ]
+    assert stream.sent_chunks == len(stream.chunks)
+
+
+async def test_fetchparse_until_falls_back_to_proxy_when_blocked():
+    client, _ = _client(status_code=429)
+
+    async with client:
+        crawler = AlgumonCrawler(keyword="키보드", client=client, parser_engine=ParserEngine.BS4)
+        with patch.object(
+            crawler,
+            "_retry_blocked_with_proxy",
+            AsyncMock(return_value=FIXTURE_HTML),
+        ) as mock_retry:
+            results = await crawler.fetchparse_until({"1"}, min_results=3)
+
+    mock_retry.assert_awaited_once()
+    assert len(results) == len(_full_parse())
+
+
+async def test_fetchparse_until_without_known_ids_uses_full_fetch():
+    crawler = AlgumonCrawler(keyword="키보드", client=None, parser_engine=ParserEngine.BS4)
+
+    with patch.object(
+        AlgumonCrawler, "fetch", AsyncMock(return_value=FIXTURE_HTML)
+    ) as mock_fetch:
+        results = await crawler.fetchparse_until(set())
+
+    mock_fetch.assert_awaited_once()
+    assert len(results) == len(_full_parse())
@@ -207,3 +207,47 @@ class TestMultiAnchor:
             added_obj = session.add.call_args[0][0]
             assert isinstance(added_obj, KeywordSite)
             assert added_obj.external_id == "102,101,100"
+
+
+class TestAnchorStorePath:
+    @pytest.mark.asyncio
+    async def test_anchor_store_diff_does_not_touch_session(self):
+        """anchor_store 경로는 DB 세션 없이 메모리 앵커와 비교하고 변경분만 스테이징해야 한다."""
+        keyword = MagicMock(spec=Keyword)
+        keyword.id = 1
+        keyword.title = "test"
+        anchor_store = MagicMock()
+        anchor_store.get_external_id.return_value = "100,99,98"
+        anchor_store.stage = AsyncMock()
+
+        crawler = AsyncMock()
+        crawler.fetchparse.return_value = mock_crawled_list(["102", "101", "99"])
+
+        with patch("app.worker_main.get_crawler", return_value=crawler):
+            new_deals = await get_new_hotdeal_keywords_for_site(
+                None, keyword, AsyncMock(), SiteName.ALGUMON, anchor_store=anchor_store
+            )
+
+        assert [deal.id for deal in new_deals] == ["102", "101"]
+        anchor_store.stage.assert_awaited_once()
+        assert anchor_store.stage.call_args.kwargs["external_id"] == "102,101,99"
+
+    @pytest.mark.asyncio
+    async def test_anchor_store_skips_stage_without_new_deals(self):
+        keyword = MagicMock(spec=Keyword)
+        keyword.id = 1
+        keyword.title = "test"
+        anchor_store = MagicMock()
+        anchor_store.get_external_id.return_value = "100"
+        anchor_store.stage = AsyncMock()
+
+        crawler = AsyncMock()
+        crawler.fetchparse.return_value = mock_crawled_list(["100", "99"])
+
+        with patch("app.worker_main.get_crawler", return_value=crawler):
+            new_deals = await get_new_hotdeal_keywords_for_site(
+                None, keyword, AsyncMock(), SiteName.ALGUMON, anchor_store=anchor_store
+            )
+
+        assert new_deals == []
+        anchor_store.stage.assert_not_awaited()
@@ -11,8 +11,13 @@ import app.worker_main as worker_main_module
 from app.src.domain.hotdeal.enums import SiteName
 from app.src.domain.hotdeal.models import Keyword, KeywordSite
 from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.Infrastructure.crawling.adaptive_limiter import AdaptiveLimiter
+from app.src.Infrastructure.crawling.circuit_breaker import SITE_CIRCUITS
+from app.src.Infrastructure.crawling.deadline import DEADLINE_STATS, deadline_scope
 from app.worker_main import (
     _apply_proxy_pool_protection,
+    _build_concurrency_limiters,
+    _prioritize_skipped_keywords,
     _reconcile_algumon_proxy_history,
     _resolve_crawl_concurrency,
     _resolve_timeout_seconds,
@@ -103,6 +108,17 @@ async def keyword_and_site_in_db(
     return keyword_in_db, keyword_site
 
 
+@pytest.fixture
+def stored_mails():
+    """메일 발송 대기열 저장을 대신합니다. (Mock 사용자는 DB에 저장할 수 없으므로)"""
+
+    async def store(emails, run_ledger=None, mailed_keyword_ids=None):
+        return [None] * len(emails)
+
+    with patch("app.worker_main._store_pending_mails", side_effect=store) as mock_store:
+        yield mock_store
+
+
 # --- 테스트 케이스 ---
 
 
@@ -132,6 +148,50 @@ def test_resolve_crawl_concurrency_clamps_and_aligns_keyword_limit():
     assert keyword_limit == 4
 
 
+def test_build_concurrency_limiters_uses_aimd_within_max_bounds():
+    sites = [SiteName.ALGUMON, SiteName.FMKOREA]
+    with (
+        patch.object(worker_main_module.settings, "CRAWL_ADAPTIVE_CONCURRENCY_ENABLED", True),
+        patch.object(worker_main_module.settings, "CRAWL_SITE_CONCURRENCY_MAX", 4),
+        patch.object(worker_main_module.settings, "CRAWL_KEYWORD_CONCURRENCY_MAX", 8),
+    ):
+        site_limiters, keyword_limiter = _build_concurrency_limiters(sites, 2, 4)
+
+    assert isinstance(keyword_limiter, AdaptiveLimiter)
+    assert (keyword_limiter.limit, keyword_limiter.max_limit) == (4, 8)
+    for site in sites:
+        limiter = site_limiters[site]
+        assert isinstance(limiter, AdaptiveLimiter)
+        assert (limiter.limit, limiter.max_limit) == (2, 4)
+        assert limiter.parent is keyword_limiter
+
+
+def test_build_concurrency_limiters_caps_aimd_at_protection_limits():
+    with (
+        patch.object(worker_main_module.settings, "CRAWL_ADAPTIVE_CONCURRENCY_ENABLED", True),
+        patch.object(worker_main_module.settings, "CRAWL_SITE_CONCURRENCY_MAX", 4),
+        patch.object(worker_main_module.settings, "CRAWL_KEYWORD_CONCURRENCY_MAX", 8),
+    ):
+        site_limiters, keyword_limiter = _build_concurrency_limiters(
+            [SiteName.ALGUMON], 1, 2, protected=True
+        )
+
+    site_limiter = site_limiters[SiteName.ALGUMON]
+    for _ in range(10):
+        site_limiter.record_success(0.1)
+
+    assert (site_limiter.limit, site_limiter.max_limit) == (1, 1)
+    assert (keyword_limiter.limit, keyword_limiter.max_limit) == (2, 2)
+
+
+def test_build_concurrency_limiters_defaults_to_static_semaphores():
+    with patch.object(worker_main_module.settings, "CRAWL_ADAPTIVE_CONCURRENCY_ENABLED", False):
+        site_limiters, keyword_limiter = _build_concurrency_limiters([SiteName.ALGUMON], 2, 4)
+
+    assert isinstance(site_limiters[SiteName.ALGUMON], asyncio.Semaphore)
+    assert isinstance(keyword_limiter, asyncio.Semaphore)
+
+
 def test_apply_proxy_pool_protection_reduces_limits_and_prioritizes_keywords():
     keywords = [
         Mock(title="beta", users=[1]),
@@ -156,6 +216,33 @@ def test_apply_proxy_pool_protection_reduces_limits_and_prioritizes_keywords():
     assert [keyword.title for keyword in selected] == ["alpha", "gamma"]
 
 
+def test_apply_proxy_pool_protection_keeps_circuit_skipped_keywords_first():
+    keywords = [
+        Mock(id=1, title="alpha", users=[1, 2, 3]),
+        Mock(id=2, title="beta", users=[1]),
+        Mock(id=3, title="gamma", users=[1, 2]),
+    ]
+
+    with patch.object(worker_main_module.settings, "CRAWL_PROTECTION_KEYWORD_RATIO", 0.5):
+        selected, _, _ = _apply_proxy_pool_protection(
+            keywords,
+            site_limit=4,
+            keyword_limit=6,
+            priority_keyword_ids={2},
+        )
+
+    assert [keyword.title for keyword in selected] == ["beta"]
+
+
+def test_prioritize_skipped_keywords_moves_them_first_in_stable_order():
+    keywords = [Mock(id=i) for i in range(1, 6)]
+
+    ordered = _prioritize_skipped_keywords(keywords, {4, 2})
+
+    assert [keyword.id for keyword in ordered] == [2, 4, 1, 3, 5]
+    assert _prioritize_skipped_keywords(keywords, set()) is keywords
+
+
 def test_reconcile_algumon_proxy_history_runs_once_for_algumon():
     with (
         patch("app.worker_main.ALGUMON_PROXY_HISTORY_RECONCILED", False),
@@ -319,7 +406,11 @@ async def test_job_e2e(mock_db_session, keyword_in_db):
         patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
         patch("app.worker_main.settings.ENVIRONMENT", "prod"),
         patch("app.worker_main.SharedBrowser") as mock_shared,
-        patch.object(worker_main_module.PROXY_MANAGER, "ensure_min_available_proxies", return_value=True),
+        patch.object(
+            worker_main_module.PROXY_MANAGER,
+            "ensure_min_available_proxies_async",
+            new=AsyncMock(return_value=True),
+        ),
     ):
         mock_shared.get_instance.return_value.start = AsyncMock()
         mock_shared.get_instance.return_value.stop = AsyncMock()
@@ -556,6 +647,85 @@ async def test_handle_keyword_multisite_timeout_keeps_partial_success(
     mock_logger.warning.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_handle_keyword_skips_site_with_open_circuit(
+    mock_db_session: AsyncSession, keyword_in_db: Keyword
+):
+    """
+    시나리오: 연속 실패로 사이트 서킷이 열림
+    - 기대: 요청 없이 즉시 건너뛰고, 건너뛴 키워드를 다음 실행 우선 대상으로 기록
+    """
+    site_semaphores = {SiteName.ALGUMON: asyncio.Semaphore(1)}
+
+    with (
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch.object(worker_main_module.settings, "CRAWL_CIRCUIT_CONSECUTIVE_FAILURES", 2),
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site", new_callable=AsyncMock
+        ) as mock_get_for_site,
+    ):
+        mock_get_for_site.side_effect = Exception("blocked")
+
+        async with httpx.AsyncClient() as client:
+            for _ in range(2):
+                assert await handle_keyword(keyword_in_db, client, site_semaphores) is None
+            assert mock_get_for_site.await_count == 2
+
+            result = await handle_keyword(keyword_in_db, client, site_semaphores)
+
+    assert result is None
+    assert mock_get_for_site.await_count == 2
+    assert SITE_CIRCUITS.take_pending_keyword_ids() == {keyword_in_db.id}
+
+
+@pytest.mark.asyncio
+async def test_handle_keyword_sheds_sites_when_deadline_is_near(
+    mock_db_session: AsyncSession, keyword_in_db: Keyword
+):
+    """
+    시나리오: 실행 마감까지 최소 요청 시간보다 적게 남음
+    - 기대: 사이트 크롤링을 시작하지 않고 건너뜀
+    """
+    site_semaphores = {SiteName.ALGUMON: asyncio.Semaphore(1)}
+    DEADLINE_STATS.reset()
+
+    with (
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch.object(worker_main_module.settings, "CRAWL_DEADLINE_MIN_REQUEST_SECONDS", 10.0),
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site", new_callable=AsyncMock
+        ) as mock_get_for_site,
+    ):
+        async with httpx.AsyncClient() as client:
+            with deadline_scope(5.0):
+                result = await handle_keyword(keyword_in_db, client, site_semaphores)
+
+    assert result is None
+    mock_get_for_site.assert_not_awaited()
+    assert DEADLINE_STATS.shed_sites == 1
+
+
+@pytest.mark.asyncio
+async def test_handle_keyword_deadline_timeout_is_not_a_circuit_failure(keyword_in_db):
+    async def slow_crawl(*_args, **_kwargs):
+        await asyncio.sleep(1)
+        return []
+
+    DEADLINE_STATS.reset()
+    with (
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch.object(worker_main_module.settings, "CRAWL_DEADLINE_MIN_REQUEST_SECONDS", 0.0),
+        patch("app.worker_main.get_new_hotdeal_keywords_for_site", side_effect=slow_crawl),deadline_scope(0.05)
+    ):
+        result = await handle_keyword(
+            keyword_in_db, Mock(), {SiteName.ALGUMON: asyncio.Semaphore(1)}
+        )
+
+    assert result is None
+    assert DEADLINE_STATS.shed_sites == 1
+    assert SITE_CIRCUITS._circuits == {}
+
+
 @pytest.mark.asyncio
 async def test_graceful_shutdown_signal():
     """SIGTERM/SIGINT 시 graceful shutdown 경로가 실행되어야 한다."""
@@ -1068,3 +1238,738 @@ def test_defunct_count_probe_fallback():
 
     with patch("app.worker_main.Path.iterdir", side_effect=OSError("proc unavailable")):
         assert worker_main_module._probe_defunct_count() == -1
+
+
+@pytest.mark.asyncio
+async def test_get_new_hotdeal_keywords_for_site_opens_session_after_fetch(
+    mock_db_session: AsyncSession, keyword_in_db: Keyword
+):
+    """세션이 주어지지 않으면 네트워크 단계가 끝난 뒤에만 DB 세션을 열어야 한다."""
+    order: list[str] = []
+
+    async def fake_fetchparse():
+        order.append("fetch")
+        return CRAWLED_DATA_NEW
+
+    def session_factory():
+        order.append("session")
+        return mock_db_session
+
+    mock_crawler = AsyncMock()
+    mock_crawler.fetchparse.side_effect = fake_fetchparse
+
+    with (
+        patch("app.worker_main.get_crawler", return_value=mock_crawler),
+        patch("app.worker_main.AsyncSessionLocal", side_effect=session_factory),
+        patch.object(worker_main_module, "DB_CHECKOUT_STATS", worker_main_module.DbCheckoutStats()),
+    ):
+        async with httpx.AsyncClient() as client:
+            new_deals = await get_new_hotdeal_keywords_for_site(
+                None, keyword_in_db, client, SiteName.ALGUMON
+            )
+        checkout_count = worker_main_module.DB_CHECKOUT_STATS.count
+
+    assert order == ["fetch", "session"]
+    assert [deal.id for deal in new_deals] == ["101"]
+    assert checkout_count == 1
+
+
+def test_db_checkout_stats_tracks_wait_times():
+    stats = worker_main_module.DbCheckoutStats()
+
+    stats.record(0.1)
+    stats.record(0.3)
+
+    assert stats.count == 2
+    assert stats.max_wait_seconds == 0.3
+    assert stats.avg_wait_seconds == pytest.approx(0.2)
+
+    stats.reset()
+    assert stats.count == 0
+    assert stats.avg_wait_seconds == 0.0
+
+
+@pytest.mark.asyncio
+async def test_streaming_mail_dispatcher_sends_when_countdown_reaches_zero(stored_mails):
+    keyword_a = Mock(id=1, title="alpha")
+    keyword_b = Mock(id=2, title="beta")
+    user_a = Mock(id="user-a", email="a@example.com", keywords=[keyword_a])
+    user_b = Mock(id="user-b", email="b@example.com", keywords=[keyword_a, keyword_b])
+    before_send = AsyncMock()
+
+    dispatcher = worker_main_module.StreamingMailDispatcher(
+        [user_a, user_b], [keyword_a, keyword_b], before_send=before_send
+    )
+
+    with (
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch(
+            "app.worker_main.make_hotdeal_email_content",
+            new_callable=AsyncMock,
+            return_value="<p>deal</p>",
+        ),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        await dispatcher.complete_keyword(keyword_a, CRAWLED_DATA_NEW[:1])
+        await asyncio.sleep(0)
+
+        # user_a는 구독 키워드가 모두 끝나 바로 발송되고, user_b는 beta를 기다린다.
+        assert [c.kwargs["to"] for c in mock_send_email.call_args_list] == [
+            "a@example.com"
+        ]
+        assert dispatcher.pending_user_count == 1
+
+        await dispatcher.complete_keyword(keyword_b, [])
+        sent = await dispatcher.wait_sent()
+
+    assert sent == 2
+    assert dispatcher.pending_user_count == 0
+    assert before_send.await_count == 2
+    assert mock_send_email.call_args_list[1].kwargs["subject"] == "[alpha] 새로운 핫딜 알림"
+
+
+@pytest.mark.asyncio
+async def test_job_streaming_mail_mode(mock_db_session, keyword_in_db):
+    from app.src.domain.user.models import User
+
+    user = User(
+        email="stream@example.com",
+        nickname="streamuser",
+        hashed_password="hashed_password",
+    )
+    user.keywords.append(keyword_in_db)
+    mock_db_session.add(user)
+    await mock_db_session.commit()
+
+    with (
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site", new_callable=AsyncMock
+        ) as mock_get_new,
+        patch(
+            "app.worker_main.send_email", new_callable=AsyncMock
+        ) as mock_send_email,
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.settings.WORKER_STREAMING_MAIL_ENABLED", True),
+        patch("app.worker_main.SharedBrowser") as mock_shared,
+        patch.object(
+            worker_main_module.PROXY_MANAGER,
+            "ensure_min_available_proxies_async",
+            new=AsyncMock(return_value=True),
+        ),
+    ):
+        mock_shared.get_instance.return_value.start = AsyncMock()
+        mock_shared.get_instance.return_value.stop = AsyncMock()
+        mock_get_new.return_value = CRAWLED_DATA_NEW
+
+        await job()
+
+    mock_send_email.assert_called_once()
+    kwargs = mock_send_email.call_args.kwargs
+    assert kwargs["to"] == "stream@example.com"
+    assert "테스트키워드" in kwargs["subject"]
+    assert "[새상품] 키보드" in kwargs["body"]
+
+
+@pytest.mark.asyncio
+async def test_collect_feed_matches_matches_keywords_locally():
+    from app.src.Infrastructure.crawling.feed_collector import FeedCollectResult
+
+    keyword_a = Mock(id=1, title="키보드")
+    keyword_b = Mock(id=2, title="모니터")
+    feed = FeedCollectResult(deals=list(CRAWLED_DATA_NEW), pages_fetched=1)
+
+    with (
+        patch(
+            "app.worker_main.collect_feed_deals",
+            new_callable=AsyncMock,
+            return_value=feed,
+        ) as mock_collect,
+        patch.dict(worker_main_module.FEED_LAST_SEEN_IDS, {}, clear=True),
+    ):
+        feed_matches, next_last_seen_ids = await worker_main_module.collect_feed_matches(
+            [keyword_a, keyword_b], Mock(), [SiteName.ALGUMON]
+        )
+        # 커서는 앵커 반영과 메일 적재를 마친 뒤에 호출자가 전진시킨다.
+        assert worker_main_module.FEED_LAST_SEEN_IDS == {}
+
+    mock_collect.assert_awaited_once()
+    assert next_last_seen_ids == {SiteName.ALGUMON: "101"}
+    site_matches = feed_matches[SiteName.ALGUMON]
+    assert [deal.id for deal in site_matches[1]] == ["101"]
+    assert [deal.id for deal in site_matches[2]] == ["103"]
+    assert site_matches[1][0].search_url.endswith(
+        "keyword=%ED%82%A4%EB%B3%B4%EB%93%9C"
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_keyword_uses_feed_matches_without_fetching(keyword_in_db):
+    feed_matches = {SiteName.ALGUMON: {keyword_in_db.id: CRAWLED_DATA_NEW}}
+    anchor_store = Mock(run_ledger=None)
+    anchor_store.get_external_id.return_value = "103"
+    anchor_store.stage = AsyncMock()
+
+    with (
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch(
+            "app.worker_main._fetch_latest_products", new_callable=AsyncMock
+        ) as mock_fetch,
+    ):
+        result = await handle_keyword(
+            keyword_in_db,
+            Mock(),
+            {SiteName.ALGUMON: asyncio.Semaphore(1)},
+            anchor_store,
+            feed_matches=feed_matches,
+        )
+
+    mock_fetch.assert_not_awaited()
+    assert result is not None
+    assert [deal.id for deal in result[1]] == ["101", "102"]
+    anchor_store.stage.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_streaming_fetch_passes_stored_anchor_ids(keyword_in_db):
+    crawler = Mock(search_url="https://www.algumon.com/n/deal?keyword=test")
+    crawler.fetchparse_until = AsyncMock(return_value=CRAWLED_DATA_NEW)
+    crawler.fetchparse = AsyncMock()
+    anchor_store = Mock()
+    anchor_store.get_external_id.return_value = "103,104"
+    anchor_store.stage = AsyncMock()
+
+    with (
+        patch("app.worker_main.get_crawler", return_value=crawler),
+        patch("app.worker_main.settings.CRAWL_STREAMING_FETCH_ENABLED", True),
+    ):
+        new_deals = await get_new_hotdeal_keywords_for_site(
+            None, keyword_in_db, Mock(), SiteName.ALGUMON, anchor_store=anchor_store
+        )
+
+    crawler.fetchparse_until.assert_awaited_once_with(
+        ["103", "104"], min_results=worker_main_module.ANCHOR_COUNT
+    )
+    crawler.fetchparse.assert_not_awaited()
+    assert [deal.id for deal in new_deals] == ["101", "102"]
+
+
+@pytest.mark.asyncio
+async def test_proxy_pool_snapshot_survives_restart(mock_db_session):
+    manager = worker_main_module.PROXY_MANAGER
+    manager.reset_proxies(clear_history=True)
+    manager.register_proxy("http://1.1.1.1:8080")
+    manager.record_proxy_success("http://1.1.1.1:8080", latency_seconds=0.2)
+
+    try:
+        with patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session):
+            await worker_main_module._save_proxy_pool_snapshot("test")
+            manager.reset_proxies(clear_history=True)
+            await worker_main_module._restore_proxy_pool_snapshot()
+
+        assert list(manager.proxies) == ["http://1.1.1.1:8080"]
+        assert manager.get_proxy_state("http://1.1.1.1:8080").latency_ewma == 0.2
+    finally:
+        manager.reset_proxies(clear_history=True)
+
+
+@pytest.mark.asyncio
+async def test_handle_keyword_uses_carried_run_ledger_deals(keyword_in_db):
+    from app.src.domain.hotdeal.run_ledger import RunLedger
+
+    run_ledger = RunLedger(Mock())
+    run_ledger._carried[(keyword_in_db.id, SiteName.ALGUMON)] = CRAWLED_DATA_NEW[:1]
+    anchor_store = Mock(run_ledger=run_ledger)
+
+    with (
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site", new_callable=AsyncMock
+        ) as mock_get_for_site,
+    ):
+        result = await handle_keyword(
+            keyword_in_db,
+            Mock(),
+            {SiteName.ALGUMON: asyncio.Semaphore(1)},
+            anchor_store=anchor_store,
+        )
+
+    mock_get_for_site.assert_not_awaited()
+    assert result is not None
+    assert [deal.id for deal in result[1]] == ["101"]
+    assert run_ledger.carried_count == 1
+    assert run_ledger.pending_carry_count == 0
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_mails_sends_and_clears_outbox(mock_db_session):
+    from app.src.domain.mail.models import PendingMail
+    from app.src.domain.user.models import User
+
+    user = User(
+        email="pending@example.com",
+        nickname="pendinguser",
+        hashed_password="hashed_password",
+    )
+    mock_db_session.add(user)
+    await mock_db_session.commit()
+    mock_db_session.add(PendingMail(user_id=user.id, subject="제목", body="본문", run_id=1))
+    await mock_db_session.commit()
+
+    with (
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+    ):
+        sent = await worker_main_module._deliver_pending_mails()
+
+    assert sent == 1
+    mock_send_email.assert_awaited_once()
+    assert mock_send_email.call_args.kwargs["subject"] == "제목"
+    remaining = (await mock_db_session.execute(select(PendingMail))).scalars().all()
+    assert remaining == []
+
+
+@pytest.mark.asyncio
+async def test_handle_keyword_skips_sites_not_due(keyword_in_db):
+    with (
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site", new_callable=AsyncMock
+        ) as mock_get_for_site,
+    ):
+        result = await handle_keyword(
+            keyword_in_db,
+            Mock(),
+            {SiteName.ALGUMON: asyncio.Semaphore(1)},
+            due_sites=set(),
+        )
+
+    assert result is None
+    mock_get_for_site.assert_not_awaited()
+
+
+def test_adaptive_schedule_uses_tick_trigger():
+    with (
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.settings.CRAWL_ADAPTIVE_SCHEDULE_ENABLED", True),
+        patch("app.worker_main.settings.CRAWL_SCHEDULE_TICK_MINUTES", 5),
+    ):
+        adaptive_trigger = worker_main_module._build_job_trigger()
+    with patch("app.worker_main.settings.ENVIRONMENT", "prod"):
+        fixed_trigger = worker_main_module._build_job_trigger()
+
+    assert str(adaptive_trigger.fields[6]) == "*/5"
+    assert str(fixed_trigger.fields[6]) == "0,30"
+
+
+@pytest.mark.asyncio
+async def test_interval_mail_dispatcher_flushes_partial_deals_per_user(stored_mails):
+    keyword_a = Mock(id=1, title="alpha")
+    keyword_b = Mock(id=2, title="beta")
+    user = Mock(id="user-a", email="a@example.com", keywords=[keyword_a, keyword_b])
+
+    dispatcher = worker_main_module.IntervalMailDispatcher(
+        [user], [keyword_a, keyword_b], flush_interval_seconds=300
+    )
+
+    with (
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch(
+            "app.worker_main.make_hotdeal_email_content",
+            new_callable=AsyncMock,
+            return_value="<p>deal</p>",
+        ),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        dispatcher.start()
+        await dispatcher.complete_keyword(keyword_a, CRAWLED_DATA_NEW[:1])
+        # beta가 남아 있어도 발송 간격이 되면 모인 핫딜을 한 통으로 보낸다.
+        await dispatcher.flush()
+        await asyncio.sleep(0)
+        assert mock_send_email.await_count == 1
+
+        await dispatcher.complete_keyword(keyword_b, [])
+        sent = await dispatcher.wait_sent()
+
+    assert sent == 1
+    assert mock_send_email.call_args.kwargs["subject"] == "[alpha] 새로운 핫딜 알림"
+
+
+@pytest.mark.asyncio
+async def test_drain_steadily_spaces_task_starts_and_keeps_order():
+    loop = asyncio.get_running_loop()
+    started_at: list[float] = []
+
+    async def work(value: int) -> int:
+        started_at.append(loop.time())
+        if value == 1:
+            raise ValueError("boom")
+        return value
+
+    results = await worker_main_module._drain_steadily([work(0), work(1), work(2)], 0.15)
+
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+    gaps = [b - a for a, b in zip(started_at, started_at[1:], strict=False)]
+    assert all(gap >= 0.04 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_job_continuous_schedule_mode(mock_db_session, keyword_in_db):
+    from app.src.domain.user.models import User
+
+    user = User(
+        email="continuous@example.com",
+        nickname="continuoususer",
+        hashed_password="hashed_password",
+    )
+    user.keywords.append(keyword_in_db)
+    mock_db_session.add(user)
+    await mock_db_session.commit()
+
+    with (
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site", new_callable=AsyncMock
+        ) as mock_get_new,
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.settings.WORKER_CONTINUOUS_SCHEDULE_ENABLED", True),
+        patch("app.worker_main.SharedBrowser") as mock_shared,
+        patch.object(
+            worker_main_module.PROXY_MANAGER,
+            "ensure_min_available_proxies_async",
+            new=AsyncMock(return_value=True),
+        ),
+    ):
+        mock_shared.get_instance.return_value.start = AsyncMock()
+        mock_shared.get_instance.return_value.stop = AsyncMock()
+        mock_get_new.return_value = CRAWLED_DATA_NEW
+
+        await job()
+
+    mock_send_email.assert_called_once()
+    assert mock_send_email.call_args.kwargs["to"] == "continuous@example.com"
+
+
+def test_drain_window_leaves_room_for_site_budget_and_mail():
+    with (
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.settings.WORKER_CONTINUOUS_DRAIN_SECONDS", 1200.0),
+        patch("app.worker_main.settings.CRAWL_SITE_BUDGET_SECONDS", 120.0),
+    ):
+        assert worker_main_module._resolve_drain_seconds(120.0) == 1200.0
+        with deadline_scope(600):
+            assert worker_main_module._resolve_drain_seconds(120.0) <= 360.0
+        with patch("app.worker_main.settings.CRAWL_ADAPTIVE_SCHEDULE_ENABLED", True):
+            assert worker_main_module._resolve_drain_seconds(60.0) == 120.0
+
+
+@pytest.mark.asyncio
+async def test_anchor_flush_failure_excludes_unflushed_deals_from_mail():
+    from app.src.domain.hotdeal.anchor_store import KeywordSiteAnchorStore
+
+    failing_session_factory = Mock(side_effect=RuntimeError("db down"))
+    anchor_store = KeywordSiteAnchorStore(session_factory=failing_session_factory)
+    await anchor_store.stage(
+        1, SiteName.ALGUMON, external_id="101", link="new_link1", price=None, meta_data=None
+    )
+    keyword = Mock(id=1, title="alpha")
+    flushed_deal = CRAWLED_DATA_NEW[1].model_copy(update={"site_name": SiteName.RULIWEB})
+
+    with patch("app.worker_main.ANCHOR_FLUSH_RETRY_DELAY_SECONDS", 0.0):
+        assert await worker_main_module._flush_anchor_store(anchor_store) is False
+
+    # 재시도까지 실패하면 반영되지 않은 앵커의 핫딜만 메일에서 뺀다.
+    assert failing_session_factory.call_count == worker_main_module.ANCHOR_FLUSH_ATTEMPTS
+    assert anchor_store.is_pending(1, SiteName.ALGUMON)
+    deals = worker_main_module._exclude_unflushed_deals(
+        keyword, [CRAWLED_DATA_NEW[0], flushed_deal], anchor_store.is_pending
+    )
+    assert deals == [flushed_deal]
+
+
+@pytest.mark.asyncio
+async def test_streaming_mail_dispatcher_defers_user_when_before_send_fails(stored_mails):
+    keyword_a = Mock(id=1, title="alpha")
+    keyword_b = Mock(id=2, title="beta")
+    user_a = Mock(id="user-a", email="a@example.com", keywords=[keyword_a])
+    user_b = Mock(id="user-b", email="b@example.com", keywords=[keyword_b])
+    ruliweb_deal = CRAWLED_DATA_NEW[1].model_copy(update={"site_name": SiteName.RULIWEB})
+    before_send = AsyncMock(side_effect=[RuntimeError("db down"), None, RuntimeError("db down")])
+
+    dispatcher = worker_main_module.StreamingMailDispatcher(
+        [user_a, user_b],
+        [keyword_a, keyword_b],
+        before_send=before_send,
+        is_unflushed=lambda keyword_id, site: site == SiteName.ALGUMON,
+    )
+
+    with (
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch(
+            "app.worker_main.make_hotdeal_email_content",
+            new_callable=AsyncMock,
+            side_effect=lambda keyword, deals: "".join(deal.title for deal in deals),
+        ),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        # 앵커 반영에 실패한 사용자는 발송하지 않고 실행 끝으로 미룬다.
+        await dispatcher.complete_keyword(keyword_a, [CRAWLED_DATA_NEW[0], ruliweb_deal])
+        await asyncio.sleep(0)
+        mock_send_email.assert_not_awaited()
+
+        await dispatcher.complete_keyword(keyword_b, CRAWLED_DATA_NEW[2:])
+        # 실행 끝에서도 반영에 실패하면 반영되지 않은 앵커의 핫딜만 빼고 보낸다.
+        sent = await dispatcher.wait_sent()
+
+    assert sent == 2
+    bodies = {c.kwargs["to"]: c.kwargs["body"] for c in mock_send_email.call_args_list}
+    assert bodies == {"b@example.com": "[기존상품] 모니터", "a@example.com": "[새상품] 마우스"}
+
+
+@pytest.mark.asyncio
+async def test_mail_dispatcher_close_cancels_unfinished_sends(stored_mails):
+    keyword = Mock(id=1, title="alpha")
+    user = Mock(id="user-a", email="a@example.com", keywords=[keyword])
+    send_started = asyncio.Event()
+
+    async def slow_send(**_kwargs):
+        send_started.set()
+        await asyncio.sleep(10)
+
+    dispatcher = worker_main_module.IntervalMailDispatcher(
+        [user], [keyword], flush_interval_seconds=300
+    )
+
+    with (
+        patch("app.worker_main.send_email", side_effect=slow_send),
+        patch(
+            "app.worker_main.make_hotdeal_email_content",
+            new_callable=AsyncMock,
+            return_value="<p>deal</p>",
+        ),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        dispatcher.start()
+        await dispatcher.complete_keyword(keyword, CRAWLED_DATA_NEW[:1])
+        await send_started.wait()
+        (send_task,) = dispatcher._send_tasks
+
+        await dispatcher.close()
+
+    assert send_task.cancelled()
+    assert dispatcher._flush_task.done()
+
+
+@pytest.mark.asyncio
+async def test_mail_dispatcher_marks_keyword_mailed_with_last_subscriber_mail(stored_mails):
+    keyword_a = Mock(id=1, title="alpha")
+    keyword_b = Mock(id=2, title="beta")
+    user_a = Mock(id="user-a", email="a@example.com", keywords=[keyword_a])
+    user_b = Mock(id="user-b", email="b@example.com", keywords=[keyword_a, keyword_b])
+    run_ledger = Mock()
+
+    dispatcher = worker_main_module.StreamingMailDispatcher(
+        [user_a, user_b], [keyword_a, keyword_b], run_ledger=run_ledger
+    )
+
+    with (
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch(
+            "app.worker_main.make_hotdeal_email_content",
+            new_callable=AsyncMock,
+            return_value="<p>deal</p>",
+        ),
+        patch("app.worker_main._mark_run_ledger_mailed", new_callable=AsyncMock) as mock_mark,
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        await dispatcher.complete_keyword(keyword_a, CRAWLED_DATA_NEW[:1])
+        # 크롤링에 실패한 키워드는 원장에 메일 적재 완료로 표시하지 않는다.
+        await dispatcher.complete_keyword(keyword_b, [], mailable=False)
+        await dispatcher.wait_sent()
+
+    # alpha는 두 번째 구독자의 메일을 적재하는 트랜잭션에서 표시된다.
+    assert [c.args[2] for c in stored_mails.call_args_list] == [[], [1]]
+    assert all(c.args[1] is run_ledger for c in stored_mails.call_args_list)
+    assert mock_send_email.await_count == 2
+    mock_mark.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_mail_dispatcher_does_not_send_when_outbox_store_fails(stored_mails):
+    keyword = Mock(id=1, title="alpha")
+    user = Mock(id="user-a", email="a@example.com", keywords=[keyword])
+    stored_mails.side_effect = None
+    stored_mails.return_value = None
+
+    dispatcher = worker_main_module.StreamingMailDispatcher([user], [keyword], run_ledger=Mock())
+
+    with (
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch(
+            "app.worker_main.make_hotdeal_email_content",
+            new_callable=AsyncMock,
+            return_value="<p>deal</p>",
+        ),
+        patch("app.worker_main._mark_run_ledger_mailed", new_callable=AsyncMock) as mock_mark,
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        await dispatcher.complete_keyword(keyword, CRAWLED_DATA_NEW[:1])
+        sent = await dispatcher.wait_sent()
+
+    assert sent == 0
+    mock_send_email.assert_not_awaited()
+    mock_mark.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_job_does_not_send_mail_when_outbox_store_fails(mock_db_session, keyword_in_db):
+    from app.src.domain.user.models import User
+
+    user = User(
+        email="outbox@example.com",
+        nickname="outboxuser",
+        hashed_password="hashed_password",
+    )
+    user.keywords.append(keyword_in_db)
+    mock_db_session.add(user)
+    await mock_db_session.commit()
+
+    with (
+        patch(
+            "app.worker_main.get_new_hotdeal_keywords_for_site",
+            new_callable=AsyncMock,
+            return_value=CRAWLED_DATA_NEW,
+        ),
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch("app.worker_main._store_pending_mails", new=AsyncMock(return_value=None)),
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.SharedBrowser") as mock_shared,
+        patch.object(
+            worker_main_module.PROXY_MANAGER,
+            "ensure_min_available_proxies_async",
+            new=AsyncMock(return_value=True),
+        ),
+    ):
+        mock_shared.get_instance.return_value.start = AsyncMock()
+        mock_shared.get_instance.return_value.stop = AsyncMock()
+
+        await job()
+
+    mock_send_email.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_feed_cursor_survives_restart(mock_db_session):
+    with (
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch.dict(worker_main_module.FEED_LAST_SEEN_IDS, {}, clear=True),
+    ):
+        await worker_main_module._advance_feed_cursors({SiteName.ALGUMON: "101"})
+        await worker_main_module._advance_feed_cursors({SiteName.ALGUMON: "102"})
+        worker_main_module.FEED_LAST_SEEN_IDS.clear()
+        await worker_main_module._load_feed_cursors()
+
+        assert worker_main_module.FEED_LAST_SEEN_IDS == {SiteName.ALGUMON: "102"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("outbox_ok, expected_cursor", [(True, "201"), (False, None)])
+async def test_job_advances_feed_cursor_only_after_mail_is_queued(
+    mock_db_session, keyword_in_db, outbox_ok, expected_cursor
+):
+    from app.src.domain.admin.repositories import select_feed_cursors
+    from app.src.domain.user.models import User
+    from app.src.Infrastructure.crawling.feed_collector import FeedCollectResult
+
+    user = User(
+        email="feed@example.com",
+        nickname="feeduser",
+        hashed_password="hashed_password",
+    )
+    user.keywords.append(keyword_in_db)
+    mock_db_session.add(user)
+    await mock_db_session.commit()
+    feed_deal = CRAWLED_DATA_NEW[0].model_copy(update={"id": "201", "title": "테스트키워드 특가"})
+    store_pending_mails = worker_main_module._store_pending_mails if outbox_ok else None
+
+    async def store(*args, **kwargs):
+        if store_pending_mails is None:
+            return None
+        return await store_pending_mails(*args, **kwargs)
+
+    with (
+        patch(
+            "app.worker_main.collect_feed_deals",
+            new_callable=AsyncMock,
+            return_value=FeedCollectResult(deals=[feed_deal], pages_fetched=1),
+        ),
+        patch("app.worker_main.get_active_sites", return_value=[SiteName.ALGUMON]),
+        patch("app.worker_main._store_pending_mails", side_effect=store),
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+        patch("app.worker_main.settings.CRAWL_FEED_MODE_ENABLED", True),
+        patch("app.worker_main.SharedBrowser") as mock_shared,
+        patch.dict(worker_main_module.FEED_LAST_SEEN_IDS, {}, clear=True),
+        patch.object(
+            worker_main_module.PROXY_MANAGER,
+            "ensure_min_available_proxies_async",
+            new=AsyncMock(return_value=True),
+        ),
+    ):
+        mock_shared.get_instance.return_value.start = AsyncMock()
+        mock_shared.get_instance.return_value.stop = AsyncMock()
+
+        await job()
+        last_seen_id = worker_main_module.FEED_LAST_SEEN_IDS.get(SiteName.ALGUMON)
+
+    cursors = await select_feed_cursors(mock_db_session)
+    assert mock_send_email.await_count == (1 if outbox_ok else 0)
+    assert last_seen_id == expected_cursor
+    assert cursors.get(SiteName.ALGUMON) == expected_cursor
+
+
+@pytest.mark.asyncio
+async def test_chunk_flush_failure_keeps_deals_and_retries_at_run_end(
+    mock_db_session, keyword_and_site_in_db
+):
+    from app.src.domain.hotdeal.anchor_store import KeywordSiteAnchorStore
+
+    keyword, _ = keyword_and_site_in_db
+    session_calls = 0
+
+    def session_factory():
+        nonlocal session_calls
+        session_calls += 1
+        # 첫 호출(앵커 적재)은 성공하고, 크롤링 중 청크 반영은 실패한다.
+        if session_calls == 2:
+            raise RuntimeError("db hiccup")
+        return mock_db_session
+
+    anchor_store = KeywordSiteAnchorStore(session_factory=session_factory, chunk_size=1)
+    await anchor_store.load([keyword.id], [SiteName.ALGUMON])
+    crawler = Mock(search_url="https://www.algumon.com/n/deal?keyword=test", fetch_succeeded=True)
+    crawler.fetchparse = AsyncMock(return_value=CRAWLED_DATA_NEW)
+
+    with (
+        patch("app.worker_main.get_crawler", return_value=crawler),
+        patch("app.worker_main.settings.CRAWL_STREAMING_FETCH_ENABLED", False),
+    ):
+        # 청크 반영이 실패해도 크롤링 경로로 예외가 올라가지 않고 신규 핫딜은 메일 대상으로 남는다.
+        new_deals = await get_new_hotdeal_keywords_for_site(
+            None, keyword, Mock(), SiteName.ALGUMON, anchor_store=anchor_store
+        )
+
+    assert [deal.id for deal in new_deals] == ["101", "102"]
+    assert anchor_store.is_pending(keyword.id, SiteName.ALGUMON)
+
+    # 실행 종료 시 재시도에서 반영된다.
+    assert await worker_main_module._flush_anchor_store(anchor_store) is True
+    anchor = (await mock_db_session.execute(select(KeywordSite))).scalars().one()
+    await mock_db_session.refresh(anchor)
+    assert anchor.external_id.startswith("101")